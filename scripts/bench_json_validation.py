@@ -0,0 +1,83 @@
+"""
+응답 검증 경로 벤치마크: resp.json() + validate_python vs validate_json(bytes)
+
+scripts/fixtures/ 의 기록 payload(익명화)를 실제 응답처럼 compact JSON bytes 로
+만든 뒤, 두 경로로 각각 검증해 처리량(건/초)을 비교한다. 네트워크 불필요.
+상세 응답은 필드 선택(projection) 모델의 validate_json 처리량도 함께 출력한다.
+
+Usage:
+    uv run python scripts/bench_json_validation.py [repeat]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from shopby_sdk.base.adapter import get_type_adapter
+from shopby_sdk.base.projection import project
+from shopby_sdk.clients.claim.models import ClaimListResponse
+from shopby_sdk.clients.order.models import OrderDetailResponse, OrdersResponse
+from shopby_sdk.clients.products.models import ProductDetailV1Response, ProductDetailV3Response
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+FIXTURE_MODELS: dict[str, Any] = {
+    "product_v1": ProductDetailV1Response,
+    "product_v3": ProductDetailV3Response,
+    "order_detail": OrderDetailResponse,
+    "orders": OrdersResponse,
+    "claims": ClaimListResponse,
+}
+
+# 카탈로그/정산 스윕에서 흔히 쓰는 필드만 고른 projection
+FIXTURE_PROJECTIONS: dict[str, Any] = {
+    "product_v3": project(
+        ProductDetailV3Response,
+        ["mall_product_no", "sale_price", "product_stock_cnt", "options.mall_option_no", "options.stock_cnt"],
+    ),
+    "order_detail": project(
+        OrderDetailResponse,
+        ["order_no", "last_main_pay_amt", "order_products.mall_product_no", "order_products.order_options"],
+    ),
+}
+
+
+def _load_body(name: str) -> bytes:
+    data = json.loads((FIXTURES_DIR / f"{name}.json").read_text(encoding="utf-8"))
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _per_second(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return repeat / (time.perf_counter() - start)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    print(f"{'fixture':<14} {'bytes':>8} {'json+python(/s)':>16} {'validate_json(/s)':>18} {'speedup':>8}")
+    for name, model in FIXTURE_MODELS.items():
+        body = _load_body(name)
+        adapter = get_type_adapter(model)
+
+        two_pass = _per_second(lambda: adapter.validate_python(json.loads(body)), repeat)
+        direct = _per_second(lambda: adapter.validate_json(body), repeat)
+        print(f"{name:<14} {len(body):>8} {two_pass:>16.0f} {direct:>18.0f} {direct / two_pass:>7.2f}x")
+
+    print(f"\n{'fixture':<14} {'full(/s)':>10} {'projection(/s)':>16} {'speedup':>8}")
+    for name, projected in FIXTURE_PROJECTIONS.items():
+        body = _load_body(name)
+        full = get_type_adapter(FIXTURE_MODELS[name])
+        light = get_type_adapter(projected)
+
+        full_rate = _per_second(lambda: full.validate_json(body), repeat)
+        light_rate = _per_second(lambda: light.validate_json(body), repeat)
+        print(f"{name:<14} {full_rate:>10.0f} {light_rate:>16.0f} {light_rate / full_rate:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
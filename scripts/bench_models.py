@@ -0,0 +1,200 @@
+"""
+응답 모델 검증 벤치마크 (오프라인, 네트워크 불필요) — 모델/BaseDto 변경의 성능 회귀 게이트
+
+scripts/fixtures/ 의 기록 payload(익명화)를 도메인별 응답 모델로 검증하면서 pydantic 설정별로
+
+- 처리량: validate_json 건/초 (라운드 중 최고값)
+- peak: 검증 1건 동안의 최대 메모리 증가량 (tracemalloc, KiB)
+- retained: 검증 결과 모델이 점유하는 메모리 (KiB) / 살아 있는 메모리 블록 수 (tracemalloc snapshot diff)
+
+를 측정한다. 설정 변형은 BaseDto 의 model_config 일부를 바꾼 모델 트리를 동적으로 만들어 비교하며
+(중첩 모델까지 같은 설정으로 다시 만든다), ``default`` 가 현재 SDK 모델이다.
+
+``--save`` 로 결과를 JSON 으로 저장하고 ``--compare`` 로 저장한 기준과 비교해 처리량이 tolerance
+이상 떨어지거나 peak/retained 메모리가 tolerance 이상 늘면 exit 1 로 끝난다 (CI 게이트용).
+
+Usage:
+    uv run python scripts/bench_models.py [--repeat 200] [--rounds 5] [--fixtures orders claims]
+        [--settings default extra=ignore] [--save bench.json] [--compare bench.json] [--tolerance 0.15]
+"""
+
+import argparse
+import copy
+import gc
+import json
+import sys
+import time
+import tracemalloc
+import types
+import typing
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from shopby_sdk.base.adapter import get_type_adapter
+from shopby_sdk.base.dto import BaseDto
+from shopby_sdk.clients.claim.models import ClaimListResponse
+from shopby_sdk.clients.display.models import ReviewListResponse
+from shopby_sdk.clients.member.models import MembersListResponse
+from shopby_sdk.clients.order.models import OrderDetailResponse, OrdersResponse
+from shopby_sdk.clients.products.models import ProductDetailV1Response, ProductDetailV3Response
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+FIXTURE_MODELS: dict[str, Any] = {
+    "product_v1": ProductDetailV1Response,
+    "product_v3": ProductDetailV3Response,
+    "order_detail": OrderDetailResponse,
+    "orders": OrdersResponse,
+    "claims": ClaimListResponse,
+    "members": MembersListResponse,
+    "reviews": ReviewListResponse,
+}
+
+# BaseDto model_config 변형 (default = 현재 설정)
+SETTINGS: dict[str, ConfigDict] = {
+    "default": ConfigDict(),
+    "extra=ignore": ConfigDict(extra="ignore"),
+    "cache_strings=keys": ConfigDict(cache_strings="keys"),
+    "by_alias_only": ConfigDict(validate_by_name=False, populate_by_name=False),
+}
+
+
+def _load_body(name: str) -> bytes:
+    data = json.loads((FIXTURES_DIR / f"{name}.json").read_text(encoding="utf-8"))
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def with_config(model: Any, config: ConfigDict, _built: dict[type, type | None] | None = None) -> Any:
+    """model 과 그 안의 모든 BaseDto 모델을 config 로 덮어쓴 설정으로 다시 만든 타입."""
+    if not config:
+        return model
+    built = {} if _built is None else _built
+    origin, args = typing.get_origin(model), typing.get_args(model)
+    if args:
+        rebuilt = tuple(with_config(arg, config, built) for arg in args)
+        if origin in (typing.Union, types.UnionType):
+            return typing.Union[rebuilt]
+        if origin is typing.Annotated:
+            return typing.Annotated[rebuilt[0], *args[1:]]
+        if origin is typing.Literal:
+            return model
+        return origin[rebuilt]
+    if not (isinstance(model, type) and issubclass(model, BaseDto)):
+        return model
+    if model in built:
+        # 자기 참조 모델은 생성 중인 자신 대신 원본을 참조한다
+        return built[model] or model
+
+    built[model] = None
+    namespace: dict[str, Any] = {"model_config": {**model.model_config, **config}, "__module__": model.__module__}
+    annotations = {}
+    for name, field in model.model_fields.items():
+        annotation = with_config(field.annotation, config, built)
+        if annotation is not field.annotation:
+            annotations[name] = annotation
+            namespace[name] = copy.copy(field)
+    namespace["__annotations__"] = annotations
+    variant = built[model] = type(model.__name__, (model,), namespace)
+    return variant
+
+
+def _per_second(fn, repeat: int, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return repeat / best
+
+
+def _memory(fn) -> tuple[float, float, int]:
+    """검증 1건의 (peak KiB, retained KiB, retained blocks).
+
+    retained 는 검증이 끝난 뒤에도 결과 모델이 붙잡고 있는 메모리이며, 블록 수는 검증 전후
+    tracemalloc snapshot 의 블록 수 차이다 (검증 중 할당했다가 해제한 블록은 세지 않는다).
+    """
+    fn()  # 지연 초기화 제외
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return (peak - base) / 1024, (current - base) / 1024, blocks
+
+
+def run(fixtures: list[str], settings: list[str], repeat: int, rounds: int) -> dict[str, dict[str, dict[str, float]]]:
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    print(f"{'fixture':<14} {'setting':<20} {'bytes':>8} {'validate/s':>11} {'peak KiB':>9} {'KiB':>8} {'blocks':>7}")
+    for name in fixtures:
+        body = _load_body(name)
+        for setting in settings:
+            adapter = get_type_adapter(with_config(FIXTURE_MODELS[name], SETTINGS[setting]))
+
+            def validate(adapter=adapter, body=body) -> BaseModel:
+                return adapter.validate_json(body)
+
+            per_sec = _per_second(validate, repeat, rounds)
+            peak, retained, blocks = _memory(validate)
+            results.setdefault(name, {})[setting] = {
+                "per_sec": per_sec,
+                "peak_kib": peak,
+                "retained_kib": retained,
+                "retained_blocks": blocks,
+            }
+            print(f"{name:<14} {setting:<20} {len(body):>8} {per_sec:>11.0f} {peak:>9.1f} {retained:>8.1f} {blocks:>7}")
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """기준 대비 회귀 목록 (처리량 감소 / peak·retained 메모리·블록 수 증가가 tolerance 초과)."""
+    regressions = []
+    for name, by_setting in results.items():
+        for setting, current in by_setting.items():
+            base = baseline.get(name, {}).get(setting)
+            if base is None:
+                continue
+            if current["per_sec"] < base["per_sec"] * (1 - tolerance):
+                regressions.append(f"{name}/{setting}: validate/s {base['per_sec']:.0f} -> {current['per_sec']:.0f}")
+            for metric in ("peak_kib", "retained_kib", "retained_blocks"):
+                if current[metric] > base[metric] * (1 + tolerance):
+                    regressions.append(f"{name}/{setting}: {metric} {base[metric]:.1f} -> {current[metric]:.1f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200, help="라운드당 검증 횟수")
+    parser.add_argument("--rounds", type=int, default=5, help="처리량 측정 라운드 수 (최고값 사용)")
+    parser.add_argument("--fixtures", nargs="+", choices=list(FIXTURE_MODELS), default=list(FIXTURE_MODELS))
+    parser.add_argument("--settings", nargs="+", choices=list(SETTINGS), default=list(SETTINGS))
+    parser.add_argument("--save", type=Path, help="결과를 JSON 으로 저장")
+    parser.add_argument("--compare", type=Path, help="저장한 기준 결과와 비교 (회귀 시 exit 1)")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="허용 회귀 비율")
+    args = parser.parse_args()
+
+    results = run(args.fixtures, args.settings, args.repeat, args.rounds)
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text(encoding="utf-8")), args.tolerance)
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건 (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n회귀 없음 (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
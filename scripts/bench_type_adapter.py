@@ -0,0 +1,57 @@
+"""
+TypeAdapter 캐시 마이크로 벤치마크 (오프라인, 네트워크 불필요)
+
+handle_resp 가 응답마다 ``TypeAdapter(type_model)`` 을 새로 만들던 방식과
+``get_type_adapter`` 캐시를 쓰는 방식의 응답 1건당 오버헤드를 비교한다.
+검증(validate) 비용은 두 방식이 동일하므로 adapter 생성/조회 비용만 측정한다.
+
+Usage:
+    uv run python scripts/bench_type_adapter.py [repeat]
+"""
+
+import sys
+import time
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from shopby_sdk.base.adapter import clear_type_adapters, get_type_adapter
+from shopby_sdk.clients.claim.models import ClaimListResponse
+from shopby_sdk.clients.order.models import OrderDetailResponse, OrdersResponse
+from shopby_sdk.clients.products.models import ProductDetailV1Response, ProductDetailV3Response
+from shopby_sdk.shop.admin.models import MallPartner
+from shopby_sdk.shop.product.models import ProductSearchResponse
+
+TARGETS: list[Any] = [
+    ProductDetailV3Response,
+    ProductDetailV1Response,
+    OrderDetailResponse,
+    OrdersResponse,
+    ClaimListResponse,
+    ProductSearchResponse,
+    list[MallPartner],
+]
+
+
+def _per_call_us(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    clear_type_adapters()
+
+    print(f"{'type':<40} {'uncached(us)':>14} {'cached(us)':>12} {'speedup':>10}")
+    for tp in TARGETS:
+        uncached = _per_call_us(lambda: TypeAdapter(tp), repeat)
+        get_type_adapter(tp)  # 캐시 적재
+        cached = _per_call_us(lambda: get_type_adapter(tp), repeat * 100)
+        name = getattr(tp, "__name__", None) if not hasattr(tp, "__origin__") else repr(tp)
+        print(f"{str(name)[:40]:<40} {uncached:>14.1f} {cached:>12.3f} {uncached / cached:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,8 @@ from datetime import date, timedelta
 
 import httpx
 
+from shopby_sdk.base.batch import fetch_many
+
 BASE = os.environ.get("SHOPBY_BASE_URL", "https://server-api.e-ncp.com")
 
 
@@ -152,19 +154,10 @@ async def collect(target: str, samples: int, concurrency: int) -> list:
         else:
             raise SystemExit(f"unknown target: {target}")
 
-        sem = asyncio.Semaphore(concurrency)
         out = []
-
-        async def one(i):
-            async with sem:
-                try:
-                    r = await c.get(path(i), headers=_h(ver))
-                    if r.status_code == 200:
-                        out.append(r.json())
-                except Exception:  # noqa: BLE001
-                    pass
-
-        await asyncio.gather(*[one(i) for i in ids])
+        async for res in fetch_many(lambda i: c.get(path(i), headers=_h(ver)), ids, concurrency=concurrency):
+            if res.ok and res.value.status_code == 200:
+                out.append(res.value.json())
         return out
 
 
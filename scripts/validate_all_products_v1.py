@@ -20,20 +20,6 @@ class ValidationResult:
     error: str | None = None
 
 
-async def fetch_product_detail(
-    client: ShopbyServerProductsApiClient,
-    product_no: int,
-    semaphore: asyncio.Semaphore,
-) -> ValidationResult:
-    """단일 상품 상세 조회 및 검증"""
-    async with semaphore:
-        try:
-            await client.get_product_detail(product_no)
-            return ValidationResult(product_no=product_no, success=True)
-        except Exception as e:
-            return ValidationResult(product_no=product_no, success=False, error=str(e))
-
-
 async def main():
     # 환경변수에서 인증 정보 읽기
     access_token = os.environ["SHOPBY_SERVER_ACCESS_TOKEN"]
@@ -46,59 +32,40 @@ async def main():
         base_url=base_url,
     )
 
-    # 1. 전시중이고 판매가능한 모든 상품 검색
+    # 1. 전시중이고 판매가능한 모든 상품 검색 (페이지는 동시에 미리 요청됨)
     print("=== 상품 검색 시작 ===")
     all_product_nos: list[int] = []
-    page = 1
-    page_size = 100
-
-    while True:
-        result = await client.search_products_v2(
-            front_display="Y",
-            sale_setting_types="AVAILABLE_FOR_SALE",
-            page_number=page,
-            page_size=page_size,
-        )
-
-        product_nos = [item.product_no for item in result.items]
-        all_product_nos.extend(product_nos)
 
-        print(f"페이지 {page}: {len(product_nos)}개 상품 (누적: {len(all_product_nos)}/{result.total_count})")
-
-        if len(all_product_nos) >= result.total_count or len(result.items) < page_size:
-            break
-
-        page += 1
+    async for item in client.iter_products_v2(
+        front_display="Y",
+        sale_setting_types="AVAILABLE_FOR_SALE",
+        page_size=100,
+    ):
+        all_product_nos.append(item.product_no)
+        if len(all_product_nos) % 1000 == 0:
+            print(f"누적: {len(all_product_nos)}개 상품")
 
     print(f"\n=== 총 {len(all_product_nos)}개 상품 검색 완료 ===\n")
 
-    # 2. 동시성 제한으로 V1 상세 조회 수행
+    # 2. 동시성 제한으로 V1 상세 조회 수행 (완료되는 대로 스트리밍, 실패는 개별 수집)
     concurrency = 20  # 동시 요청 수 제한
-    semaphore = asyncio.Semaphore(concurrency)
+    total = len(all_product_nos)
 
     print(f"=== V1 상세 조회 시작 (동시성: {concurrency}) ===")
 
-    tasks = [
-        fetch_product_detail(client, product_no, semaphore)
-        for product_no in all_product_nos
-    ]
-
     results: list[ValidationResult] = []
-    completed = 0
-    total = len(tasks)
+    fail_count = 0
 
-    # 진행 상황 출력을 위한 배치 처리
-    batch_size = 100
-    for i in range(0, total, batch_size):
-        batch = tasks[i : i + batch_size]
-        batch_results = await asyncio.gather(*batch)
-        results.extend(batch_results)
-        completed += len(batch_results)
+    async for result in client.fetch_many(client.get_product_detail, all_product_nos, concurrency=concurrency):
+        if result.ok:
+            results.append(ValidationResult(product_no=result.key, success=True))
+        else:
+            fail_count += 1
+            results.append(ValidationResult(product_no=result.key, success=False, error=str(result.error)))
 
         # 진행 상황
-        success_count = sum(1 for r in results if r.success)
-        fail_count = len(results) - success_count
-        print(f"진행: {completed}/{total} (성공: {success_count}, 실패: {fail_count})")
+        if len(results) % 100 == 0 or len(results) == total:
+            print(f"진행: {len(results)}/{total} (성공: {len(results) - fail_count}, 실패: {fail_count})")
 
     # 3. 결과 분석
     print("\n=== 검증 결과 ===")
@@ -1,10 +1,45 @@
+from shopby_sdk.base.adapter import get_type_adapter, warm_type_adapters
+from shopby_sdk.base.batch import BatchResult, fetch_many
+from shopby_sdk.base.cache import CacheBackend, InMemoryCacheBackend, ResponseCache
+from shopby_sdk.base.checkpoint import JsonStateFile
+from shopby_sdk.base.chunking import fetch_chunked
+from shopby_sdk.base.coalesce import RequestCoalescer
 from shopby_sdk.base.dto import BaseDto
+from shopby_sdk.base.http import DEFAULT_LIMITS, ClientOptions, create_http_client
 from shopby_sdk.base.kst import KST, KstDate, KstDatetime, to_kst_string
+from shopby_sdk.base.loader import BatchLoader
+from shopby_sdk.base.metrics import MetricsAggregator, MetricsSink, RequestMetrics
+from shopby_sdk.base.projection import ProjectionDto, project
+from shopby_sdk.base.ratelimit import AdaptiveRateLimiter
+from shopby_sdk.base.retry import RetryPolicy
+from shopby_sdk.base.revalidate import RevalidatingCache
 
 __all__ = [
     "BaseDto",
+    "DEFAULT_LIMITS",
+    "create_http_client",
+    "ClientOptions",
     "KST",
     "KstDate",
     "KstDatetime",
     "to_kst_string",
+    "get_type_adapter",
+    "warm_type_adapters",
+    "AdaptiveRateLimiter",
+    "RetryPolicy",
+    "ResponseCache",
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "RequestCoalescer",
+    "BatchLoader",
+    "RevalidatingCache",
+    "RequestMetrics",
+    "MetricsSink",
+    "MetricsAggregator",
+    "BatchResult",
+    "fetch_many",
+    "fetch_chunked",
+    "JsonStateFile",
+    "ProjectionDto",
+    "project",
 ]
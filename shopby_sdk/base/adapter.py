@@ -0,0 +1,111 @@
+"""응답 검증용 pydantic ``TypeAdapter`` 프로세스 전역 캐시.
+
+``TypeAdapter(type_model)`` 는 생성할 때마다 core schema 를 새로 만든다.
+``ProductDetailV3Response`` / ``OrderDetailResponse`` 같은 큰 모델이나
+``list[...]`` 제네릭은 이 비용이 검증 자체보다 커서, 응답마다 만들면 CPU 의
+상당 부분을 차지한다. 타입별로 한 번만 만들어 재사용한다.
+
+Example:
+    ```python
+    from shopby_sdk.base.adapter import warm_type_adapters
+
+    # 워커 기동 시 전 도메인 응답 모델 adapter 를 미리 생성 (첫 요청 지연 제거)
+    warm_type_adapters()
+    ```
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import pkgutil
+import types
+import typing
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+_ADAPTERS: dict[Any, TypeAdapter[Any]] = {}
+
+_CLIENT_PACKAGES = ("shopby_sdk.clients", "shopby_sdk.shop")
+
+
+def get_type_adapter(type_model: Any) -> TypeAdapter[Any]:
+    """type_model 에 대한 캐시된 ``TypeAdapter`` 반환 (없으면 생성 후 캐시).
+
+    ``list[Model]`` 같은 제네릭 alias 도 동등성으로 캐시된다. 해시 불가능한 타입은
+    캐시하지 않고 매번 생성한다.
+    """
+    try:
+        return _ADAPTERS[type_model]
+    except KeyError:
+        adapter = _ADAPTERS[type_model] = TypeAdapter(type_model)
+        return adapter
+    except TypeError:  # unhashable
+        return TypeAdapter(type_model)
+
+
+def clear_type_adapters() -> None:
+    """캐시된 adapter 를 모두 비운다 (모델을 동적으로 재정의하는 경우 등)."""
+    _ADAPTERS.clear()
+
+
+def response_types(client_class: type) -> list[Any]:
+    """클라이언트 클래스의 async 메서드 반환 타입(응답 모델) 목록."""
+    found: list[Any] = []
+    for name, func in inspect.getmembers(client_class, inspect.iscoroutinefunction):
+        if name.startswith("_"):
+            continue
+        try:
+            return_type = typing.get_type_hints(func).get("return")
+        except Exception:  # 전방 참조 해석 실패 등 — 워밍업 대상에서만 제외
+            continue
+        # fields projection 등으로 반환 타입이 Union 이면 handle_resp 에 넘기는 건 각 멤버 모델
+        members = typing.get_args(return_type) if _is_union(return_type) else (return_type,)
+        found.extend(tp for tp in members if tp is not None and tp is not type(None) and tp is not Any)
+    return found
+
+
+def _is_union(tp: Any) -> bool:
+    return typing.get_origin(tp) in (typing.Union, types.UnionType)
+
+
+def _discover_client_classes() -> list[type]:
+    from shopby_sdk.base.http import PooledHttpClientMixin
+
+    classes: list[type] = []
+    for package_name in _CLIENT_PACKAGES:
+        package = importlib.import_module(package_name)
+        for info in pkgutil.walk_packages(package.__path__, f"{package_name}."):
+            if not info.name.endswith(".client"):
+                continue
+            module = importlib.import_module(info.name)
+            for _, obj in inspect.getmembers(module, inspect.isclass):
+                if obj.__module__ == module.__name__ and issubclass(obj, PooledHttpClientMixin):
+                    classes.append(obj)
+    return classes
+
+
+def warm_type_adapters(*client_classes: type, extra_types: Iterable[Any] = ()) -> int:
+    """응답 모델 adapter 를 미리 생성해 캐시에 올린다.
+
+    Args:
+        *client_classes: 워밍업할 클라이언트 클래스. 생략하면 ``shopby_sdk.clients`` /
+            ``shopby_sdk.shop`` 의 모든 도메인 클라이언트.
+        extra_types: 메서드 반환 타입 외에 추가로 워밍업할 타입.
+
+    Returns:
+        캐시에 올라간 서로 다른 타입 수
+    """
+    classes = client_classes or _discover_client_classes()
+    targets = [tp for cls in classes for tp in response_types(cls)]
+    targets.extend(extra_types)
+    warmed = set()
+    for tp in targets:
+        get_type_adapter(tp)
+        try:
+            warmed.add(tp)
+        except TypeError:
+            continue
+    return len(warmed)
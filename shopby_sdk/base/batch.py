@@ -0,0 +1,158 @@
+"""상세 조회 API 의 동시성 제한 일괄 조회 (``fetch_many``).
+
+상품/주문 상세처럼 id 하나당 한 번 호출하는 API 를 많은 id 에 대해 호출할 때,
+``asyncio.Semaphore`` + ``asyncio.gather`` 로 전부 태스크를 만들어 두는 방식은 id 수만큼
+코루틴·결과가 메모리에 쌓이고, 하나가 실패하면 결과를 모으기 어렵다.
+
+``fetch_many`` 는
+
+- 동시에 최대 ``concurrency`` 건만 요청하고 (id 목록은 필요한 만큼만 꺼낸다),
+- 끝나는 대로(또는 ``ordered=True`` 면 입력 순서대로) ``BatchResult`` 를 스트리밍하며,
+- 개별 실패는 ``BatchResult.error`` 에 담고 나머지 조회를 계속한다.
+
+소비자가 결과를 가져가지 않으면 새 요청을 시작하지 않으므로(backpressure),
+10만 건을 돌려도 메모리는 ``concurrency`` 건 분량으로 일정하다.
+
+``fetch_many`` 위에 만든 배치 작업(대량 회원 수정, 쿠폰 발급, 증분 동기화, 재고 동기화)은 입력을
+``as_async_iter`` 로 읽고 사용자 콜백을 ``call_handler`` 로 부른다.
+
+Example:
+    ```python
+    async for result in client.fetch_many(client.get_product_detail_v3, product_nos, concurrency=20):
+        if result.ok:
+            save(result.value)
+        else:
+            failed.append((result.key, result.error))
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+_Key = TypeVar("_Key")
+_Value = TypeVar("_Value")
+
+DEFAULT_CONCURRENCY = 16
+"""``fetch_many`` 동시 요청 수 기본값."""
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult(Generic[_Key, _Value]):
+    """일괄 조회의 id 1건 결과.
+
+    Attributes:
+        key: 조회한 id
+        value: 조회 결과 (실패 시 None)
+        error: 실패 시 발생한 예외 (성공 시 None)
+    """
+
+    key: _Key
+    value: _Value | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def fetch_many(
+    fetch: Callable[[_Key], Awaitable[_Value]],
+    keys: Iterable[_Key] | AsyncIterable[_Key],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    ordered: bool = False,
+) -> AsyncGenerator[BatchResult[_Key, _Value], None]:
+    """keys 마다 ``fetch(key)`` 를 최대 concurrency 건씩 동시에 호출해 결과를 스트리밍한다.
+
+    Args:
+        fetch: id 하나를 조회하는 코루틴 함수 (예: ``client.get_order_detail``).
+        keys: 조회할 id. 리스트뿐 아니라 제너레이터·async iterable(예: ``iter_*`` 목록
+            순회 결과를 변환한 것)도 받으며, 진행에 필요한 만큼만 꺼낸다.
+        concurrency: 동시 요청 수.
+        ordered: True 면 keys 순서대로 내보낸다. 앞선 id 가 느리면 뒤의 결과는 기다리지만
+            동시 요청 수는 그대로 유지된다. False 면 끝나는 순서대로 내보낸다.
+
+    Note:
+        ``Exception`` 은 결과로 수집되고, 취소(``CancelledError``) 등은 그대로 전파된다.
+        제너레이터를 중간에 닫으면 진행 중인 요청은 취소된다.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    async def run(key: _Key) -> BatchResult[_Key, _Value]:
+        try:
+            return BatchResult(key, await fetch(key))
+        except Exception as exc:
+            return BatchResult(key, error=exc)
+
+    key_iter = as_async_iter(keys)
+    exhausted = False
+
+    async def next_task() -> asyncio.Task[BatchResult[_Key, _Value]] | None:
+        nonlocal exhausted
+        if exhausted:
+            return None
+        try:
+            key = await anext(key_iter)
+        except StopAsyncIteration:
+            exhausted = True
+            return None
+        return asyncio.ensure_future(run(key))
+
+    if ordered:
+        window: deque[asyncio.Task[BatchResult[_Key, _Value]]] = deque()
+        try:
+            while True:
+                while len(window) < concurrency and (task := await next_task()) is not None:
+                    window.append(task)
+                if not window:
+                    return
+                yield await window.popleft()
+        finally:
+            await _cancel(window)
+    else:
+        running: set[asyncio.Task[BatchResult[_Key, _Value]]] = set()
+        try:
+            while True:
+                while len(running) < concurrency and (task := await next_task()) is not None:
+                    running.add(task)
+                if not running:
+                    return
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            await _cancel(running)
+
+
+async def as_async_iter(items: Iterable[_Key] | AsyncIterable[_Key]) -> AsyncIterator[_Key]:
+    """리스트·제너레이터·async iterable 을 하나의 async iterator 로 읽는다 (필요한 만큼만 꺼낸다)."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def call_handler(handler: Callable[[Any], Awaitable[None] | None] | None, value: Any) -> None:
+    """동기/비동기 콜백 호출 (None 이면 무시, 코루틴을 반환하면 기다린다)."""
+    if handler is None:
+        return
+    result = handler(value)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _cancel(tasks: Iterable[asyncio.Task[object]]) -> None:
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
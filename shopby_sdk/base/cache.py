@@ -0,0 +1,209 @@
+"""거의 바뀌지 않는 조회 API 의 응답 캐시 (TTL + LRU, backend 교체 가능).
+
+전시 카테고리 트리·브랜드·상품정보고시 카테고리·쇼핑몰 정보처럼 거의 바뀌지 않는
+응답을 매 요청마다 다시 받아 검증하지 않도록, ``@cached(ttl=...)`` 가 붙은 메서드의
+반환값을 캐시한다. 캐시는 opt-in 이며 클라이언트 ``cache`` 인자로 켠다.
+
+- 키: 메서드 + 인자 + 호출 범위(base_url, 공통 헤더 = 쇼핑몰/자격증명, raw 모드).
+  같은 캐시를 여러 쇼핑몰 클라이언트가 공유해도 섞이지 않는다.
+- TTL: 메서드마다 ``@cached(ttl=...)`` 기본값이 있고 ``ResponseCache(ttls={...})`` 로
+  메서드별로 바꾼다 (0 이면 그 메서드는 캐시하지 않음).
+- 저장소: 기본은 프로세스 내 LRU(``InMemoryCacheBackend``). ``CacheBackend`` 를
+  구현하면 Redis 같은 외부 저장소를 쓸 수 있다 (값 직렬화는 backend 책임).
+- 무효화: ``await client.invalidate_cache(client.get_brands)`` 또는
+  ``await cache.invalidate(...)``. 인자가 없으면 전체를 비운다.
+
+오류 응답과 None 은 캐시하지 않는다. 캐시된 모델 객체는 호출자끼리 공유되므로 수정하지 않는다.
+
+Example:
+    ```python
+    cache = ResponseCache(maxsize=512, ttls={"get_brands": 60})
+    products = ShopbyServerProductsApiClient(token, system_key, cache=cache)
+    display = ShopbyServerDisplayApiClient(token, system_key, cache=cache)
+
+    await products.get_brands()  # 조회
+    await products.get_brands()  # 캐시
+    await products.invalidate_cache(products.get_brands)  # 브랜드 수정 후
+    ```
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_Client = TypeVar("_Client")
+
+DEFAULT_CACHE_MAXSIZE = 1024
+"""``InMemoryCacheBackend`` 최대 항목 수 기본값."""
+
+
+class CacheBackend(Protocol):
+    """응답 캐시 저장소.
+
+    키는 ``"{메서드 qualname}|{digest}"`` 형식의 문자열이다. 없는 키는 None 을 돌려준다.
+    """
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """prefix 로 시작하는 키를 모두 삭제."""
+        ...
+
+    async def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """프로세스 내 LRU + TTL 저장소.
+
+    항목마다 만료 시각을 두고, 가득 차면 가장 오래 쓰이지 않은 항목부터 버린다.
+    만료된 항목은 조회될 때 지운다.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache:
+    """``@cached`` 메서드들이 쓰는 응답 캐시.
+
+    Args:
+        backend: 저장소. None 이면 ``InMemoryCacheBackend(maxsize)``.
+        maxsize: 기본 저장소의 최대 항목 수
+        ttls: 메서드별 TTL(초) 덮어쓰기. 키는 메서드 이름(``"get_brands"``) 또는
+            qualname(``"ShopbyServerProductsApiClient.get_brands"``). 0 이면 캐시하지 않음.
+
+    Attributes:
+        hits: 캐시 적중 수
+        misses: 캐시 미스 수 (실제 요청 수)
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        ttls: Mapping[str, float] | None = None,
+    ):
+        self.backend: CacheBackend = backend if backend is not None else InMemoryCacheBackend(maxsize)
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, func: Callable[..., Any], default: float) -> float:
+        return self.ttls.get(func.__qualname__, self.ttls.get(func.__name__, default))
+
+    async def invalidate(self, *methods: Callable[..., Any] | str) -> None:
+        """지정한 메서드(또는 qualname)의 캐시를 모든 쇼핑몰·인자에 대해 지운다. 인자가 없으면 전체."""
+        if not methods:
+            await self.backend.clear()
+            return
+        for method in methods:
+            qualname = method if isinstance(method, str) else method.__qualname__
+            await self.backend.delete_prefix(f"{qualname}|")
+
+
+def resolve_response_cache(cache: bool | ResponseCache | None) -> ResponseCache | None:
+    """클라이언트 ``cache`` 인자를 캐시로 변환 (True 면 클라이언트 전용 ``ResponseCache()``)."""
+    if isinstance(cache, ResponseCache):
+        return cache
+    return ResponseCache() if cache else None
+
+
+def cached(
+    ttl: float,
+) -> Callable[
+    [Callable[Concatenate[_Client, _P], Awaitable[_R]]],
+    Callable[Concatenate[_Client, _P], Awaitable[_R]],
+]:
+    """클라이언트 메서드의 반환값을 ``self._response_cache`` 에 캐시하는 데코레이터.
+
+    캐시가 꺼진 클라이언트(``_response_cache is None``)에서는 그대로 호출한다.
+
+    Args:
+        ttl: 기본 TTL(초). ``ResponseCache.ttls`` 로 덮어쓴다.
+    """
+
+    def decorator(
+        func: Callable[Concatenate[_Client, _P], Awaitable[_R]],
+    ) -> Callable[Concatenate[_Client, _P], Awaitable[_R]]:
+        @functools.wraps(func)
+        async def wrapper(self: _Client, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+            cache: ResponseCache | None = getattr(self, "_response_cache", None)
+            if cache is None:
+                return await func(self, *args, **kwargs)
+            method_ttl = cache.ttl_for(func, ttl)
+            if method_ttl <= 0:
+                return await func(self, *args, **kwargs)
+
+            key = f"{func.__qualname__}|{call_digest(self, args, kwargs)}"
+            value = await cache.backend.get(key)
+            if value is not None:
+                cache.hits += 1
+                return value
+            cache.misses += 1
+            value = await func(self, *args, **kwargs)
+            if value is not None:
+                await cache.backend.set(key, value, method_ttl)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def call_digest(client: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """호출 범위(base_url, 공통 헤더 = 쇼핑몰/자격증명, raw 모드) + 인자의 해시.
+
+    자격증명이 캐시 키에 그대로 남지 않도록 해시한다.
+    """
+    scope = (
+        client.base_url,
+        sorted(client.common_header.items()),
+        getattr(client, "_raw", False),
+        getattr(client, "_json_backend", None),
+    )
+    return hashlib.blake2b(repr((scope, args, sorted(kwargs.items()))).encode(), digest_size=16).hexdigest()
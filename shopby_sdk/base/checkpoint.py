@@ -0,0 +1,43 @@
+"""장시간 배치 작업의 JSON 상태 파일 (원자적 저장).
+
+증분 동기화의 high-water mark, 대량 회원 수정·쿠폰 발급의 처리 위치, export 의 구간 진행 상태처럼
+중단 후 이어서 실행하기 위한 상태를 JSON 파일 하나에 남긴다. 임시 파일에 쓴 뒤 ``os.replace`` 로
+바꿔치기하므로 저장 도중 프로세스가 죽어도 파일에는 이전 상태나 새 상태 중 하나만 남는다.
+
+Example:
+    ```python
+    state_file = JsonStateFile("job.checkpoint.json")
+    state = state_file.load() or {"offset": 0}
+    ...
+    state_file.save({**state, "offset": 1000})
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+class JsonStateFile:
+    """JSON 상태 파일 하나 (임시 파일 + ``os.replace`` 로 원자적 저장).
+
+    Args:
+        path: 상태 파일 경로. 저장 시 같은 디렉터리에 ``<이름>.tmp`` 를 만든다.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+
+    def load(self) -> Any | None:
+        """저장된 상태 (파일이 없으면 None)."""
+        if not self.path.exists():
+            return None
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+    def save(self, state: Any) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, self.path)
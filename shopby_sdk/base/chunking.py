@@ -0,0 +1,110 @@
+"""id 목록 한도가 있는 다건 조회 API 의 자동 분할 (chunking).
+
+``search_products_by_list`` / ``get_global_nos_by_product_nos`` 처럼 id 목록을 받는 API 는
+서버가 한 번에 받는 id 수를 제한한다(대부분 100개). ``fetch_chunked`` 는 id 목록을 한도
+크기로 나눠 동시에 조회하고, 응답을 id 순서대로 하나로 합친다. 호출자는 5만 개를 넘겨도 된다.
+
+- 한도 이하면 그대로 한 번 호출한다.
+- 동시 요청은 ``concurrency`` 개로 제한되며, 클라이언트의 rate limiter·재시도가 모든 요청에
+  그대로 적용된다.
+- 한 조각이라도 실패하면 진행 중인 조회를 취소하고 그 예외를 올린다.
+- raw 모드(dict/list)도 합치지만, ``raw="bytes"`` 는 합칠 수 없어 한도를 넘기면 요청을 보내기 전에 TypeError.
+
+Example:
+    ```python
+    items = await client.get_reservation_infos_by_product_nos(product_nos)  # 50,000개 → 500회, 4개씩 동시
+    ```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+
+from shopby_sdk.base.batch import fetch_many
+from shopby_sdk.base.jsonlib import RawMode
+
+_Id = TypeVar("_Id")
+_R = TypeVar("_R")
+
+DEFAULT_CHUNK_CONCURRENCY = 4
+"""자동 분할 조회의 동시 요청 수 기본값."""
+
+
+def chunked(ids: Sequence[_Id], size: int) -> list[list[_Id]]:
+    """ids 를 size 개씩 나눈 목록."""
+    if size < 1:
+        raise ValueError("size must be >= 1")
+    return [list(ids[i : i + size]) for i in range(0, len(ids), size)]
+
+
+async def fetch_chunked(
+    fetch: Callable[[list[_Id]], Awaitable[_R]],
+    ids: Sequence[_Id],
+    *,
+    chunk_size: int,
+    merge: Callable[[list[_R]], _R],
+    concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
+    raw: RawMode = False,
+) -> _R:
+    """ids 를 chunk_size 개씩 동시에 조회해 merge 로 합친 응답.
+
+    Args:
+        fetch: id 조각 하나를 조회하는 함수 (한도 이하의 id 만 받는다)
+        ids: 전체 id 목록
+        chunk_size: API 의 id 수 한도
+        merge: 조각 응답들(id 순서)을 하나로 합치는 함수 (예: ``concat_responses``)
+        concurrency: 동시에 조회할 조각 수
+        raw: fetch 하는 클라이언트의 raw 모드 (``client._raw``). ``"bytes"`` 면 조각을 합칠 수 없다.
+
+    Raises:
+        TypeError: ``raw="bytes"`` 응답을 합쳐야 하는 경우 (요청을 보내기 전에 올린다)
+    """
+    if len(ids) <= chunk_size:
+        return await fetch(list(ids))
+    if raw == "bytes":
+        raise TypeError(f'raw="bytes" responses cannot be merged; pass at most {chunk_size} ids per call')
+
+    values: list[_R] = []
+    results = fetch_many(fetch, chunked(ids, chunk_size), concurrency=concurrency, ordered=True)
+    try:
+        async for result in results:
+            if result.error is not None:
+                raise result.error
+            values.append(result.value)  # type: ignore[arg-type]
+    finally:
+        await results.aclose()
+    return merge(values)
+
+
+def concat_responses(*fields: str) -> Callable[[list[Any]], Any]:
+    """조각 응답의 목록 필드를 이어 붙이는 merge 함수.
+
+    응답이 list 면 그대로 이어 붙이고, 모델/dict 면 fields(snake_case 필드명, dict 는 camelCase
+    키)의 목록을 이어 붙인 첫 응답의 사본을 만든다. 모든 조각에서 None 인 필드는 None 으로 둔다.
+    """
+
+    def merge(values: list[Any]) -> Any:
+        first = values[0]
+        if isinstance(first, list):
+            return [item for value in values for item in value]
+        if isinstance(first, bytes):
+            raise TypeError('raw="bytes" responses cannot be merged; pass at most one chunk of ids')
+        if isinstance(first, BaseModel):
+            return first.model_copy(update={name: _concat(getattr(v, name) for v in values) for name in fields})
+        return {**first, **{to_camel(name): _concat(v.get(to_camel(name)) for v in values) for name in fields}}
+
+    return merge
+
+
+def _concat(parts: Any) -> list[Any] | None:
+    merged: list[Any] | None = None
+    for part in parts:
+        if part is not None:
+            if merged is None:
+                merged = []
+            merged.extend(part)
+    return merged
@@ -0,0 +1,94 @@
+"""동시에 진행 중인 같은 GET 요청 합치기 (single-flight).
+
+트래픽이 몰릴 때 여러 코루틴이 같은 인기 상품·섹션을 동시에 조회하면 호출마다
+upstream 요청이 하나씩 나간다. ``RequestCoalescer`` 는 같은 요청(메서드 + URL + 쿼리 +
+헤더)이 이미 진행 중이면 새로 보내지 않고 그 응답을 기다려 함께 받는다.
+
+- 합치는 대상은 GET 뿐이다. 완료된 응답은 보관하지 않는다 (캐시는 ``shopby_sdk.base.cache``).
+- 헤더(쇼핑몰 자격증명, platform/language, version)가 다르면 다른 요청으로 본다.
+- upstream 요청은 호출자와 분리된 태스크로 실행되므로, 먼저 요청한 호출자가 취소되어도
+  기다리는 다른 호출자는 응답을 받는다. 오류는 기다리던 호출자 모두에게 전달된다.
+- 재시도·rate limit 은 합쳐진 요청 하나에 한 번만 적용된다.
+
+Example:
+    ```python
+    coalescer = RequestCoalescer()
+    client = ShopbyShopProductApiClient(client_id, coalesce=coalescer)
+    await asyncio.gather(*(client.get_product(123) for _ in range(50)))  # upstream 1회
+    coalescer.coalescing_ratio  # 0.98
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+import httpx
+from httpx import Response
+
+
+class RequestCoalescer:
+    """진행 중인 같은 요청을 하나로 합치는 single-flight.
+
+    Attributes:
+        requests: 합치기 대상으로 들어온 요청 수
+        upstream_requests: 실제로 보낸 요청 수
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[Response]] = {}
+        self.requests = 0
+        self.upstream_requests = 0
+
+    @property
+    def coalesced(self) -> int:
+        """다른 요청의 응답을 받아 간 요청 수."""
+        return self.requests - self.upstream_requests
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """합쳐진 요청 비율 (0 이면 합쳐진 적 없음)."""
+        return self.coalesced / self.requests if self.requests else 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def reset_stats(self) -> None:
+        self.requests = 0
+        self.upstream_requests = 0
+
+    async def run(self, key: Hashable, send: Callable[[], Awaitable[Response]]) -> Response:
+        """key 요청이 진행 중이면 그 응답을, 아니면 ``send()`` 로 보낸 응답을 반환."""
+        self.requests += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.upstream_requests += 1
+            task = asyncio.ensure_future(send())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Response]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 기다리던 호출자가 모두 취소된 경우 "never retrieved" 경고 방지
+
+
+def request_key(method: str, url: str, kwargs: dict[str, Any]) -> Hashable | None:
+    """합칠 수 있는 요청이면 요청 식별 키, 아니면 None (GET 이 아니거나 본문이 있는 경우)."""
+    if method.upper() != "GET" or any(name in kwargs for name in ("content", "data", "files", "json")):
+        return None
+    full_url = httpx.URL(url, params=kwargs.get("params"))
+    headers = kwargs.get("headers") or {}
+    return str(full_url), tuple(sorted((name.lower(), value) for name, value in headers.items()))
+
+
+def resolve_coalescer(coalesce: bool | RequestCoalescer | None) -> RequestCoalescer | None:
+    """클라이언트 ``coalesce`` 인자를 coalescer 로 변환 (True 면 클라이언트 전용 ``RequestCoalescer()``)."""
+    if isinstance(coalesce, RequestCoalescer):
+        return coalesce
+    return RequestCoalescer() if coalesce else None
@@ -0,0 +1,173 @@
+"""조회 기간(date range)을 API 한도 안의 구간(window)으로 나누기.
+
+주문/클레임/휴면회원 같은 기간 조회 API 는 한 번에 조회할 수 있는 기간이 제한되어
+있거나(예: 주문 최대 3개월), 기간이 길면 페이지 수가 너무 많아진다. 긴 기간을 일정
+일수의 구간으로 나눠 구간마다 조회한다.
+
+``iter_sharded`` 는 구간들을 최대 ``concurrency`` 개씩 동시에 조회하고, 결과는 구간 순서
+(과거 → 최근)대로 이어 붙여 내보낸다. 구간 하나의 조회는 각 클라이언트의 ``iter_*``
+전체 페이지 순회를 그대로 쓴다. 맨 앞 구간은 받는 대로 내보내고, 뒤에서 미리 조회하는 구간은
+구간마다 최대 ``buffer_size`` 개까지만 쌓은 뒤 차례가 올 때까지 조회를 멈추므로 기간이 길어도
+메모리는 ``concurrency × buffer_size`` 항목 (+ 구간별 진행 중인 페이지) 안에서 유지된다.
+
+Example:
+    ```python
+    for window in split_date_range(date(2025, 1, 1), date(2025, 12, 31), days=30):
+        await client.get_claims(window.start, window.end, ...)
+
+    async for order in iter_sharded(
+        lambda w: client.iter_orders(start_ymd=w.start, end_ymd=w.end),
+        date(2025, 1, 1),
+        date(2025, 12, 31),
+        days=30,
+    ):
+        ...
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, TypeVar
+
+from shopby_sdk.base.kst import KST
+
+_Item = TypeVar("_Item")
+
+DEFAULT_SHARD_CONCURRENCY = 4
+"""``iter_sharded`` 동시 조회 구간 수 기본값."""
+
+DEFAULT_SHARD_BUFFER = 1000
+"""``iter_sharded`` 가 미리 조회하는 구간마다 쌓아 두는 최대 항목 수 기본값."""
+
+_WINDOW_DONE = object()
+
+
+@dataclass(frozen=True, slots=True)
+class DateWindow:
+    """양 끝을 포함하는 날짜 구간 [start, end]."""
+
+    start: date
+    end: date
+
+    @property
+    def key(self) -> str:
+        """구간 식별자 (``2025-01-01_2025-01-30``). 파일명·체크포인트 키로 사용."""
+        return f"{self.start.isoformat()}_{self.end.isoformat()}"
+
+    @property
+    def start_datetime(self) -> datetime:
+        """구간 시작일 00:00:00 (KST)."""
+        return datetime.combine(self.start, time.min, tzinfo=KST)
+
+    @property
+    def end_datetime(self) -> datetime:
+        """구간 종료일 23:59:59 (KST). ``yyyy-MM-dd HH:mm:ss`` 파라미터용으로 초 단위."""
+        return datetime.combine(self.end, time(23, 59, 59), tzinfo=KST)
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+
+def split_date_range(start: date, end: date, *, days: int) -> list[DateWindow]:
+    """[start, end] 를 최대 days 일짜리 연속 구간으로 나눈다 (양 끝 포함, 겹침 없음).
+
+    Raises:
+        ValueError: days < 1 이거나 start > end 인 경우
+    """
+    if days < 1:
+        raise ValueError("days must be >= 1")
+    if start > end:
+        raise ValueError("start must be <= end")
+    windows: list[DateWindow] = []
+    cursor = start
+    while cursor <= end:
+        window_end = min(end, cursor + timedelta(days=days - 1))
+        windows.append(DateWindow(cursor, window_end))
+        cursor = window_end + timedelta(days=1)
+    return windows
+
+
+async def iter_sharded(
+    fetch_window: Callable[[DateWindow], AsyncIterable[_Item]],
+    start: date,
+    end: date,
+    *,
+    days: int,
+    max_days: int | None = None,
+    concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    buffer_size: int = DEFAULT_SHARD_BUFFER,
+) -> AsyncIterator[_Item]:
+    """[start, end] 를 days 일 구간으로 나눠 동시에 조회하고, 구간 순서대로 이어서 내보낸다.
+
+    Args:
+        fetch_window: 구간 하나의 항목을 내보내는 함수 (예: ``iter_*`` 전체 페이지 순회).
+        start: 조회 시작일
+        end: 조회 종료일
+        days: 구간 일수
+        max_days: API 가 허용하는 최대 조회 일수. days 가 이를 넘으면 ValueError.
+        concurrency: 동시에 조회할 구간 수. 구간 안의 페이지 prefetch 와 곱해진 만큼
+            요청이 동시에 나가므로 rate limit 을 고려해 작게 잡는다.
+        buffer_size: 미리 조회하는 구간마다 쌓아 둘 최대 항목 수. 다 차면 그 구간 조회를 멈춘다.
+
+    Note:
+        맨 앞 구간이 끝나면 다음 구간 조회를 시작해 항상 최대 ``concurrency`` 개 구간을 조회한다.
+        구간이 실패하면 그 구간 차례에 (앞서 받은 항목을 내보낸 뒤) 예외를 올리고, 진행 중인 구간
+        조회는 취소한다.
+
+    Raises:
+        ValueError: days 가 max_days 를 넘거나 split_date_range 인자가 잘못된 경우
+    """
+    if max_days is not None and days > max_days:
+        raise ValueError(f"days must be <= {max_days} for this API")
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be >= 1")
+    windows = iter(split_date_range(start, end, days=days))
+
+    async def produce(window: DateWindow, queue: asyncio.Queue[Any]) -> None:
+        try:
+            async for item in fetch_window(window):
+                await queue.put(item)
+        except Exception as exc:
+            await queue.put(_WindowError(exc))
+        else:
+            await queue.put(_WINDOW_DONE)
+
+    active: deque[tuple[asyncio.Queue[Any], asyncio.Task[None]]] = deque()
+
+    def start_next() -> None:
+        window = next(windows, None)
+        if window is not None:
+            queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=buffer_size)
+            active.append((queue, asyncio.ensure_future(produce(window, queue))))
+
+    try:
+        for _ in range(concurrency):
+            start_next()
+        while active:
+            item = await active[0][0].get()
+            if item is _WINDOW_DONE:
+                active.popleft()
+                start_next()
+            elif isinstance(item, _WindowError):
+                raise item.error
+            else:
+                yield item
+    finally:
+        tasks = [task for _, task in active]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@dataclass(frozen=True, slots=True)
+class _WindowError:
+    error: Exception
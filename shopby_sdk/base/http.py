@@ -0,0 +1,640 @@
+"""server-api / shop-api 클라이언트 공통 HTTP 커넥션 풀.
+
+도메인 클라이언트 메서드는 호출마다 ``httpx.AsyncClient`` 를 새로 열지 않고,
+API 클라이언트가 소유(또는 주입받은)한 **장수명 AsyncClient 하나**를 통해 요청한다.
+TCP/TLS 핸드셰이크를 커넥션 풀의 keep-alive 로 재사용하므로 대량 호출 시
+지연과 CPU 사용량이 크게 줄어든다.
+
+Example:
+    ```python
+    # 1) 클라이언트가 풀을 소유 — async with 로 수명 관리
+    async with ShopbyServerProductsApiClient(token, system_key) as client:
+        await client.get_product_detail_v3(12345)
+
+    # 2) 여러 도메인 클라이언트가 하나의 풀을 공유 (주입한 쪽이 닫는다)
+    http = create_http_client(limits=httpx.Limits(max_connections=200), http2=True)
+    products = ShopbyServerProductsApiClient(token, system_key, http_client=http)
+    orders = ShopbyServerOrderApiClient(token, system_key, http_client=http)
+    ...
+    await http.aclose()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, Self, TypedDict, TypeVar
+
+import httpx
+from httpx import HTTPStatusError, Response
+
+from shopby_sdk.base.adapter import get_type_adapter
+from shopby_sdk.base.cache import ResponseCache, resolve_response_cache
+from shopby_sdk.base.coalesce import RequestCoalescer, request_key, resolve_coalescer
+from shopby_sdk.base.jsonlib import JsonBackend, RawMode, json_loads
+from shopby_sdk.base.metrics import (
+    MetricsSink,
+    PhaseTimer,
+    RequestMetrics,
+    attach_metrics,
+    emit,
+    endpoint_template,
+    resolve_metrics_sink,
+    take_metrics,
+)
+from shopby_sdk.base.ratelimit import AdaptiveRateLimiter, resolve_rate_limiter
+from shopby_sdk.base.retry import RetryPolicy, resolve_retry_policy
+from shopby_sdk.base.revalidate import RevalidatingCache, current_revalidation, resolve_revalidating_cache
+from shopby_sdk.base.tracing import ATTEMPTS_KEY, CallSpan, model_name, resolve_tracer
+
+logger = logging.getLogger(__name__)
+
+_ResponseType = TypeVar("_ResponseType")
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+"""기본 커넥션 풀 한도 (최대 동시 커넥션 100, keep-alive 유지 20개/30초)."""
+
+
+def create_http_client(
+    *,
+    limits: httpx.Limits | None = None,
+    timeout: httpx.Timeout | float | None = None,
+    http2: bool = False,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """SDK 클라이언트에 주입할 풀링된 ``httpx.AsyncClient`` 생성.
+
+    Args:
+        limits: 커넥션 풀 한도. 기본값 ``DEFAULT_LIMITS``.
+        timeout: 요청 타임아웃. None 이면 httpx 기본값(5초).
+        http2: HTTP/2 사용 여부. ``h2`` 패키지 필요 (``pip install "httpx[http2]"``).
+        **kwargs: ``httpx.AsyncClient`` 에 그대로 전달 (proxy, verify 등).
+
+    Note:
+        base_url / 인증 헤더는 지정하지 않는다. 요청마다 각 API 클라이언트의
+        ``base_url`` 과 ``common_header`` 가 붙으므로, 하나의 풀을 서로 다른
+        도메인·자격증명의 클라이언트가 함께 써도 된다.
+    """
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    return httpx.AsyncClient(limits=limits or DEFAULT_LIMITS, http2=http2, **kwargs)
+
+
+class ClientOptions(TypedDict, total=False):
+    """server-api / shop-api 클라이언트 공통 생성자 키워드 인자 (``**options``).
+
+    모든 요청은 keep-alive 커넥션 풀(``http_client``)을 공유한다. 풀을 직접 만든
+    경우 ``async with client:`` 또는 ``await client.aclose()`` 로 닫는다.
+
+    Attributes:
+        on_response: 모든 응답마다 호출되는 콜백(검증/raise 전). 응답 헤더
+            (예: ``ratelimit-available-level``)·상태코드 관찰용. 예외는 무시된다.
+        raw: True 면 모든 메서드가 Pydantic 모델 대신 디코딩한 JSON(dict/list)을
+            그대로 반환한다. 검증을 건너뛰어 스키마 불일치에도 죽지 않으며 응답을
+            무손실로 받는다. ``"bytes"`` 면 본문 bytes 를 디코딩 없이 반환한다.
+            대량 백필·raw 적재용 (``shopby_sdk.base.jsonlib`` 참고). 기본값 False.
+        json_backend: raw dict 경로의 JSON 디코더. ``"stdlib"``(기본) / ``"orjson"``
+            (``pip install orjson`` 필요) / ``"auto"``(설치되어 있으면 orjson).
+        http_client: 주입할 ``httpx.AsyncClient``. 여러 도메인 클라이언트가 하나의
+            풀을 공유할 때 사용하며(``create_http_client``), 이 경우 풀을 닫는 책임은
+            주입한 쪽에 있다. None 이면 첫 요청 시 생성.
+        limits: 직접 생성하는 풀의 커넥션 한도 (``http_client`` 주입 시 무시).
+        timeout: 직접 생성하는 풀의 타임아웃 (``http_client`` 주입 시 무시).
+        http2: 직접 생성하는 풀의 HTTP/2 사용 여부. ``h2`` 패키지 필요.
+        rate_limit: ``ratelimit-available-level`` 헤더 기반 적응형 rate limiter.
+            True 면 같은 자격증명(server: systemKey/accessToken, shop: clientId)을 쓰는 클라이언트끼리
+            limiter 하나를 공유하고, ``AdaptiveRateLimiter`` 를 넘기면 그것을 쓴다. 기본값 False(제한 없음).
+        retry: 429/5xx/네트워크 오류 재시도 정책. True 면 기본 ``RetryPolicy()``
+            (GET 등 멱등 메서드만, 최대 3회, backoff + jitter, ``Retry-After`` 준수).
+            기본값 False(재시도 없음).
+        cache: 거의 바뀌지 않는 조회(``@cached`` 메서드) 응답 캐시. True 면 이 클라이언트
+            전용 ``ResponseCache()`` (LRU + 메서드별 TTL), ``ResponseCache`` 를 넘기면 그것을
+            공유한다. 기본값 False(캐시 없음) (``shopby_sdk.base.cache`` 참고).
+        coalesce: 동시에 진행 중인 같은 GET 요청을 upstream 요청 하나로 합친다(single-flight).
+            True 면 이 클라이언트 전용 ``RequestCoalescer()``, 인스턴스를 넘기면 그것을 쓰며
+            합쳐진 비율은 ``coalescing_ratio`` 로 본다. 기본값 False (``shopby_sdk.base.coalesce`` 참고).
+        revalidate: ``@revalidated`` 메서드의 조건부 요청(ETag / If-Modified-Since) + 본문 해시
+            재검증 캐시. 304 나 같은 본문이면 검증 없이 보관한 모델을 반환한다. True 면 이
+            클라이언트 전용 ``RevalidatingCache()``. 기본값 False (``shopby_sdk.base.revalidate`` 참고).
+        metrics: 요청 계측 sink (``record(RequestMetrics)`` 객체 또는 함수). 요청마다 연결/서버 대기/
+            본문 수신/파싱/검증 시간을 메서드·엔드포인트 템플릿·version·상태 태그와 함께 넘긴다.
+            기본값 None(계측 없음) (``shopby_sdk.base.metrics`` 참고).
+        tracing: SDK 메서드 호출마다 OpenTelemetry span (메서드·엔드포인트 템플릿·version·페이지·응답 크기·
+            재시도 횟수·rate limit level 속성, 파싱/검증 자식 span). True 면 전역 TracerProvider 의 tracer,
+            tracer 를 넘기면 그것을 쓴다. opentelemetry-api 가 없으면 꺼진다. 기본값 False
+            (``shopby_sdk.base.tracing`` 참고).
+    """
+
+    on_response: Callable[[Response], None] | None
+    raw: RawMode
+    json_backend: JsonBackend
+    http_client: httpx.AsyncClient | None
+    limits: httpx.Limits | None
+    timeout: httpx.Timeout | float | None
+    http2: bool
+    rate_limit: bool | AdaptiveRateLimiter
+    retry: bool | RetryPolicy
+    cache: bool | ResponseCache
+    coalesce: bool | RequestCoalescer
+    revalidate: bool | RevalidatingCache
+    metrics: MetricsSink | Callable[[RequestMetrics], None] | None
+    tracing: bool | Any
+
+
+class HttpSession:
+    """공유 AsyncClient 위에 base_url 과 공통 헤더를 얹은 요청 창구.
+
+    기존 ``async with httpx.AsyncClient(base_url=..., headers=...) as client:`` 와
+    같은 모양으로 쓸 수 있도록 async context manager 를 지원하지만, 종료 시
+    커넥션을 닫지 않는다(풀은 API 클라이언트가 관리).
+
+    트레이싱이 켜져 있으면 블록 하나(= SDK 메서드 호출 하나)가 span 하나가 된다
+    (``shopby_sdk.base.tracing``).
+    """
+
+    __slots__ = ("_owner", "_base_url", "_headers", "_operation", "_call_span")
+
+    def __init__(
+        self,
+        owner: PooledHttpClientMixin,
+        base_url: str,
+        headers: dict[str, str],
+        operation: str,
+    ):
+        self._owner = owner
+        self._base_url = base_url.rstrip("/")
+        self._headers = headers
+        self._operation = operation
+        self._call_span: CallSpan | None = None
+
+    async def __aenter__(self) -> Self:
+        tracer = self._owner._tracer
+        if tracer is not None:
+            self._call_span = CallSpan(tracer, type(self._owner).__name__, self._operation)
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: BaseException | None, tb: object) -> None:
+        if self._call_span is not None:
+            self._call_span.end(exc)
+            self._call_span = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        idempotent: bool | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        """요청 전송.
+
+        Args:
+            idempotent: 재시도 허용 여부. None 이면 메서드로 판단(GET 등). 조회용 POST 는
+                True 로 재시도를 허용한다 (``shopby_sdk.base.retry``).
+        """
+        merged = {**self._headers, **headers} if headers else self._headers
+        call_span = self._call_span
+        if call_span is not None:
+            call_span.record_request(method, self._base_url + url, merged, kwargs.get("params"))
+        resp = await self._owner._send(
+            method, self._base_url + url, headers=merged, idempotent=idempotent, operation=self._operation, **kwargs
+        )
+        if call_span is not None:
+            call_span.record_response(resp)
+        return resp
+
+    async def get(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("DELETE", url, **kwargs)
+
+
+class PooledHttpClientMixin:
+    """장수명 ``httpx.AsyncClient`` 의 소유/주입/종료를 담당하는 믹스인.
+
+    - ``http_client`` 를 주입하면 그 풀을 그대로 쓰고, ``aclose()`` 에서 닫지 않는다.
+    - 주입하지 않으면 첫 요청 시 ``create_http_client`` 로 만들어 소유하고,
+      ``aclose()`` / ``async with`` 종료 시 닫는다.
+    - 소유한 풀은 생성된 이벤트 루프에 묶이므로, 다른 루프(예: ``asyncio.run``
+      반복 호출)에서 쓰이면 새 풀을 만든다.
+    - ``_share_http_from(other)`` 로 만든 파생 클라이언트는 원본의 풀을 따라가며
+      스스로 닫지 않는다.
+    - ``_rate_limiter`` 가 설정되어 있으면 모든 요청이 limiter 를 거치고, 응답으로
+      속도가 조절된다 (``shopby_sdk.base.ratelimit``).
+    - ``_retry_policy`` 가 설정되어 있으면 재시도 가능한 요청의 429/5xx 응답과 네트워크
+      오류를 backoff 후 재시도한다 (``shopby_sdk.base.retry``). 재시도도 limiter 를 거친다.
+    - ``_coalescer`` 가 설정되어 있으면 진행 중인 같은 GET 요청을 하나로 합친다
+      (``shopby_sdk.base.coalesce``). 합쳐진 요청에는 재시도·limiter 가 한 번만 적용된다.
+    - ``_response_cache`` 가 설정되어 있으면 ``@cached`` 메서드의 반환값을 캐시한다
+      (``shopby_sdk.base.cache``).
+    - ``@revalidated`` 메서드 호출 중이면 GET 에 보관한 응답의 검증 헤더
+      (If-None-Match / If-Modified-Since)를 붙인다 (``shopby_sdk.base.revalidate``).
+    - ``_metrics_sink`` 가 설정되어 있으면 요청마다 단계별 시간을 재서 응답에 붙이고,
+      ``handle_resp`` / ``raise_for_status`` 에서 디코딩 시간과 함께 sink 로 보낸다
+      (``shopby_sdk.base.metrics``).
+    - ``_tracer`` 가 설정되어 있으면 ``_session(operation)`` 블록마다 OpenTelemetry span 을 만든다
+      (``shopby_sdk.base.tracing``).
+    - ``handle_resp`` / ``raise_for_status`` 가 응답 검증·디코딩(raw 모드, JSON backend)과
+      ``on_response`` 콜백을 처리한다.
+
+    하위 클래스는 자격증명을 저장한 뒤 ``_init_client(base_url, **options)`` 를 호출하고,
+    ``common_header`` (인증 헤더)와 ``_rate_limit_key()`` (limiter 공유 단위)만 구현한다.
+    """
+
+    DEFAULT_BASE_URL: str
+    base_url: str
+    _on_response: Callable[[Response], None] | None = None
+    _raw: RawMode = False
+    _json_backend: JsonBackend = "stdlib"
+    _rate_limiter: AdaptiveRateLimiter | None = None
+    _retry_policy: RetryPolicy | None = None
+    _response_cache: ResponseCache | None = None
+    _coalescer: RequestCoalescer | None = None
+    _revalidating_cache: RevalidatingCache | None = None
+    _metrics_sink: MetricsSink | None = None
+    _tracer: Any = None
+
+    def _init_client(
+        self,
+        base_url: str | None,
+        *,
+        on_response: Callable[[Response], None] | None = None,
+        raw: RawMode = False,
+        json_backend: JsonBackend = "stdlib",
+        http_client: httpx.AsyncClient | None = None,
+        limits: httpx.Limits | None = None,
+        timeout: httpx.Timeout | float | None = None,
+        http2: bool = False,
+        rate_limit: bool | AdaptiveRateLimiter = False,
+        retry: bool | RetryPolicy = False,
+        cache: bool | ResponseCache = False,
+        coalesce: bool | RequestCoalescer = False,
+        revalidate: bool | RevalidatingCache = False,
+        metrics: MetricsSink | Callable[[RequestMetrics], None] | None = None,
+        tracing: bool | Any = False,
+    ) -> None:
+        """공통 생성자 옵션 적용 (``ClientOptions`` 참고). 자격증명을 저장한 뒤 호출한다."""
+        self.base_url = base_url or self.DEFAULT_BASE_URL
+        self._on_response = on_response
+        self._raw = raw
+        self._json_backend = json_backend
+        self._init_http(http_client, limits, timeout, http2)
+        self._rate_limiter = resolve_rate_limiter(rate_limit, *self._rate_limit_key())
+        self._retry_policy = resolve_retry_policy(retry)
+        self._response_cache = resolve_response_cache(cache)
+        self._coalescer = resolve_coalescer(coalesce)
+        self._revalidating_cache = resolve_revalidating_cache(revalidate)
+        self._metrics_sink = resolve_metrics_sink(metrics)
+        self._tracer = resolve_tracer(tracing)
+
+    def _rate_limit_key(self) -> tuple[str, ...]:
+        """``rate_limit=True`` 일 때 limiter 를 공유하는 단위 (도메인 + base_url + 자격증명)."""
+        raise NotImplementedError
+
+    def with_options(
+        self,
+        *,
+        raw: RawMode | None = None,
+        json_backend: JsonBackend | None = None,
+        rate_limit: bool | AdaptiveRateLimiter | None = None,
+    ) -> Self:
+        """raw 모드 / JSON backend / rate limiter 만 바꾼 같은 타입의 클라이언트를 반환.
+
+        커넥션 풀·rate limiter·재시도 정책·캐시·coalescer 는 원본과 공유하므로 호출 단위로 가볍게 만들어 써도 된다.
+        풀은 원본 클라이언트가 닫는다. rate_limit 은 생성자 인자와 같다 (True 면 자격증명별 공유 limiter,
+        False 면 제한 없음).
+
+        Example:
+            ```python
+            body: bytes = await client.with_options(raw="bytes").get_orders(...)
+            ```
+        """
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        if raw is not None:
+            clone._raw = raw
+        if json_backend is not None:
+            clone._json_backend = json_backend
+        if rate_limit is not None:
+            clone._rate_limiter = resolve_rate_limiter(rate_limit, *self._rate_limit_key())
+        clone._share_http_from(self)
+        return clone
+
+    def _model_client(self) -> Self:
+        """응답을 모델로 읽는 내부 헬퍼(페이지 순회·배치 등)용 클라이언트 (raw 모드면 ``raw=False`` 복제본)."""
+        return self.with_options(raw=False) if self._raw else self
+
+    def _init_http(
+        self,
+        http_client: httpx.AsyncClient | None,
+        limits: httpx.Limits | None,
+        timeout: httpx.Timeout | float | None,
+        http2: bool,
+    ) -> None:
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._http_parent: PooledHttpClientMixin | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        self._http_limits = limits
+        self._http_timeout = timeout
+        self._http2 = http2
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """요청에 사용하는 (공유 가능한) ``httpx.AsyncClient``."""
+        if self._http_parent is not None:
+            return self._http_parent.http_client
+        if self._owns_http_client:
+            loop = _running_loop()
+            if self._http_client is None or (loop is not None and self._http_loop not in (None, loop)):
+                self._http_client = create_http_client(
+                    limits=self._http_limits, timeout=self._http_timeout, http2=self._http2
+                )
+                self._http_loop = loop
+            elif self._http_loop is None:
+                self._http_loop = loop
+        assert self._http_client is not None
+        return self._http_client
+
+    def _share_http_from(self, other: PooledHttpClientMixin) -> None:
+        """other 의 커넥션 풀을 공유하도록 설정 (풀의 소유권은 other 에 남는다)."""
+        self._http_parent = other._http_parent or other
+        self._owns_http_client = False
+
+    def _session(self, operation: str, headers: dict[str, str] | None = None) -> HttpSession:
+        """요청 창구 생성. headers 가 None 이면 ``common_header`` 를 사용한다.
+
+        Args:
+            operation: 공개 SDK 메서드 이름 (예: ``"get_order_detail"``). 계측 태그·span 이름으로 쓴다.
+                내부 helper 에서 열더라도 사용자가 호출한 공개 메서드 이름을 넘긴다.
+        """
+        return HttpSession(self, self.base_url, self.common_header if headers is None else headers, operation)
+
+    @property
+    def common_header(self) -> dict[str, str]:
+        raise NotImplementedError
+
+    async def invalidate_cache(self, *methods: Any) -> None:
+        """응답 캐시·재검증 캐시에서 지정한 메서드의 항목을 지운다. 인자가 없으면 캐시 전체를 비운다.
+
+        캐시를 공유하는 다른 클라이언트·쇼핑몰의 항목도 함께 지워진다. 캐시가 꺼져 있으면 아무것도 하지 않는다.
+
+        Example:
+            ```python
+            await client.invalidate_cache(client.get_brands)
+            ```
+        """
+        if self._response_cache is not None:
+            await self._response_cache.invalidate(*methods)
+        if self._revalidating_cache is not None:
+            await self._revalidating_cache.invalidate(*methods)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        idempotent: bool | None = None,
+        operation: str | None = None,
+        **kwargs: Any,
+    ) -> Response:
+        if self._metrics_sink is not None:
+            kwargs["operation"] = operation
+        revalidation = current_revalidation()
+        if revalidation is not None and method.upper() == "GET":
+            kwargs["headers"] = revalidation.conditional_headers(kwargs.get("headers"))
+        coalescer = self._coalescer
+        if coalescer is not None and (key := request_key(method, url, kwargs)) is not None:
+            return await coalescer.run(key, lambda: self._send_retrying(method, url, idempotent=idempotent, **kwargs))
+        return await self._send_retrying(method, url, idempotent=idempotent, **kwargs)
+
+    async def _send_retrying(
+        self, method: str, url: str, *, idempotent: bool | None = None, **kwargs: Any
+    ) -> Response:
+        policy = self._retry_policy
+        if policy is None or not policy.allows(method, idempotent):
+            return await self._send_once(method, url, **kwargs)
+
+        attempt = 1
+        while True:
+            if self._metrics_sink is not None:
+                kwargs["attempt"] = attempt
+            try:
+                resp = await self._send_once(method, url, **kwargs)
+            except Exception as exc:
+                if attempt >= policy.max_attempts or not policy.should_retry_error(exc):
+                    raise
+                delay = policy.backoff(attempt)
+                logger.warning("%s %s failed (%r), retry %d in %.2fs", method, url, exc, attempt, delay)
+            else:
+                delay = policy.delay_for(resp, attempt) if attempt < policy.max_attempts else None
+                if delay is None:
+                    if self._tracer is not None:
+                        resp.extensions[ATTEMPTS_KEY] = attempt
+                    return resp
+                logger.warning("%s %s -> %d, retry %d in %.2fs", method, url, resp.status_code, attempt, delay)
+                self._emit_metrics(self._take_metrics(resp))
+                await resp.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_once(self, method: str, url: str, **kwargs: Any) -> Response:
+        if self._metrics_sink is not None:
+            return await self._send_once_measured(method, url, **kwargs)
+        limiter = self._rate_limiter
+        if limiter is None:
+            return await self.http_client.request(method, url, **kwargs)
+        await limiter.acquire()
+        resp = await self.http_client.request(method, url, **kwargs)
+        limiter.observe(resp)
+        return resp
+
+    async def _send_once_measured(
+        self, method: str, url: str, *, operation: str | None = None, attempt: int = 1, **kwargs: Any
+    ) -> Response:
+        assert self._metrics_sink is not None
+        headers = kwargs.get("headers") or {}
+        metrics = RequestMetrics(
+            operation, method, endpoint_template(httpx.URL(url).path), headers.get("version"), attempt=attempt
+        )
+        timer = PhaseTimer()
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": timer.trace}
+
+        limiter = self._rate_limiter
+        started = time.perf_counter()
+        if limiter is not None:
+            await limiter.acquire()
+            metrics.throttle = time.perf_counter() - started
+            started = time.perf_counter()
+        try:
+            resp = await self.http_client.request(method, url, **kwargs)
+        except Exception as exc:
+            metrics.total = time.perf_counter() - started
+            metrics.error = type(exc).__name__
+            timer.fill(metrics)
+            emit(self._metrics_sink, metrics)
+            raise
+        metrics.total = time.perf_counter() - started
+        metrics.status = resp.status_code
+        metrics.response_bytes = len(resp.content)
+        timer.fill(metrics)
+        if limiter is not None:
+            limiter.observe(resp)
+        attach_metrics(resp, metrics)
+        return resp
+
+    def _take_metrics(self, resp: Response) -> RequestMetrics | None:
+        """응답에 붙은 계측값을 꺼낸다 (이미 꺼냈거나 계측이 꺼져 있으면 None)."""
+        return take_metrics(resp) if self._metrics_sink is not None else None
+
+    def _emit_metrics(self, metrics: RequestMetrics | None) -> None:
+        if metrics is not None and self._metrics_sink is not None:
+            emit(self._metrics_sink, metrics)
+
+    def handle_resp(
+        self,
+        resp: Response,
+        type_model: type[_ResponseType],
+        raw: RawMode | None = None,
+        json_backend: JsonBackend | None = None,
+    ) -> _ResponseType | Any:
+        metrics = self._take_metrics(resp)
+        if metrics is None:
+            return self._resolve_resp(resp, type_model, raw, json_backend)
+        started = time.perf_counter()
+        try:
+            value = self._resolve_resp(resp, type_model, raw, json_backend)
+        except BaseException:
+            self._emit_metrics(metrics)
+            raise
+        metrics.record_decode(time.perf_counter() - started, self._raw if raw is None else raw)
+        self._emit_metrics(metrics)
+        return value
+
+    def _resolve_resp(
+        self,
+        resp: Response,
+        type_model: type[_ResponseType],
+        raw: RawMode | None,
+        json_backend: JsonBackend | None,
+    ) -> _ResponseType | Any:
+        revalidation = current_revalidation()
+        if revalidation is not None and (entry := revalidation.reuse(resp)) is not None:
+            # 304 / 지난번과 같은 본문: 보관한 모델 반환 (shopby_sdk.base.revalidate)
+            self._notify_response(resp)
+            return entry.value
+        value = self._decode_resp(resp, type_model, raw, json_backend)
+        if revalidation is not None:
+            revalidation.store(resp, value)
+        return value
+
+    def _decode_resp(
+        self,
+        resp: Response,
+        type_model: type[_ResponseType],
+        raw: RawMode | None,
+        json_backend: JsonBackend | None,
+    ) -> _ResponseType | Any:
+        self.raise_for_status(resp)
+
+        mode = self._raw if raw is None else raw
+        if mode == "bytes":
+            return resp.content
+        if self._tracer is None:
+            return self._decode_body(resp, type_model, mode, json_backend)
+        # 트레이싱: 파싱/검증 자식 span (shopby_sdk.base.tracing)
+        with self._tracer.start_as_current_span("shopby.parse" if mode else "shopby.validate") as span:
+            span.set_attribute("http.response.body.size", len(resp.content))
+            if not mode:
+                span.set_attribute("shopby.model", model_name(type_model))
+            return self._decode_body(resp, type_model, mode, json_backend)
+
+    def _decode_body(
+        self,
+        resp: Response,
+        type_model: type[_ResponseType],
+        mode: RawMode,
+        json_backend: JsonBackend | None,
+    ) -> _ResponseType | Any:
+        if mode:
+            return json_loads(json_backend or self._json_backend)(resp.content)
+        try:
+            # resp.json() → dict → validate_python 의 2-pass 대신 원본 bytes 를 바로 검증
+            return get_type_adapter(type_model).validate_json(resp.content)
+        except ValueError:
+            self._log_response(resp)
+            raise
+
+    def raise_for_status(self, resp: Response) -> None:
+        """HTTP 상태 코드를 확인하고 오류 시 상세 정보를 로깅.
+
+        Args:
+            resp: httpx.Response 객체
+
+        Raises:
+            HTTPStatusError: 4xx 또는 5xx 응답 시
+        """
+        self._emit_metrics(self._take_metrics(resp))
+        self._notify_response(resp)
+        try:
+            resp.raise_for_status()
+        except HTTPStatusError:
+            self._log_response(resp)
+            raise
+
+    def _notify_response(self, resp: Response) -> None:
+        if self._on_response is not None:
+            try:
+                self._on_response(resp)
+            except Exception:  # 콜백 오류가 요청을 깨뜨리지 않도록
+                logger.warning("on_response callback raised", exc_info=True)
+
+    @staticmethod
+    def _log_response(resp: Response) -> None:
+        # 응답 본문 가져오기 (JSON 파싱 시도)
+        try:
+            error_body = resp.json()
+        except Exception:
+            error_body = resp.text
+
+        logger.error(
+            f"HTTP error occurred: {resp.status_code} {resp.request.method} {resp.request.url}\n"
+            f"Response body: {error_body}"
+        )
+
+    async def aclose(self) -> None:
+        """소유한 커넥션 풀을 닫는다. 주입받은 ``http_client`` 는 닫지 않는다."""
+        if self._owns_http_client and self._http_client is not None:
+            client, self._http_client, self._http_loop = self._http_client, None, None
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
@@ -0,0 +1,46 @@
+"""raw 응답 모드와 JSON 디코딩 backend 선택.
+
+``raw`` 모드는 검증을 건너뛰고 응답을 그대로 돌려준다.
+
+- ``raw=True``: JSON 을 dict/list 로 디코딩해서 반환.
+- ``raw="bytes"``: 응답 본문 bytes 를 디코딩 없이 그대로 반환. object storage 등에 원문을
+  그대로 적재하는 백필에서 파싱 비용을 완전히 없앤다.
+
+dict 경로의 디코더는 ``json_backend`` 로 고른다.
+
+- ``"stdlib"`` (기본): 표준 라이브러리 ``json``.
+- ``"orjson"``: ``orjson`` (선택 의존성, ``pip install orjson``). 대형 목록 응답에서 수 배 빠르다.
+- ``"auto"``: orjson 이 설치되어 있으면 orjson, 아니면 stdlib.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any, Literal
+
+RawMode = bool | Literal["bytes"]
+"""``raw`` 인자 타입. False=모델 검증, True=dict/list, ``"bytes"``=본문 bytes."""
+
+JsonBackend = Literal["stdlib", "orjson", "auto"]
+"""raw dict 경로의 JSON 디코더."""
+
+
+def json_loads(backend: JsonBackend = "stdlib") -> Callable[[bytes], Any]:
+    """backend 이름에 해당하는 ``bytes -> object`` 디코더 반환.
+
+    Raises:
+        ImportError: ``"orjson"`` 을 지정했는데 orjson 이 설치되어 있지 않은 경우
+        ValueError: 알 수 없는 backend 이름
+    """
+    if backend == "stdlib":
+        return json.loads
+    if backend in ("orjson", "auto"):
+        try:
+            import orjson
+        except ImportError:
+            if backend == "auto":
+                return json.loads
+            raise ImportError('json_backend="orjson" requires orjson: pip install orjson') from None
+        return orjson.loads
+    raise ValueError(f"unknown json backend: {backend!r}")
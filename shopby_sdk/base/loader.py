@@ -0,0 +1,120 @@
+"""단건 조회를 모아 다건 API 한 번으로 보내는 micro-batching (DataLoader).
+
+상품 카드를 하나씩 그리는 화면은 상품마다 추가할인·옵션·배송 정보를 단건 API 로 조회해
+상품 N 개에 N 번 왕복한다. ``BatchLoader`` 는 같은 tick (기본: 이벤트 루프 한 바퀴, ``delay`` 를
+주면 그 시간) 안에 들어온 ``load(key)`` 들을 모아 다건 조회 함수를 한 번 호출하고, 결과를 key 별로
+나눠 각 호출자에게 돌려준다. 한 번에 보내는 key 는 ``max_batch_size`` 를 넘지 않으므로 왕복 수는
+ceil(N / max_batch_size) 가 된다.
+
+- 대기 중이거나 요청 중인 key 는 다시 요청하지 않는다. 완료된 결과는 보관하지 않는다
+  (캐시는 ``shopby_sdk.base.cache``).
+- 다건 결과에 없는 key 는 None 을 받는다.
+- 다건 조회가 실패하면 그 batch 의 호출자 모두가 같은 예외를 받는다.
+- 다건 조회는 호출자와 분리된 태스크로 실행되므로, 한 호출자가 취소되어도 같은 batch 의
+  다른 호출자는 결과를 받는다.
+
+Example:
+    ```python
+    loader = BatchLoader(fetch_by_nos, max_batch_size=100)
+    infos = await asyncio.gather(*(loader.load(no) for no in product_nos))  # 250개 → 3회 요청
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+DEFAULT_MAX_BATCH_SIZE = 100
+"""다건 조회 한 번에 보내는 key 수 기본값."""
+
+
+class BatchLoader(Generic[_K, _V]):
+    """같은 tick 의 단건 조회를 다건 조회 한 번으로 합치는 loader.
+
+    Args:
+        batch_fn: key 목록을 받아 ``{key: 값}`` 을 돌려주는 다건 조회 함수
+        max_batch_size: 다건 조회 한 번에 보내는 최대 key 수 (엔드포인트 한도)
+        delay: 첫 ``load`` 후 batch 를 보내기까지 기다리는 시간(초). 0 이면 이벤트 루프 한 바퀴.
+
+    Attributes:
+        loads: ``load`` 호출 수
+        batches: 다건 조회 호출 수
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[_K]], Awaitable[Mapping[_K, _V]]],
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        delay: float = 0.0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+        self._pending: dict[_K, asyncio.Future[_V | None]] = {}
+        self._inflight: dict[_K, asyncio.Future[_V | None]] = {}
+        self._handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.loads = 0
+        self.batches = 0
+
+    async def load(self, key: _K) -> _V | None:
+        """key 의 값 (다건 결과에 없으면 None)."""
+        self.loads += 1
+        future = self._pending.get(key) or self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                if self.delay > 0:
+                    self._handle = loop.call_later(self.delay, self._dispatch)
+                else:
+                    self._handle = loop.call_soon(self._dispatch)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[_K]) -> list[_V | None]:
+        """keys 순서대로의 값 목록."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        self.batches += 1
+        self._inflight.update(batch)
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[_K, asyncio.Future[_V | None]]) -> None:
+        try:
+            results = await self.batch_fn(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+                    future.exception()  # 기다리던 호출자가 모두 취소된 경우 "never retrieved" 경고 방지
+        else:
+            for key, future in batch.items():
+                if not future.done():
+                    future.set_result(results.get(key))
+        finally:
+            for key, future in batch.items():
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
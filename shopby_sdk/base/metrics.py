@@ -0,0 +1,293 @@
+"""요청 단계별 계측 (연결 / 서버 대기 / 본문 수신 / JSON 파싱 / 모델 검증).
+
+느려졌을 때 네트워크 문제인지 SDK 의 디코딩·검증 문제인지 구분할 수 있도록, 클라이언트
+``metrics`` 인자로 sink 를 주면 요청 1건마다 ``RequestMetrics`` 하나를 sink 에 넘긴다.
+sink 가 없으면 계측 코드는 실행되지 않는다.
+
+단계 (초):
+
+- ``throttle``: rate limiter 대기
+- ``connect``: 새 커넥션의 DNS + TCP 연결 + TLS 핸드셰이크 (keep-alive 재사용 시 0)
+- ``wait``: 요청 전송 완료 ~ 응답 헤더 수신 (서버 처리 시간 + RTT)
+- ``download``: 응답 본문 수신
+- ``parse``: raw 모드의 JSON 디코딩
+- ``validate``: 모델 검증. pydantic 은 bytes 를 파싱과 동시에 검증(``validate_json``)하므로
+  모델 경로의 파싱 시간은 여기에 포함된다.
+
+connect/wait/download 는 httpx(httpcore) 의 ``trace`` 이벤트로 재므로, 이벤트를 내지 않는
+transport(``httpx.MockTransport`` 등)에서는 None 이다.
+
+태그는 SDK 메서드 이름, 엔드포인트 템플릿(숫자·UUID 경로 조각을 ``{no}`` 로 바꾼 경로,
+예: ``/products/{no}``), ``version`` 헤더, 상태 코드다.
+
+sink 는 ``record(metrics)`` 를 가진 객체 또는 일반 함수다. ``MetricsAggregator`` (메모리 집계),
+``PrometheusSink`` (``pip install prometheus-client``), ``OpenTelemetrySink``
+(``pip install opentelemetry-api``) 를 제공한다.
+
+Example:
+    ```python
+    stats = MetricsAggregator()
+    client = ShopbyServerProductsApiClient(token, system_key, metrics=stats)
+    ...
+    for row in stats.summary():
+        print(row["endpoint"], row["count"], row["wait"], row["validate"])
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from httpx import Response
+
+from shopby_sdk.base.jsonlib import RawMode
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("throttle", "connect", "wait", "download", "parse", "validate")
+"""``RequestMetrics`` 의 단계 필드 이름."""
+
+_METRICS_KEY = "shopby_metrics"
+_ID_SEGMENT = re.compile(r"/(?:\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?=/|$)")
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """요청 1건의 계측값. 단계 시간은 초 단위이며, 측정하지 못한 단계는 None.
+
+    Attributes:
+        operation: SDK 메서드 이름 (예: ``get_product_detail_v3``)
+        http_method: HTTP 메서드
+        endpoint: 엔드포인트 템플릿 (예: ``/products/{no}``)
+        version: ``version`` 요청 헤더
+        status: 응답 상태 코드 (네트워크 오류 시 None)
+        error: 네트워크 오류 타입 이름
+        attempt: 재시도 포함 몇 번째 시도인지 (1부터)
+        total: 요청 시작 ~ 본문 수신 완료 (throttle 제외)
+        response_bytes: 응답 본문 크기
+    """
+
+    operation: str | None
+    http_method: str
+    endpoint: str
+    version: str | None
+    status: int | None = None
+    error: str | None = None
+    attempt: int = 1
+    throttle: float = 0.0
+    connect: float | None = None
+    wait: float | None = None
+    download: float | None = None
+    parse: float | None = None
+    validate: float | None = None
+    total: float = 0.0
+    response_bytes: int = 0
+
+    def record_decode(self, elapsed: float, mode: RawMode) -> None:
+        """``handle_resp`` 디코딩 시간을 raw 모드에 맞는 단계로 기록."""
+        if mode == "bytes":
+            return
+        if mode:
+            self.parse = elapsed
+        else:
+            self.validate = elapsed
+
+
+class MetricsSink(Protocol):
+    """계측값을 받는 sink."""
+
+    def record(self, metrics: RequestMetrics) -> None: ...
+
+
+class CallbackSink:
+    """일반 함수를 sink 로 감싼다."""
+
+    def __init__(self, callback: Callable[[RequestMetrics], None]):
+        self.callback = callback
+
+    def record(self, metrics: RequestMetrics) -> None:
+        self.callback(metrics)
+
+
+class MetricsAggregator:
+    """(메서드, 엔드포인트, version, 상태) 별로 계측값을 메모리에 합산하는 sink.
+
+    벤치마크·배치 작업 끝에 ``summary()`` 로 어느 단계에 시간이 쓰였는지 본다.
+    """
+
+    def __init__(self) -> None:
+        self._rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    def record(self, metrics: RequestMetrics) -> None:
+        key = (metrics.operation, metrics.endpoint, metrics.version, metrics.status or metrics.error)
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = {"count": 0, "total": 0.0, "response_bytes": 0, **dict.fromkeys(PHASES, 0.0)}
+        row["count"] += 1
+        row["total"] += metrics.total
+        row["response_bytes"] += metrics.response_bytes
+        for phase in PHASES:
+            row[phase] += getattr(metrics, phase) or 0.0
+
+    def summary(self) -> list[dict[str, Any]]:
+        """그룹별 건수와 단계별 평균 시간(초)·평균 응답 크기. 총 시간이 큰 순."""
+        rows = []
+        for (operation, endpoint, version, status), row in self._rows.items():
+            count = row["count"]
+            rows.append(
+                {
+                    "operation": operation,
+                    "endpoint": endpoint,
+                    "version": version,
+                    "status": status,
+                    "count": count,
+                    **{name: row[name] / count for name in ("total", *PHASES, "response_bytes")},
+                }
+            )
+        rows.sort(key=lambda r: r["total"] * r["count"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        self._rows.clear()
+
+
+class PrometheusSink:
+    """Prometheus histogram 으로 내보내는 sink (prometheus-client 필요).
+
+    - ``{namespace}_request_phase_seconds{operation, endpoint, version, status, phase}``
+    - ``{namespace}_response_bytes{operation, endpoint, version, status}``
+
+    Raises:
+        ImportError: prometheus-client 가 설치되어 있지 않은 경우
+    """
+
+    def __init__(self, registry: Any = None, *, namespace: str = "shopby_sdk"):
+        try:
+            from prometheus_client import REGISTRY, Histogram
+        except ImportError:
+            raise ImportError("PrometheusSink requires prometheus-client: pip install prometheus-client") from None
+        labels = ("operation", "endpoint", "version", "status")
+        registry = REGISTRY if registry is None else registry
+        self._phases = Histogram(
+            "request_phase_seconds",
+            "Shopby SDK request phase duration",
+            (*labels, "phase"),
+            namespace=namespace,
+            registry=registry,
+        )
+        self._bytes = Histogram(
+            "response_bytes",
+            "Shopby SDK response body size",
+            labels,
+            namespace=namespace,
+            registry=registry,
+            buckets=(1e3, 1e4, 1e5, 1e6, 1e7, float("inf")),
+        )
+
+    def record(self, metrics: RequestMetrics) -> None:
+        labels = _labels(metrics)
+        for phase in (*PHASES, "total"):
+            value = getattr(metrics, phase)
+            if value is not None:
+                self._phases.labels(*labels.values(), phase).observe(value)
+        self._bytes.labels(*labels.values()).observe(metrics.response_bytes)
+
+
+class OpenTelemetrySink:
+    """OpenTelemetry metrics 로 내보내는 sink (opentelemetry-api 필요).
+
+    ``shopby.request.phase.duration`` (s, 속성 ``phase`` 포함) / ``shopby.response.size`` (By) histogram.
+
+    Raises:
+        ImportError: opentelemetry-api 가 설치되어 있지 않은 경우
+    """
+
+    def __init__(self, meter: Any = None):
+        try:
+            from opentelemetry import metrics as otel_metrics
+        except ImportError:
+            raise ImportError("OpenTelemetrySink requires opentelemetry-api: pip install opentelemetry-api") from None
+        meter = meter or otel_metrics.get_meter("shopby_sdk")
+        self._phases = meter.create_histogram("shopby.request.phase.duration", unit="s")
+        self._bytes = meter.create_histogram("shopby.response.size", unit="By")
+
+    def record(self, metrics: RequestMetrics) -> None:
+        attributes = _labels(metrics)
+        for phase in (*PHASES, "total"):
+            value = getattr(metrics, phase)
+            if value is not None:
+                self._phases.record(value, {**attributes, "phase": phase})
+        self._bytes.record(metrics.response_bytes, attributes)
+
+
+def resolve_metrics_sink(metrics: MetricsSink | Callable[[RequestMetrics], None] | None) -> MetricsSink | None:
+    """클라이언트 ``metrics`` 인자를 sink 로 변환 (함수는 ``CallbackSink`` 로 감싼다)."""
+    if metrics is None or hasattr(metrics, "record"):
+        return metrics  # type: ignore[return-value]
+    return CallbackSink(metrics)
+
+
+def endpoint_template(path: str) -> str:
+    """경로의 숫자·UUID 조각을 ``{no}`` 로 바꾼 엔드포인트 템플릿."""
+    return _ID_SEGMENT.sub("/{no}", path)
+
+
+def emit(sink: MetricsSink, metrics: RequestMetrics) -> None:
+    """sink 에 기록. sink 오류는 요청을 깨뜨리지 않도록 로그만 남긴다."""
+    try:
+        sink.record(metrics)
+    except Exception:
+        logger.warning("metrics sink raised", exc_info=True)
+
+
+def attach_metrics(resp: Response, metrics: RequestMetrics) -> None:
+    resp.extensions[_METRICS_KEY] = metrics
+
+
+def take_metrics(resp: Response) -> RequestMetrics | None:
+    """응답에 붙은 계측값을 꺼낸다 (한 번만 꺼낼 수 있다)."""
+    return resp.extensions.pop(_METRICS_KEY, None)
+
+
+class PhaseTimer:
+    """httpcore ``trace`` 이벤트로 connect/wait/download 시간을 잰다."""
+
+    __slots__ = ("_events",)
+
+    def __init__(self) -> None:
+        self._events: dict[str, float] = {}
+
+    async def trace(self, name: str, info: dict[str, Any]) -> None:
+        # "connection.connect_tcp.started" / "http11.receive_response_body.complete" / "http2...."
+        self._events[name.partition(".")[2]] = time.perf_counter()
+
+    def fill(self, metrics: RequestMetrics) -> None:
+        events = self._events
+        if not events:
+            return
+        metrics.connect = _span(events, "connect_tcp") + _span(events, "start_tls")
+        sent = max((at for name, at in events.items() if name.startswith("send_request")), default=None)
+        headers_done = events.get("receive_response_headers.complete")
+        if sent is not None and headers_done is not None:
+            metrics.wait = headers_done - sent
+        if "receive_response_body.complete" in events:
+            metrics.download = _span(events, "receive_response_body")
+
+
+def _span(events: dict[str, float], name: str) -> float:
+    started, complete = events.get(f"{name}.started"), events.get(f"{name}.complete")
+    return complete - started if started is not None and complete is not None else 0.0
+
+
+def _labels(metrics: RequestMetrics) -> dict[str, str]:
+    return {
+        "operation": metrics.operation or "",
+        "endpoint": metrics.endpoint,
+        "version": metrics.version or "",
+        "status": str(metrics.status) if metrics.status is not None else (metrics.error or ""),
+    }
@@ -0,0 +1,155 @@
+"""목록 API 의 자동 페이지네이션.
+
+- 페이지 번호 방식 (``iter_pages`` / ``iter_page_items``): ``totalCount`` + 한 페이지를
+  돌려주는 엔드포인트(주문/클레임/쿠폰 지급내역/상품 검색 등)를 모든 페이지에 걸쳐
+  스트리밍한다. 첫 페이지로 ``totalCount`` 를 알게 되면 이후 페이지는 최대
+  ``prefetch`` 개까지 동시에 미리 요청하고, 결과는 항상 페이지 순서대로 내보낸다.
+  전체 export 가 "페이지 수 × 왕복 지연" 이 아니라 네트워크 동시성 수준의 속도로 끝난다.
+- keySet 방식 (``iter_keyset_pages``): ``searchAfter`` / ``lastId`` 커서를 이어 가며
+  한 페이지씩 순회한다. 페이지마다 재개용 ``checkpoint`` 를 함께 내보내므로, 중단 후
+  ``resume_from=checkpoint`` 로 이미 처리한 페이지를 다시 읽지 않고 이어갈 수 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+_Page = TypeVar("_Page")
+_Item = TypeVar("_Item")
+
+DEFAULT_PREFETCH = 4
+"""첫 페이지 이후 동시에 미리 요청하는 페이지 수 기본값."""
+
+
+async def iter_pages(
+    fetch_page: Callable[[int, int], Awaitable[_Page]],
+    *,
+    page_size: int,
+    total_count: Callable[[_Page], int],
+    page_items: Callable[[_Page], Sequence[object]],
+    start_page: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[_Page]:
+    """모든 페이지 응답을 페이지 순서대로 내보낸다.
+
+    Args:
+        fetch_page: ``(page_number, page_size)`` 를 받아 한 페이지 응답을 돌려주는 코루틴 함수.
+        page_size: 페이지 크기.
+        total_count: 응답에서 전체 건수를 꺼내는 함수.
+        page_items: 응답에서 아이템 목록을 꺼내는 함수 (빈 페이지 감지용).
+        start_page: 시작 페이지 번호 (1-based).
+        prefetch: 동시에 미리 요청할 페이지 수 (1 이면 순차).
+
+    Note:
+        조회 도중 데이터가 늘거나 줄 수 있으므로, 첫 응답의 ``totalCount`` 로 마지막
+        페이지를 정하고 빈 페이지를 만나면 즉시 멈춘다. 제너레이터를 중간에 닫으면
+        미리 요청 중인 페이지는 취소된다.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    if prefetch < 1:
+        raise ValueError("prefetch must be >= 1")
+
+    first = await fetch_page(start_page, page_size)
+    yield first
+    if len(page_items(first)) < page_size:
+        return
+
+    last_page = math.ceil(total_count(first) / page_size)
+    next_page = start_page + 1
+    pending: deque[asyncio.Task[_Page]] = deque()
+    try:
+        while next_page <= last_page or pending:
+            while next_page <= last_page and len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(fetch_page(next_page, page_size)))
+                next_page += 1
+            page = await pending.popleft()
+            items = page_items(page)
+            if not items:
+                return
+            yield page
+            if len(items) < page_size:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def iter_page_items(
+    fetch_page: Callable[[int, int], Awaitable[_Page]],
+    *,
+    page_size: int,
+    total_count: Callable[[_Page], int],
+    page_items: Callable[[_Page], Sequence[_Item]],
+    start_page: int = 1,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[_Item]:
+    """``iter_pages`` 의 아이템 단위 버전. 인자는 ``iter_pages`` 와 동일."""
+    async for page in iter_pages(
+        fetch_page,
+        page_size=page_size,
+        total_count=total_count,
+        page_items=page_items,
+        start_page=start_page,
+        prefetch=prefetch,
+    ):
+        for item in page_items(page):
+            yield item
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetPage(Generic[_Item]):
+    """keySet 페이지네이션의 한 페이지.
+
+    Attributes:
+        items: 이 페이지의 아이템
+        checkpoint: 이 페이지까지 처리했음을 나타내는 커서(응답의 ``lastId``). 저장해 두었다가
+            ``resume_from`` 으로 넘기면 다음 페이지부터 이어서 조회한다.
+        is_last: 마지막 페이지 여부. True 면 순회가 끝난 것이므로 재개할 필요가 없다.
+    """
+
+    items: Sequence[_Item]
+    checkpoint: str | None
+    is_last: bool = False
+
+
+async def iter_keyset_pages(
+    fetch_page: Callable[[str | None], Awaitable[_Page]],
+    *,
+    next_cursor: Callable[[_Page], str | None],
+    page_items: Callable[[_Page], Sequence[_Item]],
+    resume_from: str | None = None,
+) -> AsyncIterator[KeysetPage[_Item]]:
+    """keySet(searchAfter) 커서를 따라 모든 페이지를 순회한다.
+
+    한 번에 한 페이지만 메모리에 두므로 결과 전체 크기와 무관하게 메모리가 일정하다.
+
+    Args:
+        fetch_page: ``search_after`` 커서(첫 페이지는 None)를 받아 한 페이지 응답을 돌려주는
+            코루틴 함수.
+        next_cursor: 응답에서 다음 커서(``lastId``)를 꺼내는 함수.
+        page_items: 응답에서 아이템 목록을 꺼내는 함수.
+        resume_from: 이전 실행에서 저장한 ``KeysetPage.checkpoint``. 이 커서 다음 페이지부터 조회.
+
+    Note:
+        빈 페이지, 커서 없음(None/빈 문자열), 커서가 더 이상 전진하지 않는 경우 종료한다.
+    """
+    cursor = resume_from
+    while True:
+        page = await fetch_page(cursor)
+        items = page_items(page)
+        if not items:
+            return
+        next_ = next_cursor(page) or None
+        done = next_ is None or next_ == cursor
+        yield KeysetPage(items=items, checkpoint=next_, is_last=done)
+        if done:
+            return
+        cursor = next_
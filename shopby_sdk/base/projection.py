@@ -0,0 +1,120 @@
+"""응답 모델의 필드 선택(projection) 모델 생성.
+
+``ProductDetailV3Response`` / ``OrderDetailResponse`` 는 수십 개의 중첩 ``BaseDto`` 로
+이루어져 있고 ``extra="allow"`` 라 모르는 키도 모두 보존한다. 상품번호·가격·재고만
+필요한 대량 조회에서도 트리 전체를 검증·보관하므로 CPU 와 메모리를 크게 쓴다.
+
+``project(model, fields)`` 는 지정한 필드 경로만 가진 가벼운 모델을 만든다.
+
+- 선택하지 않은 필드와 모르는 키는 검증하지 않고 버린다 (``extra="ignore"``).
+- ``"options.stock_cnt"`` 처럼 점으로 중첩 필드를 고르면 중첩 모델도 같은 방식으로
+  줄인다 (``list[...]`` / ``... | None`` 안의 모델 포함). ``"options"`` 처럼 상위만
+  고르면 그 하위 트리 전체를 원래 모델로 검증한다.
+- 필드 이름은 snake_case 또는 API 의 camelCase 둘 다 받는다.
+- 같은 (모델, 필드) 조합은 한 번만 만들어 캐시하므로 ``TypeAdapter`` 캐시도 재사용된다.
+
+Example:
+    ```python
+    PriceStock = project(
+        ProductDetailV3Response,
+        ["mall_product_no", "sale_price", "product_stock_cnt", "options.mall_option_no", "options.stock_cnt"],
+    )
+    item = get_type_adapter(PriceStock).validate_json(body)
+    item.options[0].stock_cnt
+    ```
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import types
+import typing
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+from shopby_sdk.base.dto import BaseDto
+
+
+class ProjectionDto(BaseDto):
+    """projection 모델 베이스. 선택하지 않은 키는 보존하지 않고 버린다."""
+
+    model_config = ConfigDict(extra="ignore")
+
+
+_PROJECTIONS: dict[tuple[type[BaseModel], tuple[str, ...]], type[ProjectionDto]] = {}
+
+
+def project(model: type[BaseModel], fields: Iterable[str]) -> type[ProjectionDto]:
+    """model 에서 fields 경로만 남긴 projection 모델 반환 (캐시됨).
+
+    Args:
+        model: 원본 응답 모델
+        fields: 남길 필드 경로. ``"sale_price"``, ``"options.stock_cnt"`` 등.
+
+    Raises:
+        ValueError: 존재하지 않는 필드이거나, 모델이 아닌 필드에 하위 경로를 지정한 경우
+    """
+    paths = tuple(sorted(set(fields)))
+    if not paths:
+        raise ValueError("fields must not be empty")
+    key = (model, paths)
+    projected = _PROJECTIONS.get(key)
+    if projected is None:
+        projected = _PROJECTIONS[key] = _build(model, paths)
+    return projected
+
+
+def _build(model: type[BaseModel], paths: tuple[str, ...]) -> type[ProjectionDto]:
+    # 필드 이름 → 하위 경로 목록 (빈 목록이면 필드 전체)
+    selected: dict[str, list[str] | None] = {}
+    for path in paths:
+        head, _, rest = path.partition(".")
+        name = _field_name(model, head)
+        if not rest or selected.get(name, []) is None:
+            selected[name] = None
+        else:
+            selected.setdefault(name, []).append(rest)
+
+    definitions: dict[str, Any] = {}
+    for name, sub_paths in selected.items():
+        info = model.model_fields[name]
+        annotation = info.annotation
+        if sub_paths is not None:
+            annotation = _project_annotation(annotation, tuple(sub_paths), f"{model.__name__}.{name}")
+        definitions[name] = (annotation, info)
+
+    return create_model(  # type: ignore[call-overload]
+        f"{model.__name__}Projection",
+        __base__=ProjectionDto,
+        __module__=model.__module__,
+        **definitions,
+    )
+
+
+def _field_name(model: type[BaseModel], name: str) -> str:
+    if name in model.model_fields:
+        return name
+    for field_name, info in model.model_fields.items():
+        if info.alias == name:
+            return field_name
+    raise ValueError(f"{model.__name__} has no field {name!r}")
+
+
+def _project_annotation(annotation: Any, paths: tuple[str, ...], where: str) -> Any:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return project(annotation, paths)
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (types.UnionType, typing.Union):
+        return functools.reduce(operator.or_, (_project_optional(arg, paths, where) for arg in args))
+    if origin is list and args:
+        return list[_project_annotation(args[0], paths, where)]
+    raise ValueError(f"{where} is not a model field; cannot select {', '.join(paths)}")
+
+
+def _project_optional(annotation: Any, paths: tuple[str, ...], where: str) -> Any:
+    return annotation if annotation is type(None) else _project_annotation(annotation, paths, where)
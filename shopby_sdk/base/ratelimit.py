@@ -0,0 +1,233 @@
+"""``ratelimit-available-level`` 응답 헤더 기반 적응형 클라이언트 rate limiter.
+
+Shopby API 는 응답마다 ``ratelimit-available-level`` 헤더로 남은 호출 여유를
+알려준다. 이를 무시하고 동시 호출을 밀어붙이면 한꺼번에 throttling 되어 429 가
+연달아 발생한다. ``AdaptiveRateLimiter`` 는 토큰 버킷으로 요청 속도를 제한하면서
+응답 헤더를 관찰해 속도를 조절한다 (AIMD).
+
+- 여유 수준이 ``low_level`` 미만이거나 429 를 받으면 속도를 ``decrease_factor`` 배로 줄인다.
+  429 의 ``Retry-After`` 가 있으면 그 시간 동안 모든 호출을 멈춘다.
+- 여유 수준이 ``high_level`` 이상이면 ``increase_step`` 씩 ``max_rate`` 까지 늘린다.
+- 조절은 ``adjust_interval`` 에 한 번만 일어나므로, 같은 시점에 돌아온 동시 응답이
+  속도를 한꺼번에 0 근처로 떨어뜨리지 않는다.
+
+같은 자격증명(server: systemKey + accessToken, shop: clientId)을 쓰는 클라이언트는
+``shared_rate_limiter`` 로 limiter 하나를 공유하므로, 도메인 클라이언트가 여러 개여도
+몰 단위 호출 속도가 함께 조절된다.
+
+Example:
+    ```python
+    # 같은 자격증명의 도메인 클라이언트끼리 limiter 자동 공유
+    products = ShopbyServerProductsApiClient(token, system_key, rate_limit=True)
+    orders = ShopbyServerOrderApiClient(token, system_key, rate_limit=True)
+
+    # 직접 설정한 limiter 주입
+    limiter = AdaptiveRateLimiter(rate=5, max_rate=30)
+    products = ShopbyServerProductsApiClient(token, system_key, rate_limit=limiter)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Hashable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+from httpx import Response
+
+logger = logging.getLogger(__name__)
+
+RATELIMIT_LEVEL_HEADER = "ratelimit-available-level"
+
+
+class AdaptiveRateLimiter:
+    """응답 헤더로 속도를 조절하는 토큰 버킷.
+
+    Args:
+        rate: 초기 초당 요청 수
+        burst: 버킷 크기 (순간 최대 연속 요청 수). None 이면 ``max(1, rate)``.
+        min_rate: 속도 하한
+        max_rate: 속도 상한
+        low_level: 이 비율(0~1) 미만의 여유 수준을 받으면 감속
+        high_level: 이 비율(0~1) 이상의 여유 수준을 받으면 가속
+        decrease_factor: 감속 시 곱할 값 (0~1)
+        increase_step: 가속 시 더할 초당 요청 수
+        adjust_interval: 속도 조절 최소 간격(초)
+        level_max: 헤더 값의 최대값. 헤더 값 / level_max 를 여유 비율로 쓴다. API 스펙에 헤더 값의
+            범위가 나와 있지 않으므로 None(기본값)이면 지금까지 관찰한 가장 큰 값을 최대값으로 쓴다.
+            몰의 호출 한도를 알면 지정한다.
+
+    Note:
+        대기 중인 호출은 예약 순서(FIFO)대로 깨어난다. 이벤트 루프에 묶인 상태가
+        없으므로 ``asyncio.run`` 을 여러 번 호출하거나 여러 스레드의 루프에서 공유해도 된다.
+        ``shared_rate_limiter`` 는 프로세스 전역이라 다른 스레드의 루프에서 도는 클라이언트도 같은
+        인스턴스를 쓰므로, 상태는 ``threading.Lock`` 으로 보호한다. 잠금은 계산하는 동안만 잡고
+        ``await`` 중에는 잡지 않으므로 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(
+        self,
+        rate: float = 20.0,
+        *,
+        burst: float | None = None,
+        min_rate: float = 1.0,
+        max_rate: float = 100.0,
+        low_level: float = 0.3,
+        high_level: float = 0.7,
+        decrease_factor: float = 0.5,
+        increase_step: float = 2.0,
+        adjust_interval: float = 1.0,
+        level_max: float | None = None,
+    ):
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("require 0 < min_rate <= rate <= max_rate")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self._rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, float(rate))
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.low_level = low_level
+        self.high_level = high_level
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.adjust_interval = adjust_interval
+        self.level_max = level_max
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._last_adjust = 0.0
+        self._level: float | None = None
+        self._level_peak = 0.0
+        self._waiters = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """현재 초당 허용 요청 수."""
+        return self._rate
+
+    @property
+    def level(self) -> float | None:
+        """마지막으로 관찰한 여유 비율 (0~1). 아직 없으면 None."""
+        return self._level
+
+    async def acquire(self) -> None:
+        """요청 1건을 보낼 수 있을 때까지 대기."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # 음수 토큰은 대기 중인 앞선 예약분. 이미 보낸 요청의 몫은 남기지 않는다
+            # (대기 도중 감속되면 이전 속도로 계산한 예약이 빚으로 남는 것을 방지)
+            self._tokens = max(self._tokens, -float(self._waiters)) - 1
+            delay = max(0.0, -self._tokens / self._rate, self._paused_until - now)
+            if delay > 0:
+                self._waiters += 1
+        if delay <= 0:
+            return
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            with self._lock:
+                self._waiters -= 1
+
+    def observe(self, resp: Response) -> None:
+        """응답의 상태코드 / ``ratelimit-available-level`` 헤더로 속도를 조절."""
+        value = _parse_level(resp.headers.get(RATELIMIT_LEVEL_HEADER))
+        with self._lock:
+            now = time.monotonic()
+            level = None
+            if value is not None:
+                self._level_peak = max(self._level_peak, value)
+                scale = self.level_max if self.level_max is not None else self._level_peak
+                level = min(1.0, value / scale) if scale > 0 else 0.0
+                self._level = level
+            if resp.status_code == 429:
+                retry_after = retry_after_seconds(resp)
+                if retry_after is not None:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                self._adjust(now, decrease=True)
+            elif level is not None and level < self.low_level:
+                self._adjust(now, decrease=True)
+            elif level is not None and level >= self.high_level:
+                self._adjust(now, decrease=False)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _adjust(self, now: float, *, decrease: bool) -> None:
+        if now - self._last_adjust < self.adjust_interval:
+            return
+        self._refill(now)
+        previous = self._rate
+        if decrease:
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            # 이미 쌓인 토큰으로 감속 직후 다시 몰려가지 않도록 비운다
+            self._tokens = min(self._tokens, 0.0)
+        else:
+            self._rate = min(self.max_rate, self._rate + self.increase_step)
+        self._last_adjust = now
+        if self._rate != previous:
+            logger.debug("rate limit %.1f -> %.1f req/s (level=%s)", previous, self._rate, self._level)
+
+
+def retry_after_seconds(resp: Response) -> float | None:
+    """``Retry-After`` 헤더(초 또는 HTTP-date)를 초 단위로 변환. 없거나 해석 불가면 None."""
+    value = resp.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _parse_level(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+_SHARED: dict[Hashable, AdaptiveRateLimiter] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_rate_limiter(*credentials: str) -> AdaptiveRateLimiter:
+    """같은 자격증명끼리 공유하는 프로세스 전역 limiter (없으면 기본 설정으로 생성).
+
+    자격증명 원문을 키로 보관하지 않도록 해시를 키로 쓴다.
+    """
+    key = hashlib.sha256("\0".join(credentials).encode()).hexdigest()
+    with _SHARED_LOCK:
+        limiter = _SHARED.get(key)
+        if limiter is None:
+            limiter = _SHARED[key] = AdaptiveRateLimiter()
+        return limiter
+
+
+def resolve_rate_limiter(
+    rate_limit: bool | AdaptiveRateLimiter | None, *credentials: str
+) -> AdaptiveRateLimiter | None:
+    """클라이언트 ``rate_limit`` 인자를 limiter 로 변환 (True 면 자격증명별 공유 limiter)."""
+    if isinstance(rate_limit, AdaptiveRateLimiter):
+        return rate_limit
+    if rate_limit:
+        return shared_rate_limiter(*credentials)
+    return None
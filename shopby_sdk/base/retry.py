@@ -0,0 +1,90 @@
+"""429 / 5xx / 네트워크 오류 재시도 정책 (exponential backoff + full jitter).
+
+긴 export·배치 작업이 일시적인 429·5xx·타임아웃 한 번에 중단되지 않도록, 클라이언트
+요청 경로(``PooledHttpClientMixin._send``)에서 응답을 ``raise_for_status`` 에 넘기기
+전에 재시도한다.
+
+- 기본적으로 멱등(idempotent) 메서드(GET/HEAD/OPTIONS)만 재시도한다.
+- 부수효과 없는 조회용 POST(상품번호 목록 조회 등)는 메서드에서
+  ``client.post(..., idempotent=True)`` 로 개별 허용한다.
+- 대기 시간은 ``Retry-After`` 헤더가 있으면 그 값을, 없으면
+  ``uniform(0, min(backoff_max, backoff_base * 2 ** attempt))`` (full jitter) 를 쓴다.
+  jitter 덕분에 동시에 실패한 호출들이 같은 시점에 한꺼번에 재시도하지 않는다.
+
+Example:
+    ```python
+    client = ShopbyServerOrderApiClient(token, system_key, retry=True)  # 기본 정책
+    client = ShopbyServerOrderApiClient(
+        token, system_key, retry=RetryPolicy(max_attempts=5, backoff_max=60)
+    )
+    ```
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+import httpx
+from httpx import Response
+
+from shopby_sdk.base.ratelimit import retry_after_seconds
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """재시도 정책.
+
+    Attributes:
+        max_attempts: 최초 요청을 포함한 최대 시도 횟수
+        backoff_base: 첫 재시도 대기 상한(초). 재시도마다 2 배씩 늘어난다.
+        backoff_max: 재시도 대기 상한(초)
+        max_retry_after: 따를 ``Retry-After`` 최대값(초). 이보다 길면 재시도하지 않고 응답을 돌려준다.
+        statuses: 재시도할 HTTP 상태 코드
+        methods: 기본으로 재시도하는 HTTP 메서드
+        retry_network_errors: 타임아웃·연결 오류(``httpx.TransportError``) 재시도 여부
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 120.0
+    statuses: frozenset[int] = field(default=RETRY_STATUSES)
+    methods: frozenset[str] = field(default=IDEMPOTENT_METHODS)
+    retry_network_errors: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+
+    def allows(self, method: str, idempotent: bool | None = None) -> bool:
+        """이 요청을 재시도해도 되는지. idempotent 가 None 이면 메서드로 판단."""
+        if self.max_attempts < 2:
+            return False
+        return method.upper() in self.methods if idempotent is None else idempotent
+
+    def backoff(self, attempt: int) -> float:
+        """attempt 번째(1부터) 재시도 전 대기 시간 (full jitter)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def delay_for(self, resp: Response, attempt: int) -> float | None:
+        """재시도할 응답이면 대기 시간, 아니면 None."""
+        if resp.status_code not in self.statuses:
+            return None
+        retry_after = retry_after_seconds(resp)
+        if retry_after is None:
+            return self.backoff(attempt)
+        return retry_after if retry_after <= self.max_retry_after else None
+
+    def should_retry_error(self, exc: Exception) -> bool:
+        return self.retry_network_errors and isinstance(exc, httpx.TransportError)
+
+
+def resolve_retry_policy(retry: bool | RetryPolicy | None) -> RetryPolicy | None:
+    """클라이언트 ``retry`` 인자를 정책으로 변환 (True 면 기본 ``RetryPolicy()``)."""
+    if isinstance(retry, RetryPolicy):
+        return retry
+    return RetryPolicy() if retry else None
@@ -0,0 +1,199 @@
+"""조건부 요청(ETag / If-Modified-Since) + 본문 해시로 변하지 않은 응답의 재검증 생략.
+
+브랜드 트리·카테고리·스티커·스킨 배너처럼 자주 조회하지만 거의 바뀌지 않는 응답은
+매번 같은 본문을 다시 받아 다시 검증한다. ``@revalidated`` 가 붙은 메서드는
+``RevalidatingCache`` 에 마지막 응답의 검증 정보와 검증된 모델을 보관하고,
+
+- 응답에 ``ETag`` / ``Last-Modified`` 가 있었으면 다음 요청에 ``If-None-Match`` /
+  ``If-Modified-Since`` 를 붙이고, ``304 Not Modified`` 면 보관한 모델을 그대로 반환한다.
+- 검증 헤더가 없거나 서버가 조건부 요청을 무시해 ``200`` 이 와도, 본문 해시가 지난번과
+  같으면 pydantic 검증 없이 보관한 모델을 반환한다.
+
+``ResponseCache`` 와 달리 매 호출마다 요청은 보내므로 항상 최신 상태를 반환한다(TTL 로 인한
+지연 없음). 항목 보관 기간(``retention``)은 저장소 크기 관리용이다. 보관한 모델은 호출자끼리
+공유되므로 수정하지 않는다.
+
+Example:
+    ```python
+    display = ShopbyShopDisplayApiClient(client_id, revalidate=True)
+    await display.get_stickers()  # 검증 후 보관
+    await display.get_stickers()  # 304 또는 같은 본문 → 검증 생략
+    ```
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Concatenate, ParamSpec, TypeVar
+
+from httpx import Response
+
+from shopby_sdk.base.cache import DEFAULT_CACHE_MAXSIZE, CacheBackend, InMemoryCacheBackend, call_digest
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_Client = TypeVar("_Client")
+
+DEFAULT_RETENTION = 24 * 60 * 60.0
+"""``RevalidatingCache`` 항목 보관 기간 기본값(초)."""
+
+
+@dataclass(frozen=True, slots=True)
+class RevalidationEntry:
+    """마지막으로 검증한 응답.
+
+    Attributes:
+        value: 검증된 반환값
+        digest: 응답 본문 해시
+        etag: 응답 ``ETag`` 헤더
+        last_modified: 응답 ``Last-Modified`` 헤더
+    """
+
+    value: Any
+    digest: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class RevalidatingCache:
+    """``@revalidated`` 메서드들이 쓰는 재검증 캐시.
+
+    Args:
+        backend: 저장소 (``shopby_sdk.base.cache.CacheBackend``). None 이면 프로세스 내 LRU.
+        maxsize: 기본 저장소의 최대 항목 수
+        retention: 항목 보관 기간(초)
+
+    Attributes:
+        not_modified: 304 로 보관한 모델을 반환한 횟수
+        unchanged: 200 이지만 본문이 같아 검증을 생략한 횟수
+        validated: 본문을 새로 검증한 횟수
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        retention: float = DEFAULT_RETENTION,
+    ):
+        self.backend: CacheBackend = backend if backend is not None else InMemoryCacheBackend(maxsize)
+        self.retention = retention
+        self.not_modified = 0
+        self.unchanged = 0
+        self.validated = 0
+
+    async def invalidate(self, *methods: Callable[..., Any] | str) -> None:
+        """지정한 메서드(또는 qualname)의 항목을 지운다. 인자가 없으면 전체."""
+        if not methods:
+            await self.backend.clear()
+            return
+        for method in methods:
+            qualname = method if isinstance(method, str) else method.__qualname__
+            await self.backend.delete_prefix(f"{qualname}|")
+
+
+class Revalidation:
+    """``@revalidated`` 호출 하나의 재검증 상태. 요청 경로(``_send`` / ``handle_resp``)가 읽는다."""
+
+    __slots__ = ("cache", "entry", "stored")
+
+    def __init__(self, cache: RevalidatingCache, entry: RevalidationEntry | None):
+        self.cache = cache
+        self.entry = entry
+        self.stored: RevalidationEntry | None = None
+
+    def conditional_headers(self, headers: dict[str, str] | None) -> dict[str, str] | None:
+        """보관한 응답의 검증 헤더를 붙인 요청 헤더."""
+        if self.entry is None or not (conditional := self.entry.conditional_headers()):
+            return headers
+        return {**(headers or {}), **conditional}
+
+    def reuse(self, resp: Response) -> RevalidationEntry | None:
+        """304 이거나 본문이 지난번과 같으면 보관한 항목 (검증 헤더는 갱신), 아니면 None."""
+        if self.entry is None:
+            return None
+        if resp.status_code == 304:
+            self.cache.not_modified += 1
+            self.stored = _refresh(self.entry, resp)
+            return self.entry
+        if resp.status_code == 200 and _digest(resp.content) == self.entry.digest:
+            self.cache.unchanged += 1
+            self.stored = _refresh(self.entry, resp)
+            return self.entry
+        return None
+
+    def store(self, resp: Response, value: Any) -> None:
+        """새로 검증한 응답을 보관 대상으로 기록 (호출이 끝나면 저장)."""
+        self.cache.validated += 1
+        if value is not None:
+            self.stored = RevalidationEntry(
+                value, _digest(resp.content), resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+            )
+
+
+_current: ContextVar[Revalidation | None] = ContextVar("shopby_revalidation", default=None)
+
+
+def current_revalidation() -> Revalidation | None:
+    """진행 중인 ``@revalidated`` 호출의 재검증 상태 (없으면 None)."""
+    return _current.get()
+
+
+def resolve_revalidating_cache(revalidate: bool | RevalidatingCache | None) -> RevalidatingCache | None:
+    """클라이언트 ``revalidate`` 인자를 캐시로 변환 (True 면 클라이언트 전용 ``RevalidatingCache()``)."""
+    if isinstance(revalidate, RevalidatingCache):
+        return revalidate
+    return RevalidatingCache() if revalidate else None
+
+
+def revalidated(
+    func: Callable[Concatenate[_Client, _P], Awaitable[_R]],
+) -> Callable[Concatenate[_Client, _P], Awaitable[_R]]:
+    """클라이언트 메서드의 응답을 ``self._revalidating_cache`` 로 재검증하는 데코레이터.
+
+    메서드는 GET 한 번 + ``handle_resp`` 한 번으로 이루어져야 한다. 재검증 캐시가 꺼진
+    클라이언트에서는 그대로 호출한다.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self: _Client, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        cache: RevalidatingCache | None = getattr(self, "_revalidating_cache", None)
+        if cache is None:
+            return await func(self, *args, **kwargs)
+
+        key = f"{func.__qualname__}|{call_digest(self, args, kwargs)}"
+        revalidation = Revalidation(cache, await cache.backend.get(key))
+        token = _current.set(revalidation)
+        try:
+            value = await func(self, *args, **kwargs)
+        finally:
+            _current.reset(token)
+        if revalidation.stored is not None:
+            await cache.backend.set(key, revalidation.stored, cache.retention)
+        return value
+
+    return wrapper
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _refresh(entry: RevalidationEntry, resp: Response) -> RevalidationEntry:
+    etag = resp.headers.get("ETag", entry.etag)
+    last_modified = resp.headers.get("Last-Modified", entry.last_modified)
+    if etag == entry.etag and last_modified == entry.last_modified:
+        return entry
+    return RevalidationEntry(entry.value, entry.digest, etag, last_modified)
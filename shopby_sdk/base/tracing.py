@@ -0,0 +1,157 @@
+"""OpenTelemetry 트레이싱 (SDK 메서드 호출 1건 = span 1개).
+
+주문 파이프라인 등을 트레이싱할 때 SDK 호출이 빈 구간으로 보이지 않도록, 클라이언트
+``tracing`` 인자를 켜면 ``async with self._session(operation)`` 블록(= SDK 메서드 호출 하나) 마다
+CLIENT span 을 만든다. span 은 현재 컨텍스트로 설정되므로 httpx 자동 계측 span 등은
+그 아래에 붙는다.
+
+span 이름은 ``{클라이언트 클래스}.{메서드}`` 이고 속성은 다음과 같다.
+
+- ``code.function`` / ``code.namespace``: SDK 메서드 이름 / 클라이언트 클래스
+- ``http.request.method``, ``url.template`` (숫자·UUID 경로 조각을 ``{no}`` 로 바꾼 경로), ``server.address``
+- ``shopby.api.version``: ``version`` 요청 헤더
+- ``shopby.page.number`` / ``shopby.page.size``: 쿼리의 page·pageNumber / size·pageSize
+- ``http.response.status_code``, ``http.response.body.size``
+- ``shopby.retry.count``: 재시도 횟수 (재시도 정책이 켜진 경우)
+- ``shopby.ratelimit.level``: ``ratelimit-available-level`` 응답 헤더
+
+본문 디코딩은 자식 span ``shopby.parse`` (raw 모드 JSON 디코딩) / ``shopby.validate`` (모델
+검증) 로 남는다. pydantic 은 bytes 를 파싱과 동시에 검증(``validate_json``)하므로 모델
+경로의 파싱 시간은 ``shopby.validate`` 에 포함된다.
+
+opentelemetry-api 가 설치되어 있지 않으면 ``tracing=True`` 여도 트레이싱은 꺼지고, 꺼져 있을
+때 요청 경로의 비용은 None 확인뿐이다.
+
+Example:
+    ```python
+    client = ShopbyServerOrderApiClient(token, system_key, tracing=True)
+    with tracer.start_as_current_span("sync-orders"):
+        await client.get_order_detail(order_no)  # sync-orders 아래 자식 span
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+from types import ModuleType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+import httpx
+from httpx import Response
+
+from shopby_sdk.base.metrics import endpoint_template
+from shopby_sdk.base.ratelimit import RATELIMIT_LEVEL_HEADER
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "shopby_sdk"
+
+ATTEMPTS_KEY = "shopby_attempts"
+"""재시도 루프가 최종 응답의 ``extensions`` 에 남기는 시도 횟수 키."""
+
+_PAGE_NUMBER_PARAMS = ("page", "pageNumber")
+_PAGE_SIZE_PARAMS = ("size", "pageSize")
+
+_trace_api: ModuleType | None = None
+_context_api: ModuleType | None = None
+
+
+def _load_trace_api() -> ModuleType | None:
+    global _trace_api, _context_api
+    if _trace_api is None:
+        try:
+            from opentelemetry import context, trace
+        except ImportError:
+            return None
+        _trace_api, _context_api = trace, context
+    return _trace_api
+
+
+def resolve_tracer(tracing: Any) -> Any | None:
+    """클라이언트 ``tracing`` 인자를 tracer 로 변환.
+
+    True 면 ``trace.get_tracer("shopby_sdk")`` (전역 TracerProvider), tracer 객체를 넘기면
+    그것을 쓴다. opentelemetry-api 가 없으면 None (트레이싱 꺼짐).
+    """
+    if not tracing:
+        return None
+    if tracing is not True:
+        return tracing
+    trace = _load_trace_api()
+    if trace is None:
+        logger.debug("tracing disabled: opentelemetry-api is not installed")
+        return None
+    return trace.get_tracer(TRACER_NAME)
+
+
+class CallSpan:
+    """SDK 메서드 호출 하나의 span. ``HttpSession`` 이 열고 닫는다."""
+
+    __slots__ = ("span", "_token")
+
+    def __init__(self, tracer: Any, client: str, operation: str | None):
+        trace = _load_trace_api()
+        assert trace is not None and _context_api is not None
+        name = f"{client}.{operation}" if operation else client
+        attributes = {"code.namespace": client}
+        if operation:
+            attributes["code.function"] = operation
+        self.span = tracer.start_span(name, kind=trace.SpanKind.CLIENT, attributes=attributes)
+        self._token = _context_api.attach(trace.set_span_in_context(self.span))
+
+    def record_request(self, method: str, url: str, headers: dict[str, str], params: Any) -> None:
+        full_url = httpx.URL(url)
+        span = self.span
+        span.set_attribute("http.request.method", method.upper())
+        span.set_attribute("url.template", endpoint_template(full_url.path))
+        span.set_attribute("server.address", full_url.host)
+        version = headers.get("version")
+        if version is not None:
+            span.set_attribute("shopby.api.version", version)
+        if isinstance(params, dict):
+            _set_first(span, "shopby.page.number", params, _PAGE_NUMBER_PARAMS)
+            _set_first(span, "shopby.page.size", params, _PAGE_SIZE_PARAMS)
+
+    def record_response(self, resp: Response) -> None:
+        span = self.span
+        span.set_attribute("http.response.status_code", resp.status_code)
+        span.set_attribute("http.response.body.size", len(resp.content))
+        attempts = resp.extensions.get(ATTEMPTS_KEY)
+        if attempts is not None:
+            span.set_attribute("shopby.retry.count", attempts - 1)
+        level = resp.headers.get(RATELIMIT_LEVEL_HEADER)
+        if level is not None:
+            try:
+                span.set_attribute("shopby.ratelimit.level", int(level))
+            except ValueError:
+                pass
+
+    def end(self, exc: BaseException | None) -> None:
+        trace = _trace_api
+        assert trace is not None and _context_api is not None
+        if exc is not None:
+            self.span.record_exception(exc)
+            self.span.set_status(trace.Status(trace.StatusCode.ERROR, f"{type(exc).__name__}: {exc}"))
+        self.span.end()
+        _context_api.detach(self._token)
+
+
+def model_name(type_model: Any) -> str:
+    """``shopby.model`` 속성값 (예: ``ProductDetailV3Response``, ``list[Brand]``)."""
+    origin, args = get_origin(type_model), get_args(type_model)
+    if origin in (Union, UnionType):
+        return " | ".join(model_name(arg) for arg in args)
+    if args:
+        return f"{origin.__name__}[{', '.join(model_name(arg) for arg in args)}]"
+    return getattr(type_model, "__name__", str(type_model))
+
+
+def _set_first(span: Any, attribute: str, params: dict[str, Any], names: tuple[str, ...]) -> None:
+    for name in names:
+        value = params.get(name)
+        if value is not None:
+            try:
+                span.set_attribute(attribute, int(value))
+            except (TypeError, ValueError):
+                span.set_attribute(attribute, str(value))
+            return
@@ -1,7 +1,6 @@
 """Admin API 클라이언트"""
 
-import httpx
-
+from shopby_sdk.base.cache import cached
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.admin.models import (
     AdminAuthorityResponse,
@@ -45,7 +44,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             AdminAuthorityResponse: 어드민 권한 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_admins_authority") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/admins", headers=headers)
             return self.handle_resp(resp, AdminAuthorityResponse)
@@ -59,7 +58,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             list[MerchandiserAdmin]: 상품담당 MD 운영자 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_md_admins") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/admins/merchandisers", headers=headers)
             return self.handle_resp(resp, list[MerchandiserAdmin])
@@ -76,7 +75,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             AdminDetailResponse: 어드민 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_admin") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/admins/{admin_no}", headers=headers)
             return self.handle_resp(resp, AdminDetailResponse)
@@ -98,7 +97,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             list[MallDomain]: 몰 도메인 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_mall_domains") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if device_type is not None:
@@ -130,7 +129,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             ContractListResponse: 계약서 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_contracts") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -156,7 +155,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             None
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_contract_status") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/contracts", headers=headers, json=body)
@@ -176,7 +175,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             None
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_contract") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/contracts", headers=headers, json=body)
@@ -195,7 +194,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             ContractDetailResponse: 계약서 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_contract_detail") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/contracts/{partner_no}", headers=headers)
             return self.handle_resp(resp, ContractDetailResponse)
@@ -215,7 +214,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             None
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_contract") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -236,7 +235,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             list[Currency]: 환율 설정 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_currencies") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/currencies", headers=headers)
             return self.handle_resp(resp, list[Currency])
@@ -256,7 +255,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             None
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_currency") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -268,16 +267,17 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
     # ------------------------------------
     #  Mall
     # ------------------------------------
+    @cached(ttl=600)
     async def get_mall_detail(self) -> MallDetailResponse:
         """
         쇼핑몰 상세 조회
 
-        Mall 정보를 조회합니다.
+        Mall 정보를 조회합니다. 응답 캐시 대상 (기본 TTL 600초).
 
         Returns:
             MallDetailResponse: 쇼핑몰 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_mall_detail") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/malls", headers=headers)
             return self.handle_resp(resp, MallDetailResponse)
@@ -291,7 +291,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             ShopbyPartnerResponse: 쇼핑몰 자체 파트너 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_shopby_partner") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/malls/shopby-partner", headers=headers)
             return self.handle_resp(resp, ShopbyPartnerResponse)
@@ -314,7 +314,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             list[ContractedPartner]: 계약된 파트너 정보 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_contracted_partners") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if partner_nos is not None:
@@ -350,7 +350,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             OperationGroupListResponse: 운영그룹 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_operation_groups") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -384,7 +384,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             PartnerCreateResponse: 생성된 파트너 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_partner") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/partners", headers=headers, json=body)
@@ -404,7 +404,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             PartnerCreateResponse: 생성된 파트너 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_temp_partner") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/partners/temp", headers=headers, json=body)
@@ -422,7 +422,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             PartnerDetailResponse: 파트너 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_partner") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/partners/{partner_no}", headers=headers)
             return self.handle_resp(resp, PartnerDetailResponse)
@@ -442,7 +442,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             None
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_partner") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -463,7 +463,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             ExistResultResponse: 중복 확인 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("exist_admin_id") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"adminId": admin_id}
             resp = await client.get(
@@ -483,7 +483,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             ExistResultResponse: 중복 확인 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("exist_partner_name") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"partnerName": partner_name}
             resp = await client.get(
@@ -503,7 +503,7 @@ class ShopbyServerAdminApiClient(ShopbyServerApiClient):
         Returns:
             ServiceDetailResponse: 서비스 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_service_detail") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/services", headers=headers)
             return self.handle_resp(resp, ServiceDetailResponse)
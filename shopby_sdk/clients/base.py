@@ -1,16 +1,14 @@
-import logging
-from collections.abc import Callable
-from typing import Any, TypeVar, Type
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from typing import TypeVar, Unpack
 
-from httpx import HTTPStatusError, Response
-from pydantic import TypeAdapter
-
-logger = logging.getLogger(__name__)
+from shopby_sdk.base.batch import DEFAULT_CONCURRENCY, BatchResult, fetch_many
+from shopby_sdk.base.http import ClientOptions, PooledHttpClientMixin
 
 _ResponseType = TypeVar("_ResponseType")
+_Key = TypeVar("_Key")
 
 
-class ShopbyServerApiClient:
+class ShopbyServerApiClient(PooledHttpClientMixin):
     DEFAULT_BASE_URL = "https://server-api.e-ncp.com"
 
     def __init__(
@@ -18,23 +16,23 @@ class ShopbyServerApiClient:
         server_access_token: str,
         server_system_key: str,
         base_url: str | None = None,
-        *,
-        on_response: Callable[[Response], None] | None = None,
-        raw: bool = False,
+        **options: Unpack[ClientOptions],
     ):
         """
         Args:
-            on_response: 모든 응답마다 호출되는 콜백(검증/raise 전). 응답 헤더
-                (예: ``ratelimit-available-level``)·상태코드 관찰용. 예외는 무시된다.
-            raw: True 면 모든 메서드가 Pydantic 모델 대신 ``resp.json()``(dict/list)
-                그대로 반환한다. 검증을 건너뛰어 스키마 불일치에도 죽지 않으며 응답을
-                무손실로 받는다. 대량 백필·raw 적재용.
+            server_access_token: 서버 API access token (``Authorization: Bearer``).
+            server_system_key: 서버 API systemKey.
+            base_url: API base URL. 기본값 ``https://server-api.e-ncp.com``.
+            **options: 커넥션 풀·raw 모드·rate limit·재시도·캐시·계측 등 공통 옵션
+                (``shopby_sdk.base.http.ClientOptions`` 참고). rate_limit=True 면 같은
+                systemKey/accessToken 을 쓰는 클라이언트끼리 limiter 하나를 공유한다.
         """
         self._access_token = server_access_token
         self._system_key = server_system_key
-        self.base_url = base_url or self.DEFAULT_BASE_URL
-        self._on_response = on_response
-        self._raw = raw
+        self._init_client(base_url, **options)
+
+    def _rate_limit_key(self) -> tuple[str, ...]:
+        return ("server", self.base_url, self._system_key, self._access_token)
 
     @property
     def common_header(self):
@@ -44,49 +42,30 @@ class ShopbyServerApiClient:
             "version": "1.0",
         }
 
-    def handle_resp(
-        self, resp: Response, type_model: Type[_ResponseType], raw: bool | None = None
-    ) -> _ResponseType | Any:
-        self.raise_for_status(resp)
-
-        if self._raw if raw is None else raw:
-            return resp.json()
-        try:
-            return TypeAdapter(type_model).validate_python(resp.json())
-        except ValueError:
-            self._log_response(resp)
-            raise
+    def fetch_many(
+        self,
+        fetch: Callable[[_Key], Awaitable[_ResponseType]],
+        ids: Iterable[_Key] | AsyncIterable[_Key],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult[_Key, _ResponseType]]:
+        """상세 조회 메서드를 여러 id 에 대해 동시성 제한으로 호출하고 결과를 스트리밍.
 
-    def raise_for_status(self, resp: Response) -> None:
-        """
-        HTTP 상태 코드를 확인하고 오류 시 상세 정보를 로깅
+        개별 실패는 ``BatchResult.error`` 로 수집되고 나머지 조회는 계속된다. 결과를 소비하는
+        속도에 맞춰 새 요청을 시작하므로 id 가 많아도 메모리가 일정하다.
+        (``shopby_sdk.base.batch.fetch_many`` 참고)
 
         Args:
-            resp: httpx.Response 객체
+            fetch: id 하나를 조회하는 메서드 (예: ``client.get_product_detail_v3``)
+            ids: 조회할 id 목록 / iterable / async iterable
+            concurrency: 동시 요청 수
+            ordered: True 면 ids 순서대로, False 면 완료 순서대로 내보낸다.
 
-        Raises:
-            HTTPStatusError: 4xx 또는 5xx 응답 시
+        Example:
+            ```python
+            async for r in client.fetch_many(client.get_order_detail, order_nos, concurrency=20):
+                print(r.key, r.value if r.ok else r.error)
+            ```
         """
-        if self._on_response is not None:
-            try:
-                self._on_response(resp)
-            except Exception:  # 콜백 오류가 요청을 깨뜨리지 않도록
-                logger.warning("on_response callback raised", exc_info=True)
-        try:
-            resp.raise_for_status()
-        except HTTPStatusError:
-            self._log_response(resp)
-            raise
-
-    @staticmethod
-    def _log_response(resp: Response):
-        # 응답 본문 가져오기 (JSON 파싱 시도)
-        try:
-            error_body = resp.json()
-        except Exception:
-            error_body = resp.text
-
-        logger.error(
-            f"HTTP error occurred: {resp.status_code} {resp.request.method} {resp.request.url}\n"
-            f"Response body: {error_body}"
-        )
+        return fetch_many(fetch, ids, concurrency=concurrency, ordered=ordered)
@@ -3,10 +3,11 @@
 OpenAPI: claim-server (docs/api/claim-server-public.yml)
 """
 
+from collections.abc import AsyncIterator
 from datetime import date
 
-import httpx
-
+from shopby_sdk.base.daterange import DEFAULT_SHARD_CONCURRENCY, iter_sharded
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, iter_page_items
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.claim.models import (
     AlreadyDeliveryRequest,
@@ -14,6 +15,7 @@ from shopby_sdk.clients.claim.models import (
     AvailableComplexRefundAmtRequest,
     AvailableComplexRefundAmtResponse,
     CancelExchangeRequest,
+    ClaimListItem,
     ClaimListResponse,
     ClaimResult,
     ClaimSearchDateType,
@@ -69,7 +71,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Returns:
             ClaimListResponse: 클레임 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_claims") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int | bool] = {
@@ -90,6 +92,107 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
             resp = await client.get("/claims", headers=headers, params=params)
             return self.handle_resp(resp, ClaimListResponse)
 
+    async def iter_claims(
+        self,
+        start_ymd: date,
+        end_ymd: date,
+        search_date_type: ClaimSearchDateType,
+        search_type: ClaimSearchType,
+        size: int = 100,
+        claim_status_types: list[ClaimStatusType] | None = None,
+        treatment_status_types: list[TreatmentStatusType] | None = None,
+        search_values: list[str] | None = None,
+        *,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[ClaimListItem]:
+        """클레임 목록 조회하기 - 전체 페이지 순회
+
+        ``get_claims`` 를 페이지별로 호출해 클레임을 하나씩 내보낸다. 첫 페이지로
+        totalCount 를 확인한 뒤 다음 페이지들은 최대 ``prefetch`` 개까지 동시에 요청한다.
+
+        Args:
+            size: 페이지 사이즈 [default: 100]
+            prefetch: 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``get_claims`` 와 동일)
+
+        Yields:
+            ClaimListItem: 클레임
+        """
+
+        client = self._model_client()
+
+        async def fetch(page: int, page_size: int) -> ClaimListResponse:
+            return await client.get_claims(
+                start_ymd=start_ymd,
+                end_ymd=end_ymd,
+                search_date_type=search_date_type,
+                search_type=search_type,
+                page=page,
+                size=page_size,
+                claim_status_types=claim_status_types,
+                treatment_status_types=treatment_status_types,
+                search_values=search_values,
+            )
+
+        async for claim in iter_page_items(
+            fetch,
+            page_size=size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.contents,
+            prefetch=prefetch,
+        ):
+            yield claim
+
+    async def iter_claims_sharded(
+        self,
+        start_ymd: date,
+        end_ymd: date,
+        search_date_type: ClaimSearchDateType,
+        search_type: ClaimSearchType,
+        size: int = 100,
+        claim_status_types: list[ClaimStatusType] | None = None,
+        treatment_status_types: list[TreatmentStatusType] | None = None,
+        search_values: list[str] | None = None,
+        *,
+        window_days: int = 30,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[ClaimListItem]:
+        """클레임 목록 조회하기 - 긴 기간을 구간으로 나눠 동시 순회
+
+        [start_ymd, end_ymd] 를 ``window_days`` 일 구간으로 나눠 구간마다 ``iter_claims``
+        로 전체 페이지를 순회하고, 최대 ``concurrency`` 개 구간을 동시에 조회한다.
+        클레임은 구간 순서(과거 → 최근)대로 나온다.
+        (``shopby_sdk.base.daterange.iter_sharded`` 참고)
+
+        Args:
+            window_days: 구간 일수 [default: 30]
+            concurrency: 동시에 조회할 구간 수
+            prefetch: 구간마다 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``iter_claims`` 와 동일)
+
+        Yields:
+            ClaimListItem: 클레임
+        """
+        async for claim in iter_sharded(
+            lambda window: self.iter_claims(
+                start_ymd=window.start,
+                end_ymd=window.end,
+                search_date_type=search_date_type,
+                search_type=search_type,
+                size=size,
+                claim_status_types=claim_status_types,
+                treatment_status_types=treatment_status_types,
+                search_values=search_values,
+                prefetch=prefetch,
+            ),
+            start_ymd,
+            end_ymd,
+            days=window_days,
+            concurrency=concurrency,
+        ):
+            yield claim
+
     async def get_available_complex_refund_amt(
         self, request: AvailableComplexRefundAmtRequest
     ) -> AvailableComplexRefundAmtResponse:
@@ -103,7 +206,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Returns:
             AvailableComplexRefundAmtResponse: 환불수단 별 환불 가능 금액
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_available_complex_refund_amt") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post(
@@ -123,7 +226,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
             claim_no: 클레임 번호
             request: 이미출고 요청 (출고일시, 송장번호, 택배사)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("already_delivery") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -141,7 +244,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Args:
             claim_no: 클레임 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("approve_claim") as client:
             headers = {"version": "1.0"}
             resp = await client.put(f"/claims/{claim_no}/approve", headers=headers)
             self.raise_for_status(resp)
@@ -159,7 +262,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
             claim_no: 클레임 번호
             request: 반품 송장번호 할당 요청 (택배사, 반품 송장번호)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("assign_return_invoice") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -176,7 +279,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Args:
             claim_no: 클레임 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("withdraw_claim") as client:
             headers = {"version": "1.0"}
             resp = await client.put(f"/claims/{claim_no}/withdraw", headers=headers)
             self.raise_for_status(resp)
@@ -194,7 +297,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Returns:
             list[ExchangeInfo]: 교환 전/후 옵션 정보 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_exchange_infos") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/claims/{order_no}/exchange-infos", headers=headers)
             return self.handle_resp(resp, list[ExchangeInfo])
@@ -210,7 +313,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Args:
             request: 옵션 취소 신청 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_option_cancel") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/option-cancels", headers=headers, json=body)
@@ -226,7 +329,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Args:
             request: 품절 취소처리 요청 (품절 주문 옵션번호 리스트)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_sold_out_cancel") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/option-cancels/sold-out", headers=headers, json=body)
@@ -243,7 +346,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Args:
             request: 세트옵션 품절 취소처리 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_sold_out_set_option_cancel") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post(
@@ -264,7 +367,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Args:
             request: 주문 취소 신청 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_order_cancel") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/order-cancels", headers=headers, json=body)
@@ -282,7 +385,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Args:
             request: 취소교환 신청 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_cancel_exchange") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/cancel-exchanges", headers=headers, json=body)
@@ -300,7 +403,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
             no: 클레임 번호
             request: 추가결제 입금확인 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("confirm_cancel_exchange_deposit") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -327,7 +430,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Returns:
             ClaimResult | None: 클레임 번호 및 클레임된 옵션 (본문 없을 경우 None)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_return_exchange") as client:
             headers = {"version": "1.1"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/return-exchanges", headers=headers, json=body)
@@ -347,7 +450,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
             no: 클레임 번호
             request: 반품교환 수거완료 요청 (재고복원여부)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("collect_return_exchange") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -367,7 +470,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
             no: 클레임 번호
             request: 추가결제 입금확인 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("confirm_return_exchange_deposit") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -392,7 +495,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
         Returns:
             ClaimResult | None: 클레임 번호 및 클레임된 옵션 (본문 없을 경우 None)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_return") as client:
             headers = {"version": "1.1"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/returns", headers=headers, json=body)
@@ -410,7 +513,7 @@ class ShopbyServerClaimApiClient(ShopbyServerApiClient):
             no: 클레임 번호
             request: 반품 수거완료 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("collect_return") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(f"/returns/{no}/collect", headers=headers, json=body)
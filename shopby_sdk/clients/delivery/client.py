@@ -1,7 +1,5 @@
 """Delivery API 클라이언트"""
 
-import httpx
-
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.delivery.models import (
     AreaFee,
@@ -39,7 +37,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             AreaFeesResponse: 지역별 추가배송비 설정 내역 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_area_fees") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"page": page, "size": size}
 
@@ -58,7 +56,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             AreaFee: 생성된 지역별 추가배송비 설정
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_area_fee") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -77,7 +75,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             AreaFee: 지역별 추가배송비 설정
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_area_fee") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/areafees/{area_fee_no}", headers=headers)
@@ -93,7 +91,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
             area_fee_no: 지역별 추가배송비 번호
             request: 지역별 추가배송비 설정 수정 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_area_fee") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -113,7 +111,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             list[Area]: 지역 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_areas") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"countryCd": country_cd}
 
@@ -138,7 +136,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             list[DeliveryTemplate]: 배송비 템플릿 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_deliveries") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if shipping_area_type is not None:
@@ -162,7 +160,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             list[TemplateGroup]: 배송비 템플릿 그룹 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_template_groups") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if shipping_area_type is not None:
@@ -185,7 +183,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             TemplateGroup: 생성된 배송비 템플릿 그룹
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_template_group") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -206,7 +204,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             TemplateGroup: 배송비 템플릿 그룹 상세
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_template_group") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(
@@ -226,7 +224,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
             template_group_no: 배송비 템플릿 그룹 번호
             request: 배송비 템플릿 그룹 수정 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_template_group") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -248,7 +246,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             TemplateDetail: 배송비 템플릿 상세
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_template") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/deliveries/templates/{template_no}", headers=headers)
@@ -270,7 +268,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             WarehousesResponse: 입출고 주소 내역 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_warehouses") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"page": page, "size": size}
 
@@ -289,7 +287,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             Warehouse: 생성된 입출고 주소
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_warehouse") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -308,7 +306,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
         Returns:
             Warehouse: 입출고 주소
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_warehouse") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/warehouses/{warehouse_no}", headers=headers)
@@ -324,7 +322,7 @@ class ShopbyServerDeliveryApiClient(ShopbyServerApiClient):
             warehouse_no: 입출고 주소 번호
             request: 입출고 주소 수정 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_warehouse") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
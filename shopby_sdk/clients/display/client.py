@@ -1,7 +1,6 @@
 """Display API 클라이언트"""
 
-import httpx
-
+from shopby_sdk.base.cache import cached
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.display.models import (
     BannerExtraInfo,
@@ -60,7 +59,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Returns:
             EventDetailResponse: 기획전 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_event_detail") as client:
             # Version 1.0 헤더 추가
             headers = {"version": "1.0"}
 
@@ -85,7 +84,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             keywords: 배너 코드 또는 ID
             keyword_type: 검색 타입 (CODE, ID, NO)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_banners") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "keywords": keywords,
@@ -104,7 +103,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Returns:
             int: 생성된 배너 섹션 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_banner_section") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/banners", json=body, headers=headers)
@@ -117,7 +116,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             banner_nos: 삭제할 배너 번호 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_banner_section") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "bannerNos": ",".join(str(no) for no in banner_nos),
@@ -134,7 +133,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             banner_no: 배너 섹션 번호
             request: 배너 섹션 수정 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_banner_section") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(f"/banners/{banner_no}", json=body, headers=headers)
@@ -155,7 +154,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             banner_section_no: 배너 섹션 번호
             banner_nos: 배너 번호 리스트 (최대 100개)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_banner_extra_infos") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if banner_section_no is not None:
@@ -172,7 +171,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             items: 배너 추가정보 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_banner_extra_info") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.post("/banners/extraInfo", json=body, headers=headers)
@@ -186,7 +185,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             items: 배너 추가정보 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_banner_extra_info") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/banners/extraInfo", json=body, headers=headers)
@@ -200,7 +199,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             banner_nos: 삭제할 배너 번호 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_banner_extra_info") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "bannerNos": ",".join(str(no) for no in banner_nos),
@@ -211,7 +210,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
 
     async def get_banner_groups(self) -> list[BannerGroup]:
         """배너 그룹 조회하기"""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_banner_groups") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/banners/groups", headers=headers)
             return self.handle_resp(resp, list[BannerGroup])
@@ -232,7 +231,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             last_banner_no: 조회할 다음 배너 번호
             size: 페이지당 조회 수
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_headless_banners") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if keywords is not None:
@@ -252,26 +251,29 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
 
     async def get_categories(self) -> list[StandardCategory]:
         """표준 카테고리 조회하기"""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_categories") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/categories", headers=headers)
             return self.handle_resp(resp, list[StandardCategory])
 
     async def get_display_categories(self) -> list[DisplayCategory]:
         """전시 카테고리 조회하기"""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_display_categories") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/categories/display-categories", headers=headers)
             return self.handle_resp(resp, list[DisplayCategory])
 
+    @cached(ttl=300)
     async def get_display_categories_tree(self, has_product_count: bool | None = None) -> list[DisplayCategoryTreeNode]:
         """
         전시카테고리 트리 조회하기
 
+        응답 캐시 대상 (기본 TTL 300초). 이 클라이언트로 전시 카테고리를 등록/수정/삭제하면 캐시를 지운다.
+
         Args:
             has_product_count: 연결된 상품 수 포함 여부
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_display_categories_tree") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if has_product_count is not None:
@@ -286,11 +288,13 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             request: 전시 카테고리 등록 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_display_category") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/categories/display-categories", json=body, headers=headers)
-            return self.handle_resp(resp, DisplayCategoryCreateResponse)
+            result = self.handle_resp(resp, DisplayCategoryCreateResponse)
+        await self.invalidate_cache(self.get_display_categories_tree)
+        return result
 
     async def update_display_category(self, display_category_no: int, request: DisplayCategoryUpdateRequest) -> None:
         """
@@ -300,14 +304,15 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             display_category_no: 전시카테고리 번호
             request: 전시 카테고리 수정 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_display_category") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.patch(
                 f"/categories/display-categories/{display_category_no}", json=body, headers=headers
             )
             self.raise_for_status(resp)
-            return None
+        await self.invalidate_cache(self.get_display_categories_tree)
+        return None
 
     async def delete_display_category(self, display_category_no: int, force: bool | None = None) -> None:
         """
@@ -317,7 +322,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             display_category_no: 전시카테고리 번호
             force: 상품 매핑 해제 후 강제 삭제 여부
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_display_category") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if force is not None:
@@ -326,7 +331,8 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
                 f"/categories/display-categories/{display_category_no}", params=params, headers=headers
             )
             self.raise_for_status(resp)
-            return None
+        await self.invalidate_cache(self.get_display_categories_tree)
+        return None
 
     # ------------------------------------
     #  기획전(Event)
@@ -358,7 +364,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             page: 시작 페이지
             size: 조회 수
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_events") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if search_date_type is not None:
@@ -408,7 +414,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             member_type: 회원검색타입 (NAME, ID, NO)
             member_keyword: 회원 검색어 (회원ID or 회원명)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiry") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if start_ymd is not None:
@@ -435,7 +441,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             inquiry_nos: 답글이 달린 문의 번호 리스트 (최대 100개)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiry_replies") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "inquiryNos": ",".join(str(no) for no in inquiry_nos),
@@ -451,7 +457,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             inquiry_no: 상품 문의 번호
             request: 전시 상태 변경 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_inquiry_display_status") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(f"/inquiry/{inquiry_no}/display-status", json=body, headers=headers)
@@ -466,7 +472,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             inquiry_no: 상품 문의 번호
             content: 답변 내용 (text/plain 본문)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("post_inquiry_reply") as client:
             headers = {"version": "1.0", "Content-Type": "text/plain;charset=UTF-8"}
             resp = await client.post(f"/inquiry/{inquiry_no}/reply", content=content.encode("utf-8"), headers=headers)
             self.raise_for_status(resp)
@@ -496,7 +502,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             review_no: 상품평 번호
             search_after: 검색 기준 값(lastId) (keySet search)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_reviews") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if start_ymd is not None:
@@ -521,7 +527,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             request: 상품평 검색 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_reviews") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/reviews", json=body, headers=headers)
@@ -534,7 +540,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             items: 상품평 등록 요청 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_reviews") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.post("/reviews/product-reviews", json=body, headers=headers)
@@ -547,7 +553,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             items: 상품평 수정 요청 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_reviews") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/reviews/product-reviews", json=body, headers=headers)
@@ -563,7 +569,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             review_nos: 삭제할 상품 리뷰 번호 리스트
             register_nos: 작성자 번호 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_reviews") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "reviewNos": ",".join(str(no) for no in review_nos),
@@ -581,7 +587,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             items: 외부 상품평 등록 요청 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_external_site_reviews") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.post("/reviews/external-site", json=body, headers=headers)
@@ -594,7 +600,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             request: 베스트 리뷰 일괄 변경 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_best_reviews") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/reviews/best-review", json=body, headers=headers)
@@ -607,7 +613,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             request: 전시상태 일괄 변경 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_review_status") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/reviews/status", json=body, headers=headers)
@@ -620,7 +626,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
         Args:
             items: extraJson 변경 요청 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_review_extra_json") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/reviews/extraJson", json=body, headers=headers)
@@ -638,7 +644,7 @@ class ShopbyServerDisplayApiClient(ShopbyServerApiClient):
             page: 페이지 번호
             size: 한 페이지에 조회되는 갯수
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_stickers") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -5,8 +5,6 @@
 
 from datetime import date, datetime
 
-import httpx
-
 from shopby_sdk.base.kst import to_kst_string
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.manage.models import (
@@ -78,7 +76,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             AccumulationsResponse: 적립금 목록 (items, totalCount)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_accumulations") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "periodType": period_type,
@@ -133,7 +131,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             AssemblesResponse: 적립금 변동 요청 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_accumulation_assembles") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -194,7 +192,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             ExternalAccumulationsResponse: 외부적립금 이력 목록 (items, totalCount)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_accumulation_externals") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "startYmdt": to_kst_string(start_ymdt),
@@ -240,7 +238,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             SettlementResponse: 적립금 지급/차감 이력 (items, totalCount)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_accumulation_settlement") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "startYmd": to_kst_string(start_ymd),
@@ -268,7 +266,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             list[AccumulationUsageItem]: 적립금 사용처 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_accumulation_usage") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "accumulationNos": ",".join(str(no) for no in accumulation_nos),
@@ -292,7 +290,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             MemberAvailableAccumulationResponse: 회원 보유 적립금 목록 (items, count)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_member_available_accumulations") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -325,7 +323,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             ProfileAccumulationsResponse: 회원 적립금 상태 (totalAmt, items, ...)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_accumulations") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -358,7 +356,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             CreateAccumulationResponse: 회원번호, 생성된 적립금 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_accumulation") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -392,7 +390,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             SubtractAccumulationResponse: 차감 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("subtract_accumulation") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool | float] = {}
             if accumulation_amt is not None:
@@ -422,7 +420,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Args:
             accumulation_no: 적립금 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("expire_accumulation") as client:
             headers = {"version": "1.0"}
 
             resp = await client.put(
@@ -468,7 +466,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             InquiriesResponse: 1:1문의 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiries") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -507,7 +505,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             list[InquiryType]: 1:1문의 유형 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiry_types") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/inquiries/types", headers=headers)
@@ -521,7 +519,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Args:
             request: 1:1문의 유형 생성 요청 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_inquiry_type") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -540,7 +538,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
             inquiry_no: 문의번호
             request: 답변 등록 요청 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("answer_inquiry") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -562,7 +560,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Args:
             request: 카카오 알림톡 전송 요청 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("send_kakao_message") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -591,7 +589,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             SmsUnsubscribeResponse: 수신거부 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_sms_unsubscribe_list") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -618,7 +616,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             list[TermsItem]: 약관 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_terms") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "termsTypes": ",".join(terms_types),
@@ -645,7 +643,7 @@ class ShopbyServerManageApiClient(ShopbyServerApiClient):
         Returns:
             CustomTermsMembersResponse: 동의 회원 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_custom_terms_agree_members") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "page": page,
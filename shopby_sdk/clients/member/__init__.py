@@ -1,5 +1,12 @@
 """Member API 클라이언트 및 모델"""
 
+from shopby_sdk.clients.member.bulk import (
+    BulkCheckpoint,
+    BulkWriteResult,
+    MemberWriteResult,
+    bulk_delete_profiles,
+    bulk_update_profiles,
+)
 from shopby_sdk.clients.member.client import ShopbyServerMemberApiClient
 from shopby_sdk.clients.member.models import (
     AddMemberToGroupRequest,
@@ -62,6 +69,11 @@ from shopby_sdk.clients.member.models import (
 __all__ = [
     # Client
     "ShopbyServerMemberApiClient",
+    "bulk_update_profiles",
+    "bulk_delete_profiles",
+    "BulkWriteResult",
+    "BulkCheckpoint",
+    "MemberWriteResult",
     # Request Enum Types
     "MemberSearchType",
     "MemberStatus",
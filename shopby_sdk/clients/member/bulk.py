@@ -0,0 +1,403 @@
+"""회원 정보 대량 수정 / 탈퇴 오케스트레이터.
+
+``bulk_update_profile`` (요청 1회 최대 1000명) / ``bulk_delete_profile`` (최대 500명) 을
+수백만 명 단위 CRM 동기화에 쓸 수 있도록
+
+- 입력(리스트·제너레이터·async iterable)을 한도 크기 chunk 로 나눠 필요한 만큼만 꺼내고,
+- chunk 를 ``concurrency`` 개씩 동시에 보내며 (적응형 rate limiter 로 속도 조절),
+- 회원별 성공/실패를 ``on_result`` 콜백과 ``BulkWriteResult.failures`` 로 남기고,
+- 체크포인트 파일에 처리한 입력 위치를 chunk 마다 기록해, 중단 후 같은 입력으로 다시 실행하면
+  처리한 위치 다음부터 이어서 보낸다.
+
+응답의 회원 번호를 읽어야 하므로 raw 모드 클라이언트를 넘겨도 응답은 모델로 받는다.
+
+chunk 요청이 요청 내용 오류(400/422)로 거부되면 chunk 를 반씩 나눠 다시 보내 문제 회원만 실패로 남긴다
+(``isolate_failures``). 인증 오류(401/403)는 어느 회원에도 해당하지 않으므로 실행을 멈추고 예외를 올린다.
+수정·탈퇴 모두 같은 요청을 다시 보내도 결과가 같아 멱등 요청으로 보내므로 429/5xx 는 클라이언트 재시도
+정책(``retry=True``)이 재시도하고, 그래도 실패하면 (다른 4xx 와 함께) chunk 전체를 실패로 기록한다.
+회원 번호·아이디가 모두 없는 수정 요청은 보내기 전에 ValueError 로 멈춘다. 체크포인트는 입력 순서
+기준이므로 재개 시 입력 순서가 같아야 하며, 중단 직전에 보낸 chunk 는 다시 보내질 수 있다 (at-least-once).
+
+Example:
+    ```python
+    result = await bulk_update_profiles(
+        member_client,
+        (ProfileUpdateRequest(member_no=row.no, email=row.email) for row in crm_rows),
+        checkpoint="profile_sync.checkpoint.json",
+        on_result=lambda r: None if r.ok else failed_log.write(f"{r.member}\\t{r.error}\\n"),
+    )
+    print(result.succeeded, result.failed, result.throughput)
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from httpx import HTTPStatusError
+
+from shopby_sdk.base.batch import as_async_iter, call_handler, fetch_many
+from shopby_sdk.base.checkpoint import JsonStateFile
+from shopby_sdk.base.ratelimit import AdaptiveRateLimiter
+from shopby_sdk.clients.member.client import ShopbyServerMemberApiClient
+from shopby_sdk.clients.member.models import BulkDeleteProfileRequest, ProfileUpdateRequest
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+MAX_UPDATE_CHUNK = 1000
+"""``bulk_update_profile`` 요청 1회 최대 회원 수."""
+
+MAX_DELETE_CHUNK = 500
+"""``bulk_delete_profile`` 요청 1회 최대 회원 수."""
+
+DEFAULT_BULK_CONCURRENCY = 4
+"""동시에 보내는 chunk 요청 수 기본값."""
+
+ISOLATE_STATUSES = frozenset({400, 422})
+"""chunk 를 반씩 나눠 다시 보내는 응답 상태 (요청 내용 중 일부 회원이 잘못된 경우)."""
+
+ABORT_STATUSES = frozenset({401, 403})
+"""실행을 멈추는 응답 상태 (자격증명·권한 오류는 나눠 보내도 같다)."""
+
+
+@dataclass(frozen=True, slots=True)
+class MemberWriteResult:
+    """회원 1명의 처리 결과.
+
+    Attributes:
+        member: 회원 번호 (번호 없이 아이디로 수정한 경우 회원 아이디)
+        error: 실패 사유 (성공 시 None)
+        status: 실패한 요청의 HTTP 상태 코드 (네트워크 오류·응답 누락 시 None)
+    """
+
+    member: int | str
+    error: str | None = None
+    status: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+ResultHandler = Callable[[MemberWriteResult], Awaitable[None] | None]
+
+
+@dataclass(slots=True)
+class BulkWriteResult:
+    """대량 처리 1회 실행 결과 (체크포인트로 재개한 경우 이전 실행 분량 포함).
+
+    Attributes:
+        operation: ``update_profile`` / ``delete_profile``
+        succeeded: 성공한 회원 수
+        failed: 실패한 회원 수
+        requests: 보낸 API 요청 수 (실패 격리를 위한 분할 요청 포함)
+        resumed: 체크포인트로 건너뛴 입력 수
+        failures: 이번 실행의 실패 결과
+        elapsed: 이번 실행 시간(초)
+    """
+
+    operation: str
+    succeeded: int = 0
+    failed: int = 0
+    requests: int = 0
+    resumed: int = 0
+    failures: list[MemberWriteResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def throughput(self) -> float:
+        """이번 실행의 초당 처리 회원 수."""
+        return (self.processed - self.resumed) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class BulkCheckpoint:
+    """대량 처리 진행 상태 (JSON 파일, 임시 파일 + rename 으로 원자적 저장).
+
+    파일 구조::
+
+        {"operation": "update_profile", "offset": 152000, "succeeded": 151990, "failed": 10,
+         "requests": 153, "done": false}
+    """
+
+    def __init__(self, path: str | os.PathLike[str], operation: str):
+        self._file = JsonStateFile(path)
+        self.path = self._file.path
+        self.operation = operation
+        state = self._file.load()
+        if state is None:
+            state = {"operation": operation, "offset": 0, "succeeded": 0, "failed": 0, "requests": 0}
+        elif state.get("operation") != operation:
+            raise ValueError(f"checkpoint {self.path} is for {state.get('operation')!r}, not {operation!r}")
+        self._state = state
+
+    @property
+    def offset(self) -> int:
+        """처리를 마친 입력 수 (입력 순서 기준)."""
+        return self._state["offset"]
+
+    @property
+    def done(self) -> bool:
+        return bool(self._state.get("done"))
+
+    def restore(self, result: BulkWriteResult) -> None:
+        result.succeeded = self._state["succeeded"]
+        result.failed = self._state["failed"]
+        result.requests = self._state["requests"]
+        result.resumed = self.offset
+
+    def update(self, offset: int, result: BulkWriteResult, *, done: bool = False) -> None:
+        self._state.update(
+            offset=offset, succeeded=result.succeeded, failed=result.failed, requests=result.requests, done=done
+        )
+        self._file.save(self._state)
+
+
+async def bulk_update_profiles(
+    client: ShopbyServerMemberApiClient,
+    requests: Iterable[ProfileUpdateRequest] | AsyncIterable[ProfileUpdateRequest],
+    *,
+    chunk_size: int = MAX_UPDATE_CHUNK,
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    checkpoint: str | os.PathLike[str] | None = None,
+    on_result: ResultHandler | None = None,
+    isolate_failures: bool = True,
+    rate_limit: bool | AdaptiveRateLimiter | None = True,
+) -> BulkWriteResult:
+    """회원 정보를 ``bulk_update_profile`` 로 chunk 단위 동시 수정.
+
+    응답의 ``memberNos`` 에 없는 회원 번호는 실패로 기록한다 (회원 아이디로만 지정한 회원은
+    요청이 성공하면 성공으로 본다).
+
+    Args:
+        client: 회원 server API 클라이언트
+        requests: 수정 요청 (회원 1명당 1건). 제너레이터·async iterable 은 필요한 만큼만 꺼낸다.
+        chunk_size: 요청 1회 회원 수 (최대 1000)
+        concurrency: 동시에 보내는 chunk 요청 수
+        checkpoint: 체크포인트 파일 경로. 있으면 기록된 위치 다음부터 처리한다.
+        on_result: 회원별 결과를 받는 콜백 (동기/비동기)
+        isolate_failures: 400/422 로 거부된 chunk 를 반씩 나눠 다시 보내 실패 회원만 골라낼지
+        rate_limit: 적응형 rate limiter. True(기본)면 자격증명별 공유 limiter, None 이면 클라이언트 설정 그대로.
+
+    Raises:
+        HTTPStatusError: 401/403 응답 (체크포인트는 마지막으로 처리를 마친 위치에 남는다)
+        ValueError: member_no 와 member_id 가 모두 없는 요청 (그 요청이 든 chunk 는 보내지 않는다)
+    """
+
+    client = _working_client(client, rate_limit)
+
+    async def write(chunk: list[ProfileUpdateRequest]) -> set[int | str]:
+        resp = await client.bulk_update_profile(chunk)
+        updated = set(resp.member_nos)
+        return {key for key in map(_profile_key, chunk) if isinstance(key, str) or key in updated}
+
+    return await _run_bulk(
+        "update_profile",
+        requests,
+        write,
+        _profile_key,
+        chunk_size=_check_chunk_size(chunk_size, MAX_UPDATE_CHUNK),
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+        on_result=on_result,
+        isolate_failures=isolate_failures,
+    )
+
+
+async def bulk_delete_profiles(
+    client: ShopbyServerMemberApiClient,
+    member_nos: Iterable[int] | AsyncIterable[int],
+    *,
+    chunk_size: int = MAX_DELETE_CHUNK,
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    checkpoint: str | os.PathLike[str] | None = None,
+    on_result: ResultHandler | None = None,
+    isolate_failures: bool = True,
+    rate_limit: bool | AdaptiveRateLimiter | None = True,
+) -> BulkWriteResult:
+    """회원을 ``bulk_delete_profile`` 로 chunk 단위 동시 탈퇴 처리.
+
+    요청이 성공한 chunk 의 회원은 모두 성공으로 본다. 인자는 ``bulk_update_profiles`` 와 같다
+    (chunk_size 최대 500).
+    """
+
+    client = _working_client(client, rate_limit)
+
+    async def write(chunk: list[int]) -> set[int | str]:
+        await client.bulk_delete_profile(BulkDeleteProfileRequest(member_nos=chunk))
+        return set(chunk)
+
+    return await _run_bulk(
+        "delete_profile",
+        member_nos,
+        write,
+        lambda member_no: member_no,
+        chunk_size=_check_chunk_size(chunk_size, MAX_DELETE_CHUNK),
+        concurrency=concurrency,
+        checkpoint=checkpoint,
+        on_result=on_result,
+        isolate_failures=isolate_failures,
+    )
+
+
+def _working_client(
+    client: ShopbyServerMemberApiClient, rate_limit: bool | AdaptiveRateLimiter | None
+) -> ShopbyServerMemberApiClient:
+    """응답을 모델로 읽고(raw 모드 무시) 지정한 rate limiter 를 쓰는 복제본 (풀 공유)."""
+    return client.with_options(raw=False, rate_limit=rate_limit)
+
+
+async def _run_bulk(
+    operation: str,
+    items: Iterable[_T] | AsyncIterable[_T],
+    write: Callable[[list[_T]], Awaitable[set[int | str]]],
+    key: Callable[[_T], int | str],
+    *,
+    chunk_size: int,
+    concurrency: int,
+    checkpoint: str | os.PathLike[str] | None,
+    on_result: ResultHandler | None,
+    isolate_failures: bool,
+) -> BulkWriteResult:
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    result = BulkWriteResult(operation)
+    state = BulkCheckpoint(checkpoint, operation) if checkpoint is not None else None
+    skip = 0
+    if state is not None:
+        state.restore(result)
+        skip = state.offset
+        if state.done:
+            logger.info("bulk %s: already done (%d members)", operation, skip)
+            return result
+        if skip:
+            logger.info("bulk %s: resuming after %d members", operation, skip)
+
+    async def send(chunk: list[_T]) -> tuple[list[MemberWriteResult], int]:
+        # fetch_many 는 입력 순서대로 결과를 내보내므로 체크포인트 위치는 항상 처리를 마친 입력의 끝이다.
+        # 집계도 순서대로 합쳐야 체크포인트의 건수가 위치와 맞는다.
+        results: list[MemberWriteResult] = []
+        requests = await _write_isolating(chunk, write, key, results, isolate_failures)
+        return results, requests
+
+    started = time.perf_counter()
+    offset = skip
+    batches = fetch_many(send, _chunks(items, chunk_size, skip, key), concurrency=concurrency, ordered=True)
+    try:
+        async for batch in batches:
+            if batch.error is not None:
+                raise batch.error
+            member_results, requests = batch.value or ((), 0)
+            result.requests += requests
+            for member_result in member_results:
+                if member_result.ok:
+                    result.succeeded += 1
+                else:
+                    result.failed += 1
+                    result.failures.append(member_result)
+                await call_handler(on_result, member_result)
+            offset += len(batch.key)
+            if state is not None:
+                state.update(offset, result)
+    finally:
+        await batches.aclose()
+        result.elapsed = time.perf_counter() - started
+    if state is not None:
+        state.update(offset, result, done=True)
+
+    logger.info(
+        "bulk %s: succeeded=%d failed=%d requests=%d (%.1f/s)",
+        operation,
+        result.succeeded,
+        result.failed,
+        result.requests,
+        result.throughput,
+    )
+    return result
+
+
+async def _write_isolating(
+    chunk: list[_T],
+    write: Callable[[list[_T]], Awaitable[set[int | str]]],
+    key: Callable[[_T], int | str],
+    results: list[MemberWriteResult],
+    isolate_failures: bool,
+) -> int:
+    """chunk 를 보내 회원별 결과를 results 에 추가하고 보낸 요청 수를 반환. 400/422 면 반씩 나눠 다시 보낸다."""
+    try:
+        succeeded = await write(chunk)
+    except HTTPStatusError as exc:
+        status = exc.response.status_code
+        if status in ABORT_STATUSES:
+            raise
+        if isolate_failures and len(chunk) > 1 and status in ISOLATE_STATUSES:
+            middle = len(chunk) // 2
+            return (
+                1
+                + await _write_isolating(chunk[:middle], write, key, results, isolate_failures)
+                + await _write_isolating(chunk[middle:], write, key, results, isolate_failures)
+            )
+        error = _error_message(exc)
+        results.extend(MemberWriteResult(key(item), error, status) for item in chunk)
+        return 1
+    except Exception as exc:
+        logger.warning("bulk chunk failed (%d members)", len(chunk), exc_info=True)
+        error = f"{type(exc).__name__}: {exc}"
+        results.extend(MemberWriteResult(key(item), error) for item in chunk)
+        return 1
+    for item in chunk:
+        member = key(item)
+        results.append(MemberWriteResult(member) if member in succeeded else MemberWriteResult(member, "not updated"))
+    return 1
+
+
+async def _chunks(
+    items: Iterable[_T] | AsyncIterable[_T], size: int, skip: int, key: Callable[[_T], int | str]
+) -> AsyncIterator[list[_T]]:
+    """skip 개를 건너뛴 items 를 size 개씩 묶는다. 회원 키를 꺼낼 수 없는 항목은 chunk 를 보내기 전에 예외."""
+    chunk: list[_T] = []
+    index = 0
+    async for item in as_async_iter(items):
+        index += 1
+        if index <= skip:
+            continue
+        key(item)
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _profile_key(request: ProfileUpdateRequest) -> int | str:
+    if request.member_no is not None:
+        return request.member_no
+    if request.member_id is not None:
+        return request.member_id
+    raise ValueError("ProfileUpdateRequest requires member_no or member_id")
+
+
+def _check_chunk_size(chunk_size: int, limit: int) -> int:
+    if not 1 <= chunk_size <= limit:
+        raise ValueError(f"chunk_size must be between 1 and {limit}")
+    return chunk_size
+
+
+def _error_message(exc: HTTPStatusError) -> str:
+    try:
+        body: Any = exc.response.json()
+    except ValueError:
+        return f"HTTP {exc.response.status_code}"
+    message = body.get("message") if isinstance(body, dict) else None
+    return f"HTTP {exc.response.status_code}: {message}" if message else f"HTTP {exc.response.status_code}"
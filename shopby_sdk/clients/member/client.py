@@ -1,10 +1,11 @@
 """Member API 클라이언트"""
 
+from collections.abc import AsyncIterator
 from datetime import date, datetime
-
-import httpx
+from typing import Any
 
 from shopby_sdk.base.kst import to_kst_string
+from shopby_sdk.base.pagination import KeysetPage, iter_keyset_pages
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.member.models import (
     AddMemberToGroupResponse,
@@ -20,6 +21,7 @@ from shopby_sdk.clients.member.models import (
     ExternalMemberResponse,
     ExtraInfoConfigResponse,
     Grade,
+    Member,
     MemberGroup,
     MemberGroupRequest,
     MemberProhibitRequest,
@@ -114,7 +116,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             MembersListResponse: 회원 목록 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_members") as client:
             headers = {"version": "1.2"}
 
             params: dict[str, str | int | bool] = {}
@@ -167,6 +169,41 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
 
             return self.handle_resp(resp, MembersListResponse)
 
+    async def iter_members(
+        self,
+        *,
+        page_size: int = 1000,
+        resume_from: str | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[KeysetPage[Member]]:
+        """
+        회원 목록 조회하기 V1.2 - keySet(searchAfter) 전체 순회
+
+        ``get_members`` 응답의 lastId 를 다음 요청의 searchAfter 로 이어 간다. 한 번에
+        한 페이지만 보관하므로 메모리가 일정하다.
+
+        Args:
+            page_size: 페이지 크기 (최대 10000) [default: 1000]
+            resume_from: 이전 실행에서 저장한 ``KeysetPage.checkpoint`` (중단 지점부터 재개)
+            **filters: ``get_members`` 의 검색 인자 (search_after/page_number/page_size 제외)
+
+        Yields:
+            KeysetPage[Member]: 페이지별 회원 목록과 재개용 checkpoint
+        """
+
+        client = self._model_client()
+
+        async def fetch(search_after: str | None) -> MembersListResponse:
+            return await client.get_members(search_after=search_after, page_size=page_size, **filters)
+
+        async for page in iter_keyset_pages(
+            fetch,
+            next_cursor=lambda r: r.last_id,
+            page_items=lambda r: r.contents,
+            resume_from=resume_from,
+        ):
+            yield page
+
     # ------------------------------------
     #  회원 그룹 API
     # ------------------------------------
@@ -180,7 +217,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             list[MemberGroup]: 회원 그룹 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_member_groups") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/member-groups", headers=headers)
@@ -200,7 +237,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             MemberGroup: 회원 그룹 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_member_group") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/member-groups/{group_no}", headers=headers)
@@ -230,7 +267,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             ProfileGroupsResponse: 회원의 그룹 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_groups") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int] = {}
@@ -264,7 +301,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             AddMemberToGroupResponse: 추가된 회원 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("add_member_to_group") as client:
             headers = {"version": "1.0"}
 
             body: dict[str, str | int] = {"memberGroupNo": member_group_no}
@@ -295,7 +332,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
             member_no: 회원 번호
             member_id: 회원 아이디
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("remove_member_from_group") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int] = {"memberGroupNo": member_group_no}
@@ -320,7 +357,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             CommonJoinConfigResponse: 회원가입항목 config
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_common_join_config") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/configurations/member/common-join-config", headers=headers)
@@ -336,7 +373,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             ExtraInfoConfigResponse: 추가항목 config
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_extra_info_config") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/configurations/member/extra-info-config", headers=headers)
@@ -353,7 +390,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             OpenIdConfigResponse: 간편회원가입 config
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_openid_config_by_provider") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/configurations/member/open-id/{provider_type}", headers=headers)
@@ -372,7 +409,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
             provider_type: 프로바이더 타입 (PAYCO, NAVER, KAKAO, KAKAO_SYNC, FACEBOOK, LINE, APPLE, GOOGLE, APP_CARD)
             request: 수정할 config 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_openid_config_by_provider") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -389,7 +426,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             provider_type: 프로바이더 타입 (PAYCO, NAVER, KAKAO, KAKAO_SYNC, FACEBOOK, LINE, APPLE, GOOGLE, APP_CARD)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_openid_provider_client_secret") as client:
             headers = {"version": "1.0"}
 
             resp = await client.delete(
@@ -405,7 +442,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             request: 수정할 앱카드 storeId 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("patch_app_card_store_id") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -420,7 +457,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             request: 프로바이더 및 액션(ADD/REMOVE) 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("patch_open_id_pending_provider") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -441,7 +478,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             list[Grade]: 회원등급 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_grades") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/grades", headers=headers)
@@ -460,7 +497,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             ProfileGradesResponse: 등급 변경완료 회원번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_profile_grades") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -479,7 +516,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             request: 생성할 회원 그룹 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_member_group") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -495,7 +532,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
             group_no: 회원 그룹 번호
             request: 수정할 회원 그룹 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_member_group") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -510,7 +547,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             group_no: 회원 그룹 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_member_group") as client:
             headers = {"version": "1.0"}
 
             resp = await client.delete(f"/member-groups/{group_no}", headers=headers)
@@ -578,7 +615,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             MembersListResponse: 회원 목록 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("post_members") as client:
             headers = {"version": "1.3"}
 
             body: dict = {"status": status}
@@ -625,6 +662,43 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
 
             return self.handle_resp(resp, MembersListResponse)
 
+    async def iter_post_members(
+        self,
+        status: MemberStatus,
+        *,
+        page_size: int = 500,
+        resume_from: str | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[KeysetPage[Member]]:
+        """
+        회원 목록 조회하기 V1.3 - keySet(searchAfter) 전체 순회
+
+        ``post_members`` 응답의 lastId 를 다음 요청의 searchAfter 로 이어 간다. 한 번에
+        한 페이지만 보관하므로 메모리가 일정하다.
+
+        Args:
+            status: 회원상태 (필수)
+            page_size: 페이지 크기 (최대 500) [default: 500]
+            resume_from: 이전 실행에서 저장한 ``KeysetPage.checkpoint`` (중단 지점부터 재개)
+            **filters: ``post_members`` 의 검색 인자 (search_after/page_size 제외)
+
+        Yields:
+            KeysetPage[Member]: 페이지별 회원 목록과 재개용 checkpoint
+        """
+
+        client = self._model_client()
+
+        async def fetch(search_after: str | None) -> MembersListResponse:
+            return await client.post_members(status, search_after=search_after, page_size=page_size, **filters)
+
+        async for page in iter_keyset_pages(
+            fetch,
+            next_cursor=lambda r: r.last_id,
+            page_items=lambda r: r.contents,
+            resume_from=resume_from,
+        ):
+            yield page
+
     async def get_expelled_members(
         self,
         target_date: date,
@@ -646,7 +720,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             list[ExpelledMember]: 탈퇴 회원 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_expelled_members") as client:
             headers = {"version": "1.1"}
 
             params: dict[str, str | bool] = {"targetDate": target_date.strftime("%Y-%m-%d")}
@@ -671,7 +745,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             ExternalMemberResponse: 가입된 회원 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_external_member") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -686,7 +760,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             request: 현재/변경할 Oauth ID 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_external_member_id") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -706,7 +780,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             MemberProhibitResponse: 처리 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("prohibit_members") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -742,7 +816,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             ProfileResponse: 회원 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int] = {}
@@ -771,7 +845,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             ProfileUpdateResponse: 수정된 회원 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_profile") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -796,7 +870,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
             member_no: 회원 번호
             oauth_id_no: oauth 인증 일련번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_profile") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int] = {}
@@ -829,7 +903,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
             member_no: 회원 번호
             oauth_id_no: oauth 인증 일련번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("restore_profile") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int] = {}
@@ -859,7 +933,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
             member_no: 회원 번호
             oauth_id_no: oauth 인증 일련번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("logout_profile") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int] = {}
@@ -886,11 +960,12 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             ProfileBulkUpdateResponse: 수정된 회원 번호 목록 (memberNos)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("bulk_update_profile") as client:
             headers = {"version": "1.0"}
 
             body = [item.model_dump(by_alias=True, exclude_none=True, mode="json") for item in requests]
-            resp = await client.put("/profile/bulk", headers=headers, json=body)
+            # 같은 값으로 다시 수정해도 결과가 같으므로 재시도 정책이 켜져 있으면 재시도한다
+            resp = await client.put("/profile/bulk", headers=headers, json=body, idempotent=True)
 
             return self.handle_resp(resp, ProfileBulkUpdateResponse)
 
@@ -903,11 +978,12 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             request: 탈퇴시킬 회원 번호 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("bulk_delete_profile") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
-            resp = await client.post("/profile/bulk-delete", headers=headers, json=body)
+            # 이미 탈퇴한 회원을 다시 탈퇴 처리해도 결과가 같으므로 재시도 정책이 켜져 있으면 재시도한다
+            resp = await client.post("/profile/bulk-delete", headers=headers, json=body, idempotent=True)
             self.raise_for_status(resp)
             return None
 
@@ -921,7 +997,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             request: 차단자 및 차단 대상 회원 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("release_blocked_member") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -953,7 +1029,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Returns:
             DormantMembersResponse: 휴면 회원 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_dormant_members") as client:
             headers = {"version": "1.1"}
 
             params: dict[str, str | int] = {
@@ -984,7 +1060,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
             member_id: 회원 아이디
             member_no: 회원 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("convert_dormant_member") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int] = {}
@@ -1007,7 +1083,7 @@ class ShopbyServerMemberApiClient(ShopbyServerApiClient):
         Args:
             request: 회원 아이디/번호 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("release_dormant_member") as client:
             headers = {"version": "1.0"}
 
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -1,10 +1,13 @@
 """Order API 클라이언트"""
 
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime, date
+from typing import Any, overload
 
-import httpx
-
+from shopby_sdk.base.daterange import DEFAULT_SHARD_CONCURRENCY, iter_sharded
 from shopby_sdk.base.kst import to_kst_string
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, iter_page_items
+from shopby_sdk.base.projection import ProjectionDto, project
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.order.models import (
     AccountOrder,
@@ -25,6 +28,7 @@ from shopby_sdk.clients.order.models import (
     HoldDeliveryRequest,
     OrderDeliveriesResponse,
     OrderDetailResponse,
+    Order,
     OrderExtraDataItem,
     OrderRequestType,
     OrdersResponse,
@@ -121,7 +125,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             OrdersResponse: 주문 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_orders") as client:
             # Version 1.1 헤더 추가
             headers = {"version": "1.1"}
 
@@ -190,7 +194,131 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
 
             return self.handle_resp(resp, OrdersResponse)
 
-    async def get_order_detail(self, order_no: str) -> OrderDetailResponse:
+    async def iter_orders(
+        self,
+        *,
+        start_ymd: date | None = None,
+        end_ymd: date | None = None,
+        start_ymdt: datetime | None = None,
+        end_ymdt: datetime | None = None,
+        order_option_nos: list[int] | None = None,
+        order_request_types: list[OrderRequestType] | None = None,
+        search_date_type: SearchDateType | None = None,
+        member_no: int | None = None,
+        search_type: SearchType | None = None,
+        search_values: list[str] | None = None,
+        delivery_company_type: DeliveryCompanyType | None = None,
+        orderer_contact1: str | None = None,
+        receiver_contact1: str | None = None,
+        shipping_area_type: ShippingAreaType | None = None,
+        pay_type: PayType | None = None,
+        desc: bool | None = None,
+        partner_no: int | None = None,
+        page_size: int = 200,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[Order]:
+        """
+        주문 조회하기 v1.1 - 전체 페이지 순회
+
+        ``get_orders`` 를 페이지별로 호출해 주문을 하나씩 내보낸다. 첫 페이지로
+        totalCount 를 확인한 뒤 다음 페이지들은 최대 ``prefetch`` 개까지 동시에 요청한다.
+
+        Args:
+            page_size: 페이지 크기 (최대 200) [default: 200]
+            prefetch: 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``get_orders`` 와 동일)
+
+        Yields:
+            Order: 주문
+        """
+
+        client = self._model_client()
+
+        async def fetch(page_number: int, size: int) -> OrdersResponse:
+            return await client.get_orders(
+                start_ymd=start_ymd,
+                end_ymd=end_ymd,
+                start_ymdt=start_ymdt,
+                end_ymdt=end_ymdt,
+                order_option_nos=order_option_nos,
+                order_request_types=order_request_types,
+                search_date_type=search_date_type,
+                member_no=member_no,
+                search_type=search_type,
+                search_values=search_values,
+                delivery_company_type=delivery_company_type,
+                orderer_contact1=orderer_contact1,
+                receiver_contact1=receiver_contact1,
+                shipping_area_type=shipping_area_type,
+                pay_type=pay_type,
+                page_number=page_number,
+                page_size=size,
+                desc=desc,
+                partner_no=partner_no,
+            )
+
+        async for order in iter_page_items(
+            fetch,
+            page_size=page_size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.contents,
+            prefetch=prefetch,
+        ):
+            yield order
+
+    async def iter_orders_sharded(
+        self,
+        start_ymd: date,
+        end_ymd: date,
+        *,
+        window_days: int = 30,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        page_size: int = 200,
+        prefetch: int = DEFAULT_PREFETCH,
+        **filters: Any,
+    ) -> AsyncIterator[Order]:
+        """
+        주문 조회하기 v1.1 - 긴 기간을 구간으로 나눠 동시 순회
+
+        주문 조회 기간은 최대 3개월이다. [start_ymd, end_ymd] 를 ``window_days`` 일
+        구간으로 나눠 구간마다 ``iter_orders`` 로 전체 페이지를 순회하고, 최대
+        ``concurrency`` 개 구간을 동시에 조회한다. 주문은 구간 순서(과거 → 최근)대로,
+        구간 안에서는 ``get_orders`` 정렬 순서대로 나온다.
+        (``shopby_sdk.base.daterange.iter_sharded`` 참고)
+
+        Args:
+            start_ymd: 시작일
+            end_ymd: 종료일
+            window_days: 구간 일수 (최대 90) [default: 30]
+            concurrency: 동시에 조회할 구간 수
+            page_size: 페이지 크기 (최대 200) [default: 200]
+            prefetch: 구간마다 동시에 미리 요청할 페이지 수
+            **filters: ``get_orders`` 의 필터 인자 (기간/page_number/page_size 제외)
+
+        Yields:
+            Order: 주문
+        """
+        async for order in iter_sharded(
+            lambda window: self.iter_orders(
+                start_ymd=window.start, end_ymd=window.end, page_size=page_size, prefetch=prefetch, **filters
+            ),
+            start_ymd,
+            end_ymd,
+            days=window_days,
+            max_days=90,
+            concurrency=concurrency,
+        ):
+            yield order
+
+    @overload
+    async def get_order_detail(self, order_no: str) -> OrderDetailResponse: ...
+
+    @overload
+    async def get_order_detail(self, order_no: str, *, fields: Iterable[str]) -> ProjectionDto: ...
+
+    async def get_order_detail(
+        self, order_no: str, *, fields: Iterable[str] | None = None
+    ) -> OrderDetailResponse | ProjectionDto:
         """
         주문 상세 조회
 
@@ -198,11 +326,15 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
 
         Args:
             order_no: 주문 번호 (예: 202206151234567890)
+            fields: 지정하면 이 필드 경로만 검증한 가벼운 모델을 반환한다
+                (예: ``["order_no", "last_main_pay_amt", "order_products.order_options"]``).
+                (``shopby_sdk.base.projection.project`` 참고)
 
         Returns:
-            OrderDetailResponse: 주문 상세 정보
+            OrderDetailResponse: 주문 상세 정보 (fields 지정 시 projection 모델)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        model = OrderDetailResponse if fields is None else project(OrderDetailResponse, fields)
+        async with self._session("get_order_detail") as client:
             # Version 1.0 헤더 추가
             headers = {"version": "1.0"}
 
@@ -211,7 +343,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
                 headers=headers,
             )
 
-            return self.handle_resp(resp, OrderDetailResponse)
+            return self.handle_resp(resp, model)
 
     # ============================================================
     #  무통장 미입금 주문 (/accounts/orders)
@@ -226,7 +358,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             list[AccountOrder]: 무통장 미입금 주문 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_account_orders") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/accounts/orders", headers=headers)
             return self.handle_resp(resp, list[AccountOrder])
@@ -241,7 +373,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             AccountOrder: 무통장 미입금 주문 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_account_order") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/accounts/orders/{order_no}", headers=headers)
             return self.handle_resp(resp, AccountOrder)
@@ -259,7 +391,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             list[AccountOrderConfirmResult]: 주문번호별 처리 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("confirm_account_orders") as client:
             headers = {"version": "1.0"}
             body = [r.model_dump(by_alias=True, exclude_none=True, mode="json") for r in requests]
             resp = await client.put("/accounts/orders/confirmation", headers=headers, json=body)
@@ -278,7 +410,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             AppCardPaymentKey: PG 결제 키 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_app_card_payment_key") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/app-card/payment-key", headers=headers)
             return self.handle_resp(resp, AppCardPaymentKey)
@@ -296,7 +428,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             dict: 등록 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("register_app_card_payment_key") as client:
             headers = {"version": "1.0"}
             resp = await client.post("/app-card/payment-key", headers=headers, json=request)
             return self.handle_resp(resp, dict)
@@ -308,7 +440,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             request: 사용여부 정보 (예: {"available": true})
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_app_card_available") as client:
             headers = {"version": "1.0"}
             resp = await client.patch("/app-card/available", headers=headers, json=request)
             self.raise_for_status(resp)
@@ -345,7 +477,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             CartResponse: 장바구니 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_carts") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if member_nos is not None:
@@ -385,7 +517,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             WishResponse: 위시리스트 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_wishes") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if start_ymdt is not None:
@@ -449,7 +581,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             OrderDeliveriesResponse: 배송번호 기준 주문 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_orders_deliveries") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if start_ymd is not None:
@@ -517,7 +649,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             PreviousOrdersResponse: 이전주문 검색 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_previous_orders") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"page": page, "size": size}
             if search_type is not None:
@@ -545,7 +677,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             PreviousOrderRegisterResult: 등록 결과 (등록 개수)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("register_previous_orders") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.post("/previous-orders", headers=headers, json=body)
@@ -561,7 +693,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             PreviousOrderDeleteResult: 삭제 결과 (삭제 개수)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_previous_orders") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"mallName": mall_name}
             resp = await client.post("/previous-orders/delete", headers=headers, params=params)
@@ -582,7 +714,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             PreviousOrderDeleteResult: 삭제 결과 (삭제 개수)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_previous_orders_by_order_nos") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"mallName": mall_name}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
@@ -621,7 +753,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             RecurringPaymentsResponse: 정기결제(배송) 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_recurring_payments") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"page": page, "size": size}
             if member_nos is not None:
@@ -659,7 +791,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             ShippingAddressesResponse: 배송지 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_shipping_addresses") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "memberNos": ",".join(str(no) for no in member_nos),
@@ -687,10 +819,12 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             CouponAvailableResponse: 사용 가능 쿠폰 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_available_coupons") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
-            resp = await client.post("/orders/coupons/available", headers=headers, json=body)
+            resp = await client.post(
+                "/orders/coupons/available", headers=headers, json=body, idempotent=True
+            )
             return self.handle_resp(resp, CouponAvailableResponse)
 
     async def calculate_coupons(
@@ -706,10 +840,12 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             CouponAvailableResponse: 쿠폰 적용 금액 계산 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("calculate_coupons") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
-            resp = await client.post("/orders/coupons/calculate", headers=headers, json=body)
+            resp = await client.post(
+                "/orders/coupons/calculate", headers=headers, json=body, idempotent=True
+            )
             return self.handle_resp(resp, CouponAvailableResponse)
 
     # ============================================================
@@ -729,7 +865,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             ChangeStatusByShippingNoResponse: 처리 건수 및 실패 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("change_orders_status_by_shipping_no") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/orders/change-status/by-shipping-no", headers=headers, json=body)
@@ -742,7 +878,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             request: 구매확정 처리 정보 (free-form object)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("confirm_orders_purchase") as client:
             headers = {"version": "1.0"}
             resp = await client.put("/orders/confirm", headers=headers, json=request)
             self.raise_for_status(resp)
@@ -755,7 +891,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             items: 주문상품옵션번호 및 송장정보 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("deliver_orders") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/orders/delivery", headers=headers, json=body)
@@ -769,7 +905,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             items: 주문상품옵션번호 및 송장정보 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("deliver_ing_orders") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/orders/delivery-ing", headers=headers, json=body)
@@ -783,7 +919,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             items: 주문번호별 key/value 추가정보 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_orders_extra_data") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/orders/extra-data", headers=headers, json=body)
@@ -797,7 +933,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             request: 배송보류 처리 정보 (주문옵션번호, 사유 등)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("hold_orders_delivery") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/orders/hold-delivery", headers=headers, json=body)
@@ -811,7 +947,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             request: 배송준비중 처리 정보 (free-form object)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("prepare_orders_delivery") as client:
             headers = {"version": "1.0"}
             resp = await client.put("/orders/prepare-delivery", headers=headers, json=request)
             self.raise_for_status(resp)
@@ -824,7 +960,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             request: 상품준비중 처리 정보 (free-form object)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("prepare_orders_product") as client:
             headers = {"version": "1.0"}
             resp = await client.put("/orders/prepare-product", headers=headers, json=request)
             self.raise_for_status(resp)
@@ -837,7 +973,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             request: 수취확인 처리 정보 (free-form object)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("receive_orders") as client:
             headers = {"version": "1.0"}
             resp = await client.put("/orders/receive", headers=headers, json=request)
             self.raise_for_status(resp)
@@ -850,7 +986,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             request: 예약 주문의 주문옵션번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("reserve_orders_to_normal") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/orders/reserve-to-normal", headers=headers, json=body)
@@ -867,7 +1003,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             items: 주문번호별 현금영수증 발행결과 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_cash_receipt_issuance_result") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/orders/cash-receipt", headers=headers, json=body)
@@ -884,7 +1020,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Args:
             items: 주문번호별 세금계산서 발행결과 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_tax_invoice_issuance_result") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/orders/tax-invoice", headers=headers, json=body)
@@ -904,7 +1040,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             list[UpdateInvoiceResult]: 배송번호별 변경 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_orders_invoices") as client:
             headers = {"version": "1.0"}
             body = [x.model_dump(by_alias=True, exclude_none=True, mode="json") for x in items]
             resp = await client.put("/orders/update-invoices", headers=headers, json=body)
@@ -935,7 +1071,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             TaskMessagesResponse: 업무 메시지 조회 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_task_messages") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "dateType": date_type,
@@ -963,7 +1099,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             TaskMessageCreateResult: 등록된 업무메시지 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_task_message") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/task-messages", headers=headers, json=body)
@@ -981,7 +1117,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
             task_message_no: 업무 메시지 번호
             request: 수정할 업무 메시지 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_task_message") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(f"/task-messages/{task_message_no}", headers=headers, json=body)
@@ -1003,7 +1139,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
         Returns:
             TaskMessageDetailCreateResult: 등록된 상세 업무메시지 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_task_message_detail") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post(f"/task-messages/{task_message_no}/details", headers=headers, json=body)
@@ -1023,7 +1159,7 @@ class ShopbyServerOrderApiClient(ShopbyServerApiClient):
             task_message_detail_no: 상세 메시지 번호
             request: 수정할 상세 업무 메시지 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_task_message_detail") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
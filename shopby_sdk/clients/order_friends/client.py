@@ -3,10 +3,12 @@
 주문과 관련된 부가 기능(통계, 정산, CS 등)을 수행하는 server API 클라이언트
 """
 
+from collections.abc import AsyncIterator
 from datetime import date
+from typing import Any
 
-import httpx
-
+from shopby_sdk.base.daterange import DEFAULT_SHARD_CONCURRENCY, iter_sharded
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, iter_page_items
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.order_friends.models import (
     CouponType,
@@ -14,6 +16,7 @@ from shopby_sdk.clients.order_friends.models import (
     GenderType,
     MemberJoinType,
     MemberType,
+    OrdersSalesItem,
     OrdersSalesResponse,
     PayType,
     PlatformType,
@@ -26,6 +29,7 @@ from shopby_sdk.clients.order_friends.models import (
     SettlementPartnerType,
     StatisticsPromotionDetailItem,
     StatisticsPromotionsResponse,
+    StatisticsSalesPeriodItem,
     StatisticsSalesPeriodResponse,
     StatisticsSalesProductResponse,
     StatisticsSalesSummaryResponse,
@@ -58,7 +62,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             CsResponse: CS 처리내역 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_cs") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
 
@@ -99,7 +103,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             OrdersSalesResponse: 쇼핑몰 매출 데이터 (totalCount, items)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_orders_sales") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "startYmd": start_ymd.strftime("%Y-%m-%d"),
@@ -112,6 +116,80 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
             resp = await client.get("/orders/sales", headers=headers, params=params)
             return self.handle_resp(resp, OrdersSalesResponse)
 
+    async def iter_orders_sales(
+        self,
+        start_ymd: date,
+        end_ymd: date,
+        includes_delivery_amt: bool,
+        size: int = 100,
+        *,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[OrdersSalesItem]:
+        """
+        쇼핑몰 정산(매출) 데이터 조회하기 - 전체 페이지 순회
+
+        Args:
+            size: 페이지 사이즈 [default: 100]
+            prefetch: 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``get_orders_sales`` 와 동일)
+
+        Yields:
+            OrdersSalesItem: 매출 데이터
+        """
+
+        client = self._model_client()
+
+        async def fetch(page: int, page_size: int) -> OrdersSalesResponse:
+            return await client.get_orders_sales(start_ymd, end_ymd, includes_delivery_amt, page=page, size=page_size)
+
+        async for item in iter_page_items(
+            fetch,
+            page_size=size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.items,
+            prefetch=prefetch,
+        ):
+            yield item
+
+    async def iter_orders_sales_sharded(
+        self,
+        start_ymd: date,
+        end_ymd: date,
+        includes_delivery_amt: bool,
+        size: int = 100,
+        *,
+        window_days: int = 30,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[OrdersSalesItem]:
+        """
+        쇼핑몰 정산(매출) 데이터 조회하기 - 긴 기간을 구간으로 나눠 동시 순회
+
+        [start_ymd, end_ymd] 를 ``window_days`` 일 구간으로 나눠 구간마다
+        ``iter_orders_sales`` 로 순회하고, 최대 ``concurrency`` 개 구간을 동시에 조회한다.
+        결과는 구간 순서(과거 → 최근)대로 나온다.
+        (``shopby_sdk.base.daterange.iter_sharded`` 참고)
+
+        Args:
+            window_days: 구간 일수 [default: 30]
+            concurrency: 동시에 조회할 구간 수
+            prefetch: 구간마다 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``iter_orders_sales`` 와 동일)
+
+        Yields:
+            OrdersSalesItem: 매출 데이터
+        """
+        async for item in iter_sharded(
+            lambda window: self.iter_orders_sales(
+                window.start, window.end, includes_delivery_amt, size=size, prefetch=prefetch
+            ),
+            start_ymd,
+            end_ymd,
+            days=window_days,
+            concurrency=concurrency,
+        ):
+            yield item
+
     async def get_settlement(
         self,
         year: int,
@@ -129,7 +207,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             list[SettlementItem]: 파트너 정산 데이터 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_settlement") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "year": year,
@@ -162,7 +240,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             SettlementDetailResponse: 정산 상세 데이터 (totalCount, totalPage, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_settlement_detail") as client:
             headers = {"version": "1.1"}
             params: dict[str, str | int | bool] = {
                 "startYmd": start_ymd.strftime("%Y-%m-%d"),
@@ -219,7 +297,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             StatisticsPromotionsResponse: 프로모션 통계 쿠폰 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_statistics_promotions") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "couponType": ",".join(coupon_type),
@@ -297,7 +375,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             list[StatisticsPromotionDetailItem]: 쿠폰 판매 현황 상세 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_statistics_promotions_detail") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "couponType": ",".join(coupon_type),
@@ -470,7 +548,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             StatisticsSalesPeriodResponse: 판매통계 일자별 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_statistics_sales_period") as client:
             headers = {"version": "1.0"}
             params = self._build_sales_statistics_params(
                 start_ymd=start_ymd,
@@ -503,6 +581,103 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
             resp = await client.get("/statistics/sales/period", headers=headers, params=params)
             return self.handle_resp(resp, StatisticsSalesPeriodResponse)
 
+    async def iter_statistics_sales_period(
+        self,
+        start_ymd: date,
+        end_ymd: date,
+        gender_types: list[GenderType],
+        member_type: list[MemberType],
+        platform_types: list[PlatformType],
+        size: int = 100,
+        *,
+        prefetch: int = DEFAULT_PREFETCH,
+        **filters: Any,
+    ) -> AsyncIterator[StatisticsSalesPeriodItem]:
+        """
+        판매통계 기간별 목록 조회 - 전체 페이지 순회
+
+        Args:
+            size: 페이지 사이즈 [default: 100]
+            prefetch: 동시에 미리 요청할 페이지 수
+            **filters: ``get_statistics_sales_period`` 의 선택 필터 인자
+                (page/size/page_number/page_size 제외)
+            (그 외 인자는 ``get_statistics_sales_period`` 와 동일)
+
+        Yields:
+            StatisticsSalesPeriodItem: 판매통계 일자별 항목
+        """
+
+        client = self._model_client()
+
+        async def fetch(page: int, page_size: int) -> StatisticsSalesPeriodResponse:
+            return await client.get_statistics_sales_period(
+                start_ymd,
+                end_ymd,
+                gender_types,
+                member_type,
+                platform_types,
+                page=page,
+                size=page_size,
+                **filters,
+            )
+
+        async for item in iter_page_items(
+            fetch,
+            page_size=size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.contents,
+            prefetch=prefetch,
+        ):
+            yield item
+
+    async def iter_statistics_sales_period_sharded(
+        self,
+        start_ymd: date,
+        end_ymd: date,
+        gender_types: list[GenderType],
+        member_type: list[MemberType],
+        platform_types: list[PlatformType],
+        size: int = 100,
+        *,
+        window_days: int = 30,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        prefetch: int = DEFAULT_PREFETCH,
+        **filters: Any,
+    ) -> AsyncIterator[StatisticsSalesPeriodItem]:
+        """
+        판매통계 기간별 목록 조회 - 긴 기간을 구간으로 나눠 동시 순회
+
+        일자별 통계는 구간을 나눠도 항목이 겹치지 않으므로 구간 결과를 그대로 이어 붙인다.
+        상품별/요약 통계는 구간 합산이 필요해 구간 분할을 제공하지 않는다.
+        (``shopby_sdk.base.daterange.iter_sharded`` 참고)
+
+        Args:
+            window_days: 구간 일수 [default: 30]
+            concurrency: 동시에 조회할 구간 수
+            prefetch: 구간마다 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``iter_statistics_sales_period`` 와 동일)
+
+        Yields:
+            StatisticsSalesPeriodItem: 판매통계 일자별 항목
+        """
+        async for item in iter_sharded(
+            lambda window: self.iter_statistics_sales_period(
+                window.start,
+                window.end,
+                gender_types,
+                member_type,
+                platform_types,
+                size=size,
+                prefetch=prefetch,
+                **filters,
+            ),
+            start_ymd,
+            end_ymd,
+            days=window_days,
+            concurrency=concurrency,
+        ):
+            yield item
+
     async def get_statistics_sales_product(
         self,
         start_ymd: date,
@@ -564,7 +739,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             StatisticsSalesProductResponse: 판매통계 상품별 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_statistics_sales_product") as client:
             headers = {"version": "1.0"}
             params = self._build_sales_statistics_params(
                 start_ymd=start_ymd,
@@ -658,7 +833,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             StatisticsSalesSummaryResponse: 판매통계 기간별 요약 (summary, promotionSummary)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_statistics_sales_period_summary") as client:
             headers = {"version": "1.0"}
             params = self._build_sales_statistics_params(
                 start_ymd=start_ymd,
@@ -754,7 +929,7 @@ class ShopbyServerOrderFriendsApiClient(ShopbyServerApiClient):
         Returns:
             StatisticsSalesSummaryResponse: 판매통계 상품별 요약 (summary, promotionSummary)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_statistics_sales_product_summary") as client:
             headers = {"version": "1.0"}
             params = self._build_sales_statistics_params(
                 start_ymd=start_ymd,
@@ -63,9 +63,31 @@ from shopby_sdk.clients.products.models import (
     SavedProductResponse,
     UpdatePurchasePermissionProductRequest,
 )
+from shopby_sdk.clients.products.stock_sync import (
+    OptionStockIndex,
+    StockSyncResult,
+    StockWriteFailure,
+    load_option_stocks,
+    sync_option_stocks,
+)
+from shopby_sdk.clients.products.sync import (
+    JsonFileSyncStateStore,
+    ProductCatalogSync,
+    ProductSyncStats,
+    SyncStateStore,
+)
 
 __all__ = [
     "ShopbyServerProductsApiClient",
+    "JsonFileSyncStateStore",
+    "ProductCatalogSync",
+    "ProductSyncStats",
+    "SyncStateStore",
+    "sync_option_stocks",
+    "load_option_stocks",
+    "OptionStockIndex",
+    "StockSyncResult",
+    "StockWriteFailure",
     "ChangedProductItem",
     "ChangedProductsResponse",
     "PatchProductV2Request",
@@ -1,14 +1,18 @@
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
-from typing import Any, Literal
-
-import httpx
+from typing import Any, Literal, overload
 
+from shopby_sdk.base.cache import cached
+from shopby_sdk.base.chunking import DEFAULT_CHUNK_CONCURRENCY, concat_responses, fetch_chunked
 from shopby_sdk.base.kst import to_kst_string
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, KeysetPage, iter_keyset_pages, iter_page_items
+from shopby_sdk.base.projection import ProjectionDto, project
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.products.models import (
     AddCustomPropertyMappingRequest,
     BrandDetailResponse,
     BrandTreeItem,
+    ChangedProductItem,
     ChangedProductsResponse,
     CreateBrandsRequest,
     CreateBrandsResponse,
@@ -44,6 +48,7 @@ from shopby_sdk.clients.products.models import (
     ProductNosByGlobalNosResponse,
     ProductOptionsResponse,
     ProductSearchResponse,
+    ProductSearchItem,
     ProductSearchV2Response,
     PartialQuickItem,
     PartialQuickResponse,
@@ -71,6 +76,10 @@ from shopby_sdk.clients.products.models import (
 )
 
 
+_MAX_PRODUCT_NOS = 100
+"""상품번호 목록 조회 API 한 번에 보내는 최대 상품 수. 넘으면 나눠 조회한다 (``shopby_sdk.base.chunking``)."""
+
+
 # docs/api/product-server-public.yml
 
 
@@ -85,7 +94,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Returns:
             ProductDetailV1Response: 상품 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_detail") as client:
             # Version 1.0 헤더 추가
             headers = {"version": "1.0"}
 
@@ -96,17 +105,30 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
 
             return self.handle_resp(resp, ProductDetailV1Response)
 
-    async def get_product_detail_v3(self, mall_product_no: int) -> ProductDetailV3Response:
+    @overload
+    async def get_product_detail_v3(self, mall_product_no: int) -> ProductDetailV3Response: ...
+
+    @overload
+    async def get_product_detail_v3(self, mall_product_no: int, *, fields: Iterable[str]) -> ProjectionDto: ...
+
+    async def get_product_detail_v3(
+        self, mall_product_no: int, *, fields: Iterable[str] | None = None
+    ) -> ProductDetailV3Response | ProjectionDto:
         """
         상품 상세 조회하기 (Version 3.0)
 
         Args:
             mall_product_no: 상품번호
+            fields: 지정하면 이 필드 경로만 검증한 가벼운 모델을 반환한다
+                (예: ``["mall_product_no", "sale_price", "options.stock_cnt"]``).
+                나머지 하위 트리는 검증·보존하지 않으므로 대량 조회 시 CPU/메모리가 크게 준다.
+                (``shopby_sdk.base.projection.project`` 참고)
 
         Returns:
-            ProductDetailV3Response: 상품 상세 정보
+            ProductDetailV3Response: 상품 상세 정보 (fields 지정 시 projection 모델)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        model = ProductDetailV3Response if fields is None else project(ProductDetailV3Response, fields)
+        async with self._session("get_product_detail_v3") as client:
             # Version 3.0 헤더 추가
             headers = {"version": "3.0"}
 
@@ -115,7 +137,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
                 headers=headers,
             )
 
-            return self.handle_resp(resp, ProductDetailV3Response)
+            return self.handle_resp(resp, model)
 
     async def search_products_v2(
         self,
@@ -211,7 +233,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Returns:
             ProductSearchV2Response: 검색 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_products_v2") as client:
             # Version 2.0 헤더 추가
             headers = {"version": "2.0"}
 
@@ -316,6 +338,110 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
 
             return self.handle_resp(resp, ProductSearchV2Response)
 
+    async def iter_products_v2(
+        self,
+        *,
+        keywords: str | None = None,
+        delivery_condition_type: Literal["FREE", "CONDITIONAL", "FIXED_FEE"] | None = None,
+        sale_status: str | None = None,
+        soldout: bool | None = None,
+        total_review_count: bool | None = None,
+        family_malls: bool | None = None,
+        product_management_cd: str | None = None,
+        exclude_mall_product_no: int | None = None,
+        include_mall_product_no: int | None = None,
+        order_by: Literal["RECENT_PRODUCT", "SALE_YMD"] | None = None,
+        order_direction: Literal["ASC", "DESC"] | None = None,
+        soldout_place_end: bool | None = None,
+        display_category_nos: str | None = None,
+        display_brand_nos: str | None = None,
+        partner_no: int | None = None,
+        has_option_values: bool | None = None,
+        shipping_area_type: Literal["PARTNER", "MALL"] | None = None,
+        platform_type: Literal["PC", "MOBILE_WEB", "MOBILE"] | None = None,
+        front_display: Literal["Y", "N", "ALL"] | None = None,
+        url_direct_display: Literal["Y", "N", "ALL"] | None = None,
+        registration_period_start_ymdt: datetime | None = None,
+        registration_period_end_ymdt: datetime | None = None,
+        modification_period_start_ymdt: datetime | None = None,
+        modification_period_end_ymdt: datetime | None = None,
+        sale_setting_types: str | None = None,
+        apply_status_type: str | None = None,
+        sale_method_type: Literal["ALL", "PURCHASE", "CONSIGNMENT"] | None = None,
+        stock_range_type: Literal["ALL", "NONE", "EXIST", "EQ", "LT", "LE", "GT", "GE", "RANGE"] | None = None,
+        stock_range_stock_cnt: int | None = None,
+        stock_range_min_stock_cnt: int | None = None,
+        stock_range_max_stock_cnt: int | None = None,
+        custom_property_value_nos: str | None = None,
+        admin_no: int | None = None,
+        page_size: int = 100,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[ProductSearchItem]:
+        """
+        상품 검색하기 version 2.0 - 전체 페이지 순회
+
+        ``search_products_v2`` 를 페이지별로 호출해 상품을 하나씩 내보낸다. 첫 페이지로
+        totalCount 를 확인한 뒤 다음 페이지들은 최대 ``prefetch`` 개까지 동시에 요청한다.
+
+        Args:
+            page_size: 한 페이지당 노출 수 (최대 100) [default: 100]
+            prefetch: 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``search_products_v2`` 와 동일, search_after 제외)
+
+        Yields:
+            ProductSearchItem: 검색된 상품
+        """
+
+        client = self._model_client()
+
+        async def fetch(page_number: int, size: int) -> ProductSearchV2Response:
+            return await client.search_products_v2(
+                keywords=keywords,
+                delivery_condition_type=delivery_condition_type,
+                sale_status=sale_status,
+                soldout=soldout,
+                total_review_count=total_review_count,
+                family_malls=family_malls,
+                product_management_cd=product_management_cd,
+                exclude_mall_product_no=exclude_mall_product_no,
+                include_mall_product_no=include_mall_product_no,
+                order_by=order_by,
+                order_direction=order_direction,
+                soldout_place_end=soldout_place_end,
+                display_category_nos=display_category_nos,
+                display_brand_nos=display_brand_nos,
+                partner_no=partner_no,
+                has_option_values=has_option_values,
+                shipping_area_type=shipping_area_type,
+                platform_type=platform_type,
+                front_display=front_display,
+                url_direct_display=url_direct_display,
+                registration_period_start_ymdt=registration_period_start_ymdt,
+                registration_period_end_ymdt=registration_period_end_ymdt,
+                modification_period_start_ymdt=modification_period_start_ymdt,
+                modification_period_end_ymdt=modification_period_end_ymdt,
+                sale_setting_types=sale_setting_types,
+                apply_status_type=apply_status_type,
+                sale_method_type=sale_method_type,
+                stock_range_type=stock_range_type,
+                stock_range_stock_cnt=stock_range_stock_cnt,
+                stock_range_min_stock_cnt=stock_range_min_stock_cnt,
+                stock_range_max_stock_cnt=stock_range_max_stock_cnt,
+                custom_property_value_nos=custom_property_value_nos,
+                admin_no=admin_no,
+                page_number=page_number,
+                page_size=size,
+            )
+
+        async for item in iter_page_items(
+            fetch,
+            page_size=page_size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.items,
+            prefetch=prefetch,
+        ):
+            yield item
+
     async def get_changed_product_nos(
         self,
         as_of: datetime,
@@ -343,7 +469,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Returns:
             ChangedProductsResponse: 변경된 상품 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_changed_product_nos") as client:
             # Version 1.0 헤더 추가
             headers = {"version": "1.0"}
 
@@ -371,24 +497,84 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
 
             return self.handle_resp(resp, ChangedProductsResponse)
 
+    async def iter_changed_product_nos(
+        self,
+        as_of: datetime,
+        size: int = 1000,
+        direction: Literal["ASC", "DESC"] | None = None,
+        *,
+        resume_from: str | None = None,
+    ) -> AsyncIterator[KeysetPage[ChangedProductItem]]:
+        """
+        변경된 상품 번호 목록 조회 - keySet(searchAfter) 전체 순회
+
+        ``sort_by="REGISTERED_AT"`` 으로 ``get_changed_product_nos`` 를 호출하며 응답의
+        lastId 를 다음 요청의 searchAfter 로 이어 간다. 한 번에 한 페이지만 보관하므로
+        메모리가 일정하다.
+
+        Args:
+            as_of: 조회 기준시점 (datetime 객체)
+            size: 페이지 사이즈 [default: 1000]
+            direction: 정렬 방향 (ASC: 오름차순, DESC: 내림차순, default: ASC)
+            resume_from: 이전 실행에서 저장한 ``KeysetPage.checkpoint`` (중단 지점부터 재개)
+
+        Yields:
+            KeysetPage[ChangedProductItem]: 페이지별 상품 목록과 재개용 checkpoint
+        """
+
+        client = self._model_client()
+
+        async def fetch(search_after: str | None) -> ChangedProductsResponse:
+            return await client.get_changed_product_nos(
+                as_of=as_of,
+                sort_by="REGISTERED_AT",
+                size=size,
+                direction=direction,
+                search_after=search_after,
+            )
+
+        async for page in iter_keyset_pages(
+            fetch,
+            next_cursor=lambda r: r.last_id,
+            page_items=lambda r: r.contents,
+            resume_from=resume_from,
+        ):
+            yield page
+
     async def search_products_by_list(
         self,
         product_nos: list[int],
         partner_no: int | None = None,
+        *,
+        concurrency: int = DEFAULT_CHUNK_CONCURRENCY,
     ) -> ProductListSearchResponse:
         """
         상품 리스트로 상품 검색하기
 
-        상품번호 목록으로 상품을 검색하는 API (최대 100개)
+        상품번호 목록으로 상품을 검색하는 API (요청 1회 최대 100개)
+        100개를 넘으면 100개씩 나눠 concurrency 개씩 동시에 조회하고 순서대로 합친다.
 
         Args:
             product_nos: 검색 할 상품 번호들 (예: [10001, 10002, 10003])
             partner_no: 파트너 번호 (자사파트너의 경우에만 사용 가능)
+            concurrency: 100개를 넘을 때 동시에 보내는 요청 수
 
         Returns:
             ProductListSearchResponse: 상품 목록 (list)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        return await fetch_chunked(
+            lambda nos: self._search_products_by_list_chunk(nos, partner_no),
+            product_nos,
+            chunk_size=_MAX_PRODUCT_NOS,
+            merge=concat_responses(),
+            concurrency=concurrency,
+            raw=self._raw,
+        )
+
+    async def _search_products_by_list_chunk(
+        self, product_nos: list[int], partner_no: int | None
+    ) -> ProductListSearchResponse:
+        async with self._session("search_products_by_list") as client:
             # Version 1.0 헤더 추가
             headers = {"version": "1.0"}
 
@@ -433,7 +619,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Returns:
             None (204 No Content)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("patch_product_v2") as client:
             # Version 2.0 헤더 추가
             headers = {"version": "2.0"}
 
@@ -469,7 +655,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Returns:
             ProductHistoriesResponse: 상품 변경 히스토리 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_histories") as client:
             # Version 1.0 헤더 추가
             headers = {"version": "1.0"}
 
@@ -494,9 +680,13 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
     # ------------------------------------------------------------------
     #  브랜드 (Brand)
     # ------------------------------------------------------------------
+    @cached(ttl=600)
     async def get_brands(self) -> list[BrandTreeItem]:
-        """브랜드 전체 조회하기 (트리 구조, version 2.0)"""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        """브랜드 전체 조회하기 (트리 구조, version 2.0)
+
+        응답 캐시 대상 (기본 TTL 600초). 이 클라이언트로 브랜드를 생성/수정/삭제하면 캐시를 지운다.
+        """
+        async with self._session("get_brands") as client:
             headers = {"version": "2.0"}
             resp = await client.get("/brands", headers=headers)
             return self.handle_resp(resp, list[BrandTreeItem])
@@ -507,7 +697,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             display_brand_no: 전시브랜드 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_brand_detail") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/brands/{display_brand_no}", headers=headers)
             return self.handle_resp(resp, BrandDetailResponse)
@@ -518,11 +708,13 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 생성할 브랜드 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_brands") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/brands", headers=headers, json=body)
-            return self.handle_resp(resp, CreateBrandsResponse)
+            result = self.handle_resp(resp, CreateBrandsResponse)
+        await self.invalidate_cache(self.get_brands)
+        return result
 
     async def modify_brands(self, brands: list[ModifyBrandItem]) -> None:
         """브랜드 수정하기 (한 번에 최대 500개)
@@ -530,12 +722,13 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             brands: 수정할 브랜드 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("modify_brands") as client:
             headers = {"version": "1.0"}
             body = [b.model_dump(by_alias=True, exclude_none=True, mode="json") for b in brands]
             resp = await client.put("/brands", headers=headers, json=body)
             self.raise_for_status(resp)
-            return None
+        await self.invalidate_cache(self.get_brands)
+        return None
 
     async def delete_brands(self, display_brand_nos: list[int]) -> None:
         """브랜드 삭제하기 (한 번에 최대 500개)
@@ -543,19 +736,20 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             display_brand_nos: 삭제할 전시브랜드 번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_brands") as client:
             headers = {"version": "1.0"}
             params = {"displayBrandNos": ",".join(str(no) for no in display_brand_nos)}
             resp = await client.delete("/brands", headers=headers, params=params)
             self.raise_for_status(resp)
-            return None
+        await self.invalidate_cache(self.get_brands)
+        return None
 
     # ------------------------------------------------------------------
     #  상품 추가항목 (Custom Property)
     # ------------------------------------------------------------------
     async def get_custom_properties(self) -> list[CustomPropertyItem]:
         """상품 추가항목 전체 조회하기"""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_custom_properties") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/custom-properties", headers=headers)
             return self.handle_resp(resp, list[CustomPropertyItem])
@@ -569,7 +763,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             product_no: 상품번호
             request: 추가할 추가항목 값 번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("add_custom_property_mappings") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post(
@@ -586,7 +780,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             product_no: 상품번호
             prop_value_nos: 삭제할 추가항목 값 번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("remove_custom_property_mappings") as client:
             headers = {"version": "1.0"}
             params = {"propValueNos": ",".join(str(no) for no in prop_value_nos)}
             resp = await client.delete(
@@ -597,9 +791,10 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
     # ------------------------------------------------------------------
     #  상품 정보 고시 항목 (Duty Category)
     # ------------------------------------------------------------------
+    @cached(ttl=3600)
     async def get_duty_categories(self) -> list[DutyCategoryItem]:
-        """상품 정보 고시 항목 조회하기"""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        """상품 정보 고시 항목 조회하기 (응답 캐시 대상, 기본 TTL 3600초)"""
+        async with self._session("get_duty_categories") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/duty-categories", headers=headers)
             return self.handle_resp(resp, list[DutyCategoryItem])
@@ -632,7 +827,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             page_number: 페이지 번호
             page_size: 한 페이지당 노출 수
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_like_products") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "mallNo": mall_no,
@@ -661,7 +856,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             product_management_cd: 상품 관리 코드
             partner_no: 파트너 번호 (자사파트너의 경우에만 사용 가능)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_by_management_code") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {"productManagementCd": product_management_cd}
             if partner_no is not None:
@@ -682,7 +877,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             search_after: 검색 기준 값(response의 lastId)
             size: 조회할 상품 개수 (default: 10)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_by_sticker_nos") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {
                 "stickerNos": ",".join(str(no) for no in sticker_nos),
@@ -710,7 +905,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             size: 페이지 사이즈 (default: 10)
             partner_no: 파트너 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_deleted_products") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {
                 "startYmdt": to_kst_string(start_ymdt),
@@ -731,21 +926,34 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             product_nos: 상품 번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_extra_infos") as client:
             headers = {"version": "1.0"}
             params = {"productNos": ",".join(str(no) for no in product_nos)}
             resp = await client.get("/products/extraInfo", headers=headers, params=params)
             return self.handle_resp(resp, list[ProductExtraInfoItem])
 
     async def get_product_nos_by_global_nos(
-        self, global_product_nos: list[int]
+        self, global_product_nos: list[int], *, concurrency: int = DEFAULT_CHUNK_CONCURRENCY
     ) -> ProductNosByGlobalNosResponse:
-        """글로벌 번호로 상품 번호 조회하기
+        """글로벌 번호로 상품 번호 조회하기 (100개를 넘으면 나눠 동시에 조회하고 items 를 합친다)
 
         Args:
             global_product_nos: 글로벌 상품 번호 목록
+            concurrency: 100개를 넘을 때 동시에 보내는 요청 수
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        return await fetch_chunked(
+            self._get_product_nos_by_global_nos_chunk,
+            global_product_nos,
+            chunk_size=_MAX_PRODUCT_NOS,
+            merge=concat_responses("items"),
+            concurrency=concurrency,
+            raw=self._raw,
+        )
+
+    async def _get_product_nos_by_global_nos_chunk(
+        self, global_product_nos: list[int]
+    ) -> ProductNosByGlobalNosResponse:
+        async with self._session("get_product_nos_by_global_nos") as client:
             headers = {"version": "1.0"}
             params = {"globalProductNos": ",".join(str(no) for no in global_product_nos)}
             resp = await client.get(
@@ -754,14 +962,25 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             return self.handle_resp(resp, ProductNosByGlobalNosResponse)
 
     async def get_global_nos_by_product_nos(
-        self, product_nos: list[int]
+        self, product_nos: list[int], *, concurrency: int = DEFAULT_CHUNK_CONCURRENCY
     ) -> GlobalNosByProductNosResponse:
-        """상품 번호로 글로벌 번호 조회하기
+        """상품 번호로 글로벌 번호 조회하기 (100개를 넘으면 나눠 동시에 조회하고 items 를 합친다)
 
         Args:
             product_nos: 상품 번호 목록
+            concurrency: 100개를 넘을 때 동시에 보내는 요청 수
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        return await fetch_chunked(
+            self._get_global_nos_by_product_nos_chunk,
+            product_nos,
+            chunk_size=_MAX_PRODUCT_NOS,
+            merge=concat_responses("items"),
+            concurrency=concurrency,
+            raw=self._raw,
+        )
+
+    async def _get_global_nos_by_product_nos_chunk(self, product_nos: list[int]) -> GlobalNosByProductNosResponse:
+        async with self._session("get_global_nos_by_product_nos") as client:
             headers = {"version": "1.0"}
             params = {"productNos": ",".join(str(no) for no in product_nos)}
             resp = await client.get(
@@ -770,14 +989,25 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             return self.handle_resp(resp, GlobalNosByProductNosResponse)
 
     async def get_reservation_infos_by_product_nos(
-        self, product_nos: list[int]
+        self, product_nos: list[int], *, concurrency: int = DEFAULT_CHUNK_CONCURRENCY
     ) -> list[ReservationInfoItem]:
-        """상품 번호 리스트로 예약배송 정보 벌크 조회 (최대 100개)
+        """상품 번호 리스트로 예약배송 정보 벌크 조회 (요청 1회 최대 100개, 넘으면 나눠 동시에 조회하고 합친다)
 
         Args:
             product_nos: 상품 번호 목록
+            concurrency: 100개를 넘을 때 동시에 보내는 요청 수
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        return await fetch_chunked(
+            self._get_reservation_infos_by_product_nos_chunk,
+            product_nos,
+            chunk_size=_MAX_PRODUCT_NOS,
+            merge=concat_responses(),
+            concurrency=concurrency,
+            raw=self._raw,
+        )
+
+    async def _get_reservation_infos_by_product_nos_chunk(self, product_nos: list[int]) -> list[ReservationInfoItem]:
+        async with self._session("get_reservation_infos_by_product_nos") as client:
             headers = {"version": "1.0"}
             params = {"productNos": ",".join(str(no) for no in product_nos)}
             resp = await client.get("/products/reservation-infos", headers=headers, params=params)
@@ -785,7 +1015,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
 
     async def get_required_properties(self) -> RequiredPropertiesResponse:
         """필수 항목 조회하기"""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_required_properties") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/products/required-properties", headers=headers)
             return self.handle_resp(resp, RequiredPropertiesResponse)
@@ -805,7 +1035,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             partner_no: 파트너 번호
             search_after: 검색 기준 값(lastId - 상품번호)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_products") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {"size": size}
             if page is not None:
@@ -826,7 +1056,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             product_no: 상품 번호
             partner_no: 파트너 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_options") as client:
             headers = {"version": "1.0"}
             params: dict[str, int] = {}
             if partner_no is not None:
@@ -836,6 +1066,38 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             )
             return self.handle_resp(resp, ProductOptionsResponse)
 
+    @overload
+    async def get_option_stocks(
+        self,
+        period_type: str,
+        size: int,
+        brand_no: int | None = None,
+        start_ymdt: datetime | None = None,
+        end_ymdt: datetime | None = None,
+        sale_status_types: list[str] | None = None,
+        sale_setting_status_types: list[str] | None = None,
+        allows_front_display: Literal["ALL", "Y", "N"] | None = None,
+        page: int | None = None,
+        search_after: int | None = None,
+    ) -> OptionStocksResponse: ...
+
+    @overload
+    async def get_option_stocks(
+        self,
+        period_type: str,
+        size: int,
+        brand_no: int | None = None,
+        start_ymdt: datetime | None = None,
+        end_ymdt: datetime | None = None,
+        sale_status_types: list[str] | None = None,
+        sale_setting_status_types: list[str] | None = None,
+        allows_front_display: Literal["ALL", "Y", "N"] | None = None,
+        page: int | None = None,
+        search_after: int | None = None,
+        *,
+        fields: Iterable[str],
+    ) -> ProjectionDto: ...
+
     async def get_option_stocks(
         self,
         period_type: str,
@@ -848,7 +1110,9 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         allows_front_display: Literal["ALL", "Y", "N"] | None = None,
         page: int | None = None,
         search_after: int | None = None,
-    ) -> OptionStocksResponse:
+        *,
+        fields: Iterable[str] | None = None,
+    ) -> OptionStocksResponse | ProjectionDto:
         """상품재고관리 옵션 리스트 조회
 
         Args:
@@ -862,8 +1126,12 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             allows_front_display: 전시 여부 (default: ALL)
             page: 페이지 번호 (default: 1)
             search_after: 검색 기준 값(lastId)
+            fields: 지정하면 이 필드 경로만 검증한 가벼운 모델을 반환한다
+                (예: ``["mall_product_count", "stock_views.mall_option_no", "stock_views.stock_cnt"]``).
+                (``shopby_sdk.base.projection.project`` 참고)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        model = OptionStocksResponse if fields is None else project(OptionStocksResponse, fields)
+        async with self._session("get_option_stocks") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {"periodType": period_type, "size": size}
             if brand_no is not None:
@@ -883,7 +1151,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             if search_after is not None:
                 params["searchAfter"] = search_after
             resp = await client.get("/products/options/stocks", headers=headers, params=params)
-            return self.handle_resp(resp, OptionStocksResponse)
+            return self.handle_resp(resp, model)
 
     # ------------------------------------------------------------------
     #  상품 심사 (Inspections)
@@ -915,7 +1183,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             keywords: 검색어
             keyword_type: 검색어 종류
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inspections_approval_waiting") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {
                 "periodType": period_type,
@@ -948,7 +1216,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             product_no: 상품번호
             partner_no: 파트너 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inspection_view") as client:
             headers = {"version": "1.0"}
             params: dict[str, int] = {}
             if partner_no is not None:
@@ -966,7 +1234,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 승인할 상품번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("confirm_inspections") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/products/inspections/confirm", headers=headers, json=body)
@@ -978,7 +1246,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 거절 사유 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("reject_inspections") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/products/inspections/reject", headers=headers, json=body)
@@ -995,7 +1263,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 상품 등록 정보 (CreateProductRequest)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_product") as client:
             headers = {"version": "2.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/products", headers=headers, json=body)
@@ -1009,7 +1277,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 상품 수정 정보 (UpdateProductRequest, mallProductNo 포함)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_product") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/products", headers=headers, json=body)
@@ -1026,7 +1294,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             product_no: 상품번호
             request: 상품 수정 정보 (UpdateProductV2Request)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_product_v2") as client:
             headers = {"version": "2.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(f"/products/{product_no}", headers=headers, json=body)
@@ -1042,7 +1310,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 상품 임시 등록 정보 (CreateProductTemporaryRequest)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_product_temporary") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/products/temporary", headers=headers, json=body)
@@ -1059,7 +1327,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             product_no: 원본(마스터) 상품번호
             request: 재고연동상품 등록 정보 (CreateCopiedProductRequest)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_copied_product") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post(f"/products/{product_no}", headers=headers, json=body)
@@ -1071,7 +1339,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 상품 이용안내 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("upsert_product_guide") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/products/guides", headers=headers, json=body)
@@ -1086,7 +1354,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             items: 부분수정할 상품 항목 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("patch_products_quick") as client:
             headers = {"version": "1.0"}
             body = [i.model_dump(by_alias=True, exclude_none=True, mode="json") for i in items]
             resp = await client.patch("/products/partial/quick", headers=headers, json=body)
@@ -1103,7 +1371,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 옵션/구매자작성형 수정 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_product_options") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/products/options", headers=headers, json=body)
@@ -1117,11 +1385,11 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 옵션 번호별 재고 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_stock_by_option_no") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
-                "/products/options/stock-with-id", headers=headers, json=body
+                "/products/options/stock-with-id", headers=headers, json=body, idempotent=True
             )
             return self.handle_resp(resp, PutStockByOptionNoResponse)
 
@@ -1133,11 +1401,11 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 옵션 관리코드별 재고 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_stock_by_option_management_code") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
-                "/products/options/stock-with-management-code", headers=headers, json=body
+                "/products/options/stock-with-management-code", headers=headers, json=body, idempotent=True
             )
             return self.handle_resp(resp, PutStockByOptionCodeResponse)
 
@@ -1149,7 +1417,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 상품 관리코드별 재고 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_stock_by_product_management_code") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -1165,7 +1433,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 상품 번호별 재고 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_stock_by_product_no") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -1184,7 +1452,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 부분 수정 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_product_partial") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/products/partial", headers=headers, json=body)
@@ -1199,7 +1467,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             mall_product_no: 상품번호
             request: 상태 변경 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_product_status") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -1216,7 +1484,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 판매합의 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_sale_agreement") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put("/products/sale-agreements", headers=headers, json=body)
@@ -1234,7 +1502,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             sno: 서비스 번호
             request: 네이버 쇼핑 인증키 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("set_naver_shopping_auth_key") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post(
@@ -1252,7 +1520,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             product_no: 상품번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_purchase_permission") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/purchase-permission/{product_no}", headers=headers)
             return self.handle_resp(resp, list[PurchasePermissionItem])
@@ -1265,7 +1533,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             request: 우선구매권한 생성 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_purchase_permission") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/purchase-permission", headers=headers, json=body)
@@ -1280,7 +1548,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             permission_no: 구매권한번호
             request: 상품 권한 수정 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_purchase_permission_product") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.put(
@@ -1298,7 +1566,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             permission_no: 구매권한번호
             members: 회원 권한 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_purchase_permission_member") as client:
             headers = {"version": "1.0"}
             body = [m.model_dump(by_alias=True, exclude_none=True, mode="json") for m in members]
             resp = await client.put(
@@ -1313,7 +1581,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
         Args:
             permission_no: 구매권한번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_purchase_permission") as client:
             headers = {"version": "1.0"}
             resp = await client.delete(
                 f"/purchase-permission/{permission_no}", headers=headers
@@ -1330,7 +1598,7 @@ class ShopbyServerProductsApiClient(ShopbyServerApiClient):
             permission_no: 구매권한번호
             member_nos: 회원번호 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_purchase_permission_member") as client:
             headers = {"version": "1.0"}
             params = {"memberNos": ",".join(str(no) for no in member_nos)}
             resp = await client.delete(
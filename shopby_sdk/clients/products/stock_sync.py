@@ -0,0 +1,430 @@
+"""WMS 재고 스냅샷 → 샵바이 옵션 재고 차분(diff) 동기화 엔진.
+
+WMS 가 몇 분마다 보내는 전체 재고 스냅샷을 그대로 ``update_stock_by_option_no`` 로 보내면
+대부분 값이 같은 행에 API 호출과 쿼터를 쓴다. ``sync_option_stocks`` 는
+
+- ``get_option_stocks`` 로 현재 옵션 재고를 모두 읽어 ``OptionStockIndex`` (옵션번호·재고를
+  int64 하나로 묶은 정렬 배열, 옵션당 8바이트)에 담고,
+- 스냅샷을 한 행씩 흘려보내며 현재 재고와 비교해 바뀐 행만 모으고,
+- 바뀐 행만 요청 1회 최대 100개(``MAX_STOCK_OPTIONS``)씩 ``PutStockByOptionNoRequest`` 로
+  ``concurrency`` 개씩 동시에 보낸다 (적응형 rate limiter 로 속도 조절).
+
+옵션 재고 목록은 기본적으로 ``searchAfter`` keyset 으로 읽는다 (``paging="keyset"``). 응답에 lastId 가
+없으므로 페이지 마지막 행의 상품번호를 기준으로 삼되, ``size`` 가 상품 수인지 옵션 행 수인지 문서로 확정할 수
+없어 페이지 끝에 걸친 마지막 상품은 다음 페이지에서 다시 읽는다 (중복 행은 색인에서 하나로 합쳐진다).
+서버가 ``searchAfter`` 를 따르지 않는 것으로 보이면(상품번호가 기준값 이하로 돌아오거나 정렬되지 않은 경우)
+페이지 번호 읽기(``paging="page"``, ``prefetch`` 개 미리 요청)로 처음부터 다시 읽는다. 어느 방식이든
+빈 페이지나 ``page_size`` 보다 적은 행이 온 페이지에서 멈춘다 (행 수가 size 보다 적으면 상품 수도 적으므로
+size 의 단위와 관계없이 마지막 페이지다).
+
+스냅샷은 옵션번호 대신 옵션 관리코드(``key="management_code"``)로 줄 수도 있다. 이 경우 관리코드를 현재
+목록의 옵션번호로 바꿔 같은 방식으로 보낸다 (관리코드 색인은 dict 라 옵션당 메모리가 더 든다).
+
+현재 목록에 없는 옵션(삭제·필터 밖)은 보내지 않고 ``unknown`` 으로 센다. 재고 변경은 절대값
+설정이라 멱등이므로, 실패한 행은 다음 스냅샷에서 다시 차이로 잡혀 자연히 재전송된다.
+
+Example:
+    ```python
+    result = await sync_option_stocks(
+        products_client,
+        ((row.option_no, row.qty) for row in wms_snapshot),
+        concurrency=8,
+    )
+    print(result.changed, result.requests, result.saved_ratio, result.failures[:10])
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from shopby_sdk.base.batch import as_async_iter, fetch_many
+from shopby_sdk.base.ratelimit import AdaptiveRateLimiter
+from shopby_sdk.clients.products.client import ShopbyServerProductsApiClient
+from shopby_sdk.clients.products.models import OptionStockByIdItem, PutStockByOptionNoRequest
+
+logger = logging.getLogger(__name__)
+
+MAX_STOCK_OPTIONS = 100
+"""``update_stock_by_option_no`` 요청 1회 최대 옵션 수."""
+
+DEFAULT_STOCK_CONCURRENCY = 4
+"""동시에 보내는 재고 변경 요청 수 기본값."""
+
+MAX_STOCK_PAGE_SIZE = 100
+"""``get_option_stocks`` 페이지 크기 상한."""
+
+StockPaging = Literal["keyset", "page"]
+"""현재 옵션 재고 목록 읽기 방식 (``searchAfter`` keyset / 페이지 번호)."""
+
+_STOCK_FIELDS = (
+    "stock_views.mall_product_no",
+    "stock_views.mall_option_no",
+    "stock_views.stock_cnt",
+    "stock_views.option_management_cd",
+)
+
+# 옵션번호(상위 32비트)와 재고(하위 32비트, 부호 보정)를 int64 하나로 묶는다.
+_STOCK_BIAS = 1 << 31
+_STOCK_MASK = (1 << 32) - 1
+
+
+def _pack(option_no: int, stock: int) -> int:
+    if not 0 <= option_no < 1 << 31:
+        raise ValueError(f"option_no out of range: {option_no}")
+    if not -_STOCK_BIAS <= stock < _STOCK_BIAS:
+        raise ValueError(f"stock out of range: {stock}")
+    return option_no << 32 | (stock + _STOCK_BIAS)
+
+
+def _sorted_unique(packed: array[int]) -> array[int]:
+    unique = array("q")
+    last = -1
+    for value in sorted(packed):
+        option_no = value >> 32
+        if option_no == last:
+            unique[-1] = value
+        else:
+            unique.append(value)
+            last = option_no
+    return unique
+
+
+class OptionStockIndex:
+    """옵션번호 → 재고 조회용 정렬 배열 (옵션당 8바이트, 이진 탐색).
+
+    같은 옵션이 여러 번 들어오면 (keyset 조회에서 마지막 상품을 다시 읽거나 페이지 번호 조회 중 목록이 밀린 경우 등) 하나만 남긴다.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, rows: Iterable[tuple[int, int]] = ()):
+        self._packed = _sorted_unique(array("q", (_pack(option_no, stock) for option_no, stock in rows)))
+
+    @classmethod
+    def _from_packed(cls, packed: array[int]) -> OptionStockIndex:
+        index = cls.__new__(cls)
+        index._packed = _sorted_unique(packed)
+        return index
+
+    def get(self, option_no: int) -> int | None:
+        """옵션의 현재 재고 (목록에 없으면 None)."""
+        packed = self._packed
+        index = bisect_left(packed, option_no << 32)
+        if index < len(packed) and packed[index] >> 32 == option_no:
+            return (packed[index] & _STOCK_MASK) - _STOCK_BIAS
+        return None
+
+    def __contains__(self, option_no: object) -> bool:
+        return isinstance(option_no, int) and self.get(option_no) is not None
+
+    def __len__(self) -> int:
+        return len(self._packed)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        for value in self._packed:
+            yield value >> 32, (value & _STOCK_MASK) - _STOCK_BIAS
+
+    @property
+    def nbytes(self) -> int:
+        """배열이 차지하는 바이트 수."""
+        return self._packed.itemsize * len(self._packed)
+
+
+@dataclass(frozen=True, slots=True)
+class StockWriteFailure:
+    """재고 변경에 실패한 옵션.
+
+    Attributes:
+        option_no: 옵션 번호
+        stock: 보내려던 재고
+        error: 실패 사유 (207 응답의 errorCode 또는 요청 예외)
+    """
+
+    option_no: int
+    stock: int
+    error: str | None
+
+
+@dataclass(slots=True)
+class StockSyncResult:
+    """재고 동기화 1회 실행 결과 / 지표.
+
+    Attributes:
+        options: 현재 옵션 재고 목록의 옵션 수
+        snapshot_rows: 스냅샷 행 수
+        unchanged: 현재 재고와 같아 보내지 않은 행 수
+        changed: 재고가 달라 보낸(dry_run 이면 보낼) 옵션 수
+        unknown: 현재 목록에 없어 보내지 않은 행 수
+        updated: 변경에 성공한 옵션 수
+        requests: 보낸 재고 변경 요청 수
+        read_requests: 현재 재고 조회 요청 수
+        failures: 변경에 실패한 옵션
+        read_elapsed: 현재 재고 조회 시간(초)
+        elapsed: 전체 실행 시간(초)
+    """
+
+    options: int = 0
+    snapshot_rows: int = 0
+    unchanged: int = 0
+    changed: int = 0
+    unknown: int = 0
+    updated: int = 0
+    requests: int = 0
+    read_requests: int = 0
+    failures: list[StockWriteFailure] = field(default_factory=list)
+    read_elapsed: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    @property
+    def saved_ratio(self) -> float:
+        """스냅샷 전체를 보냈을 때 대비 줄인 재고 변경 요청 비율 (0~1)."""
+        full = -(-self.snapshot_rows // MAX_STOCK_OPTIONS)
+        return 1 - self.requests / full if full else 0.0
+
+
+async def load_option_stocks(
+    client: ShopbyServerProductsApiClient,
+    *,
+    page_size: int = MAX_STOCK_PAGE_SIZE,
+    prefetch: int = DEFAULT_STOCK_CONCURRENCY,
+    paging: StockPaging = "keyset",
+    with_management_codes: bool = False,
+    **filters: Any,
+) -> tuple[OptionStockIndex, dict[str, int | tuple[int, ...]] | None, int]:
+    """현재 옵션 재고 전체를 읽어 (색인, 관리코드 → 옵션번호, 조회 요청 수) 반환.
+
+    Args:
+        client: 상품 server API 클라이언트 (raw 모드여도 응답은 모델로 읽는다)
+        page_size: 페이지 크기 (1~100)
+        prefetch: 페이지 번호로 읽을 때 동시에 미리 요청할 페이지 수
+        paging: ``"keyset"`` (``searchAfter``, 따르지 않으면 페이지 번호로 전환) 또는 ``"page"``
+        with_management_codes: 옵션 관리코드 → 옵션번호 색인도 만들지 여부 (아니면 None)
+        **filters: ``get_option_stocks`` 의 필터 (brand_no, sale_status_types 등)
+    """
+    codes: dict[str, int | tuple[int, ...]] | None = {} if with_management_codes else None
+    packed = array("q")
+    requests = 0
+    async for page in _iter_stock_pages(client.with_options(raw=False), page_size, prefetch, paging, filters):
+        requests += 1
+        for view in page.stock_views:
+            if view.mall_option_no is None:
+                continue
+            packed.append(_pack(view.mall_option_no, view.stock_cnt or 0))
+            if codes is not None and view.option_management_cd:
+                _add_code(codes, view.option_management_cd, view.mall_option_no)
+    return OptionStockIndex._from_packed(packed), codes, requests
+
+
+async def sync_option_stocks(
+    client: ShopbyServerProductsApiClient,
+    snapshot: Iterable[tuple[int | str, int]] | AsyncIterable[tuple[int | str, int]],
+    *,
+    key: Literal["option_no", "management_code"] = "option_no",
+    concurrency: int = DEFAULT_STOCK_CONCURRENCY,
+    page_size: int = MAX_STOCK_PAGE_SIZE,
+    prefetch: int = DEFAULT_STOCK_CONCURRENCY,
+    paging: StockPaging = "keyset",
+    rate_limit: bool | AdaptiveRateLimiter | None = True,
+    dry_run: bool = False,
+    **filters: Any,
+) -> StockSyncResult:
+    """스냅샷과 현재 옵션 재고를 비교해 바뀐 옵션만 ``update_stock_by_option_no`` 로 보낸다.
+
+    Args:
+        client: 상품 server API 클라이언트 (raw 모드여도 응답은 모델로 읽는다)
+        snapshot: ``(옵션번호, 재고)`` 또는 ``(옵션 관리코드, 재고)`` 행 (리스트·제너레이터·async iterable).
+            같은 옵션이 여러 번 있으면 마지막 값을 쓴다.
+        key: 스냅샷 행의 첫 값 종류
+        concurrency: 동시에 보낼 재고 변경 요청 수
+        page_size: 현재 재고 조회 페이지 크기 (1~100)
+        prefetch: 현재 재고를 페이지 번호로 읽을 때 동시에 미리 요청할 페이지 수
+        paging: 현재 재고 읽기 방식 (``load_option_stocks`` 참고)
+        rate_limit: ``client.with_options(rate_limit=...)`` 에 넘길 값 (None 이면 클라이언트 설정 유지)
+        dry_run: True 면 차이만 계산하고 보내지 않는다
+        **filters: ``get_option_stocks`` 의 필터. 필터 밖의 옵션은 ``unknown`` 으로 센다.
+
+    Raises:
+        ValueError: 잘못된 인자이거나 옵션번호/재고가 int32 범위를 벗어난 경우
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if key not in ("option_no", "management_code"):
+        raise ValueError(f"unknown snapshot key: {key}")
+    client = client.with_options(raw=False, rate_limit=rate_limit)
+
+    started = time.perf_counter()
+    result = StockSyncResult()
+    current, codes, result.read_requests = await load_option_stocks(
+        client,
+        page_size=page_size,
+        prefetch=prefetch,
+        paging=paging,
+        with_management_codes=key == "management_code",
+        **filters,
+    )
+    result.options = len(current)
+    result.read_elapsed = time.perf_counter() - started
+
+    # 바뀐 행만 담으므로 보통 스냅샷보다 훨씬 작다. dict 삽입 순서대로 보낸다.
+    changed: dict[int, int] = {}
+    async for row_key, stock in as_async_iter(snapshot):
+        result.snapshot_rows += 1
+        option_nos = _resolve(row_key, codes)
+        if not option_nos:
+            result.unknown += 1
+            continue
+        for option_no in option_nos:
+            now = current.get(option_no)
+            if now is None:
+                result.unknown += 1
+            elif now == stock:
+                result.unchanged += 1
+                changed.pop(option_no, None)
+            else:
+                changed[option_no] = stock
+    result.changed = len(changed)
+
+    if not dry_run and changed:
+        await _write_changes(client, changed, concurrency, result)
+    result.elapsed = time.perf_counter() - started
+
+    logger.info(
+        "stock sync: options=%d rows=%d changed=%d unknown=%d updated=%d failed=%d requests=%d (saved %.1f%%)",
+        result.options,
+        result.snapshot_rows,
+        result.changed,
+        result.unknown,
+        result.updated,
+        result.failed,
+        result.requests,
+        result.saved_ratio * 100,
+    )
+    return result
+
+
+async def _write_changes(
+    client: ShopbyServerProductsApiClient,
+    changed: dict[int, int],
+    concurrency: int,
+    result: StockSyncResult,
+) -> None:
+    async def send(chunk: list[tuple[int, int]]) -> list[StockWriteFailure]:
+        request = PutStockByOptionNoRequest(
+            options=[OptionStockByIdItem(option_no=option_no, stock=stock) for option_no, stock in chunk]
+        )
+        try:
+            response = await client.update_stock_by_option_no(request)
+        except Exception as exc:
+            logger.warning("stock update failed (%d options)", len(chunk), exc_info=True)
+            return [StockWriteFailure(option_no, stock, f"{type(exc).__name__}: {exc}") for option_no, stock in chunk]
+        stocks = dict(chunk)
+        return [
+            StockWriteFailure(failure.option_no, stocks.get(failure.option_no, 0), failure.error_code)
+            for failure in response.failures
+        ]
+
+    rows = list(changed.items())
+    chunks = (rows[i : i + MAX_STOCK_OPTIONS] for i in range(0, len(rows), MAX_STOCK_OPTIONS))
+    batches = fetch_many(send, chunks, concurrency=concurrency)
+    try:
+        async for batch in batches:
+            if batch.error is not None:
+                raise batch.error
+            failures = batch.value or []
+            result.requests += 1
+            result.updated += len(batch.key) - len(failures)
+            result.failures.extend(failures)
+    finally:
+        await batches.aclose()
+
+
+async def _iter_stock_pages(
+    client: ShopbyServerProductsApiClient,
+    page_size: int,
+    prefetch: int,
+    paging: StockPaging,
+    filters: dict[str, Any],
+) -> AsyncIterator[Any]:
+    """옵션 재고 목록을 순서대로 내보낸다. 같은 옵션이 여러 페이지에 나올 수 있다 (색인이 합친다)."""
+    if not 1 <= page_size <= MAX_STOCK_PAGE_SIZE:
+        raise ValueError(f"page_size must be between 1 and {MAX_STOCK_PAGE_SIZE}")
+    if prefetch < 1:
+        raise ValueError("prefetch must be >= 1")
+    if paging not in ("keyset", "page"):
+        raise ValueError(f"unknown paging: {paging}")
+    filters.setdefault("period_type", "UPDATE_YMDT")
+
+    if paging == "keyset":
+        cursor: int | None = None
+        while True:
+            page = await client.get_option_stocks(size=page_size, search_after=cursor, fields=_STOCK_FIELDS, **filters)
+            if not page.stock_views:
+                return
+            product_nos = [view.mall_product_no for view in page.stock_views]
+            follows_cursor = None not in product_nos and product_nos == sorted(product_nos)
+            if follows_cursor and cursor is not None:
+                follows_cursor = product_nos[0] > cursor
+            yield page
+            if follows_cursor and len(page.stock_views) < page_size:
+                return
+            # 마지막 상품의 옵션은 다음 페이지로 이어질 수 있으므로 그 앞 상품까지만 읽은 것으로 본다
+            complete = [no for no in product_nos if follows_cursor and no < product_nos[-1]]
+            if not complete:
+                logger.warning("get_option_stocks did not page by searchAfter=%s; re-reading by page number", cursor)
+                break
+            cursor = complete[-1]
+
+    def fetch(page: int) -> asyncio.Future[Any]:
+        return asyncio.ensure_future(
+            client.get_option_stocks(size=page_size, page=page, fields=_STOCK_FIELDS, **filters)
+        )
+
+    next_page = 1
+    pending: deque[asyncio.Future[Any]] = deque()
+    try:
+        while True:
+            while len(pending) < prefetch:
+                pending.append(fetch(next_page))
+                next_page += 1
+            page = await pending.popleft()
+            if not page.stock_views:
+                return
+            yield page
+            if len(page.stock_views) < page_size:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _add_code(codes: dict[str, int | tuple[int, ...]], code: str, option_no: int) -> None:
+    known = codes.get(code)
+    if known is None:
+        codes[code] = option_no
+    elif isinstance(known, int):
+        if known != option_no:
+            codes[code] = (known, option_no)
+    elif option_no not in known:
+        codes[code] = (*known, option_no)
+
+
+def _resolve(row_key: int | str, codes: dict[str, int | tuple[int, ...]] | None) -> tuple[int, ...]:
+    if codes is None:
+        return (int(row_key),)
+    option_nos = codes.get(str(row_key), ())
+    return (option_nos,) if isinstance(option_nos, int) else option_nos
@@ -0,0 +1,288 @@
+"""상품 카탈로그 증분 동기화 엔진.
+
+매일 전체 상품을 다시 조회하는 대신, 직전 실행 시점(high-water mark) 이후 변경된
+상품만 찾아(`get_changed_product_nos(sort_by="UPDATED_AT", direction="ASC")`) 상세 v3 를
+제한된 동시성으로 조회하고, 같은 기간의 삭제 상품(`get_deleted_products`)을 tombstone 으로
+전달한다. 모든 상세 조회가 성공한 경우에만 high-water mark 를 전진시키므로
+(at-least-once), 실패한 실행은 다음 실행에서 같은 구간을 다시 처리한다.
+
+변경 목록은 페이지 번호로 읽으므로, 실행 중 수정된 상품이 목록 끝으로 옮겨 가면 뒤쪽 행이 한 칸씩
+당겨져 페이지 경계의 상품을 건너뛸 수 있다. 그래서 목록을 다 읽은 뒤 마지막 응답의 ``totalCount`` 와
+본 상품 수를 비교해 모자라면 목록을 다시 훑어(``max_rescans``) 못 본 상품만 조회하고, 그래도 모자라면
+high-water mark 를 전진시키지 않는다.
+
+Example:
+    ```python
+    sync = ProductCatalogSync(
+        client,
+        JsonFileSyncStateStore("product_sync_state.json"),
+        on_product=upsert_product,        # (ProductDetailV3Response) -> None | Awaitable
+        on_deleted=delete_product,        # (DeletedProductItem) -> None | Awaitable
+        concurrency=16,
+        initial_as_of=datetime(2025, 1, 1),
+    )
+    stats = await sync.run()
+    print(stats.fetched, stats.throughput, stats.lag)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Protocol
+
+from shopby_sdk.base.batch import call_handler
+from shopby_sdk.base.checkpoint import JsonStateFile
+from shopby_sdk.base.kst import KST, to_kst_string
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, iter_page_items, iter_pages
+from shopby_sdk.clients.products.client import ShopbyServerProductsApiClient
+from shopby_sdk.clients.products.models import (
+    ChangedProductsResponse,
+    DeletedProductItem,
+    DeletedProductsResponse,
+    ProductDetailV3Response,
+)
+
+logger = logging.getLogger(__name__)
+
+ProductHandler = Callable[[ProductDetailV3Response], Awaitable[None] | None]
+DeletedHandler = Callable[[DeletedProductItem], Awaitable[None] | None]
+
+
+class SyncStateStore(Protocol):
+    """high-water mark 저장소 인터페이스."""
+
+    def load(self) -> datetime | None:
+        """저장된 high-water mark (없으면 None)."""
+        ...
+
+    def save(self, high_water_mark: datetime) -> None:
+        """high-water mark 저장."""
+        ...
+
+
+class JsonFileSyncStateStore:
+    """JSON 파일 기반 high-water mark 저장소 (임시 파일 + rename 으로 원자적 저장)."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._file = JsonStateFile(path)
+        self.path = self._file.path
+
+    def load(self) -> datetime | None:
+        data = self._file.load()
+        value = data.get("highWaterMark") if data else None
+        return datetime.fromisoformat(value).astimezone(KST) if value else None
+
+    def save(self, high_water_mark: datetime) -> None:
+        self._file.save({"highWaterMark": high_water_mark.isoformat()})
+
+
+@dataclass(slots=True)
+class ProductSyncStats:
+    """동기화 1회 실행 결과 / 지표.
+
+    Attributes:
+        window_start: 변경 조회 시작 시점 (이전 high-water mark - overlap)
+        window_end: 이번 실행 기준 시점 (성공 시 새 high-water mark)
+        previous_mark: 이전 high-water mark (첫 실행이면 initial_as_of)
+        changed: 변경된 상품 수 (중복 제거)
+        unseen: 변경 목록의 totalCount 대비 끝내 보지 못한 상품 수 (0 이 아니면 전진하지 않는다)
+        rescans: 목록을 다시 훑은 횟수
+        fetched: 상세 조회 성공 수
+        deleted: 전달한 삭제 상품(tombstone) 수
+        failed_product_nos: 상세 조회/처리에 실패한 상품 번호
+        elapsed: 실행 시간(초)
+        advanced: high-water mark 전진 여부
+    """
+
+    window_start: datetime
+    window_end: datetime
+    previous_mark: datetime
+    changed: int = 0
+    unseen: int = 0
+    rescans: int = 0
+    fetched: int = 0
+    deleted: int = 0
+    failed_product_nos: list[int] = field(default_factory=list)
+    elapsed: float = 0.0
+    advanced: bool = False
+
+    @property
+    def failed(self) -> int:
+        return len(self.failed_product_nos)
+
+    @property
+    def throughput(self) -> float:
+        """초당 상세 조회 성공 수."""
+        return self.fetched / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def lag(self) -> timedelta:
+        """실행 시작 시 카탈로그가 뒤처져 있던 시간 (window_end - previous_mark, overlap 제외)."""
+        return self.window_end - self.previous_mark
+
+
+class ProductCatalogSync:
+    """high-water mark 기반 상품 카탈로그 증분 동기화.
+
+    Args:
+        client: 상품 server API 클라이언트. raw 모드면 ``on_product`` 가 상세를 dict 로 받는다
+            (변경/삭제 목록은 항상 모델로 읽는다).
+        store: high-water mark 저장소
+        on_product: 변경된 상품 상세(v3)를 받는 콜백 (동기/비동기)
+        on_deleted: 삭제된 상품(tombstone)을 받는 콜백 (동기/비동기). None 이면 삭제 조회 생략.
+        concurrency: 상세 조회 동시 요청 수
+        page_size: 변경/삭제 목록 페이지 크기
+        overlap: 이전 high-water mark 보다 이만큼 앞에서부터 조회 (경계/시계 오차 보정)
+        initial_as_of: 저장된 high-water mark 가 없을 때 시작 시점 (없으면 ValueError)
+        including_stock_changes: 재고 변경도 변경으로 볼지 여부 (API 기본값 true)
+        max_rescans: 변경 목록의 totalCount 보다 본 상품이 적을 때 목록을 다시 훑는 최대 횟수
+    """
+
+    def __init__(
+        self,
+        client: ShopbyServerProductsApiClient,
+        store: SyncStateStore,
+        *,
+        on_product: ProductHandler,
+        on_deleted: DeletedHandler | None = None,
+        concurrency: int = 16,
+        page_size: int = 500,
+        overlap: timedelta = timedelta(minutes=5),
+        initial_as_of: datetime | None = None,
+        including_stock_changes: bool | None = None,
+        max_rescans: int = 2,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if max_rescans < 0:
+            raise ValueError("max_rescans must be >= 0")
+        self.client = client
+        self._list_client = client.with_options(raw=False)
+        self.store = store
+        self.on_product = on_product
+        self.on_deleted = on_deleted
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.overlap = overlap
+        self.initial_as_of = initial_as_of
+        self.including_stock_changes = including_stock_changes
+        self.max_rescans = max_rescans
+
+    async def run(self) -> ProductSyncStats:
+        """변경분 동기화 1회 실행."""
+        previous = self.store.load() or self.initial_as_of
+        if previous is None:
+            raise ValueError("no stored high-water mark; pass initial_as_of for the first run")
+        # naive datetime 은 KST 로 간주 (to_kst_string 과 동일 규칙)
+        previous = previous.replace(tzinfo=KST) if previous.tzinfo is None else previous.astimezone(KST)
+
+        # 실행 도중 바뀐 상품을 놓치지 않도록 조회 전에 기준 시점을 잡는다
+        window_end = datetime.now(KST)
+        stats = ProductSyncStats(window_start=previous - self.overlap, window_end=window_end, previous_mark=previous)
+        started = time.perf_counter()
+
+        await self._sync_changed(stats)
+        if self.on_deleted is not None:
+            await self._sync_deleted(stats)
+
+        stats.elapsed = time.perf_counter() - started
+        if not stats.failed_product_nos and not stats.unseen:
+            self.store.save(window_end)
+            stats.advanced = True
+        elif stats.unseen:
+            logger.warning(
+                "product sync: %d changed products not seen after %d rescans; high-water mark kept",
+                stats.unseen,
+                stats.rescans,
+            )
+
+        logger.info(
+            "product sync %s ~ %s: changed=%d fetched=%d deleted=%d failed=%d (%.1f/s, lag=%s)",
+            to_kst_string(stats.window_start),
+            to_kst_string(stats.window_end),
+            stats.changed,
+            stats.fetched,
+            stats.deleted,
+            stats.failed,
+            stats.throughput,
+            stats.lag,
+        )
+        return stats
+
+    async def _sync_changed(self, stats: ProductSyncStats) -> None:
+        queue: asyncio.Queue[int | None] = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        async def worker() -> None:
+            while (product_no := await queue.get()) is not None:
+                try:
+                    detail = await self.client.get_product_detail_v3(product_no)
+                    await call_handler(self.on_product, detail)
+                    stats.fetched += 1
+                except Exception:
+                    logger.warning("product sync failed: %s", product_no, exc_info=True)
+                    stats.failed_product_nos.append(product_no)
+
+        async def fetch(page: int, size: int) -> ChangedProductsResponse:
+            return await self._list_client.get_changed_product_nos(
+                as_of=stats.window_start,
+                sort_by="UPDATED_AT",
+                size=size,
+                direction="ASC",
+                including_stock_changes=self.including_stock_changes,
+                page=page,
+            )
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            seen: set[int] = set()
+            for scan in range(self.max_rescans + 1):
+                total = 0
+                async for page in iter_pages(
+                    fetch,
+                    page_size=self.page_size,
+                    total_count=lambda r: r.total_count,
+                    page_items=lambda r: r.contents,
+                    prefetch=DEFAULT_PREFETCH,
+                ):
+                    total = page.total_count
+                    for item in page.contents:
+                        if item.product_no in seen:
+                            continue
+                        seen.add(item.product_no)
+                        stats.changed += 1
+                        await queue.put(item.product_no)
+                # 마지막 응답의 totalCount 보다 적게 봤다면 목록이 밀려 건너뛴 상품이 있다
+                stats.unseen = max(total - len(seen), 0)
+                if not stats.unseen:
+                    break
+                if scan < self.max_rescans:
+                    stats.rescans += 1
+                    logger.info("product sync: %d changed products missed, rescanning", stats.unseen)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def _sync_deleted(self, stats: ProductSyncStats) -> None:
+        async def fetch(page: int, size: int) -> DeletedProductsResponse:
+            return await self._list_client.get_deleted_products(
+                start_ymdt=stats.window_start, end_ymdt=stats.window_end, page=page, size=size
+            )
+
+        async for item in iter_page_items(
+            fetch,
+            page_size=self.page_size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.contents,
+        ):
+            await call_handler(self.on_deleted, item)
+            stats.deleted += 1
@@ -42,9 +42,21 @@ from shopby_sdk.clients.promotion.models import (
     WithdrawCouponBulkRequest,
     WithdrawCouponRequest,
 )
+from shopby_sdk.clients.promotion.pipeline import (
+    CouponIssueCheckpoint,
+    CouponIssueCounts,
+    CouponIssueSummary,
+    issue_coupons_to_members,
+    read_member_nos,
+)
 
 __all__ = [
     "ShopbyServerPromotionApiClient",
+    "issue_coupons_to_members",
+    "read_member_nos",
+    "CouponIssueSummary",
+    "CouponIssueCounts",
+    "CouponIssueCheckpoint",
     # Literal 타입 별칭
     "CouponType",
     "CouponSubType",
@@ -1,12 +1,14 @@
 """Promotion(쿠폰) API 클라이언트"""
 
+from collections.abc import AsyncIterator
 from datetime import date
 
-import httpx
-
+from shopby_sdk.base.daterange import DEFAULT_SHARD_CONCURRENCY, iter_sharded
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, iter_page_items
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.promotion.models import (
     CouponDetailResponse,
+    CouponIssueContent,
     CouponIssueSearchDateType,
     CouponSearchDateType,
     CouponSearchKeywordType,
@@ -78,7 +80,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             SearchCouponResponse: 쿠폰 검색 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_coupons") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int | bool] = {
@@ -122,7 +124,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             CreateCouponResponse: 생성된 쿠폰 번호
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("create_coupon") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -148,7 +150,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             CouponTargetsResponse: 제외 대상 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_coupon_exclude_targets") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int | bool] = {}
@@ -194,7 +196,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             SearchCouponIssueResponse: 지급된 쿠폰 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_coupon_issues") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int | bool] = {
@@ -217,6 +219,108 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
             resp = await client.get("/coupons/issues", headers=headers, params=params)
             return self.handle_resp(resp, SearchCouponIssueResponse)
 
+    async def iter_coupon_issues(
+        self,
+        search_date_type: CouponIssueSearchDateType,
+        start_ymd: date,
+        end_ymd: date,
+        size: int = 1000,
+        member_nos: list[int] | None = None,
+        member_ids: list[str] | None = None,
+        coupon_nos: list[int] | None = None,
+        coupon_issue_nos: list[int] | None = None,
+        *,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[CouponIssueContent]:
+        """지급된 쿠폰 검색하기 - 전체 페이지 순회
+
+        ``search_coupon_issues`` 를 페이지별로 호출해 지급 쿠폰을 하나씩 내보낸다. 첫
+        페이지로 totalCount 를 확인한 뒤 다음 페이지들은 최대 ``prefetch`` 개까지 동시에
+        요청한다.
+
+        Args:
+            size: 페이지 크기 (최대 10,000) [default: 1000]
+            prefetch: 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``search_coupon_issues`` 와 동일)
+
+        Yields:
+            CouponIssueContent: 지급된 쿠폰
+        """
+
+        client = self._model_client()
+
+        async def fetch(page: int, page_size: int) -> SearchCouponIssueResponse:
+            return await client.search_coupon_issues(
+                search_date_type=search_date_type,
+                start_ymd=start_ymd,
+                end_ymd=end_ymd,
+                page=page,
+                size=page_size,
+                member_nos=member_nos,
+                member_ids=member_ids,
+                coupon_nos=coupon_nos,
+                coupon_issue_nos=coupon_issue_nos,
+            )
+
+        async for issue in iter_page_items(
+            fetch,
+            page_size=size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.contents,
+            prefetch=prefetch,
+        ):
+            yield issue
+
+    async def iter_coupon_issues_sharded(
+        self,
+        search_date_type: CouponIssueSearchDateType,
+        start_ymd: date,
+        end_ymd: date,
+        size: int = 1000,
+        member_nos: list[int] | None = None,
+        member_ids: list[str] | None = None,
+        coupon_nos: list[int] | None = None,
+        coupon_issue_nos: list[int] | None = None,
+        *,
+        window_days: int = 30,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[CouponIssueContent]:
+        """지급된 쿠폰 검색하기 - 긴 기간을 구간으로 나눠 동시 순회
+
+        [start_ymd, end_ymd] 를 ``window_days`` 일 구간으로 나눠 구간마다
+        ``iter_coupon_issues`` 로 전체 페이지를 순회하고, 최대 ``concurrency`` 개 구간을
+        동시에 조회한다. 지급 쿠폰은 구간 순서(과거 → 최근)대로 나온다.
+        (``shopby_sdk.base.daterange.iter_sharded`` 참고)
+
+        Args:
+            window_days: 구간 일수 [default: 30]
+            concurrency: 동시에 조회할 구간 수
+            prefetch: 구간마다 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``iter_coupon_issues`` 와 동일)
+
+        Yields:
+            CouponIssueContent: 지급된 쿠폰
+        """
+        async for issue in iter_sharded(
+            lambda window: self.iter_coupon_issues(
+                search_date_type=search_date_type,
+                start_ymd=window.start,
+                end_ymd=window.end,
+                size=size,
+                member_nos=member_nos,
+                member_ids=member_ids,
+                coupon_nos=coupon_nos,
+                coupon_issue_nos=coupon_issue_nos,
+                prefetch=prefetch,
+            ),
+            start_ymd,
+            end_ymd,
+            days=window_days,
+            concurrency=concurrency,
+        ):
+            yield issue
+
     async def issue_coupons(self, request: IssueCouponRequest) -> list[IssueCouponResult]:
         """회원번호와 쿠폰번호로 쿠폰 발급하기
 
@@ -230,7 +334,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             list[IssueCouponResult]: 발급 결과 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("issue_coupons") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -256,7 +360,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             CouponTargetsResponse: 대상 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_coupon_targets") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int | bool] = {}
@@ -279,7 +383,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Args:
             request: 쿠폰 철회 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("withdraw_coupon") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -296,7 +400,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Args:
             request: 쿠폰 지급 철회(bulk) 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("withdraw_coupons_bulk") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -315,7 +419,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             CouponDetailResponse: 쿠폰 상세 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_coupon") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/coupons/{coupon_no}", headers=headers)
@@ -330,7 +434,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
             coupon_no: 쿠폰 번호
             request: 쿠폰 수정 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("update_coupon") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -347,7 +451,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
             coupon_no: 쿠폰 번호
             request: 사용 중지/재개 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("use_stop_coupon") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -384,7 +488,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Returns:
             list[UsedCouponContent]: 사용된 쿠폰 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_used_coupons") as client:
             headers = {"version": "1.0"}
 
             params: dict[str, str | int | bool] = {
@@ -412,7 +516,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Args:
             items: 사용 처리할 쿠폰 리스트
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("use_coupons") as client:
             headers = {"version": "1.0"}
             body = [item.model_dump(by_alias=True, exclude_none=True, mode="json") for item in items]
 
@@ -426,7 +530,7 @@ class ShopbyServerPromotionApiClient(ShopbyServerApiClient):
         Args:
             request: 쿠폰 취소 요청
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("rollback_coupon_use") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -0,0 +1,405 @@
+"""대량 쿠폰 발급 파이프라인 (``issue_coupons``).
+
+``issue_coupons`` 는 요청 1회에 회원 최대 1000명 × 쿠폰 최대 10개를 발급한다.
+``issue_coupons_to_members`` 는 회원 번호 스트림(``iter_post_members`` 결과, 파일 등)을
+1000명씩 묶고 쿠폰을 10개씩 묶어 최대 크기 요청으로 만든 뒤 ``concurrency`` 개 회원 묶음을 동시에
+보낸다 (적응형 rate limiter 로 속도 조절). 결과는 회원별 목록 대신 쿠폰별 발급/실패 건수로
+모으고(``CouponIssueSummary``), 실패 건은 ``on_failure`` 콜백과 일부 표본만 남긴다.
+
+발급은 멱등하지 않으므로 (같은 요청을 다시 보내면 두 번 발급될 수 있다) 재시도는 다음처럼 한다.
+
+- 429/5xx/네트워크 오류로 결과를 모르는 요청은 다시 보내기 전에 ``iter_coupon_issues`` 로 실행
+  시작일 이후 이미 지급된 (회원, 쿠폰) 을 확인하고, 지급되지 않은 것만 보낸다.
+- 체크포인트 파일에 처리를 마친 회원 수를 회원 묶음마다 기록한다. 같은 입력으로 다시 실행하면
+  처리한 회원은 건너뛰고, 중단 당시 요청 중이었을 수 있는 묶음(최대 ``concurrency`` 개)은 위와 같이
+  지급 여부를 확인한 뒤 보낸다.
+
+Example:
+    ```python
+    summary = await issue_coupons_to_members(
+        promotion_client,
+        [1001, 1002],
+        (m.member_no async for m in member_client.iter_post_members(...)),
+        reason="2025 여름 캠페인",
+        checkpoint="summer_campaign.checkpoint.json",
+    )
+    print(summary.issued, summary.failed, summary.coupons[1001].issued)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+
+import httpx
+
+from shopby_sdk.base.batch import as_async_iter, call_handler, fetch_many
+from shopby_sdk.base.checkpoint import JsonStateFile
+from shopby_sdk.base.kst import KST
+from shopby_sdk.base.ratelimit import AdaptiveRateLimiter
+from shopby_sdk.base.retry import RetryPolicy
+from shopby_sdk.clients.promotion.client import ShopbyServerPromotionApiClient
+from shopby_sdk.clients.promotion.models import IssueCouponRequest, IssueCouponResult
+
+logger = logging.getLogger(__name__)
+
+MAX_ISSUE_MEMBERS = 1000
+"""``issue_coupons`` 요청 1회 최대 회원 수."""
+
+MAX_ISSUE_COUPONS = 10
+"""``issue_coupons`` 요청 1회 최대 쿠폰 수."""
+
+DEFAULT_ISSUE_CONCURRENCY = 4
+"""동시에 발급하는 회원 묶음 수 기본값."""
+
+DEFAULT_ISSUE_RETRY = RetryPolicy()
+"""발급 재시도 정책 기본값 (429/5xx/네트워크 오류, 최대 3회). 재시도 전에 지급 여부를 확인한다."""
+
+FailureHandler = Callable[[IssueCouponResult], Awaitable[None] | None]
+
+
+@dataclass(slots=True)
+class CouponIssueCounts:
+    """쿠폰 하나의 발급 건수.
+
+    Attributes:
+        issued: 발급 성공
+        failed: 발급 실패 (``issueFail`` 또는 요청 실패)
+        already_issued: 재시도/재개 시 이미 지급되어 있어 건너뛴 건수
+    """
+
+    issued: int = 0
+    failed: int = 0
+    already_issued: int = 0
+
+
+@dataclass(slots=True)
+class CouponIssueSummary:
+    """발급 실행 결과 (체크포인트로 재개한 경우 이전 실행 분량 포함).
+
+    Attributes:
+        coupons: 쿠폰 번호별 발급 건수
+        members: 처리한 회원 수
+        requests: 보낸 발급 요청 수
+        failed_requests: 재시도 후에도 실패한 발급 요청 수
+        resumed: 체크포인트로 건너뛴 회원 수
+        failure_samples: 실패한 (회원 번호, 쿠폰 번호) 표본 (최대 ``max_failure_samples`` 개, 이번 실행분)
+        elapsed: 이번 실행 시간(초)
+    """
+
+    coupons: dict[int, CouponIssueCounts] = field(default_factory=dict)
+    members: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+    resumed: int = 0
+    failure_samples: list[tuple[int, int]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def issued(self) -> int:
+        return sum(counts.issued for counts in self.coupons.values())
+
+    @property
+    def failed(self) -> int:
+        return sum(counts.failed for counts in self.coupons.values())
+
+    @property
+    def already_issued(self) -> int:
+        return sum(counts.already_issued for counts in self.coupons.values())
+
+    @property
+    def throughput(self) -> float:
+        """이번 실행의 초당 처리 회원 수."""
+        return (self.members - self.resumed) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class CouponIssueCheckpoint:
+    """발급 진행 상태 (JSON 파일, 임시 파일 + rename 으로 원자적 저장).
+
+    파일 구조::
+
+        {"couponNos": [1001, 1002], "since": "2025-07-01", "offset": 152000, "requests": 304,
+         "failedRequests": 0, "coupons": {"1001": {"issued": 151990, "failed": 10, "already_issued": 0}, ...},
+         "done": false}
+    """
+
+    def __init__(self, path: str | os.PathLike[str], coupon_nos: Sequence[int]):
+        self._file = JsonStateFile(path)
+        self.path = self._file.path
+        state = self._file.load()
+        if state is None:
+            today = datetime.now(KST).date()
+            state = {"couponNos": list(coupon_nos), "since": today.isoformat(), "offset": 0, "coupons": {}}
+        elif state["couponNos"] != list(coupon_nos):
+            raise ValueError(f"checkpoint {self.path} is for coupons {state['couponNos']}")
+        self._state = state
+
+    @property
+    def offset(self) -> int:
+        """처리를 마친 회원 수 (입력 순서 기준)."""
+        return self._state["offset"]
+
+    @property
+    def since(self) -> date:
+        """첫 실행일 (KST). 이미 지급된 쿠폰은 이 날짜 이후 지급분에서 찾는다."""
+        return date.fromisoformat(self._state["since"])
+
+    @property
+    def done(self) -> bool:
+        return bool(self._state.get("done"))
+
+    def restore(self, summary: CouponIssueSummary) -> None:
+        summary.members = summary.resumed = self.offset
+        summary.requests = self._state.get("requests", 0)
+        summary.failed_requests = self._state.get("failedRequests", 0)
+        for coupon_no, counts in self._state["coupons"].items():
+            summary.coupons[int(coupon_no)] = CouponIssueCounts(**counts)
+
+    def update(self, summary: CouponIssueSummary, *, done: bool = False) -> None:
+        self._state.update(
+            offset=summary.members,
+            requests=summary.requests,
+            failedRequests=summary.failed_requests,
+            coupons={str(no): asdict(counts) for no, counts in summary.coupons.items()},
+            done=done,
+        )
+        self._file.save(self._state)
+
+
+async def issue_coupons_to_members(
+    client: ShopbyServerPromotionApiClient,
+    coupon_nos: Sequence[int],
+    member_nos: Iterable[int] | AsyncIterable[int],
+    *,
+    reason: str | None = None,
+    is_admin_issue: bool | None = None,
+    concurrency: int = DEFAULT_ISSUE_CONCURRENCY,
+    checkpoint: str | os.PathLike[str] | None = None,
+    retry: RetryPolicy | None = DEFAULT_ISSUE_RETRY,
+    rate_limit: bool | AdaptiveRateLimiter | None = True,
+    on_failure: FailureHandler | None = None,
+    max_failure_samples: int = 1000,
+) -> CouponIssueSummary:
+    """회원 스트림에 쿠폰을 최대 크기 요청(1000명 × 10개)으로 동시에 발급.
+
+    Args:
+        client: 프로모션 server API 클라이언트
+        coupon_nos: 발급할 쿠폰 번호 (10개를 넘으면 10개씩 나눠 요청)
+        member_nos: 회원 번호. 제너레이터·async iterable 은 필요한 만큼만 꺼낸다. 중복은 제거하지 않는다.
+        reason: 발급 사유
+        is_admin_issue: 어드민 발급 여부
+        concurrency: 동시에 발급하는 회원 묶음(1000명) 수
+        checkpoint: 체크포인트 파일 경로. 있으면 처리한 회원 다음부터 이어서 발급한다.
+        retry: 429/5xx/네트워크 오류 재시도 정책 (재시도 전 지급 여부 확인). None 이면 재시도하지 않는다.
+        rate_limit: 적응형 rate limiter. True(기본)면 자격증명별 공유 limiter, None 이면 클라이언트 설정 그대로.
+        on_failure: 실패한 (회원, 쿠폰) 마다 ``issue_fail=True`` 인 결과를 받는 콜백 (동기/비동기)
+        max_failure_samples: ``failure_samples`` 에 남길 최대 개수
+    """
+    coupon_nos = list(coupon_nos)
+    if not coupon_nos:
+        raise ValueError("coupon_nos must not be empty")
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    # 발급 결과를 모델로 읽어야 하므로 raw 모드는 쓰지 않는다 (발급 뒤 결과를 못 읽으면 재실행 시 중복 발급)
+    client = client.with_options(raw=False, rate_limit=rate_limit)
+
+    summary = CouponIssueSummary(coupons={no: CouponIssueCounts() for no in coupon_nos})
+    state = CouponIssueCheckpoint(checkpoint, coupon_nos) if checkpoint is not None else None
+    since = datetime.now(KST).date()
+    skip = 0
+    if state is not None:
+        state.restore(summary)
+        since, skip = state.since, state.offset
+        if state.done:
+            logger.info("coupon issue %s: already done (%d members)", coupon_nos, skip)
+            return summary
+        if skip:
+            logger.info("coupon issue %s: resuming after %d members", coupon_nos, skip)
+
+    coupon_groups = [coupon_nos[i : i + MAX_ISSUE_COUPONS] for i in range(0, len(coupon_nos), MAX_ISSUE_COUPONS)]
+    # 재개 시 중단 직전에 요청 중이었을 수 있는 묶음은 지급 여부를 확인한 뒤 보낸다
+    unconfirmed = concurrency if skip else 0
+
+    async def issue(chunk: tuple[int, list[int]]) -> CouponIssueSummary:
+        # 묶음별로 집계해 입력 순서대로 합쳐야 체크포인트의 건수가 위치와 맞는다
+        index, members = chunk
+        part = CouponIssueSummary(coupons={no: CouponIssueCounts() for no in coupon_nos})
+        issuer = _Issuer(client, part, reason, is_admin_issue, since, retry, on_failure, max_failure_samples)
+        for coupons in coupon_groups:
+            await issuer.issue(members, coupons, reconcile=index < unconfirmed)
+        return part
+
+    started = time.perf_counter()
+    results = fetch_many(issue, _member_chunks(member_nos, skip), concurrency=concurrency, ordered=True)
+    try:
+        # 입력 순서대로 완료되므로 체크포인트 위치는 항상 발급을 마친 회원의 끝이다
+        async for result in results:
+            if result.error is not None:
+                raise result.error
+            _merge(summary, result.value, max_failure_samples)  # type: ignore[arg-type]
+            summary.members += len(result.key[1])
+            if state is not None:
+                state.update(summary)
+    finally:
+        await results.aclose()
+        summary.elapsed = time.perf_counter() - started
+    if state is not None:
+        state.update(summary, done=True)
+
+    logger.info(
+        "coupon issue %s: members=%d issued=%d failed=%d already_issued=%d requests=%d (%.1f members/s)",
+        coupon_nos,
+        summary.members,
+        summary.issued,
+        summary.failed,
+        summary.already_issued,
+        summary.requests,
+        summary.throughput,
+    )
+    return summary
+
+
+def _merge(summary: CouponIssueSummary, part: CouponIssueSummary, max_failure_samples: int) -> None:
+    for coupon_no, counts in part.coupons.items():
+        total = summary.coupons[coupon_no]
+        total.issued += counts.issued
+        total.failed += counts.failed
+        total.already_issued += counts.already_issued
+    summary.requests += part.requests
+    summary.failed_requests += part.failed_requests
+    room = max_failure_samples - len(summary.failure_samples)
+    if room > 0:
+        summary.failure_samples.extend(part.failure_samples[:room])
+
+
+def read_member_nos(path: str | os.PathLike[str]) -> Iterator[int]:
+    """한 줄에 회원 번호 하나인 텍스트 파일을 순서대로 읽는다 (빈 줄·``#`` 주석 무시)."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield int(line)
+
+
+class _Issuer:
+    """(회원 묶음, 쿠폰 묶음) 발급 + 결과 집계 + 지급 여부 확인 후 재시도."""
+
+    def __init__(
+        self,
+        client: ShopbyServerPromotionApiClient,
+        summary: CouponIssueSummary,
+        reason: str | None,
+        is_admin_issue: bool | None,
+        since: date,
+        retry: RetryPolicy | None,
+        on_failure: FailureHandler | None,
+        max_failure_samples: int,
+    ):
+        self.client = client
+        self.summary = summary
+        self.reason = reason
+        self.is_admin_issue = is_admin_issue
+        self.since = since
+        self.retry = retry
+        self.on_failure = on_failure
+        self.max_failure_samples = max_failure_samples
+
+    async def issue(self, members: list[int], coupons: list[int], *, reconcile: bool, attempt: int = 1) -> None:
+        groups = await self._pending_groups(members, coupons) if reconcile else [(members, coupons)]
+        for group_members, group_coupons in groups:
+            await self._send(group_members, group_coupons, attempt)
+
+    async def _send(self, members: list[int], coupons: list[int], attempt: int) -> None:
+        request = IssueCouponRequest(
+            coupon_nos=coupons, member_nos=members, reason=self.reason, is_admin_issue=self.is_admin_issue
+        )
+        self.summary.requests += 1
+        try:
+            results = await self.client.issue_coupons(request)
+        except Exception as exc:
+            delay = self._retry_delay(exc, attempt)
+            if delay is None:
+                logger.warning("coupon issue failed (%d members x %s)", len(members), coupons, exc_info=True)
+                self.summary.failed_requests += 1
+                for member_no in members:
+                    for coupon_no in coupons:
+                        await self._record(IssueCouponResult(coupon_no=coupon_no, member_no=member_no, issue_fail=True))
+                return
+            await asyncio.sleep(delay)
+            # 요청이 서버에서 처리됐을 수 있으므로 지급 여부를 확인한 뒤 남은 것만 다시 보낸다
+            await self.issue(members, coupons, reconcile=True, attempt=attempt + 1)
+            return
+
+        answered: set[tuple[int | None, int | None]] = set()
+        for result in results:
+            answered.add((result.member_no, result.coupon_no))
+            await self._record(result)
+        if len(answered) < len(members) * len(coupons):
+            for member_no in members:
+                for coupon_no in coupons:
+                    if (member_no, coupon_no) not in answered:
+                        await self._record(IssueCouponResult(coupon_no=coupon_no, member_no=member_no, issue_fail=True))
+
+    async def _pending_groups(self, members: list[int], coupons: list[int]) -> list[tuple[list[int], list[int]]]:
+        """아직 지급되지 않은 (회원, 쿠폰) 을 같은 쿠폰 조합끼리 묶은 요청 목록."""
+        issued: set[tuple[int | None, int | None]] = set()
+        async for item in self.client.iter_coupon_issues(
+            "ISSUE_YMD", self.since, datetime.now(KST).date(), member_nos=members, coupon_nos=coupons
+        ):
+            if not item.withdrawn:
+                issued.add((item.member_no, item.coupon_no))
+        by_coupons: dict[tuple[int, ...], list[int]] = {}
+        for member_no in members:
+            missing = []
+            for coupon_no in coupons:
+                if (member_no, coupon_no) in issued:
+                    self.summary.coupons[coupon_no].already_issued += 1
+                else:
+                    missing.append(coupon_no)
+            if missing:
+                by_coupons.setdefault(tuple(missing), []).append(member_no)
+        return [(group_members, list(group_coupons)) for group_coupons, group_members in by_coupons.items()]
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> float | None:
+        policy = self.retry
+        if policy is None or attempt >= policy.max_attempts:
+            return None
+        if isinstance(exc, httpx.HTTPStatusError):
+            return policy.delay_for(exc.response, attempt)
+        return policy.backoff(attempt) if policy.should_retry_error(exc) else None
+
+    async def _record(self, result: IssueCouponResult) -> None:
+        counts = self.summary.coupons.get(result.coupon_no) if result.coupon_no is not None else None
+        if counts is None:
+            return
+        if not result.issue_fail:
+            counts.issued += 1
+            return
+        counts.failed += 1
+        if len(self.summary.failure_samples) < self.max_failure_samples and result.member_no is not None:
+            self.summary.failure_samples.append((result.member_no, result.coupon_no))
+        await call_handler(self.on_failure, result)
+
+
+async def _member_chunks(
+    member_nos: Iterable[int] | AsyncIterable[int], skip: int
+) -> AsyncIterator[tuple[int, list[int]]]:
+    """(묶음 순번, 회원 번호 최대 1000개) — 처음 skip 명은 건너뛴다."""
+    chunk: list[int] = []
+    index = seen = 0
+    async for member_no in as_async_iter(member_nos):
+        seen += 1
+        if seen <= skip:
+            continue
+        chunk.append(member_no)
+        if len(chunk) == MAX_ISSUE_MEMBERS:
+            yield index, chunk
+            index, chunk = index + 1, []
+    if chunk:
+        yield index, chunk
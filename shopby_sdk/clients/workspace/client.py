@@ -3,11 +3,12 @@
 OpenAPI: workspace-server (docs/api/workspace-server-public.yml)
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 
-import httpx
-
-from shopby_sdk.base.kst import to_kst_string
+from shopby_sdk.base.daterange import DEFAULT_SHARD_CONCURRENCY, iter_sharded
+from shopby_sdk.base.kst import KST, to_kst_string
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, iter_page_items
 from shopby_sdk.clients.base import ShopbyServerApiClient
 from shopby_sdk.clients.workspace.models import (
     AppInstalledExtendRequest,
@@ -18,6 +19,7 @@ from shopby_sdk.clients.workspace.models import (
     ExternalScriptItem,
     ExternalScriptRegisterRequest,
     ScriptType,
+    WebhookFailedItem,
     WebhooksFailedResponse,
 )
 
@@ -41,7 +43,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Returns:
             AppInstalledStatusResponse: 설치 앱 사용 상태
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_app_installed_status") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/app-installed/status", headers=headers)
@@ -54,7 +56,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Args:
             request: 만료일 연장 요청 (주문번호, 결제금액, 요청일시, 결제타입)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("extend_app_installed") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -72,7 +74,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Returns:
             AuthMeResponse: 어드민/몰 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_auth_me") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/auth/me", headers=headers)
@@ -105,7 +107,9 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Returns:
             AuthTokenResponse: 발급된 토큰 정보
         """
-        return await self._request_token("/auth/token", client_id, client_secret, grant_type, code, redirect_uri, refresh_token)
+        return await self._request_token(
+            "issue_token", "/auth/token", client_id, client_secret, grant_type, code, redirect_uri, refresh_token
+        )
 
     async def issue_long_lived_token(
         self,
@@ -133,10 +137,20 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Returns:
             AuthTokenResponse: 발급된 장기 토큰 정보
         """
-        return await self._request_token("/auth/token/long-lived", client_id, client_secret, grant_type, code, redirect_uri, refresh_token)
+        return await self._request_token(
+            "issue_long_lived_token",
+            "/auth/token/long-lived",
+            client_id,
+            client_secret,
+            grant_type,
+            code,
+            redirect_uri,
+            refresh_token,
+        )
 
     async def _request_token(
         self,
+        operation: str,
         path: str,
         client_id: str,
         client_secret: str,
@@ -145,7 +159,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         redirect_uri: str | None,
         refresh_token: str | None,
     ) -> AuthTokenResponse:
-        """토큰 발급 공통 처리 (무인증, OAuth snake_case 바디)"""
+        """토큰 발급 공통 처리 (무인증, OAuth snake_case 바디). operation 은 호출한 공개 메서드 이름."""
         # OAuth 표준 키(snake_case)로 직접 구성 — BaseDto camelCase 변환을 회피
         body: dict[str, str] = {
             "client_id": client_id,
@@ -160,7 +174,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
             body["refresh_token"] = refresh_token
 
         # Authorization/systemKey 미전송 — common_header 를 사용하지 않는다
-        async with httpx.AsyncClient(base_url=self.base_url) as client:
+        async with self._session(operation, headers={}) as client:
             headers = {"version": "1.0"}
             resp = await client.post(path, headers=headers, json=body)
             return self.handle_resp(resp, AuthTokenResponse)
@@ -172,7 +186,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Args:
             token: 제거할 토큰
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("revoke_token") as client:
             headers = {"version": "1.0"}
 
             resp = await client.post("/auth/token/revoke", headers=headers, json={"token": token})
@@ -197,7 +211,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Returns:
             list[ExternalScriptItem]: 외부 스크립트 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_external_scripts") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if script_types is not None:
@@ -215,7 +229,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Args:
             request: 등록할 외부 스크립트 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("register_external_scripts") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -235,7 +249,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
             script_type: 삭제할 스크립트 노출 위치 타입
             device_type: 삭제할 디바이스 타입
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_external_script") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if script_type is not None:
@@ -277,7 +291,7 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
         Returns:
             WebhooksFailedResponse: 실패한 웹훅 목록 (totalCount, contents)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_failed_webhooks") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "startDateTime": to_kst_string(start_date_time),
@@ -298,3 +312,107 @@ class ShopbyServerWorkspaceApiClient(ShopbyServerApiClient):
 
             resp = await client.get("/webhooks/failed", headers=headers, params=params)
             return self.handle_resp(resp, WebhooksFailedResponse)
+
+    async def iter_failed_webhooks(
+        self,
+        start_date_time: datetime,
+        end_date_time: datetime,
+        page_size: int = 100,
+        mall_nos: list[int] | None = None,
+        shop_nos: list[int] | None = None,
+        event_type: str | None = None,
+        direction: str | None = None,
+        *,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[WebhookFailedItem]:
+        """
+        실패한 웹훅 조회하기 - 전체 페이지 순회
+
+        ``get_failed_webhooks`` 를 페이지별로 호출해 실패 웹훅을 하나씩 내보낸다. 조회
+        기간은 7일 이내여야 한다 (더 긴 기간은 ``iter_failed_webhooks_sharded``).
+
+        Args:
+            page_size: 페이지 크기 [default: 100]
+            prefetch: 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``get_failed_webhooks`` 와 동일)
+
+        Yields:
+            WebhookFailedItem: 실패한 웹훅
+        """
+
+        client = self._model_client()
+
+        async def fetch(page: int, size: int) -> WebhooksFailedResponse:
+            return await client.get_failed_webhooks(
+                start_date_time=start_date_time,
+                end_date_time=end_date_time,
+                page=page,
+                page_size=size,
+                mall_nos=mall_nos,
+                shop_nos=shop_nos,
+                event_type=event_type,
+                direction=direction,
+            )
+
+        async for item in iter_page_items(
+            fetch,
+            page_size=page_size,
+            total_count=lambda r: r.total_count,
+            page_items=lambda r: r.contents,
+            prefetch=prefetch,
+        ):
+            yield item
+
+    async def iter_failed_webhooks_sharded(
+        self,
+        start_date_time: datetime,
+        end_date_time: datetime,
+        page_size: int = 100,
+        mall_nos: list[int] | None = None,
+        shop_nos: list[int] | None = None,
+        event_type: str | None = None,
+        direction: str | None = None,
+        *,
+        window_days: int = 7,
+        concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[WebhookFailedItem]:
+        """
+        실패한 웹훅 조회하기 - 긴 기간을 구간으로 나눠 동시 순회
+
+        실패 웹훅 조회 기간은 최대 7일이다 (보관기간 6개월). KST 날짜 기준으로
+        ``window_days`` 일 구간으로 나누고 첫/마지막 구간은 start_date_time/end_date_time
+        으로 자른 뒤, 구간마다 ``iter_failed_webhooks`` 로 순회한다. 최대 ``concurrency``
+        개 구간을 동시에 조회하며 결과는 구간 순서(과거 → 최근)대로 나온다.
+        (``shopby_sdk.base.daterange.iter_sharded`` 참고)
+
+        Args:
+            window_days: 구간 일수 (최대 7) [default: 7]
+            concurrency: 동시에 조회할 구간 수
+            prefetch: 구간마다 동시에 미리 요청할 페이지 수
+            (그 외 인자는 ``iter_failed_webhooks`` 와 동일)
+
+        Yields:
+            WebhookFailedItem: 실패한 웹훅
+        """
+        # naive datetime 은 KST 로 간주 (to_kst_string 과 동일)
+        start = start_date_time.replace(tzinfo=KST) if start_date_time.tzinfo is None else start_date_time
+        end = end_date_time.replace(tzinfo=KST) if end_date_time.tzinfo is None else end_date_time
+        async for item in iter_sharded(
+            lambda window: self.iter_failed_webhooks(
+                start_date_time=max(window.start_datetime, start),
+                end_date_time=min(window.end_datetime, end),
+                page_size=page_size,
+                mall_nos=mall_nos,
+                shop_nos=shop_nos,
+                event_type=event_type,
+                direction=direction,
+                prefetch=prefetch,
+            ),
+            start.astimezone(KST).date(),
+            end.astimezone(KST).date(),
+            days=window_days,
+            max_days=7,
+            concurrency=concurrency,
+        ):
+            yield item
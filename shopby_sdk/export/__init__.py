@@ -0,0 +1,23 @@
+from shopby_sdk.export.exporter import (
+    ExportCheckpoint,
+    ExportResult,
+    export_claims,
+    export_dormant_members,
+    export_orders,
+    export_post_members,
+    export_windows,
+)
+from shopby_sdk.export.writers import ExportFormat, NdjsonWriter, ParquetWriter
+
+__all__ = [
+    "ExportCheckpoint",
+    "ExportResult",
+    "export_claims",
+    "export_dormant_members",
+    "export_orders",
+    "export_post_members",
+    "export_windows",
+    "ExportFormat",
+    "NdjsonWriter",
+    "ParquetWriter",
+]
@@ -0,0 +1,376 @@
+"""주문/클레임/회원 목록의 스트리밍 export.
+
+목록 API 결과를 메모리에 모으지 않고 페이지 단위로 받아 chunk 마다 파일에 바로 쓴다.
+
+- 긴 기간은 ``split_date_range`` 로 ``window_days`` 일 구간으로 나누고, 구간마다 파일 하나를
+  만든다 (``{out_dir}/{name}/{start}_{end}.ndjson``). 쓰는 동안은 ``.part`` 파일이고,
+  구간이 끝나면 최종 이름으로 바뀐다.
+- 응답은 raw dict 로 받아(검증 생략) API 원본 필드 그대로 쓴다.
+- 체크포인트(``_checkpoint.json``)에 완료한 구간과 진행 중 구간의 다음 페이지/커서,
+  파일 위치를 chunk 마다 기록한다. 같은 인자로 다시 실행하면 완료된 구간은 건너뛰고,
+  진행 중이던 구간은 마지막 chunk 다음부터 이어 쓴다 (Parquet 은 구간을 처음부터 다시 쓴다).
+
+Example:
+    ```python
+    result = await export_orders(order_client, "exports", date(2025, 1, 1), date(2025, 6, 30))
+    result = await export_claims(
+        claim_client, "exports", date(2025, 1, 1), date(2025, 6, 30), format="parquet", window_days=7
+    )
+    print(result.rows, [str(f) for f in result.files])
+    ```
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from shopby_sdk.base.checkpoint import JsonStateFile
+from shopby_sdk.base.daterange import DateWindow, split_date_range
+from shopby_sdk.base.jsonlib import JsonBackend
+from shopby_sdk.base.pagination import DEFAULT_PREFETCH, iter_keyset_pages, iter_pages
+from shopby_sdk.clients.claim.client import ShopbyServerClaimApiClient
+from shopby_sdk.clients.claim.models import ClaimSearchDateType, ClaimSearchType
+from shopby_sdk.clients.member.client import ShopbyServerMemberApiClient
+from shopby_sdk.clients.member.models import MemberStatus
+from shopby_sdk.clients.order.client import ShopbyServerOrderApiClient
+from shopby_sdk.export.writers import ExportFormat, open_writer
+
+logger = logging.getLogger(__name__)
+
+PageSource = Callable[[DateWindow, Any], AsyncIterator[tuple[Sequence[dict[str, Any]], Any]]]
+"""(구간, 재개 토큰) → (페이지 rows, 다음 페이지 재개 토큰) 을 순서대로 내보내는 함수."""
+
+DEFAULT_CHUNK_SIZE = 1000
+"""파일에 한 번에 쓰고 체크포인트를 남기는 최소 row 수."""
+
+
+@dataclass(slots=True)
+class ExportResult:
+    """export 실행 결과.
+
+    Attributes:
+        files: 구간별 출력 파일 (건너뛴 완료 구간 포함, 구간 순서)
+        rows: 이번 실행에서 쓴 row 수 (재개 전 구간 분량 포함)
+        windows: 이번 실행에서 처리한 구간 수
+        skipped_windows: 이전 실행에서 이미 완료되어 건너뛴 구간 수
+        elapsed: 실행 시간(초)
+    """
+
+    files: list[Path] = field(default_factory=list)
+    rows: int = 0
+    windows: int = 0
+    skipped_windows: int = 0
+    elapsed: float = 0.0
+
+
+class ExportCheckpoint:
+    """구간 단위 export 진행 상태 (JSON 파일, 임시 파일 + rename 으로 원자적 저장).
+
+    파일 구조::
+
+        {"done": {"2025-01-01_2025-01-30": 1234, ...},
+         "current": {"window": "2025-01-31_2025-03-01", "resume": 7, "offset": 52311, "rows": 1200}}
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._file = JsonStateFile(path)
+        self.path = self._file.path
+        self._state = self._file.load() or {"done": {}, "current": None}
+
+    def is_done(self, window: DateWindow) -> bool:
+        return window.key in self._state["done"]
+
+    def current(self, window: DateWindow) -> dict[str, Any] | None:
+        """window 가 진행 중이던 구간이면 그 재개 정보."""
+        current = self._state.get("current")
+        return current if current and current["window"] == window.key else None
+
+    def update(self, window: DateWindow, *, resume: Any, offset: int, rows: int) -> None:
+        self._state["current"] = {"window": window.key, "resume": resume, "offset": offset, "rows": rows}
+        self._save()
+
+    def mark_done(self, window: DateWindow, rows: int) -> None:
+        self._state["done"][window.key] = rows
+        self._state["current"] = None
+        self._save()
+
+    def _save(self) -> None:
+        self._file.save(self._state)
+
+
+async def export_windows(
+    name: str,
+    windows: Sequence[DateWindow],
+    pages: PageSource,
+    out_dir: str | os.PathLike[str],
+    *,
+    format: ExportFormat = "ndjson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: str | os.PathLike[str] | None = None,
+    schema: Any = None,
+) -> ExportResult:
+    """구간마다 pages 결과를 chunk 단위로 파일에 쓰는 공통 export 루프.
+
+    Args:
+        name: export 이름 (출력 하위 디렉터리명)
+        windows: 처리할 구간 (순서대로 처리)
+        pages: 구간의 페이지 rows 를 내보내는 함수 (``PageSource``)
+        out_dir: 출력 루트 디렉터리
+        format: ``"ndjson"`` 또는 ``"parquet"`` (pyarrow 필요)
+        chunk_size: 이만큼 쌓일 때마다 파일에 쓰고 체크포인트를 남긴다
+        checkpoint: 체크포인트 파일 경로. 기본값 ``{out_dir}/{name}/_checkpoint.json``
+        schema: Parquet 스키마 (``pyarrow.Schema``). None 이면 구간별 첫 chunk 로 추론.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    directory = Path(out_dir) / name
+    directory.mkdir(parents=True, exist_ok=True)
+    state = ExportCheckpoint(checkpoint or directory / "_checkpoint.json")
+    result = ExportResult()
+    started = time.perf_counter()
+
+    for window in windows:
+        final = directory / f"{window.key}.{format}"
+        if state.is_done(window) and final.exists():
+            result.files.append(final)
+            result.skipped_windows += 1
+            continue
+
+        part = final.with_name(final.name + ".part")
+        resumed = state.current(window) if format == "ndjson" and part.exists() else None
+        rows = resumed["rows"] if resumed else 0
+        if resumed:
+            logger.info("export %s %s: resuming at %s (%d rows)", name, window.key, resumed["resume"], rows)
+
+        buffer: list[dict[str, Any]] = []
+        with open_writer(part, format, resume_offset=resumed["offset"] if resumed else None, schema=schema) as writer:
+            async for page_rows, resume in pages(window, resumed["resume"] if resumed else None):
+                buffer.extend(page_rows)
+                if len(buffer) >= chunk_size:
+                    writer.write(buffer)
+                    rows += len(buffer)
+                    buffer = []
+                    if (offset := writer.tell()) >= 0:
+                        state.update(window, resume=resume, offset=offset, rows=rows)
+            if buffer:
+                writer.write(buffer)
+                rows += len(buffer)
+
+        os.replace(part, final)
+        state.mark_done(window, rows)
+        result.files.append(final)
+        result.rows += rows
+        result.windows += 1
+        logger.info("export %s %s: %d rows -> %s", name, window.key, rows, final)
+
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def _numbered_pages(
+    fetch: Callable[[DateWindow, int, int], Any],
+    *,
+    page_size: int,
+    total_key: str,
+    items_key: str,
+    prefetch: int,
+) -> PageSource:
+    """페이지 번호 방식 API 의 PageSource. 재개 토큰은 다음 페이지 번호."""
+
+    async def pages(window: DateWindow, resume: int | None) -> AsyncIterator[tuple[Sequence[dict[str, Any]], int]]:
+        page_no = resume or 1
+        async for page in iter_pages(
+            lambda number, size: fetch(window, number, size),
+            page_size=page_size,
+            total_count=lambda r: r.get(total_key) or 0,
+            page_items=lambda r: r.get(items_key) or [],
+            start_page=page_no,
+            prefetch=prefetch,
+        ):
+            page_no += 1
+            yield page.get(items_key) or [], page_no
+
+    return pages
+
+
+async def export_orders(
+    client: ShopbyServerOrderApiClient,
+    out_dir: str | os.PathLike[str],
+    start_ymd: date,
+    end_ymd: date,
+    *,
+    window_days: int = 30,
+    page_size: int = 200,
+    prefetch: int = DEFAULT_PREFETCH,
+    format: ExportFormat = "ndjson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: str | os.PathLike[str] | None = None,
+    json_backend: JsonBackend = "auto",
+    **filters: Any,
+) -> ExportResult:
+    """주문 목록(``get_orders``)을 ``{out_dir}/orders/`` 로 export.
+
+    Args:
+        window_days: 구간 일수 (주문 조회 기간은 최대 3개월)
+        page_size: 페이지 크기 (최대 200)
+        **filters: ``get_orders`` 의 필터 인자 (기간/페이징 제외)
+        (그 외 인자는 ``export_windows`` 참고)
+    """
+    raw = client.with_options(raw=True, json_backend=json_backend)
+
+    async def fetch(window: DateWindow, page_number: int, size: int) -> Any:
+        return await raw.get_orders(
+            start_ymd=window.start, end_ymd=window.end, page_number=page_number, page_size=size, **filters
+        )
+
+    return await export_windows(
+        "orders",
+        split_date_range(start_ymd, end_ymd, days=window_days),
+        _numbered_pages(fetch, page_size=page_size, total_key="totalCount", items_key="contents", prefetch=prefetch),
+        out_dir,
+        format=format,
+        chunk_size=chunk_size,
+        checkpoint=checkpoint,
+    )
+
+
+async def export_claims(
+    client: ShopbyServerClaimApiClient,
+    out_dir: str | os.PathLike[str],
+    start_ymd: date,
+    end_ymd: date,
+    *,
+    search_date_type: ClaimSearchDateType = "APPLY_YMDT",
+    search_type: ClaimSearchType = "ALL",
+    window_days: int = 30,
+    page_size: int = 100,
+    prefetch: int = DEFAULT_PREFETCH,
+    format: ExportFormat = "ndjson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: str | os.PathLike[str] | None = None,
+    json_backend: JsonBackend = "auto",
+    **filters: Any,
+) -> ExportResult:
+    """클레임 목록(``get_claims``)을 ``{out_dir}/claims/`` 로 export.
+
+    Args:
+        search_date_type: 검색일자타입 (APPLY_YMDT, COMPLETE_YMDT)
+        search_type: 클레임 검색 타입
+        **filters: ``get_claims`` 의 나머지 필터 인자 (claim_status_types 등)
+        (그 외 인자는 ``export_orders`` 와 동일)
+    """
+    raw = client.with_options(raw=True, json_backend=json_backend)
+
+    async def fetch(window: DateWindow, page: int, size: int) -> Any:
+        return await raw.get_claims(
+            start_ymd=window.start,
+            end_ymd=window.end,
+            search_date_type=search_date_type,
+            search_type=search_type,
+            page=page,
+            size=size,
+            **filters,
+        )
+
+    return await export_windows(
+        "claims",
+        split_date_range(start_ymd, end_ymd, days=window_days),
+        _numbered_pages(fetch, page_size=page_size, total_key="totalCount", items_key="contents", prefetch=prefetch),
+        out_dir,
+        format=format,
+        chunk_size=chunk_size,
+        checkpoint=checkpoint,
+    )
+
+
+async def export_dormant_members(
+    client: ShopbyServerMemberApiClient,
+    out_dir: str | os.PathLike[str],
+    start_dormant_date: date,
+    end_dormant_date: date,
+    *,
+    window_days: int = 30,
+    page_size: int = 100,
+    prefetch: int = DEFAULT_PREFETCH,
+    format: ExportFormat = "ndjson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: str | os.PathLike[str] | None = None,
+    json_backend: JsonBackend = "auto",
+) -> ExportResult:
+    """휴면 회원(``get_dormant_members``)을 휴면전환일 구간별로 ``{out_dir}/dormant_members/`` 로 export."""
+    raw = client.with_options(raw=True, json_backend=json_backend)
+
+    async def fetch(window: DateWindow, page: int, size: int) -> Any:
+        return await raw.get_dormant_members(window.start, window.end, page=page, size=size)
+
+    return await export_windows(
+        "dormant_members",
+        split_date_range(start_dormant_date, end_dormant_date, days=window_days),
+        _numbered_pages(fetch, page_size=page_size, total_key="totalElements", items_key="content", prefetch=prefetch),
+        out_dir,
+        format=format,
+        chunk_size=chunk_size,
+        checkpoint=checkpoint,
+    )
+
+
+async def export_post_members(
+    client: ShopbyServerMemberApiClient,
+    out_dir: str | os.PathLike[str],
+    status: MemberStatus,
+    start_sign_up_date: date,
+    end_sign_up_date: date,
+    *,
+    window_days: int = 30,
+    page_size: int = 500,
+    format: ExportFormat = "ndjson",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint: str | os.PathLike[str] | None = None,
+    json_backend: JsonBackend = "auto",
+    **filters: Any,
+) -> ExportResult:
+    """회원 목록 V1.3(``post_members``)을 가입일 구간별로 ``{out_dir}/members_{status}/`` 로 export.
+
+    keySet(searchAfter) 방식이라 재개 토큰은 ``lastId`` 커서다.
+
+    Args:
+        status: 회원상태
+        **filters: ``post_members`` 의 나머지 검색 인자 (가입일시/커서/페이지 크기 제외)
+    """
+    raw = client.with_options(raw=True, json_backend=json_backend)
+
+    async def pages(window: DateWindow, resume: str | None) -> AsyncIterator[tuple[Sequence[dict[str, Any]], Any]]:
+        async def fetch(search_after: str | None) -> Any:
+            return await raw.post_members(
+                status,
+                start_sign_up_date_time=window.start_datetime,
+                end_sign_up_date_time=window.end_datetime,
+                search_after=search_after,
+                page_size=page_size,
+                **filters,
+            )
+
+        async for page in iter_keyset_pages(
+            fetch,
+            next_cursor=lambda r: r.get("lastId"),
+            page_items=lambda r: r.get("contents") or [],
+            resume_from=resume,
+        ):
+            yield page.items, page.checkpoint
+
+    return await export_windows(
+        f"members_{status.lower()}",
+        split_date_range(start_sign_up_date, end_sign_up_date, days=window_days),
+        pages,
+        out_dir,
+        format=format,
+        chunk_size=chunk_size,
+        checkpoint=checkpoint,
+    )
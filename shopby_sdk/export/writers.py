@@ -0,0 +1,241 @@
+"""export 출력 writer: NDJSON (기본) / Parquet (pyarrow 선택 의존성).
+
+writer 는 rows(dict 목록)를 chunk 단위로 받아 바로 파일에 쓰고, 쓴 뒤에는 rows 를
+보관하지 않는다. 메모리 사용량은 chunk 크기로 제한된다. writer 는 context manager 이며
+``with`` 블록을 벗어날 때(예외 포함) 파일을 닫는다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Literal, Protocol, Self
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["ndjson", "parquet"]
+
+
+class ExportWriter(Protocol):
+    """chunk 단위 rows writer."""
+
+    def write(self, rows: Sequence[dict[str, Any]]) -> None: ...
+
+    def tell(self) -> int:
+        """재개 지점으로 기록할 현재 위치. 재개를 지원하지 않으면 -1."""
+        ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> Self: ...
+
+    def __exit__(self, *exc_info: object) -> None: ...
+
+
+class _ClosingWriter:
+    """``with`` 블록을 벗어날 때 ``close()`` 를 부르는 writer 베이스."""
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class NdjsonWriter(_ClosingWriter):
+    """한 줄에 JSON 객체 하나씩 쓰는 writer.
+
+    Args:
+        path: 출력 파일
+        resume_offset: 이어 쓸 바이트 위치. 지정하면 파일을 그 위치로 잘라낸 뒤 이어 쓴다
+            (마지막 체크포인트 이후 중단 전에 쓰인 부분을 버림). None 이면 새로 쓴다.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, resume_offset: int | None = None):
+        self.path = Path(path)
+        # 파일은 writer 가 소유하고 close() / with 블록 종료 시 닫는다
+        if resume_offset is not None and self.path.exists():
+            self._file = open(self.path, "r+b")  # noqa: SIM115
+            try:
+                self._file.truncate(resume_offset)
+                self._file.seek(resume_offset)
+            except BaseException:
+                self._file.close()
+                raise
+        else:
+            self._file = open(self.path, "wb")  # noqa: SIM115
+
+    def write(self, rows: Sequence[dict[str, Any]]) -> None:
+        self._file.write(
+            b"".join(json.dumps(row, ensure_ascii=False, separators=(",", ":")).encode() + b"\n" for row in rows)
+        )
+        self._file.flush()
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter(_ClosingWriter):
+    """rows chunk 를 row group 으로 쓰는 Parquet writer (pyarrow 필요).
+
+    - 스키마는 ``schema`` 로 지정하거나, 첫 chunk 에서 추론한다. 추론 시 객체/배열 값은
+      JSON 문자열 컬럼, 첫 chunk 에서 전부 null 인 컬럼은 문자열 컬럼이 된다.
+    - 추론한 스키마에 맞지 않는 값이 이후 chunk 에 오면 컬럼 타입을 넓힌다 (정수 → 실수,
+      그 밖의 불일치 → 문자열). Parquet 파일은 스키마가 하나이므로 그때까지 쓴 row group 을
+      새 스키마로 한 번 다시 쓴다 (row group 단위로 읽어 메모리는 chunk 크기로 유지된다).
+      ``schema`` 를 직접 지정한 경우에는 넓히지 않는다.
+    - 값은 스키마 타입으로 맞춘다(문자열 컬럼은 JSON 직렬화, 실수 컬럼은 float).
+      스키마에 없는 새 키는 버리고 한 번 경고를 남긴다.
+    - Parquet 은 이어 쓰기가 불가능하므로 ``tell()`` 은 -1 이다 (중단된 구간은 처음부터 다시 쓴다).
+
+    Raises:
+        ImportError: pyarrow 가 설치되어 있지 않은 경우
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, schema: Any = None):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError('format="parquet" requires pyarrow: pip install pyarrow') from None
+        self.path = Path(path)
+        self._schema = schema
+        self._widens = schema is None
+        self._writer: Any = None
+        # 타입을 넓혀 다시 쓰는 동안에는 임시 파일에 쓰고 close() 에서 path 로 옮긴다
+        self._current = self.path
+        self._dropped: set[str] = set()
+
+    def write(self, rows: Sequence[dict[str, Any]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not rows:
+            return
+        if self._schema is None:
+            self._schema = _infer_schema(rows)
+        elif self._widens:
+            widened = _widen_schema(self._schema, rows)
+            if widened != self._schema:
+                logger.info("parquet export %s: widening schema to %s", self.path.name, widened)
+                self._rewrite(widened)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._current, self._schema)
+
+        new_keys = {key for row in rows for key in row} - set(self._schema.names) - self._dropped
+        if new_keys:
+            logger.warning("parquet export %s: dropping fields not in schema: %s", self.path.name, sorted(new_keys))
+            self._dropped |= new_keys
+
+        columns = [
+            pa.array([_coerce(row.get(field.name), field.type) for row in rows], type=field.type)
+            for field in self._schema
+        ]
+        self._writer.write_table(pa.Table.from_arrays(columns, schema=self._schema))
+
+    def _rewrite(self, schema: Any) -> None:
+        """지금까지 쓴 row group 을 넓힌 스키마로 다른 파일에 다시 쓰고 이어서 그 파일에 쓴다."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._schema = schema
+        if self._writer is None:
+            return
+        self._writer.close()
+        source = self._current
+        self._current = self.path.with_name(self.path.name + ".tmp") if source == self.path else self.path
+        self._writer = pq.ParquetWriter(self._current, schema)
+        for batch in pq.ParquetFile(source).iter_batches():
+            self._writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+        source.unlink()
+
+    def tell(self) -> int:
+        return -1
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            if self._current != self.path:
+                os.replace(self._current, self.path)
+            return
+        # 빈 구간도 파일은 남긴다 (구간 파일 존재 = 구간 완료)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.table({}) if self._schema is None else self._schema.empty_table(), self.path)
+
+
+def open_writer(
+    path: str | os.PathLike[str],
+    format: ExportFormat,
+    *,
+    resume_offset: int | None = None,
+    schema: Any = None,
+) -> ExportWriter:
+    """format 에 맞는 writer 생성. Parquet 은 resume_offset 을 무시하고 새로 쓴다."""
+    if format == "ndjson":
+        return NdjsonWriter(path, resume_offset=resume_offset)
+    if format == "parquet":
+        return ParquetWriter(path, schema=schema)
+    raise ValueError(f"unknown export format: {format!r}")
+
+
+def _infer_schema(rows: Sequence[dict[str, Any]]) -> Any:
+    import pyarrow as pa
+
+    kinds: dict[str, set[type]] = {}
+    for row in rows:
+        for key, value in row.items():
+            kinds.setdefault(key, set())
+            if value is not None:
+                kinds[key].add(type(value))
+
+    fields = []
+    for key, seen in kinds.items():
+        if seen == {bool}:
+            type_ = pa.bool_()
+        elif seen == {int}:
+            type_ = pa.int64()
+        elif seen and seen <= {int, float}:
+            type_ = pa.float64()
+        else:
+            type_ = pa.string()
+        fields.append(pa.field(key, type_))
+    return pa.schema(fields)
+
+
+def _widen_schema(schema: Any, rows: Sequence[dict[str, Any]]) -> Any:
+    """rows 의 값이 모두 들어가도록 넓힌 스키마 (바꿀 컬럼이 없으면 schema 그대로)."""
+    import pyarrow as pa
+
+    fields = []
+    for field in schema:
+        type_ = field.type
+        if not pa.types.is_string(type_):
+            seen = {type(row[field.name]) for row in rows if row.get(field.name) is not None}
+            fits = {bool} if pa.types.is_boolean(type_) else {int} if pa.types.is_integer(type_) else {int, float}
+            if not seen <= fits:
+                type_ = pa.float64() if pa.types.is_integer(type_) and seen <= {int, float} else pa.string()
+        fields.append(field.with_type(type_))
+    widened = pa.schema(fields)
+    return schema if widened == schema else widened
+
+
+def _coerce(value: Any, type_: Any) -> Any:
+    import pyarrow as pa
+
+    if value is None:
+        return None
+    if pa.types.is_string(type_):
+        return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    if pa.types.is_floating(type_) and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
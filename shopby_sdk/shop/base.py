@@ -9,16 +9,13 @@ Bearer 토큰 + systemKey 가 아니라 쇼핑몰 식별자 `clientId` 와 `plat
 않으며, 개인화 필드(찜 여부 등)는 응답에서 null 로 내려온다.
 """
 
-import logging
-from collections.abc import Callable
-from typing import Any, Literal, Type, TypeVar
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Literal, Self, Unpack
 
-from httpx import HTTPStatusError, Response
-from pydantic import TypeAdapter
-
-logger = logging.getLogger(__name__)
-
-_ResponseType = TypeVar("_ResponseType")
+from shopby_sdk.base.http import ClientOptions, PooledHttpClientMixin
+from shopby_sdk.base.jsonlib import JsonBackend, RawMode
+from shopby_sdk.base.loader import BatchLoader
+from shopby_sdk.base.ratelimit import AdaptiveRateLimiter
 
 PlatformType = Literal["PC", "MOBILE_WEB", "AOS", "IOS"]
 """shop-api `platform` 헤더 값.
@@ -30,7 +27,7 @@ PlatformType = Literal["PC", "MOBILE_WEB", "AOS", "IOS"]
 """
 
 
-class ShopbyShopApiClient:
+class ShopbyShopApiClient(PooledHttpClientMixin):
     """Shopby Shop(Client) API 공통 클라이언트.
 
     Args:
@@ -39,9 +36,21 @@ class ShopbyShopApiClient:
         platform: 접근 플랫폼 (`platform` 헤더). 기본값 ``"PC"``.
         base_url: API base URL. 기본값 ``https://shop-api.e-ncp.com``.
         language: 응답 언어 (`language` 헤더, 선택). ko/en/jp/zh.
+        batch_delay: ``load_*`` 메서드(단건 조회를 다건 API 로 모으는 micro-batching)가 호출을 모으는 시간(초).
+            0 이면 이벤트 루프 한 바퀴 안에 들어온 호출만 모은다 (``shopby_sdk.base.loader`` 참고).
+        **options: 커넥션 풀·raw 모드·rate limit·재시도·캐시·계측 등 공통 옵션
+            (``shopby_sdk.base.http.ClientOptions`` 참고). rate_limit=True 면 같은 clientId 를
+            쓰는 클라이언트끼리 limiter 하나를 공유한다.
 
     Note:
         공개 API 전용이므로 회원 `accessToken` 은 의도적으로 지원하지 않는다.
+
+    Example:
+        ```python
+        async with ShopbyShopProductApiClient(client_id, "PC") as pc:
+            mobile = pc.with_options(platform="MOBILE_WEB")  # 같은 풀 공유
+            await pc.get_product(1), await mobile.get_product(1)
+        ```
     """
 
     DEFAULT_BASE_URL = "https://shop-api.e-ncp.com"
@@ -53,22 +62,66 @@ class ShopbyShopApiClient:
         *,
         base_url: str | None = None,
         language: str | None = None,
-        on_response: Callable[[Response], None] | None = None,
-        raw: bool = False,
+        batch_delay: float = 0.0,
+        **options: Unpack[ClientOptions],
     ):
         self._client_id = client_id
         self._platform = platform
         self._language = language
-        self.base_url = base_url or self.DEFAULT_BASE_URL
-        self._on_response = on_response
-        self._raw = raw
+        self._common_header = self._build_common_header()
+        self._batch_delay = batch_delay
+        self._loaders: dict[str, BatchLoader[Any, Any]] = {}
+        self._init_client(base_url, **options)
+
+    def _rate_limit_key(self) -> tuple[str, ...]:
+        return ("shop", self.base_url, self._client_id)
+
+    def with_options(
+        self,
+        *,
+        platform: PlatformType | None = None,
+        language: str | None = None,
+        raw: RawMode | None = None,
+        json_backend: JsonBackend | None = None,
+        rate_limit: bool | AdaptiveRateLimiter | None = None,
+    ) -> Self:
+        """platform/language/raw 모드/JSON backend/rate limiter 만 바꾼 같은 타입의 클라이언트를 반환.
+
+        새 클라이언트는 이 클라이언트의 커넥션 풀을 그대로 공유하므로 PC/모바일,
+        다국어 변형을 여러 개 만들어도 풀이 늘어나지 않는다. 풀은 원본 클라이언트가
+        닫는다.
+        """
+        clone = super().with_options(raw=raw, json_backend=json_backend, rate_limit=rate_limit)
+        if platform is not None:
+            clone._platform = platform
+        if language is not None:
+            clone._language = language
+        clone._common_header = clone._build_common_header()
+        clone._loaders = {}  # 헤더(platform/language)가 다르면 batch 도 따로
+        return clone
+
+    def _loader(
+        self,
+        name: str,
+        batch_fn: Callable[[list[Any]], Awaitable[Mapping[Any, Any]]],
+        max_batch_size: int,
+    ) -> BatchLoader[Any, Any]:
+        """``load_*`` 메서드가 쓰는 이 클라이언트 전용 ``BatchLoader`` (없으면 생성)."""
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = self._loaders[name] = BatchLoader(batch_fn, max_batch_size=max_batch_size, delay=self._batch_delay)
+        return loader
 
     @property
     def common_header(self) -> dict[str, str]:
         """모든 요청에 공통으로 들어가는 헤더 (clientId/platform/[language]).
 
         `version` 헤더는 엔드포인트마다 값이 다르므로 각 메서드에서 개별 지정한다.
+        생성 시 한 번 만들어 재사용한다.
         """
+        return self._common_header
+
+    def _build_common_header(self) -> dict[str, str]:
         header = {
             "clientId": self._client_id,
             "platform": self._platform,
@@ -76,48 +129,3 @@ class ShopbyShopApiClient:
         if self._language is not None:
             header["language"] = self._language
         return header
-
-    def handle_resp(
-        self, resp: Response, type_model: Type[_ResponseType], raw: bool | None = None
-    ) -> _ResponseType | Any:
-        self.raise_for_status(resp)
-
-        if self._raw if raw is None else raw:
-            return resp.json()
-        try:
-            return TypeAdapter(type_model).validate_python(resp.json())
-        except ValueError:
-            self._log_response(resp)
-            raise
-
-    def raise_for_status(self, resp: Response) -> None:
-        """HTTP 상태 코드를 확인하고 오류 시 상세 정보를 로깅.
-
-        Args:
-            resp: httpx.Response 객체
-
-        Raises:
-            HTTPStatusError: 4xx 또는 5xx 응답 시
-        """
-        if self._on_response is not None:
-            try:
-                self._on_response(resp)
-            except Exception:  # 콜백 오류가 요청을 깨뜨리지 않도록
-                logger.warning("on_response callback raised", exc_info=True)
-        try:
-            resp.raise_for_status()
-        except HTTPStatusError:
-            self._log_response(resp)
-            raise
-
-    @staticmethod
-    def _log_response(resp: Response):
-        try:
-            error_body = resp.json()
-        except Exception:
-            error_body = resp.text
-
-        logger.error(
-            f"HTTP error occurred: {resp.status_code} {resp.request.method} {resp.request.url}\n"
-            f"Response body: {error_body}"
-        )
@@ -6,8 +6,7 @@ shop-api(`https://shop-api.e-ncp.com`) 의 전시(display) 공개(익명) 엔드
 
 from __future__ import annotations
 
-import httpx
-
+from shopby_sdk.base.revalidate import revalidated
 from shopby_sdk.shop.base import ShopbyShopApiClient
 from shopby_sdk.shop.display.models import (
     BannerExtraInfo,
@@ -68,7 +67,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             banner_section_no: 배너 섹션 번호.
             banner_nos: 배너 번호 리스트(쉼표로 구분).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_banner_extra_infos") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {}
             if banner_section_no is not None:
@@ -84,7 +83,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             banner_section_ids: 배너 섹션 ID(","로 구분한 배열).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_banners_with_ids") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/display/banners/id/{banner_section_ids}", headers=headers)
             return self.handle_resp(resp, list[BannerSection])
@@ -95,7 +94,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             banner_section_codes: 배너 섹션 코드(","로 구분한 배열).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_banners") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/display/banners/{banner_section_codes}", headers=headers)
             return self.handle_resp(resp, list[BannerSection])
@@ -115,7 +114,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             keyword: 카테고리명.
             category_view_type: 응답 형식 (ALL/MULTI_LEVEL/FLAT).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_categories_by_keyword") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {}
             if keyword is not None:
@@ -130,14 +129,15 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
 
         판매 시작일이 1주일 이내인 상품이 존재하는 카테고리 번호 목록.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_new_product_categories") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/categories/new-product-categories", headers=headers)
             return self.handle_resp(resp, list[int])
 
+    @revalidated
     async def get_categories_simple_1depth(self) -> list[SimpleCategory]:
-        """1차 카테고리 간단 정보 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        """1차 카테고리 간단 정보 조회하기 (Version 1.0). 재검증 캐시 대상 (``revalidate``)."""
+        async with self._session("get_categories_simple_1depth") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/categories/simple-1depth", headers=headers)
             return self.handle_resp(resp, list[SimpleCategory])
@@ -156,7 +156,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             needs_brands: 브랜드 정보 조회 여부 (default: true).
             category_view_type: 응답 형식 (ALL/MULTI_LEVEL/FLAT).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_category") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | bool] = {}
             if needs_brands is not None:
@@ -172,7 +172,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             category_no: 카테고리 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_category_display_setting") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/categories/{category_no}/display-setting", headers=headers)
             return self.handle_resp(resp, CategoryDisplaySetting)
@@ -185,11 +185,11 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             request: 전시카테고리 관리코드 목록.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_category_nos_by_codes") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post(
-                "/categories/search-by-management-code", headers=headers, json=body
+                "/categories/search-by-management-code", headers=headers, json=body, idempotent=True
             )
             return self.handle_resp(resp, list[CategoryNoByCode])
 
@@ -226,7 +226,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             order_by: 정렬 조건.
             order_direction: 정렬 방식 (DESC/ASC).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_events") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {
                 "page.number": page_number,
@@ -269,7 +269,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_size: 한 페이지당 노출 수 (default 10).
             has_total_count: 목록 카운트 여부 (default false).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_closed_events") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if keyword is not None:
@@ -307,7 +307,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             sale_status: 판매 상태.
             has_product_detail: 상품정보 포함 여부.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_event_by_id") as client:
             headers = {"version": "2.0"}
             params: dict[str, str | bool] = {}
             if include_non_member_coupon is not None:
@@ -339,7 +339,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             product_nos: 상품 번호(",")로 구분.
             category_nos: 전시 카테고리 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_events_by_product_nos") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {"productNos": product_nos}
             if category_nos is not None:
@@ -353,7 +353,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             product_no: 상품 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_events_by_product_no") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/display/events/products/{product_no}", headers=headers)
             return self.handle_resp(resp, list[EventSummary])
@@ -372,7 +372,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             category_nos: 전시 카테고리 번호.
             only_ing_status: 진행중인 기획전만 검색 (default false).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_event_by_name") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"keyword": keyword}
             if category_nos is not None:
@@ -398,7 +398,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             soldout: 품절 상품 포함 여부 (default false).
             sale_status: 판매 상태.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_event_by_event_nos") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | bool] = {"eventNos": event_nos}
             if count_per_event is not None:
@@ -426,7 +426,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             category_nos: 전시 카테고리 번호.
             progress_status: 진행상태 (ING/READY/END).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_event_by_keyword_and_progress") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {"keyword": keyword}
             if keyword_type is not None:
@@ -446,7 +446,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             event_nos: 기획전 번호 리스트(",")로 구분.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_sections_by_event_nos") as client:
             headers = {"version": "1.0"}
             params = {"eventNos": event_nos}
             resp = await client.get("/display/events/sections", headers=headers, params=params)
@@ -466,7 +466,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             include_non_member_coupon: 비로그인 발급가능 쿠폰 노출 (default false).
             preview: 미리보기 여부 (default false).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_event_v2") as client:
             headers = {"version": "2.0"}
             params: dict[str, bool] = {}
             if include_non_member_coupon is not None:
@@ -494,7 +494,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             sale_status: 판매 상태.
             has_product_detail: 상품정보 포함 여부.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_event") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | bool] = {}
             if order is not None:
@@ -538,7 +538,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_number: 페이지 번호 (default 1).
             page_size: 한 페이지당 상품 노출 수 (default 10).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_event_section_products") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if order is not None:
@@ -581,7 +581,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_type: 페이지 유형 (MAIN/CATEGORY/EVENT/PRODUCT).
             target_no: 페이지 유형에 따른 페이지 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_popups") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {}
             if page_type is not None:
@@ -605,7 +605,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_type: 페이지 유형.
             target_no: 페이지 유형에 따른 페이지 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_popups_by_popup_ids") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {}
             if page_type is not None:
@@ -631,7 +631,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_type: 페이지 유형.
             target_no: 페이지 유형에 따른 페이지 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_popups_by_popup_nos") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {}
             if page_type is not None:
@@ -647,7 +647,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             request: 노출 URL/팝업ID/파라미터 조건.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_design_popup") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
             resp = await client.post("/design-popups", headers=headers, json=body)
@@ -676,7 +676,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             search_keyword: 검색어.
             tag_value_nos: 태그값 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_inquiries") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if has_total_count is not None:
@@ -696,14 +696,14 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
 
     async def get_inquiries_configurations(self) -> InquiryConfigurations:
         """상품문의 게시판 설정 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiries_configurations") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/products/inquiries/configurations", headers=headers)
             return self.handle_resp(resp, InquiryConfigurations)
 
     async def get_inquiries_tags(self) -> InquiryTagsResponse:
         """상품문의 태그 전체 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiries_tags") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/products/inquiries/tags", headers=headers)
             return self.handle_resp(resp, InquiryTagsResponse)
@@ -734,7 +734,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_number: 페이지 번호.
             page_size: 한 페이지당 노출 수.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_inquiries") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if has_total_count is not None:
@@ -765,7 +765,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             product_no: 상품 번호.
             inquiry_no: 상품문의 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_inquiry") as client:
             headers = {"version": "1.0"}
             resp = await client.get(
                 f"/products/{product_no}/inquiries/{inquiry_no}", headers=headers
@@ -777,7 +777,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
     # ------------------------------------------------------------------
     async def get_sections(self) -> SectionListResponse:
         """상품 진열 리스트 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_sections") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/display/sections", headers=headers)
             return self.handle_resp(resp, SectionListResponse)
@@ -788,7 +788,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             section_id: 상품 진열 ID.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_section_by_id_v2") as client:
             headers = {"version": "2.0"}
             resp = await client.get(f"/display/sections/ids/{section_id}", headers=headers)
             return self.handle_resp(resp, SectionResponse)
@@ -821,7 +821,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             has_option_values: 옵션리스트 포함 여부.
             include_stop_product: 판매중지 상품 포함 여부.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_section_v1") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "by": by,
@@ -845,7 +845,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             section_no: 상품 진열 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_section_v2") as client:
             headers = {"version": "2.0"}
             resp = await client.get(f"/display/sections/{section_no}", headers=headers)
             return self.handle_resp(resp, SectionResponse)
@@ -878,7 +878,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             has_option_values: 옵션리스트 포함 여부.
             include_stop_product: 판매중지 상품 포함 여부.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_by_section_no") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "by": by,
@@ -933,7 +933,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             has_total_count: 목록 카운트 포함 여부 (default false).
             has_ordered_option: 주문 옵션 정보 포함 여부 (default true).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_category_product_reviews") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {
                 "categoryDepth": category_depth,
@@ -962,7 +962,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
 
     async def get_product_reviews_configurations(self) -> ReviewConfigurations:
         """상품평 게시판 설정 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_reviews_configurations") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/product-reviews/configurations", headers=headers)
             return self.handle_resp(resp, ReviewConfigurations)
@@ -985,7 +985,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_number: 페이지 번호 (default 1).
             page_size: 한 페이지당 노출 수 (default 10).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_photo_reviews") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if has_total_count is not None:
@@ -1035,7 +1035,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             has_product_info: 상품 정보 포함 여부 (default true).
             has_ordered_option: 주문 옵션 정보 포함 여부 (default false).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_reviews") as client:
             headers = {"version": "2.0"}
             params: dict[str, str | int | bool] = {}
             if has_attachment_file is not None:
@@ -1081,7 +1081,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             review_no: 상품평 번호.
             has_ordered_option: 주문 옵션 정보 포함 여부 (default true).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_product_reviews") as client:
             headers = {"version": "1.0"}
             params: dict[str, bool] = {}
             if has_ordered_option is not None:
@@ -1111,7 +1111,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page: 페이지 번호 (default 1).
             size: 한 페이지당 노출 수 (default 10).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_product_reviews_comments") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if has_total_count is not None:
@@ -1151,7 +1151,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             is_widget: 위젯 여부 (default false).
             tag_value_nos: 태그값 번호.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_reviews_by_board") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {"boardType": board_type}
             if sorting_sort_criterion is not None:
@@ -1191,7 +1191,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             page_number: 페이지 번호 (default 1).
             is_widget: 위젯 여부 (default false).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_reviews_by_products") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if sorting_sort_criterion is not None:
@@ -1213,7 +1213,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
 
     async def get_reviews_tags(self) -> ReviewTagsResponse:
         """상품리뷰 태그 전체 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_reviews_tags") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/reviews/tags", headers=headers)
             return self.handle_resp(resp, ReviewTagsResponse)
@@ -1221,19 +1221,20 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
     # ------------------------------------------------------------------
     #  SkinBanner
     # ------------------------------------------------------------------
+    @revalidated
     async def get_skin_banners(
         self,
         *,
         banner_group_codes: str,
         skin_no: int | None = None,
     ) -> list[SkinBannerGroup]:
-        """플랫폼 별 전체 스킨 배너 조회하기 (Version 1.0).
+        """플랫폼 별 전체 스킨 배너 조회하기 (Version 1.0). 재검증 캐시 대상 (``revalidate``).
 
         Args:
             banner_group_codes: 배너 그룹 코드 리스트(",")로 구분.
             skin_no: 스킨 번호 (미리보기의 경우에만 입력).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_skin_banners") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {"bannerGroupCodes": banner_group_codes}
             if skin_no is not None:
@@ -1253,7 +1254,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
             is_preview: 미리보기 스킨 여부 (default false).
             skin_no: 스킨 번호 (미리보기의 경우 필수).
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_skin_banners_groups_by_skin") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if is_preview is not None:
@@ -1269,7 +1270,7 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
         Args:
             banner_id: 배너 ID.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_skin_banners_by_banner_id") as client:
             headers = {"version": "1.0"}
             resp = await client.get(f"/skin-banners/{banner_id}", headers=headers)
             return self.handle_resp(resp, list[SkinBannerGroup])
@@ -1277,9 +1278,10 @@ class ShopbyShopDisplayApiClient(ShopbyShopApiClient):
     # ------------------------------------------------------------------
     #  Sticker
     # ------------------------------------------------------------------
+    @revalidated
     async def get_stickers(self) -> list[Sticker]:
-        """스티커 목록 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        """스티커 목록 조회 (Version 1.0). 재검증 캐시 대상 (``revalidate``)."""
+        async with self._session("get_stickers") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/stickers", headers=headers)
             return self.handle_resp(resp, list[Sticker])
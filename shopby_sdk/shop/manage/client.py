@@ -8,8 +8,6 @@ clientId/platform/language 헤더는 base(``ShopbyShopApiClient``) 가 주입하
 각 메서드는 엔드포인트별 ``version`` 헤더만 지정한다.
 """
 
-import httpx
-
 from shopby_sdk.shop.base import ShopbyShopApiClient
 from shopby_sdk.shop.manage.models import (
     AddressSearchResponse,
@@ -65,7 +63,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             AddressSearchResponse: 주소 목록 (totalCount, items)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_addresses") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {"keyword": keyword}
             if page_number is not None:
@@ -85,7 +83,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             JapanAddressResponse: 일본 주소 정보
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_jp_address") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {"zipCode": zip_code}
 
@@ -103,7 +101,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             BoardConfigurationsResponse: 게시판/문의/리뷰 설정
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_board_config") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/boards/configurations", headers=headers)
@@ -118,7 +116,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             list[BoardCategory]: 게시판 카테고리 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_board_categories") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/boards/{board_no}/categories", headers=headers)
@@ -168,7 +166,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             ArticleListResponse: 게시글 목록 (totalCount, items)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_posts") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page_number is not None:
@@ -223,7 +221,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             ArticleDetailResponse: 게시글 상세
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_post") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | bool] = {}
             if password is not None:
@@ -256,7 +254,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             ArticleListResponse: 답글 목록 (totalCount, items)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("reply_posts") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int | bool] = {}
             if page is not None:
@@ -294,7 +292,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             PostListResponse: 게시글 목록 (totalCount, items)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_posts_v2") as client:
             headers = {"version": "1.0"}
             params: dict[str, int] = {}
             if page is not None:
@@ -303,7 +301,9 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
                 params["pageSize"] = page_size
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
-            resp = await client.post("/boards/posts", headers=headers, params=params, json=body)
+            resp = await client.post(
+                "/boards/posts", headers=headers, params=params, json=body, idempotent=True
+            )
             return self.handle_resp(resp, PostListResponse)
 
     async def get_post_v2(
@@ -324,7 +324,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             PostDetailResponse: 게시글 상세
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_post_v2") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {}
             if password is not None:
@@ -353,7 +353,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             PostListResponse: 답글 목록 (totalCount, items)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_reply_posts_v2") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | int] = {}
             if page is not None:
@@ -383,11 +383,13 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             list[PostPreviewItem]: 게시글 프리뷰 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_post_previews") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
-            resp = await client.post(f"/boards/{board_no}/posts/previews", headers=headers, json=body)
+            resp = await client.post(
+                f"/boards/{board_no}/posts/previews", headers=headers, json=body, idempotent=True
+            )
             return self.handle_resp(resp, list[PostPreviewItem])
 
     # ------------------------------------
@@ -409,7 +411,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             list[int]: 공휴일 일자 목록 (예: [5, 6, 12, ...])
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_holiday") as client:
             headers = {"version": "1.0"}
             params: dict[str, int] = {}
             if year is not None:
@@ -429,7 +431,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             InquiryConfigurationResponse: 1:1 문의 설정
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiry_configuration") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/inquiries/configurations", headers=headers)
@@ -447,7 +449,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             list[InquiryType]: 1:1 문의 유형 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_inquiry_types") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {}
             if direction is not None:
@@ -468,7 +470,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             InstagramMediaResponse: 인스타그램 미디어 목록 (data, error)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_instagram_media") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get("/shopby/instagram/media", headers=headers)
@@ -489,7 +491,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             list[ExternalScriptItem]: 외부 스크립트 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_external_script") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {"pageTypes": ",".join(page_types)}
 
@@ -515,7 +517,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             UsedTermsResponse: {약관타입: 약관 본문} 맵
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_used_terms") as client:
             headers = {"version": "1.0"}
             params: dict[str, str | bool] = {"termsTypes": ",".join(terms_types)}
             if used_only is not None:
@@ -538,7 +540,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             UsedTermsResponse: {약관타입: 약관 본문} 맵
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("post_search_used_terms") as client:
             headers = {"version": "1.1"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -557,7 +559,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             list[CustomTermsItem]: 추가 약관 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_custom_terms") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
 
@@ -578,7 +580,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             list[TermsHistoryItem]: 약관 변경이력 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_terms_histories") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {"termsType": terms_type}
             if future_days_to_show is not None:
@@ -599,7 +601,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             UsedTermsTypesResponse: 적용 중인 약관 타입 리스트 (termsList)
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_used_terms_only_used") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {"termsTypes": ",".join(terms_types)}
 
@@ -615,7 +617,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             TermsDetailResponse: 약관 상세
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_term") as client:
             headers = {"version": "1.0"}
 
             resp = await client.get(f"/terms/{terms_no}", headers=headers)
@@ -637,7 +639,7 @@ class ShopbyShopManageApiClient(ShopbyShopApiClient):
         Returns:
             TermsDetailResponse: 약관 상세
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("post_terms") as client:
             headers = {"version": "1.1"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json") if request is not None else {}
 
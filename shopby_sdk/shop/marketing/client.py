@@ -1,7 +1,5 @@
 """Marketing(마케팅) shop API 클라이언트."""
 
-import httpx
-
 from shopby_sdk.shop.base import ShopbyShopApiClient
 
 from .models import SnsShareResponse
@@ -22,9 +20,7 @@ class ShopbyShopMarketingApiClient(ShopbyShopApiClient):
 
         operationId: get-sns-share
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_sns_share") as client:
             headers = {"version": "1.0"}
             params = {"productNo": product_no}
             resp = await client.get(
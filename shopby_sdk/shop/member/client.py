@@ -7,8 +7,6 @@ clientId/platform/language 헤더는 base(`ShopbyShopApiClient`)가 주입한다
 대응 OpenAPI 스펙: docs/api/member-shop-public.yml
 """
 
-import httpx
-
 from shopby_sdk.shop.base import ShopbyShopApiClient
 from shopby_sdk.shop.member.models import (
     BusinessExistResponse,
@@ -42,7 +40,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             BusinessExistResponse: 중복 여부
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("check_duplicated_business") as client:
             headers = {"version": "1.0"}
             params = {"registration": registration}
             resp = await client.get("/companies/business-exist", headers=headers, params=params)
@@ -58,7 +56,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             MemberExtraInfoConfigResponse: 회원정보 추가항목 설정
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_member_extra_info_config") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/config/member-extra-info", headers=headers)
             return self.handle_resp(resp, MemberExtraInfoConfigResponse)
@@ -76,7 +74,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             list[MemberGrade]: 회원 등급 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_member_grades") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {}
             if grade_nos is not None:
@@ -97,7 +95,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             list[MemberGroup]: 회원 그룹 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_member_groups") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {}
             if group_nos is not None:
@@ -124,7 +122,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             ProfileExistResponse: 중복 여부 및 회원 상태
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_email_exist") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {"email": email}
             if member_types is not None:
@@ -141,7 +139,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             ProfileExistResponse: 중복 여부 및 회원 상태
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_id_exist") as client:
             headers = {"version": "1.0"}
             params = {"memberId": member_id}
             resp = await client.get("/profile/id/exist", headers=headers, params=params)
@@ -156,7 +154,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             ProfileExistResponse: 중복 여부 및 회원 상태
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_nickname_exist") as client:
             headers = {"version": "1.0"}
             params = {"nickname": nickname}
             resp = await client.get("/profile/nickname/exist", headers=headers, params=params)
@@ -171,7 +169,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             ProfileMobileExistResponse: 번호 존재 여부, 회원 상태, 마스킹된 회원 ID
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_mobile_exist") as client:
             headers = {"version": "1.0"}
             params = {"mobileNo": mobile_no}
             resp = await client.get("/profile/mobile/exist", headers=headers, params=params)
@@ -195,7 +193,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             ProfileExistResponse: 일치 회원 존재 여부
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_member_equals_with_email") as client:
             headers = {"version": "1.0"}
             params = {"memberId": member_id, "memberName": member_name, "email": email}
             resp = await client.get(
@@ -221,7 +219,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             ProfileExistResponse: 일치 회원 존재 여부
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_profile_member_equals_with_mobile") as client:
             headers = {"version": "1.0"}
             params = {"memberId": member_id, "memberName": member_name, "mobileNo": mobile_no}
             resp = await client.get(
@@ -244,7 +242,7 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             MemberExtraInfosResponse: 회원별 추가항목 목록
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_extra_info_members") as client:
             headers = {"version": "1.0"}
             params = {"memberNos": ",".join(str(no) for no in member_nos)}
             resp = await client.get("/profile/member/extra-infos", headers=headers, params=params)
@@ -268,8 +266,10 @@ class ShopbyShopMemberApiClient(ShopbyShopApiClient):
         Returns:
             ExternalMemberExistResponse: 중복확인 결과
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("post_profile_external_member_exists") as client:
             headers = {"version": "1.0"}
             body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
-            resp = await client.post("/profile/external-member/exist", headers=headers, json=body)
+            resp = await client.post(
+                "/profile/external-member/exist", headers=headers, json=body, idempotent=True
+            )
             return self.handle_resp(resp, ExternalMemberExistResponse)
@@ -4,8 +4,6 @@ order-shop-public.yml 의 공개(인증 불필요) 엔드포인트만 다룬다.
 회원 토큰(accessToken / Shop-By-Authorization)은 전송하지 않는다.
 """
 
-import httpx
-
 from shopby_sdk.shop.base import ShopbyShopApiClient
 from shopby_sdk.shop.order.models import (
     AppCardCardsResponse,
@@ -27,9 +25,7 @@ class ShopbyShopOrderApiClient(ShopbyShopApiClient):
         Args:
             card_code: 특정 카드사 코드 (예: 2088). 없으면 전체 조회.
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_app_card_cards") as client:
             headers = {"version": "1.0"}
             params: dict[str, str] = {}
             if card_code is not None:
@@ -47,9 +43,7 @@ class ShopbyShopOrderApiClient(ShopbyShopApiClient):
         Args:
             amount: 상품금액 (예: 50000).
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_app_card_inst_plan") as client:
             headers = {"version": "1.0"}
             params: dict[str, float] = {}
             if amount is not None:
@@ -61,27 +55,21 @@ class ShopbyShopOrderApiClient(ShopbyShopApiClient):
 
     async def get_cart_configuration(self) -> CartConfigResponse:
         """장바구니 설정 값 가져오기 (Version 1.0)."""
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_cart_configuration") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/cart/config", headers=headers)
             return self.handle_resp(resp, CartConfigResponse)
 
     async def get_order_configuration(self) -> OrderConfigResponse:
         """주문 설정 값 가져오기 (Version 1.0)."""
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_order_configuration") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/order-configs", headers=headers)
             return self.handle_resp(resp, OrderConfigResponse)
 
     async def get_shippings_enums(self) -> ShippingEnumsResponse:
         """배송 enum 정보 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_shippings_enums") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/shippings/enums", headers=headers)
             return self.handle_resp(resp, ShippingEnumsResponse)
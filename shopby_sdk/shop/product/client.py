@@ -8,8 +8,9 @@ Shop-By-Authorization)을 전송하지 않는다. clientId/platform/language 헤
 spec: docs/api/product-shop-public.yml
 """
 
-import httpx
 
+from shopby_sdk.base.chunking import DEFAULT_CHUNK_CONCURRENCY, concat_responses, fetch_chunked
+from shopby_sdk.base.revalidate import revalidated
 from shopby_sdk.shop.base import ShopbyShopApiClient
 from shopby_sdk.shop.product.models import (
     AdditionalDiscountResponse,
@@ -35,6 +36,7 @@ from shopby_sdk.shop.product.models import (
     ProductDetailResponse,
     ProductExtraInfoItem,
     ProductKeywordsItem,
+    ProductOptionInfo,
     ProductOptionsResponse,
     ProductSearchByNosRequest,
     ProductSearchByNosResponse,
@@ -55,6 +57,11 @@ from shopby_sdk.shop.product.models import (
 
 _V1 = {"version": "1.0"}
 
+_MAX_PRODUCT_NOS = 100
+"""상품번호 다건 조회 API 한 번에 보내는 최대 상품 수 (추가할인 다건 조회 스펙 한도).
+
+넘으면 나눠 조회한다 (``shopby_sdk.base.chunking``)."""
+
 
 class ShopbyShopProductApiClient(ShopbyShopApiClient):
     """shop-api Product 도메인 공개 API 클라이언트."""
@@ -66,7 +73,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_no: int
     ) -> AdditionalDiscountResponse:
         """추가할인 정보 조회하기 (상품번호 단건) (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_additional_discounts_by_product_no") as client:
             resp = await client.get(
                 "/additional-discounts/by-product-no",
                 headers=_V1,
@@ -75,10 +82,25 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             return self.handle_resp(resp, AdditionalDiscountResponse)
 
     async def get_additional_discounts_by_product_nos(
+        self, product_nos: list[int], *, concurrency: int = DEFAULT_CHUNK_CONCURRENCY
+    ) -> AdditionalDiscountsResponse:
+        """추가할인 정보 다건 조회하기 (Version 1.0).
+
+        요청 1회 최대 100건이며, 넘으면 100건씩 concurrency 개씩 동시에 조회해 ``data`` 를 합친다.
+        """
+        return await fetch_chunked(
+            self._get_additional_discounts_by_product_nos_chunk,
+            product_nos,
+            chunk_size=_MAX_PRODUCT_NOS,
+            merge=concat_responses("data"),
+            concurrency=concurrency,
+            raw=self._raw,
+        )
+
+    async def _get_additional_discounts_by_product_nos_chunk(
         self, product_nos: list[int]
     ) -> AdditionalDiscountsResponse:
-        """추가할인 정보 다건 조회하기 (최대 100건) (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_additional_discounts_by_product_nos") as client:
             resp = await client.get(
                 "/additional-discounts/by-product-nos",
                 headers=_V1,
@@ -122,7 +144,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             params["sort.criterion"] = sort_criterion
         if sort_direction is not None:
             params["sort.direction"] = sort_direction
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_display_brands") as client:
             resp = await client.get("/display/brands", headers=_V1, params=params)
             return self.handle_resp(resp, BrandListResponse)
 
@@ -130,7 +152,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, display_brand_nos: list[int]
     ) -> list[BrandExtraInfoItem]:
         """브랜드 추가 정보 조회하기 (최대 30개) (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_display_brand_extra_info") as client:
             resp = await client.get(
                 "/display/brands/extraInfo",
                 headers=_V1,
@@ -159,7 +181,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             params["sortCriterion"] = sort_criterion
         if sort_direction is not None:
             params["sortDirection"] = sort_direction
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_brands") as client:
             resp = await client.get("/display/brands/search", headers=_V1, params=params)
             return self.handle_resp(resp, list[BrandSearchItem])
 
@@ -170,25 +192,26 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         params: dict = {}
         if display_brand_nos is not None:
             params["displayBrandNos"] = ",".join(str(n) for n in display_brand_nos)
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_display_brands_search_by_nos") as client:
             resp = await client.get("/display/brands/search-by-nos", headers=_V1, params=params)
             return self.handle_resp(resp, BrandsByNoResponse)
 
+    @revalidated
     async def get_brand_tree(self) -> list[BrandTreeItem]:
-        """브랜드 트리 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        """브랜드 트리 조회하기 (Version 1.0). 재검증 캐시 대상 (``revalidate``)."""
+        async with self._session("get_brand_tree") as client:
             resp = await client.get("/display/brands/tree", headers=_V1)
             return self.handle_resp(resp, list[BrandTreeItem])
 
     async def get_display_brand(self, display_brand_no: int) -> BrandDetailResponse:
         """브랜드 상세 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_display_brand") as client:
             resp = await client.get(f"/display/brands/{display_brand_no}", headers=_V1)
             return self.handle_resp(resp, BrandDetailResponse)
 
     async def get_brand_children(self, display_brand_no: int) -> list[BrandChildItem]:
         """자식 브랜드 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_brand_children") as client:
             resp = await client.get(
                 f"/display/brands/{display_brand_no}/children", headers=_V1
             )
@@ -199,13 +222,13 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
     # ------------------------------------------------------------------
     async def get_naver_shopping_configuration(self) -> NaverShoppingConfigResponse:
         """네이버 쇼핑 설정정보 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_naver_shopping_configuration") as client:
             resp = await client.get("/products/configuration/naver-shopping", headers=_V1)
             return self.handle_resp(resp, NaverShoppingConfigResponse)
 
     async def get_custom_properties(self) -> CustomPropertiesResponse:
         """상품 항목 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_custom_properties") as client:
             resp = await client.get("/products/custom-properties", headers=_V1)
             return self.handle_resp(resp, CustomPropertiesResponse)
 
@@ -219,7 +242,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         params: dict = {}
         if order_amt is not None:
             params["orderAmt"] = order_amt
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_free_gift_condition_by_order_amount") as client:
             resp = await client.get(
                 "/free-gift-condition/order-amount", headers=_V1, params=params
             )
@@ -229,7 +252,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_no: int
     ) -> FreeGiftConditionResponse:
         """사은품 지급가능한 조건 조회하기 (상품금액기준) (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_free_gift_condition_by_product") as client:
             resp = await client.get(f"/free-gift-condition/{product_no}", headers=_V1)
             return self.handle_resp(resp, FreeGiftConditionResponse)
 
@@ -254,14 +277,14 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             params["pageNumber"] = page_number
         if page_size is not None:
             params["pageSize"] = page_size
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_restock") as client:
             resp = await client.get("/products/restock", headers=_V1, params=params)
             return self.handle_resp(resp, RestockListResponse)
 
     async def post_restock(self, request: RestockRequest) -> None:
         """재입고 알림 신청 (Version 1.0). 응답 본문 없음."""
         body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("post_restock") as client:
             resp = await client.post("/products/restock", headers=_V1, json=body)
             self.raise_for_status(resp)
             return None
@@ -269,7 +292,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
     async def delete_restock(self, restock_nos: list[int]) -> None:
         """재입고 알림 삭제 (Version 1.0). 응답 본문 없음."""
         params = {"restockNos": ",".join(str(n) for n in restock_nos)}
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("delete_restock") as client:
             resp = await client.delete("/products/restock", headers=_V1, params=params)
             self.raise_for_status(resp)
             return None
@@ -281,7 +304,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_nos: list[int]
     ) -> list[ProductExtraInfoItem]:
         """상품 번호 리스트로 추가 정보 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_extra_infos") as client:
             resp = await client.get(
                 "/products/extraInfo",
                 headers=_V1,
@@ -294,13 +317,13 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         params: dict = {}
         if size is not None:
             params["size"] = size
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_favorite_keywords") as client:
             resp = await client.get("/products/favoriteKeywords", headers=_V1, params=params)
             return self.handle_resp(resp, list[str])
 
     async def get_products_options(self, product_nos: list[int]) -> ProductsOptionsResponse:
         """옵션 목록 조회하기 (상품번호 리스트) (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_options") as client:
             resp = await client.get(
                 "/products/options",
                 headers=_V1,
@@ -310,7 +333,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
 
     async def get_public_infos(self, product_nos: list[int]) -> list[PublicInfoItem]:
         """상품 공개용 기본정보 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_public_infos") as client:
             resp = await client.get(
                 "/products/public-info",
                 headers=_V1,
@@ -320,7 +343,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
 
     async def get_shipping_infos(self, product_nos: list[int]) -> list[ProductShippingInfo]:
         """상품번호를 통한 배송 정보 및 배송 불가 국가 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_shipping_infos") as client:
             resp = await client.get(
                 "/products/shipping-info",
                 headers=_V1,
@@ -332,7 +355,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_nos: list[int]
     ) -> list[ProductKeywordsItem]:
         """상품 번호 리스트로 검색어 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_search_keywords") as client:
             resp = await client.get(
                 "/products/search/keywords",
                 headers=_V1,
@@ -358,7 +381,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             params["size"] = size
         if display_category_nos is not None:
             params["displayCategoryNos"] = ",".join(str(n) for n in display_category_nos)
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_regular_delivery_products") as client:
             resp = await client.get("/products/regular-delivery", headers=_V1, params=params)
             return self.handle_resp(resp, RegularDeliveryListResponse)
 
@@ -366,7 +389,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_nos: list[int]
     ) -> list[RegularDeliverySearchItem]:
         """상품 번호 리스트로 정기 결제 상품 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_regular_delivery_products") as client:
             resp = await client.get(
                 "/products/regular-delivery/search",
                 headers=_V1,
@@ -384,7 +407,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         40개 이상이라 raw query dict 로 받는다. 콤마구분 리스트 키는 호출자가
         문자열로 전달한다. None 값은 호출자가 제거하거나, 본 메서드가 그대로 전달한다.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_products") as client:
             resp = await client.get("/products/search", headers=_V1, params=params or {})
             return self.handle_resp(resp, ProductSearchResponse)
 
@@ -395,7 +418,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
 
         search_products 와 동일하게 dotted query key 가 많아 raw query dict 로 받는다.
         """
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_products_search_summary") as client:
             resp = await client.get("/products/search/summary", headers=_V1, params=params or {})
             return self.handle_resp(resp, SearchSummaryResponse)
 
@@ -426,7 +449,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             params["hasTotalCount"] = has_total_count
         if has_option_values is not None:
             params["hasOptionValues"] = has_option_values
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_best_review_products") as client:
             resp = await client.get("/products/best-review/search", headers=_V1, params=params)
             return self.handle_resp(resp, BestReviewSearchResponse)
 
@@ -457,7 +480,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             params["hasTotalCount"] = has_total_count
         if has_option_values is not None:
             params["hasOptionValues"] = has_option_values
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("search_best_seller_products") as client:
             resp = await client.get("/products/best-seller/search", headers=_V1, params=params)
             return self.handle_resp(resp, BestSellerSearchResponse)
 
@@ -489,17 +512,33 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
             params["productSort.criterion"] = product_sort_criterion
         if product_sort_direction is not None:
             params["productSort.direction"] = product_sort_direction
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_bundle_shipping_products") as client:
             resp = await client.get("/products/bundle-shipping", headers=_V1, params=params)
             return self.handle_resp(resp, BundleShippingResponse)
 
     async def search_products_by_nos(
-        self, request: ProductSearchByNosRequest
+        self, request: ProductSearchByNosRequest, *, concurrency: int = DEFAULT_CHUNK_CONCURRENCY
     ) -> ProductSearchByNosResponse:
-        """상품번호 리스트로 상품 조회 (Version 1.0)."""
+        """상품번호 리스트로 상품 조회 (Version 1.0).
+
+        상품번호가 100개를 넘으면 100개씩 concurrency 개씩 동시에 조회해 ``products`` /
+        ``invalid_products_nos`` 를 합친다.
+        """
+        return await fetch_chunked(
+            lambda nos: self._search_products_by_nos_chunk(request.model_copy(update={"product_nos": nos})),
+            request.product_nos,
+            chunk_size=_MAX_PRODUCT_NOS,
+            merge=concat_responses("products", "invalid_products_nos"),
+            concurrency=concurrency,
+            raw=self._raw,
+        )
+
+    async def _search_products_by_nos_chunk(self, request: ProductSearchByNosRequest) -> ProductSearchByNosResponse:
         body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
-            resp = await client.post("/products/search-by-nos", headers=_V1, json=body)
+        async with self._session("search_products_by_nos") as client:
+            resp = await client.post(
+                "/products/search-by-nos", headers=_V1, json=body, idempotent=True
+            )
             return self.handle_resp(resp, ProductSearchByNosResponse)
 
     async def get_group_management_codes(
@@ -507,9 +546,9 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
     ) -> list[GroupManagementCodeItem]:
         """그룹관리코드 조회하기 (Version 1.0)."""
         body = request.model_dump(by_alias=True, exclude_none=True, mode="json")
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_group_management_codes") as client:
             resp = await client.post(
-                "/products/group-management-code", headers=_V1, json=body
+                "/products/group-management-code", headers=_V1, json=body, idempotent=True
             )
             return self.handle_resp(resp, list[GroupManagementCodeItem])
 
@@ -523,7 +562,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         params: dict = {}
         if channel_type is not None:
             params["channelType"] = channel_type
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product") as client:
             resp = await client.get(f"/products/{product_no}", headers=_V1, params=params)
             return self.handle_resp(resp, ProductDetailResponse)
 
@@ -531,7 +570,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_no: int
     ) -> list[DisplayCategoryItem]:
         """상품번호에 해당하는 모든 전시카테고리 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_display_categories") as client:
             resp = await client.get(
                 f"/products/{product_no}/display-categories", headers=_V1
             )
@@ -539,19 +578,19 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
 
     async def get_extra_products(self, product_no: int) -> ExtraProductsResponse:
         """추가상품 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_extra_products") as client:
             resp = await client.get(f"/products/{product_no}/extra-products", headers=_V1)
             return self.handle_resp(resp, ExtraProductsResponse)
 
     async def get_product_options(self, product_no: int) -> ProductOptionsResponse:
         """옵션 조회하기 (단일 상품) (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_options") as client:
             resp = await client.get(f"/products/{product_no}/options", headers=_V1)
             return self.handle_resp(resp, ProductOptionsResponse)
 
     async def get_product_options_images(self, product_no: int) -> list[OptionImageItem]:
         """상품에 해당하는 옵션 이미지 목록 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_options_images") as client:
             resp = await client.get(f"/products/{product_no}/options/images", headers=_V1)
             return self.handle_resp(resp, list[OptionImageItem])
 
@@ -559,7 +598,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_no: int, option_no: int
     ) -> list[OptionImageItem]:
         """옵션의 이미지 정보 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_option_images") as client:
             resp = await client.get(
                 f"/products/{product_no}/options/{option_no}/images", headers=_V1
             )
@@ -569,13 +608,13 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_no: int
     ) -> list[PurchasePermissionItem]:
         """상품번호로 상품우선구매권한 조회 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_purchase_permissions") as client:
             resp = await client.get(f"/products/{product_no}/purchasable", headers=_V1)
             return self.handle_resp(resp, list[PurchasePermissionItem])
 
     async def get_related_products(self, product_no: int) -> list[RelatedProductItem]:
         """관련 상품 정보 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_related_products") as client:
             resp = await client.get(f"/products/{product_no}/related-products", headers=_V1)
             return self.handle_resp(resp, list[RelatedProductItem])
 
@@ -583,7 +622,7 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
         self, product_no: int
     ) -> StandardCategoryResponse:
         """상품번호에 해당하는 표준카테고리 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_standard_category") as client:
             resp = await client.get(
                 f"/products/{product_no}/standard-category", headers=_V1
             )
@@ -591,8 +630,51 @@ class ShopbyShopProductApiClient(ShopbyShopApiClient):
 
     async def get_product_url_shortening(self, product_no: int) -> UrlShorteningResponse:
         """상품 번호와 쇼핑몰 번호에 해당하는 단축URL 조회하기 (Version 1.0)."""
-        async with httpx.AsyncClient(base_url=self.base_url, headers=self.common_header) as client:
+        async with self._session("get_product_url_shortening") as client:
             resp = await client.get(
                 f"/products/{product_no}/url-shortening", headers=_V1
             )
             return self.handle_resp(resp, UrlShorteningResponse)
+
+    # ------------------------------------------------------------------
+    # Micro-batching (단건 조회 → 다건 API)
+    # ------------------------------------------------------------------
+    async def load_additional_discount(self, product_no: int) -> AdditionalDiscountResponse | None:
+        """추가할인 정보 단건 조회를 모아 ``get_additional_discounts_by_product_nos`` 로 조회.
+
+        같은 tick(``batch_delay``) 안에 들어온 호출을 최대 100건씩 한 번에 보내고 상품별로 나눠 돌려준다.
+        raw 모드와 무관하게 모델을 반환하며, 결과에 없는 상품은 None (``shopby_sdk.base.loader`` 참고).
+
+        Example:
+            ```python
+            discounts = await asyncio.gather(*(client.load_additional_discount(no) for no in product_nos))
+            ```
+        """
+        loader = self._loader("additional_discounts", self._batch_additional_discounts, _MAX_PRODUCT_NOS)
+        return await loader.load(product_no)
+
+    async def load_product_option_info(self, product_no: int) -> ProductOptionInfo | None:
+        """옵션 단건 조회를 모아 ``get_products_options`` 로 조회 (최대 100건씩).
+
+        반환 모델은 다건 API 의 상품별 항목(``ProductOptionInfo``)으로, 단일 상품 API
+        (``get_product_options``)의 ``ProductOptionsResponse`` 와 형태가 다르다. 결과에 없는 상품은 None.
+        """
+        loader = self._loader("products_options", self._batch_products_options, _MAX_PRODUCT_NOS)
+        return await loader.load(product_no)
+
+    async def load_shipping_info(self, product_no: int) -> ProductShippingInfo | None:
+        """배송 정보 단건 조회를 모아 ``get_shipping_infos`` 로 조회 (최대 100건씩). 결과에 없는 상품은 None."""
+        loader = self._loader("shipping_infos", self._batch_shipping_infos, _MAX_PRODUCT_NOS)
+        return await loader.load(product_no)
+
+    async def _batch_additional_discounts(self, product_nos: list[int]) -> dict[int, AdditionalDiscountResponse]:
+        resp = await self._model_client().get_additional_discounts_by_product_nos(product_nos)
+        return {item.product_no: item for item in resp.data or [] if item.product_no is not None}
+
+    async def _batch_products_options(self, product_nos: list[int]) -> dict[int, ProductOptionInfo]:
+        resp = await self._model_client().get_products_options(product_nos)
+        return {item.mall_product_no: item for item in resp.option_infos or [] if item.mall_product_no is not None}
+
+    async def _batch_shipping_infos(self, product_nos: list[int]) -> dict[int, ProductShippingInfo]:
+        items = await self._model_client().get_shipping_infos(product_nos)
+        return {item.product_no: item for item in items if item.product_no is not None}
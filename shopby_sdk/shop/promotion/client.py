@@ -6,8 +6,6 @@ shop-api(`https://shop-api.e-ncp.com`) 의 공개(인증 불필요) 쿠폰 조
 대응 OpenAPI: docs/api/promotion-shop-public.yml
 """
 
-import httpx
-
 from shopby_sdk.shop.base import ShopbyShopApiClient
 
 from .models import (
@@ -26,9 +24,7 @@ class ShopbyShopPromotionApiClient(ShopbyShopApiClient):
         operationId: get-promotion-configs-coupon
         GET /promotion-configs/coupon
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_promotion_configs_coupon") as client:
             headers = {"version": "1.0"}
             resp = await client.get("/promotion-configs/coupon", headers=headers)
             return self.handle_resp(resp, PromotionCouponConfig)
@@ -46,9 +42,7 @@ class ShopbyShopPromotionApiClient(ShopbyShopApiClient):
         Args:
             channel_type: 채널 타입 (NAVER_EP, FACEBOOK).
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_issuable_coupons") as client:
             headers = {"version": "1.0"}
             params: dict = {}
             if channel_type is not None:
@@ -72,9 +66,7 @@ class ShopbyShopPromotionApiClient(ShopbyShopApiClient):
             product_no: 상품번호.
             channel_type: 채널 타입 (NAVER_EP, FACEBOOK).
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_issuable_coupon_by_products") as client:
             headers = {"version": "1.0"}
             params: dict = {}
             if channel_type is not None:
@@ -108,9 +100,7 @@ class ShopbyShopPromotionApiClient(ShopbyShopApiClient):
             target_nos: 할인 대상 번호 리스트 (콤마 조인되어 전송됨).
             channel_type: 채널 타입 (NAVER_EP, FACEBOOK).
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_issuable_coupons_by_target_no") as client:
             headers = {"version": "1.0"}
             params: dict = {"couponTargetType": coupon_target_type}
             if target_no is not None:
@@ -139,9 +129,7 @@ class ShopbyShopPromotionApiClient(ShopbyShopApiClient):
             page_number: 페이지 번호.
             page_size: 한 페이지당 노출 수.
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_coupon_target") as client:
             headers = {"version": "1.0"}
             params = {"pageNumber": page_number, "pageSize": page_size}
             resp = await client.get(
@@ -164,9 +152,7 @@ class ShopbyShopPromotionApiClient(ShopbyShopApiClient):
             page_number: 페이지 번호.
             page_size: 한 페이지당 노출 수.
         """
-        async with httpx.AsyncClient(
-            base_url=self.base_url, headers=self.common_header
-        ) as client:
+        async with self._session("get_coupon_exclude_target") as client:
             headers = {"version": "1.0"}
             params = {"pageNumber": page_number, "pageSize": page_size}
             resp = await client.get(
@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+
+import httpx
+from shopby_sdk.clients.products import ShopbyServerProductsApiClient
+
+
+class FetchChunkedTest(unittest.TestCase):
+    def setUp(self):
+        self.requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            product_nos = request.url.params["productNos"].split(",")
+            return httpx.Response(200, json=[{"productNo": int(no)} for no in product_nos])
+
+        self.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def test_raw_chunks_are_merged_in_order(self):
+        client = ShopbyServerProductsApiClient("token", "key", http_client=self.http, raw=True)
+        items = asyncio.run(client.get_global_nos_by_product_nos(list(range(250))))
+
+        self.assertEqual([item["productNo"] for item in items], list(range(250)))
+        self.assertEqual(len(self.requests), 3)
+
+    def test_bytes_mode_is_rejected_before_any_request(self):
+        client = ShopbyServerProductsApiClient("token", "key", http_client=self.http, raw="bytes")
+        with self.assertRaises(TypeError):
+            asyncio.run(client.get_global_nos_by_product_nos(list(range(250))))
+
+        self.assertEqual(self.requests, [])
+
+    def test_bytes_mode_single_chunk_is_sent(self):
+        client = ShopbyServerProductsApiClient("token", "key", http_client=self.http, raw="bytes")
+        body = asyncio.run(client.get_global_nos_by_product_nos([1, 2]))
+
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(len(self.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+
+import httpx
+from shopby_sdk.base.retry import RetryPolicy
+from shopby_sdk.clients.promotion import ShopbyServerPromotionApiClient
+from shopby_sdk.clients.promotion.pipeline import issue_coupons_to_members
+
+NO_WAIT = RetryPolicy(backoff_base=0.0)
+
+
+class CouponIssueServer:
+    """쿠폰 발급(``POST /coupons/issues``)과 지급 쿠폰 검색(``GET /coupons/issues``) 가짜 서버.
+
+    lose_responses 개의 발급 요청은 서버에서 처리한 뒤 503 으로 응답한다 (응답 유실).
+    """
+
+    def __init__(self):
+        self.issued: Counter[tuple[int, int]] = Counter()
+        self.lose_responses = 0
+        self.issue_requests: list[list[int]] = []
+        self.searches: list[list[int]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            members = [int(no) for no in request.url.params["memberNos"].split(",")]
+            coupons = {int(no) for no in request.url.params["couponNos"].split(",")}
+            self.searches.append(members)
+            contents = [
+                {"memberNo": member, "couponNo": coupon}
+                for (member, coupon) in self.issued
+                if member in set(members) and coupon in coupons
+            ]
+            return httpx.Response(200, json={"totalCount": len(contents), "contents": contents})
+        body = json.loads(request.content)
+        self.issue_requests.append(body["memberNos"])
+        results = []
+        for member in body["memberNos"]:
+            for coupon in body["couponNos"]:
+                self.issued[member, coupon] += 1
+                results.append({"memberNo": member, "couponNo": coupon})
+        if self.lose_responses:
+            self.lose_responses -= 1
+            return httpx.Response(503)
+        return httpx.Response(200, json=results)
+
+
+def stop_after(member_nos, count):
+    for index, member_no in enumerate(member_nos):
+        if index == count:
+            raise RuntimeError("interrupted")
+        yield member_no
+
+
+class IssueCouponsToMembersTest(unittest.TestCase):
+    def setUp(self):
+        self.server = CouponIssueServer()
+        http = httpx.AsyncClient(transport=httpx.MockTransport(self.server.handler))
+        self.client = ShopbyServerPromotionApiClient("token", "key", http_client=http)
+
+    def issue(self, member_nos, **kwargs):
+        kwargs.setdefault("retry", NO_WAIT)
+        kwargs.setdefault("rate_limit", None)
+        return asyncio.run(issue_coupons_to_members(self.client, [7001, 7002], member_nos, **kwargs))
+
+    def test_reconciles_before_retrying_a_lost_response(self):
+        self.server.lose_responses = 1
+        summary = self.issue(range(1, 11))
+
+        self.assertEqual(self.server.searches, [list(range(1, 11))])
+        self.assertEqual(len(self.server.issue_requests), 1)
+        self.assertEqual(set(self.server.issued.values()), {1})
+        self.assertEqual((summary.issued, summary.already_issued, summary.failed), (0, 20, 0))
+
+    def test_raw_client_results_are_read_as_models(self):
+        self.client = self.client.with_options(raw=True)
+        summary = self.issue(range(1, 11))
+
+        self.assertEqual((summary.issued, summary.failed), (20, 0))
+        self.assertEqual(len(self.server.issue_requests), 1)
+
+    def test_resume_skips_checkpointed_members_and_reconciles_the_next_chunk(self):
+        checkpoint = Path(tempfile.mkdtemp()) / "issue.json"
+        members = range(1, 2501)
+        with self.assertRaises(RuntimeError):
+            self.issue(stop_after(members, 2100), checkpoint=checkpoint, concurrency=1)
+        self.assertEqual(json.loads(checkpoint.read_text(encoding="utf-8"))["offset"], 2000)
+        self.assertEqual(self.server.searches, [])
+
+        # 중단 직전 요청이 서버에서 처리된 상황: 다음 묶음의 일부가 이미 지급되어 있다
+        for member in range(2001, 2101):
+            self.server.issued[member, 7001] += 1
+        self.server.issue_requests.clear()
+        summary = self.issue(members, checkpoint=checkpoint, concurrency=1)
+
+        self.assertEqual(self.server.searches, [list(range(2001, 2501))])
+        self.assertEqual([len(r) for r in self.server.issue_requests], [100, 400])
+        self.assertEqual(set(self.server.issued.values()), {1})
+        self.assertEqual((summary.resumed, summary.members), (2000, 2500))
+        self.assertEqual((summary.issued, summary.already_issued), (4900, 100))
+        self.assertTrue(json.loads(checkpoint.read_text(encoding="utf-8"))["done"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from datetime import date
+
+from shopby_sdk.base.daterange import DateWindow, iter_sharded, split_date_range
+
+START, END = date(2025, 1, 1), date(2025, 1, 10)
+
+
+class ShardedSource:
+    """구간마다 items_per_window 개를 내보내는 가짜 ``iter_*``. 구간별로 내보낸 수와 종료 여부를 기록한다."""
+
+    def __init__(self, items_per_window: int, *, failing: date | None = None):
+        self.items_per_window = items_per_window
+        self.failing = failing
+        self.produced: dict[date, int] = {}
+        self.closed: set[date] = set()
+
+    async def fetch(self, window: DateWindow):
+        self.produced[window.start] = 0
+        try:
+            for n in range(self.items_per_window):
+                if window.start == self.failing and n == 3:
+                    raise RuntimeError(f"window {window.key} failed")
+                self.produced[window.start] += 1
+                yield (window.start, n)
+                await asyncio.sleep(0)
+        finally:
+            self.closed.add(window.start)
+
+
+def collect(aiter, limit: int | None = None) -> list:
+    async def run() -> list:
+        items = []
+        async for item in aiter:
+            items.append(item)
+            if limit is not None and len(items) == limit:
+                break
+        return items
+
+    return asyncio.run(run())
+
+
+class IterShardedTest(unittest.TestCase):
+    def test_items_come_in_window_order(self):
+        source = ShardedSource(5)
+        items = collect(iter_sharded(source.fetch, START, END, days=3, concurrency=2))
+
+        windows = [window.start for window in split_date_range(START, END, days=3)]
+        self.assertEqual(items, [(start, n) for start in windows for n in range(5)])
+
+    def test_prefetched_windows_are_bounded_by_buffer_size(self):
+        source = ShardedSource(200)
+        peaks: list[int] = []
+
+        async def run() -> None:
+            async for start, _ in iter_sharded(source.fetch, START, END, days=2, concurrency=3, buffer_size=10):
+                ahead = [count for window, count in source.produced.items() if window > start]
+                peaks.append(max(ahead, default=0))
+
+        asyncio.run(run())
+        self.assertLessEqual(max(peaks), 11)
+        self.assertEqual(sum(source.produced.values()), 5 * 200)
+
+    def test_failure_is_raised_in_window_order_and_cancels_the_rest(self):
+        source = ShardedSource(5, failing=date(2025, 1, 4))
+        items = []
+
+        async def run() -> None:
+            async for item in iter_sharded(source.fetch, START, END, days=3, concurrency=4):
+                items.append(item)
+
+        with self.assertRaisesRegex(RuntimeError, "2025-01-04_2025-01-06"):
+            asyncio.run(run())
+        self.assertEqual(items[:5], [(START, n) for n in range(5)])
+        self.assertEqual(items[5:], [(date(2025, 1, 4), n) for n in range(3)])
+        self.assertEqual(source.closed, set(source.produced))
+
+    def test_closing_early_cancels_window_fetches(self):
+        source = ShardedSource(100)
+        items = collect(iter_sharded(source.fetch, START, END, days=2, concurrency=3, buffer_size=5), limit=3)
+
+        self.assertEqual(len(items), 3)
+        self.assertEqual(source.closed, set(source.produced))
+        self.assertLess(sum(source.produced.values()), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import importlib.util
+import json
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+import httpx
+from shopby_sdk.clients.order import ShopbyServerOrderApiClient
+from shopby_sdk.export import export_orders
+from shopby_sdk.export.writers import ParquetWriter
+
+
+class OrderListServer:
+    """구간(startYmd)별 주문 목록을 페이지로 내보내는 가짜 서버."""
+
+    def __init__(self, orders_per_window: int):
+        self.orders_per_window = orders_per_window
+        self.fail_at: tuple[str, int] | None = None
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        start, page, size = params["startYmd"], int(params["pageNumber"]), int(params["pageSize"])
+        if self.fail_at == (start, page):
+            return httpx.Response(400, json={"message": "boom"})
+        rows = [f"{start}-{n}" for n in range(self.orders_per_window)][(page - 1) * size : page * size]
+        return httpx.Response(
+            200, json={"totalCount": self.orders_per_window, "contents": [{"orderNo": no} for no in rows]}
+        )
+
+
+def read_order_nos(path: Path) -> list[str]:
+    return [json.loads(line)["orderNo"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class ExportOrdersTest(unittest.TestCase):
+    def setUp(self):
+        self.out = Path(tempfile.mkdtemp())
+        self.server = OrderListServer(orders_per_window=55)
+        http = httpx.AsyncClient(transport=httpx.MockTransport(self.server.handler))
+        self.client = ShopbyServerOrderApiClient("token", "key", http_client=http)
+
+    def export(self):
+        return asyncio.run(
+            export_orders(
+                self.client, self.out, date(2025, 1, 1), date(2025, 1, 20), window_days=10, page_size=10, chunk_size=10
+            )
+        )
+
+    def test_resumes_after_last_checkpointed_chunk(self):
+        self.server.fail_at = ("2025-01-11", 4)
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.export()
+        checkpoint = json.loads((self.out / "orders" / "_checkpoint.json").read_text(encoding="utf-8"))
+        self.assertEqual(list(checkpoint["done"]), ["2025-01-01_2025-01-10"])
+        self.assertEqual(checkpoint["current"]["resume"], 4)
+        self.assertTrue((self.out / "orders" / "2025-01-11_2025-01-20.ndjson.part").exists())
+
+        self.server.fail_at = None
+        result = self.export()
+
+        self.assertEqual(result.skipped_windows, 1)
+        self.assertEqual(result.windows, 1)
+        second = read_order_nos(self.out / "orders" / "2025-01-11_2025-01-20.ndjson")
+        self.assertEqual(second, [f"2025-01-11-{n}" for n in range(55)])
+        self.assertFalse((self.out / "orders" / "2025-01-11_2025-01-20.ndjson.part").exists())
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+class ParquetWriterTest(unittest.TestCase):
+    def test_widens_inferred_columns_for_later_chunks(self):
+        import pyarrow.parquet as pq
+
+        path = Path(tempfile.mkdtemp()) / "rows.parquet"
+        with ParquetWriter(path) as writer:
+            writer.write([{"amount": 1, "flag": True, "extra": 1}])
+            writer.write([{"amount": 1.5, "flag": "Y", "extra": {"k": 1}}])
+            writer.write([{"amount": "n/a", "flag": False, "extra": 3}])
+
+        table = pq.read_table(path)
+        self.assertEqual([str(field.type) for field in table.schema], ["string", "string", "string"])
+        self.assertEqual(table.column("amount").to_pylist(), ["1", "1.5", "n/a"])
+        self.assertEqual(table.column("flag").to_pylist(), ["true", "Y", "false"])
+        self.assertEqual(table.column("extra").to_pylist(), ["1", '{"k":1}', "3"])
+        self.assertEqual(list(path.parent.iterdir()), [path])
+
+    def test_int_column_widens_to_float(self):
+        import pyarrow.parquet as pq
+
+        path = Path(tempfile.mkdtemp()) / "rows.parquet"
+        with ParquetWriter(path) as writer:
+            writer.write([{"amount": 1}, {"amount": None}])
+            writer.write([{"amount": 2.5}])
+
+        table = pq.read_table(path)
+        self.assertEqual(str(table.schema.field("amount").type), "double")
+        self.assertEqual(table.column("amount").to_pylist(), [1.0, None, 2.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
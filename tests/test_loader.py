@@ -0,0 +1,107 @@
+import asyncio
+import unittest
+
+import httpx
+from shopby_sdk.base.loader import BatchLoader
+from shopby_sdk.shop.product import ShopbyShopProductApiClient
+
+
+class RecordingBatch:
+    """받은 key 목록을 기록하고 ``{key: key * 10}`` 을 돌려주는 다건 조회 함수. missing 은 결과에서 뺀다."""
+
+    def __init__(self, missing: frozenset[int] = frozenset()):
+        self.missing = missing
+        self.calls: list[list[int]] = []
+        self.release: asyncio.Event | None = None
+        self.error: Exception | None = None
+
+    async def __call__(self, keys: list[int]) -> dict[int, int]:
+        self.calls.append(keys)
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {key: key * 10 for key in keys if key not in self.missing}
+
+
+class BatchLoaderTest(unittest.TestCase):
+    def test_splits_by_max_batch_size_and_returns_none_for_missing_keys(self):
+        batch = RecordingBatch(missing=frozenset({7}))
+        loader = BatchLoader(batch, max_batch_size=100)
+
+        values = asyncio.run(loader.load_many(range(250)))
+
+        self.assertEqual([len(keys) for keys in batch.calls], [100, 100, 50])
+        self.assertEqual(values[:3], [0, 10, 20])
+        self.assertIsNone(values[7])
+        self.assertEqual((loader.loads, loader.batches), (250, 3))
+
+    def test_same_key_is_requested_once_while_pending_or_in_flight(self):
+        batch = RecordingBatch()
+        loader = BatchLoader(batch)
+
+        async def run() -> list[int | None]:
+            batch.release = asyncio.Event()
+            first = asyncio.gather(loader.load(1), loader.load(1), loader.load(2))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            in_flight = asyncio.ensure_future(loader.load(1))
+            await asyncio.sleep(0)
+            batch.release.set()
+            return [*await first, await in_flight]
+
+        self.assertEqual(asyncio.run(run()), [10, 10, 20, 10])
+        self.assertEqual(batch.calls, [[1, 2]])
+
+    def test_batch_error_is_raised_to_every_caller(self):
+        batch = RecordingBatch()
+        batch.error = RuntimeError("down")
+        loader = BatchLoader(batch)
+
+        async def run() -> list[object]:
+            return await asyncio.gather(*(loader.load(key) for key in (1, 2, 3)), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertEqual(len(batch.calls), 1)
+        self.assertTrue(all(result is batch.error for result in results))
+
+    def test_cancelled_caller_does_not_cancel_the_batch(self):
+        batch = RecordingBatch()
+        loader = BatchLoader(batch)
+
+        async def run() -> int | None:
+            batch.release = asyncio.Event()
+            cancelled = asyncio.ensure_future(loader.load(1))
+            other = asyncio.ensure_future(loader.load(2))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            batch.release.set()
+            return await other
+
+        self.assertEqual(asyncio.run(run()), 20)
+
+
+class LoadShippingInfoTest(unittest.TestCase):
+    def test_loads_are_batched_into_shipping_info_requests(self):
+        requests: list[list[int]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            product_nos = [int(no) for no in request.url.params["productNos"].split(",")]
+            requests.append(product_nos)
+            return httpx.Response(200, json=[{"productNo": no} for no in product_nos if no != 5])
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = ShopbyShopProductApiClient("client-id", http_client=http, raw=True)
+
+        async def run() -> list:
+            return await asyncio.gather(*(client.load_shipping_info(no) for no in range(150)))
+
+        infos = asyncio.run(run())
+        self.assertEqual([len(nos) for nos in requests], [100, 50])
+        self.assertEqual(infos[3].product_no, 3)
+        self.assertIsNone(infos[5])
+
+
+if __name__ == "__main__":
+    unittest.main()
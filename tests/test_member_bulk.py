@@ -0,0 +1,109 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import httpx
+from shopby_sdk.base.retry import RetryPolicy
+from shopby_sdk.clients.member import ShopbyServerMemberApiClient, bulk_delete_profiles, bulk_update_profiles
+from shopby_sdk.clients.member.models import ProfileUpdateRequest
+
+
+class ProfileBulkServer:
+    """``PUT /profile/bulk`` 가짜 서버. bad 회원이 든 요청은 400, status 를 지정하면 그 상태로 응답한다."""
+
+    def __init__(self, bad: frozenset[int] = frozenset()):
+        self.bad = bad
+        self.status: int | None = None
+        self.fail_at_request: int | None = None
+        self.requests: list[list[int]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        member_nos = [item.get("memberNo") for item in json.loads(request.content)]
+        self.requests.append(member_nos)
+        if self.status is not None and len(self.requests) == (self.fail_at_request or len(self.requests)):
+            return httpx.Response(self.status, json={"message": "denied"})
+        if self.bad & set(member_nos):
+            return httpx.Response(400, json={"message": "invalid email"})
+        return httpx.Response(200, json={"memberNos": member_nos})
+
+
+def profiles(member_nos):
+    return [ProfileUpdateRequest(member_no=no, email=f"{no}@example.com") for no in member_nos]
+
+
+class BulkUpdateProfilesTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ProfileBulkServer()
+        http = httpx.AsyncClient(transport=httpx.MockTransport(self.server.handler))
+        self.client = ShopbyServerMemberApiClient("token", "key", http_client=http)
+
+    def update(self, requests, **kwargs):
+        kwargs.setdefault("chunk_size", 4)
+        kwargs.setdefault("rate_limit", None)
+        return asyncio.run(bulk_update_profiles(self.client, requests, **kwargs))
+
+    def test_bisects_request_errors_down_to_the_bad_member(self):
+        self.server.bad = frozenset({6})
+        result = self.update(profiles(range(1, 9)))
+
+        self.assertEqual((result.succeeded, result.failed), (7, 1))
+        self.assertEqual([(f.member, f.status) for f in result.failures], [(6, 400)])
+        # [1..4], [5..8] -> [5,6] / [7,8] -> [5] / [6]
+        self.assertEqual(result.requests, 6)
+
+    def test_other_client_errors_fail_the_chunk_without_bisecting(self):
+        self.server.status = 404
+        result = self.update(profiles(range(1, 5)))
+
+        self.assertEqual((result.succeeded, result.failed, result.requests), (0, 4, 1))
+
+    def test_auth_error_stops_the_run_and_keeps_the_checkpoint(self):
+        checkpoint = Path(tempfile.mkdtemp()) / "bulk.json"
+        self.server.status, self.server.fail_at_request = 401, 3
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.update(profiles(range(1, 21)), checkpoint=checkpoint, concurrency=1)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(json.loads(checkpoint.read_text(encoding="utf-8"))["offset"], 8)
+
+        self.server.status = None
+        self.server.requests.clear()
+        result = self.update(profiles(range(1, 21)), checkpoint=checkpoint, concurrency=1)
+
+        self.assertEqual(self.server.requests, [[9, 10, 11, 12], [13, 14, 15, 16], [17, 18, 19, 20]])
+        self.assertEqual((result.resumed, result.succeeded, result.failed), (8, 20, 0))
+        self.assertTrue(json.loads(checkpoint.read_text(encoding="utf-8"))["done"])
+
+    def test_request_without_member_key_is_rejected_before_sending_its_chunk(self):
+        requests = [*profiles(range(1, 5)), *profiles([5, 6]), ProfileUpdateRequest(email="x@example.com")]
+        with self.assertRaises(ValueError):
+            self.update(requests, concurrency=1)
+
+        self.assertEqual(self.server.requests, [[1, 2, 3, 4]])
+
+    def test_raw_client_results_are_read_as_models(self):
+        self.client = self.client.with_options(raw=True)
+        result = self.update(profiles(range(1, 9)))
+
+        self.assertEqual((result.succeeded, result.failed, result.requests), (8, 0, 2))
+
+
+class BulkDeleteProfilesTest(unittest.TestCase):
+    def test_server_errors_are_retried(self):
+        requests: list[list[int]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(json.loads(request.content)["memberNos"])
+            return httpx.Response(503 if len(requests) == 1 else 204)
+
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = ShopbyServerMemberApiClient("token", "key", http_client=http, retry=RetryPolicy(backoff_base=0.0))
+        result = asyncio.run(bulk_delete_profiles(client, range(1, 5), rate_limit=None))
+
+        self.assertEqual(requests, [[1, 2, 3, 4], [1, 2, 3, 4]])
+        self.assertEqual((result.succeeded, result.failed, result.requests), (4, 0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
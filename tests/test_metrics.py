@@ -0,0 +1,35 @@
+import asyncio
+import unittest
+
+import httpx
+from shopby_sdk.clients.products import ShopbyServerProductsApiClient
+from shopby_sdk.clients.workspace.client import ShopbyServerWorkspaceApiClient
+
+
+def client_with_metrics(client_type, operations: list[str | None], **kwargs):
+    http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[])))
+    return client_type("token", "key", http_client=http, metrics=lambda m: operations.append(m.operation), **kwargs)
+
+
+class OperationNameTest(unittest.TestCase):
+    def test_chunked_calls_report_public_method(self):
+        operations: list[str | None] = []
+        client = client_with_metrics(ShopbyServerProductsApiClient, operations, raw=True)
+        asyncio.run(client.get_global_nos_by_product_nos(list(range(250))))
+
+        self.assertEqual(operations, ["get_global_nos_by_product_nos"] * 3)
+
+    def test_shared_helper_reports_each_caller(self):
+        operations: list[str | None] = []
+        client = client_with_metrics(ShopbyServerWorkspaceApiClient, operations, raw=True)
+
+        async def issue() -> None:
+            await client.issue_token(client_id="id", client_secret="secret", code="c")
+            await client.issue_long_lived_token(client_id="id", client_secret="secret", code="c")
+
+        asyncio.run(issue())
+        self.assertEqual(operations, ["issue_token", "issue_long_lived_token"])
+
+
+if __name__ == "__main__":
+    unittest.main()
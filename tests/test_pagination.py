@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+from datetime import datetime
+
+import httpx
+from shopby_sdk.clients.order import ShopbyServerOrderApiClient
+from shopby_sdk.clients.products import ShopbyServerProductsApiClient
+
+
+def collect(aiter) -> list:
+    async def run() -> list:
+        return [item async for item in aiter]
+
+    return asyncio.run(run())
+
+
+class RawClientIterTest(unittest.TestCase):
+    """raw 클라이언트의 ``iter_*`` 도 페이지를 모델로 읽어 항목을 모두 내보낸다."""
+
+    def setUp(self):
+        self.requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            params = request.url.params
+            if request.url.path == "/orders":
+                page, size = int(params["pageNumber"]), int(params["pageSize"])
+                numbers = range((page - 1) * size, min(page * size, 25))
+                return httpx.Response(
+                    200, json={"totalCount": 25, "contents": [{"orderNo": str(no)} for no in numbers]}
+                )
+            if request.url.path == "/products/changed":
+                after = int(params.get("searchAfter", 0))
+                numbers = range(after + 1, min(after + int(params["size"]), 25) + 1)
+                body = {
+                    "totalCount": 25,
+                    "totalPage": 3,
+                    "lastId": str(numbers[-1]) if numbers else "",
+                    "contents": [{"productNo": no, "registeredAt": "2024-01-01 00:00:00"} for no in numbers],
+                }
+                return httpx.Response(200, json=body)
+            return httpx.Response(404)
+
+        self.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def test_iter_orders_on_raw_clients(self):
+        for raw in (True, "bytes"):
+            with self.subTest(raw=raw):
+                client = ShopbyServerOrderApiClient("token", "key", http_client=self.http, raw=raw)
+                orders = collect(client.iter_orders(page_size=10, prefetch=2))
+
+                self.assertEqual([order.order_no for order in orders], [str(no) for no in range(25)])
+
+    def test_iter_changed_product_nos_on_raw_clients(self):
+        for raw in (True, "bytes"):
+            with self.subTest(raw=raw):
+                client = ShopbyServerProductsApiClient("token", "key", http_client=self.http, raw=raw)
+                pages = collect(client.iter_changed_product_nos(datetime(2025, 1, 1), size=10))
+
+                self.assertEqual([item.product_no for page in pages for item in page.items], list(range(1, 26)))
+                self.assertEqual(pages[-1].checkpoint, "25")
+
+    def test_raw_mode_is_kept_for_direct_calls(self):
+        client = ShopbyServerOrderApiClient("token", "key", http_client=self.http, raw=True)
+        collect(client.iter_orders(page_size=10))
+        resp = asyncio.run(client.get_orders(page_number=1, page_size=10))
+
+        self.assertIsInstance(resp, dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
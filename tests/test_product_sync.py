@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+from shopby_sdk.base.kst import KST
+from shopby_sdk.clients.products import ProductCatalogSync, ShopbyServerProductsApiClient
+
+AS_OF = datetime(2025, 1, 1, tzinfo=KST)
+
+
+class MemoryStore:
+    def __init__(self, mark: datetime | None = None):
+        self.mark = mark
+
+    def load(self) -> datetime | None:
+        return self.mark
+
+    def save(self, high_water_mark: datetime) -> None:
+        self.mark = high_water_mark
+
+
+class ChangedCatalog:
+    """UPDATED_AT 오름차순 변경 목록 + 상세 조회를 흉내 내는 가짜 서버."""
+
+    def __init__(self, product_nos: list[int]):
+        self.order = list(product_nos)
+        self.list_params: list[dict[str, str]] = []
+        self.on_page = None
+        self.failing: set[int] = set()
+        self.extra_total = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/products/changed":
+            params = dict(request.url.params)
+            self.list_params.append(params)
+            page, size = int(params["page"]), int(params["size"])
+            rows = self.order[(page - 1) * size : page * size]
+            body = {
+                "totalCount": len(self.order) + self.extra_total,
+                "totalPage": -(-len(self.order) // size),
+                "lastId": "",
+                "contents": [{"productNo": no, "registeredAt": "2024-01-01 00:00:00"} for no in rows],
+            }
+            if self.on_page is not None:
+                self.on_page(page)
+            return httpx.Response(200, json=body)
+        product_no = int(request.url.path.strip("/").split("/")[1])
+        if product_no in self.failing:
+            return httpx.Response(500, json={"message": "down"})
+        return httpx.Response(200, json={"mallProductNo": product_no})
+
+    def touch(self, product_no: int) -> None:
+        """상품이 수정되어 UPDATED_AT 오름차순 목록의 끝으로 옮겨 간다."""
+        self.order.remove(product_no)
+        self.order.append(product_no)
+
+
+def make_sync(catalog: ChangedCatalog, store: MemoryStore, fetched: list[int], **kwargs) -> ProductCatalogSync:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(catalog.handler))
+    client = ShopbyServerProductsApiClient("token", "key", raw=True, http_client=http)
+    return ProductCatalogSync(
+        client,
+        store,
+        on_product=lambda detail: fetched.append(detail["mallProductNo"]),
+        concurrency=4,
+        page_size=10,
+        initial_as_of=AS_OF,
+        **kwargs,
+    )
+
+
+class ProductCatalogSyncTest(unittest.TestCase):
+    def test_advances_mark_and_reads_ascending(self):
+        catalog = ChangedCatalog(list(range(1, 36)))
+        store, fetched = MemoryStore(), []
+        stats = asyncio.run(make_sync(catalog, store, fetched).run())
+
+        self.assertEqual(sorted(fetched), list(range(1, 36)))
+        self.assertTrue(stats.advanced)
+        self.assertEqual(store.mark, stats.window_end)
+        self.assertTrue(all(p["direction"] == "ASC" and p["sortBy"] == "UPDATED_AT" for p in catalog.list_params))
+
+    def test_rescans_products_shifted_past_page_boundary(self):
+        catalog = ChangedCatalog(list(range(1, 36)))
+
+        def touch_first(page: int) -> None:
+            if page == 1 and not catalog.list_params[1:]:
+                catalog.touch(1)  # 11 번이 1 페이지로 당겨져 2 페이지에서 빠진다
+
+        catalog.on_page = touch_first
+        store, fetched = MemoryStore(), []
+        stats = asyncio.run(make_sync(catalog, store, fetched).run())
+
+        self.assertEqual(sorted(fetched), list(range(1, 36)))
+        self.assertEqual(stats.rescans, 1)
+        self.assertEqual(stats.unseen, 0)
+        self.assertTrue(stats.advanced)
+
+    def test_keeps_mark_when_products_stay_unseen(self):
+        catalog = ChangedCatalog(list(range(1, 6)))
+        catalog.extra_total = 1  # 목록에 끝내 나오지 않는 상품
+        store, fetched = MemoryStore(), []
+        stats = asyncio.run(make_sync(catalog, store, fetched, max_rescans=1).run())
+
+        self.assertEqual(stats.unseen, 1)
+        self.assertEqual(stats.rescans, 1)
+        self.assertFalse(stats.advanced)
+        self.assertIsNone(store.mark)
+        self.assertEqual(sorted(fetched), [1, 2, 3, 4, 5])
+
+    def test_keeps_mark_when_detail_fails(self):
+        catalog = ChangedCatalog(list(range(1, 6)))
+        catalog.failing = {3}
+        store, fetched = MemoryStore(), []
+        stats = asyncio.run(make_sync(catalog, store, fetched).run())
+
+        self.assertEqual(stats.failed_product_nos, [3])
+        self.assertFalse(stats.advanced)
+        self.assertIsNone(store.mark)
+
+    def test_lag_excludes_overlap(self):
+        mark = datetime.now(KST) - timedelta(minutes=1)
+        stats = asyncio.run(make_sync(ChangedCatalog([]), MemoryStore(mark), []).run())
+
+        self.assertEqual(stats.window_start, mark - timedelta(minutes=5))
+        self.assertLess(stats.lag, timedelta(minutes=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
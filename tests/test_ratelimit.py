@@ -0,0 +1,111 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+from shopby_sdk.base.ratelimit import RATELIMIT_LEVEL_HEADER, AdaptiveRateLimiter, shared_rate_limiter
+from shopby_sdk.clients.order import ShopbyServerOrderApiClient
+from shopby_sdk.clients.products import ShopbyServerProductsApiClient
+
+_yield = asyncio.sleep
+
+
+class FakeClock:
+    """``time.monotonic`` 대신 쓰는 시계. ``asyncio.sleep`` 은 대기 시간만 기록하고 다른 태스크에 차례만 넘긴다."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        await _yield(0)
+
+
+def level(value: float, status: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(status, headers={RATELIMIT_LEVEL_HEADER: str(value), **headers})
+
+
+class AdaptiveRateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        for target, fake in (("time.monotonic", self.clock.monotonic), ("asyncio.sleep", self.clock.sleep)):
+            patcher = mock.patch(f"shopby_sdk.base.ratelimit.{target}", fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def limiter(self, **kwargs) -> AdaptiveRateLimiter:
+        kwargs.setdefault("level_max", 100)
+        return AdaptiveRateLimiter(**kwargs)
+
+    def test_low_level_decreases_at_most_once_per_interval(self):
+        limiter = self.limiter(rate=20, min_rate=4)
+        limiter.observe(level(10))
+        limiter.observe(level(10))
+        self.assertEqual(limiter.rate, 10)
+
+        for expected in (5, 4, 4):
+            self.clock.now += 1.0
+            limiter.observe(level(10))
+            self.assertEqual(limiter.rate, expected)
+
+    def test_high_level_increases_up_to_max_rate(self):
+        limiter = self.limiter(rate=10, max_rate=13, increase_step=2)
+        for expected in (12, 13, 13):
+            limiter.observe(level(90))
+            self.assertEqual(limiter.rate, expected)
+            self.clock.now += 1.0
+
+    def test_mid_level_keeps_the_rate(self):
+        limiter = self.limiter(rate=10)
+        limiter.observe(level(50))
+
+        self.assertEqual((limiter.rate, limiter.level), (10, 0.5))
+
+    def test_level_scale_defaults_to_the_observed_peak(self):
+        limiter = AdaptiveRateLimiter(rate=10)
+        limiter.observe(level(40))
+        self.assertEqual((limiter.rate, limiter.level), (12, 1.0))
+
+        self.clock.now += 1.0
+        limiter.observe(level(8))
+        self.assertEqual((limiter.rate, limiter.level), (6, 0.2))
+
+    def test_token_bucket_spaces_requests_after_burst(self):
+        limiter = self.limiter(rate=2, burst=2)
+
+        async def acquire_all() -> None:
+            await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        asyncio.run(acquire_all())
+        self.assertEqual(sorted(self.clock.sleeps), [0.5, 1.0])
+
+    def test_429_pauses_for_retry_after_and_decreases(self):
+        limiter = self.limiter(rate=10)
+        limiter.observe(httpx.Response(429, headers={"Retry-After": "5"}))
+
+        asyncio.run(limiter.acquire())
+        self.assertEqual(limiter.rate, 5)
+        self.assertEqual(self.clock.sleeps, [5.0])
+
+
+class SharedRateLimiterTest(unittest.TestCase):
+    def test_keyed_by_credentials(self):
+        self.assertIs(shared_rate_limiter("server", "a", "key"), shared_rate_limiter("server", "a", "key"))
+        self.assertIsNot(shared_rate_limiter("server", "a", "key"), shared_rate_limiter("server", "b", "key"))
+
+    def test_domain_clients_with_same_credentials_share_one_limiter(self):
+        orders = ShopbyServerOrderApiClient("token", "shared-key", rate_limit=True)
+        products = ShopbyServerProductsApiClient("token", "shared-key", rate_limit=True)
+        other = ShopbyServerProductsApiClient("token", "other-key", rate_limit=True)
+
+        self.assertIs(orders._rate_limiter, products._rate_limiter)
+        self.assertIsNot(orders._rate_limiter, other._rate_limiter)
+        self.assertIs(orders.with_options(raw=True)._rate_limiter, orders._rate_limiter)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+from shopby_sdk.base.retry import RetryPolicy
+from shopby_sdk.clients.member import ShopbyServerMemberApiClient
+from shopby_sdk.clients.member.models import ProfileUpdateRequest
+from shopby_sdk.clients.order import ShopbyServerOrderApiClient
+from shopby_sdk.clients.promotion import ShopbyServerPromotionApiClient
+from shopby_sdk.clients.promotion.models import IssueCouponRequest
+
+
+class ScriptedServer:
+    """요청마다 responses 의 다음 응답을 돌려주고 (마지막 응답은 반복) 요청을 기록하는 가짜 서버."""
+
+    def __init__(self, *responses: httpx.Response | Exception):
+        self.responses = list(responses)
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.responses[min(len(self.requests), len(self.responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def http(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+class SendRetryingTest(unittest.TestCase):
+    def setUp(self):
+        self.sleeps: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            self.sleeps.append(delay)
+
+        patcher = mock.patch("shopby_sdk.base.http.asyncio.sleep", sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def order_client(self, server: ScriptedServer, retry: RetryPolicy | bool = True) -> ShopbyServerOrderApiClient:
+        return ShopbyServerOrderApiClient("token", "key", http_client=server.http(), raw=True, retry=retry)
+
+    def test_server_error_is_retried_until_success(self):
+        server = ScriptedServer(httpx.Response(503), httpx.Response(503), httpx.Response(200, json={"orderNo": "1"}))
+        detail = asyncio.run(self.order_client(server).get_order_detail("1"))
+
+        self.assertEqual(detail, {"orderNo": "1"})
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_retry_after_is_followed(self):
+        server = ScriptedServer(httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200, json={}))
+        asyncio.run(self.order_client(server).get_order_detail("1"))
+
+        self.assertEqual(self.sleeps, [7.0])
+
+    def test_retry_after_over_the_limit_is_returned_without_waiting(self):
+        server = ScriptedServer(httpx.Response(503, headers={"Retry-After": "600"}), httpx.Response(200, json={}))
+        with self.assertRaises(httpx.HTTPStatusError) as caught:
+            asyncio.run(self.order_client(server, RetryPolicy(max_retry_after=120)).get_order_detail("1"))
+
+        self.assertEqual(caught.exception.response.status_code, 503)
+        self.assertEqual((len(server.requests), self.sleeps), (1, []))
+
+    def test_gives_up_after_max_attempts(self):
+        server = ScriptedServer(httpx.Response(502))
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(self.order_client(server, RetryPolicy(max_attempts=2)).get_order_detail("1"))
+
+        self.assertEqual(len(server.requests), 2)
+
+    def test_network_errors_are_retried(self):
+        server = ScriptedServer(httpx.ConnectError("refused"), httpx.Response(200, json={}))
+        asyncio.run(self.order_client(server).get_order_detail("1"))
+
+        self.assertEqual(len(server.requests), 2)
+
+    def test_post_without_opt_in_is_not_retried(self):
+        server = ScriptedServer(httpx.Response(503), httpx.Response(200, json=[]))
+        client = ShopbyServerPromotionApiClient("token", "key", http_client=server.http(), retry=True)
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(client.issue_coupons(IssueCouponRequest(member_nos=[1], coupon_nos=[2])))
+
+        self.assertEqual((len(server.requests), self.sleeps), (1, []))
+
+    def test_opted_in_write_is_retried(self):
+        server = ScriptedServer(httpx.Response(503), httpx.Response(200, json={"memberNos": [1]}))
+        client = ShopbyServerMemberApiClient("token", "key", http_client=server.http(), retry=True)
+        resp = asyncio.run(client.bulk_update_profile([ProfileUpdateRequest(member_no=1, email="a@example.com")]))
+
+        self.assertEqual(resp.member_nos, [1])
+        self.assertEqual(len(server.requests), 2)
+
+    def test_disabled_policy_sends_once(self):
+        server = ScriptedServer(httpx.Response(503), httpx.Response(200, json={}))
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(self.order_client(server, retry=False).get_order_detail("1"))
+
+        self.assertEqual(len(server.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import asyncio
+import unittest
+
+import httpx
+from shopby_sdk.base.revalidate import current_revalidation
+from shopby_sdk.shop.display import ShopbyShopDisplayApiClient
+
+CATEGORIES = [{"displayCategoryNo": 1, "displayCategoryName": "상의"}]
+
+
+class CategoryServer:
+    """``GET /categories/simple-1depth`` 가짜 서버. etag 를 주면 If-None-Match 가 같을 때 304 로 응답한다."""
+
+    def __init__(self, etag: str | None = None):
+        self.etag = etag
+        self.body = CATEGORIES
+        self.requests: list[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path != "/categories/simple-1depth":
+            return httpx.Response(200, json=[])
+        headers = {"ETag": self.etag} if self.etag else {}
+        if self.etag is not None and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json=self.body, headers=headers)
+
+
+def make_client(server: CategoryServer) -> ShopbyShopDisplayApiClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    return ShopbyShopDisplayApiClient("client-id", http_client=http, revalidate=True)
+
+
+class RevalidatedTest(unittest.TestCase):
+    def test_304_returns_the_stored_model(self):
+        server = CategoryServer(etag='"v1"')
+        client = make_client(server)
+        first = asyncio.run(client.get_categories_simple_1depth())
+        second = asyncio.run(client.get_categories_simple_1depth())
+
+        self.assertIs(second, first)
+        self.assertNotIn("If-None-Match", server.requests[0].headers)
+        self.assertEqual(server.requests[1].headers["If-None-Match"], '"v1"')
+        cache = client._revalidating_cache
+        self.assertEqual((cache.validated, cache.not_modified, cache.unchanged), (1, 1, 0))
+
+    def test_changed_etag_validates_the_new_body(self):
+        server = CategoryServer(etag='"v1"')
+        client = make_client(server)
+        asyncio.run(client.get_categories_simple_1depth())
+        server.etag, server.body = '"v2"', [{"displayCategoryNo": 2}]
+        second = asyncio.run(client.get_categories_simple_1depth())
+        third = asyncio.run(client.get_categories_simple_1depth())
+
+        self.assertEqual([category.display_category_no for category in second], [2])
+        self.assertIs(third, second)
+        self.assertEqual(server.requests[2].headers["If-None-Match"], '"v2"')
+
+    def test_same_body_without_validators_skips_validation(self):
+        server = CategoryServer()
+        client = make_client(server)
+        first = asyncio.run(client.get_categories_simple_1depth())
+        second = asyncio.run(client.get_categories_simple_1depth())
+
+        self.assertIs(second, first)
+        self.assertEqual(len(server.requests), 2)
+        cache = client._revalidating_cache
+        self.assertEqual((cache.validated, cache.not_modified, cache.unchanged), (1, 0, 1))
+
+    def test_revalidation_state_is_scoped_to_the_call(self):
+        server = CategoryServer(etag='"v1"')
+        client = make_client(server)
+        asyncio.run(client.get_categories_simple_1depth())
+        asyncio.run(client.get_new_product_categories())
+
+        self.assertIsNone(current_revalidation())
+        self.assertNotIn("If-None-Match", server.requests[1].headers)
+
+    def test_disabled_cache_sends_no_conditional_headers(self):
+        server = CategoryServer(etag='"v1"')
+        http = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+        client = ShopbyShopDisplayApiClient("client-id", http_client=http)
+        first = asyncio.run(client.get_categories_simple_1depth())
+        second = asyncio.run(client.get_categories_simple_1depth())
+
+        self.assertIsNot(second, first)
+        self.assertNotIn("If-None-Match", server.requests[1].headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import unittest
+
+import httpx
+from shopby_sdk.clients.products import ShopbyServerProductsApiClient, load_option_stocks, sync_option_stocks
+
+
+class StockCatalog:
+    """상품번호·옵션번호 오름차순 옵션 재고 목록 + 재고 변경을 흉내 내는 가짜 서버 (size 는 옵션 행 수)."""
+
+    def __init__(self, options_per_product: int = 3, products: int = 10, honor_search_after: bool = True):
+        self.rows = [
+            (product_no, product_no * 100 + option, product_no + option)
+            for product_no in range(1, products + 1)
+            for option in range(options_per_product)
+        ]
+        self.honor_search_after = honor_search_after
+        self.list_params: list[dict[str, str]] = []
+        self.updates: list[list[dict[str, int]]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT":
+            options = json.loads(request.content)["options"]
+            self.updates.append(options)
+            return httpx.Response(200, json={"failures": []})
+        params = dict(request.url.params)
+        self.list_params.append(params)
+        size = int(params["size"])
+        if "searchAfter" in params and self.honor_search_after:
+            rows = [row for row in self.rows if row[0] > int(params["searchAfter"])][:size]
+        else:
+            page = int(params.get("page", 1))
+            rows = self.rows[(page - 1) * size : page * size]
+        views = [
+            {
+                "mallProductNo": product_no,
+                "mallOptionNo": option_no,
+                "stockCnt": stock,
+                "optionManagementCd": f"C{option_no}",
+            }
+            for product_no, option_no, stock in rows
+        ]
+        # 상품 수라 size 보다 작아도 마지막 페이지가 아니다
+        return httpx.Response(200, json={"stockViews": views, "mallProductCount": len({row[0] for row in rows})})
+
+    def stocks(self) -> dict[int, int]:
+        return {option_no: stock for _, option_no, stock in self.rows}
+
+
+def make_client(catalog: StockCatalog) -> ShopbyServerProductsApiClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(catalog.handler))
+    return ShopbyServerProductsApiClient("token", "key", http_client=http)
+
+
+def load(catalog: StockCatalog, **kwargs):
+    return asyncio.run(load_option_stocks(make_client(catalog), **kwargs))
+
+
+class LoadOptionStocksTest(unittest.TestCase):
+    def test_keyset_reads_every_option_across_product_boundaries(self):
+        catalog = StockCatalog()
+        index, _, requests = load(catalog, page_size=7)
+
+        self.assertEqual(dict(index), catalog.stocks())
+        self.assertTrue(all("page" not in params for params in catalog.list_params))
+        self.assertEqual(requests, len(catalog.list_params))
+
+    def test_falls_back_to_page_numbers_when_search_after_is_ignored(self):
+        catalog = StockCatalog(honor_search_after=False)
+        with self.assertLogs("shopby_sdk.clients.products.stock_sync", "WARNING"):
+            index, _, _ = load(catalog, page_size=7)
+
+        self.assertEqual(dict(index), catalog.stocks())
+        self.assertTrue(any("page" in params for params in catalog.list_params))
+
+    def test_page_mode_reads_past_pages_with_few_products(self):
+        catalog = StockCatalog(options_per_product=5, products=6)
+        index, _, requests = load(catalog, page_size=10, paging="page", prefetch=1)
+
+        self.assertEqual(dict(index), catalog.stocks())
+        self.assertEqual(requests, 3)  # 10 + 10 + 10 행, 마지막은 빈 페이지
+
+    def test_page_mode_stops_on_short_page(self):
+        catalog = StockCatalog(options_per_product=3, products=6)
+        _, _, requests = load(catalog, page_size=10, paging="page", prefetch=1)
+
+        self.assertEqual(requests, 2)
+
+
+class SyncOptionStocksTest(unittest.TestCase):
+    def test_sends_only_changed_options(self):
+        catalog = StockCatalog()
+        snapshot = [(option_no, stock) for option_no, stock in catalog.stocks().items()]
+        snapshot[0] = (snapshot[0][0], 99)
+        snapshot[5] = (snapshot[5][0], 0)
+        snapshot.append((999_999, 1))
+
+        result = asyncio.run(sync_option_stocks(make_client(catalog), snapshot, page_size=7, rate_limit=None))
+
+        sent = [item for chunk in catalog.updates for item in chunk]
+        self.assertEqual(sent, [{"optionNo": snapshot[0][0], "stock": 99}, {"optionNo": snapshot[5][0], "stock": 0}])
+        self.assertEqual((result.changed, result.unchanged, result.unknown), (2, 28, 1))
+        self.assertEqual((result.updated, result.requests, result.failed), (2, 1, 0))
+
+    def test_raw_client_results_are_read_as_models(self):
+        catalog = StockCatalog()
+        snapshot = [(100, 99)]
+        client = make_client(catalog).with_options(raw=True)
+
+        result = asyncio.run(sync_option_stocks(client, snapshot, rate_limit=None))
+
+        self.assertEqual(catalog.updates, [[{"optionNo": 100, "stock": 99}]])
+        self.assertEqual((result.updated, result.failed), (1, 0))
+
+    def test_dry_run_by_management_code(self):
+        catalog = StockCatalog()
+        snapshot = [("C100", 1), ("C101", 50), ("missing", 3)]
+
+        result = asyncio.run(
+            sync_option_stocks(make_client(catalog), snapshot, key="management_code", dry_run=True, rate_limit=None)
+        )
+
+        self.assertEqual(catalog.updates, [])
+        self.assertEqual((result.changed, result.unchanged, result.unknown), (1, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()